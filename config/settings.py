@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 import yaml
 
@@ -11,12 +11,28 @@ import yaml
 class BillingApiSettings:
     credential_id: str
     credential_secret: str
+    # 프로세스 전체 Billing API 호출 속도 제한 (초당 요청 수, 0이면 제한 없음 - 테넌트 간 공유)
+    rate_limit_per_second: float = 0.0
+    # 여러 테넌트를 동시에 처리할 스레드 수
+    tenant_workers: int = 4
+    # Billing API 주소 (None이면 Kakao Cloud 기본 주소, 부하 테스트 시 로컬 stub 서버 주소로 변경)
+    api_url: Optional[str] = None
 
 
 @dataclass
 class MongoSettings:
     uri: str
     db_name: str
+    # 커넥션 풀/압축/타임아웃 설정 (pymongo MongoClient 옵션으로 전달)
+    max_pool_size: int = 20
+    min_pool_size: int = 0
+    compressors: List[str] = field(default_factory=lambda: ["zlib"])
+    server_selection_timeout_ms: int = 5000
+    connect_timeout_ms: int = 5000
+    socket_timeout_ms: Optional[int] = 60000
+    read_preference: str = "primary"
+    # billing_daily 저장 방식: "document"(일반 컬렉션) | "timeseries"(time-series 컬렉션)
+    daily_storage: str = "document"
 
 
 @dataclass
@@ -25,11 +41,192 @@ class ObjectStorageSettings:
     bucket: str
     access_key: str
     secret_key: str
+    # Raw 데이터 압축 방식: None(기존 pretty JSON) | "gzip" | "zstd" (JSON Lines 스트리밍 업로드)
+    raw_compression: Optional[str] = None
+    # Raw 엔트리를 컬럼 포맷(Parquet/Arrow)으로도 내보낼지 여부 (pyarrow 필요)
+    columnar_export: bool = False
+    # S3 클라이언트 HTTP 커넥션 풀 크기 (병렬 전송 스레드 수 이상으로 설정)
+    max_pool_connections: int = 32
+    # 여러 오브젝트를 동시에 업로드/다운로드할 때의 기본 스레드 수
+    transfer_workers: int = 8
+    # 테넌트 이름 - 설정되면 raw/columnar key에 tenant=<name> 파티션이 추가됩니다. (테넌트 실행 시 자동 지정)
+    tenant: Optional[str] = None
+
+
+@dataclass
+class AlertChannelSettings:
+    # 채널 이름 - outbox/로그에 기록 (예: "ops-slack")
+    name: str
+    webhook_url: str
+    # webhook별 초당 발송 수 (Slack Incoming Webhook은 초당 1건 권장)
+    rate_limit_per_second: float = 1.0
 
 
 @dataclass
 class AlertSettings:
+    # 기본 Slack 채널 (지정하면 "slack" 채널로 발송)
     slack_webhook_url: Optional[str] = None
+    # 추가 webhook 채널
+    channels: List[AlertChannelSettings] = field(default_factory=list)
+    # 발송 실패 시 최대 시도 횟수 (넘으면 outbox에 failed로 남김)
+    max_attempts: int = 5
+    # 재시도 간격 기준(초) - 시도마다 2배씩 늘어나며, 다음 실행의 dispatcher가 다시 보냅니다.
+    retry_base_seconds: int = 60
+    # 채널 동시 발송 수
+    dispatch_workers: int = 4
+    # digest 메시지 1건에 자세히 표시할 이상치 수 (나머지는 건수만)
+    digest_max_items: int = 20
+    timeout_seconds: float = 5.0
+
+    def all_channels(self) -> List[AlertChannelSettings]:
+        """발송 대상 채널 목록 (slack_webhook_url 포함)"""
+        channels = list(self.channels)
+        if self.slack_webhook_url and self.slack_webhook_url.strip():
+            channels.insert(0, AlertChannelSettings("slack", self.slack_webhook_url.strip()))
+        return channels
+
+
+@dataclass
+class LifecycleSettings:
+    # 컬렉션별 보관 기간(일). 기간이 지난 문서는 Object Storage로 아카이브 후 삭제합니다.
+    retention_days: Dict[str, int] = field(default_factory=dict)
+    # 컬렉션별 TTL(일). 아카이브 없이 createdAt 기준으로 MongoDB가 자동 삭제합니다.
+    ttl_days: Dict[str, int] = field(default_factory=dict)
+    archive_prefix: str = "archive"
+    batch_size: int = 5000
+    compact: bool = False
+
+
+@dataclass
+class SchedulerSettings:
+    # 상주 스케줄러(jobs/scheduler.py)의 Job별 cron 표현식 (빈 값이면 해당 Job 비활성화)
+    hourly: str = "10 * * * *"
+    daily: str = "10 0 * * *"
+    lifecycle: str = "40 3 * * *"
+    timezone: str = "Asia/Seoul"
+    # Hourly Job이 재사용하는 baseline 캐시 유효 시간(초)
+    baseline_cache_ttl_seconds: int = 3600
+
+
+@dataclass
+class CheckpointSettings:
+    # Job 실행 단계별 checkpoint 사용 여부 (job_checkpoints 컬렉션 + 로컬 artifact 파일)
+    enabled: bool = True
+    # 단계 출력(API 응답, 집계 결과 등)을 저장할 디렉토리 (상대 경로는 프로젝트 루트 기준)
+    artifact_dir: str = "logs/checkpoints"
+
+
+@dataclass
+class ClusterSettings:
+    # 여러 노드에서 같은 Job을 실행할 때 (job, 날짜, 시간)별 lease lock 사용 여부 (job_locks 컬렉션)
+    lock_enabled: bool = True
+    # lease 만료 시간(초) - 노드가 죽으면 이 시간이 지난 뒤 다른 노드가 실행할 수 있습니다.
+    lock_ttl_seconds: int = 300
+    # 분할 실행: 이 노드의 shard 번호와 전체 shard 수 (shard_count=1이면 분할하지 않음)
+    shard_index: int = 0
+    shard_count: int = 1
+    # 분할 기준: "domain" | "project"
+    shard_key: str = "domain"
+
+
+@dataclass
+class MetricsSettings:
+    # Job 실행 요약(단계별 시간, 카운터)을 job_runs 컬렉션에 저장할지 여부
+    store_runs: bool = True
+    # node_exporter textfile collector 디렉토리 (지정하면 실행마다 billing_{job}.prom 갱신)
+    textfile_dir: Optional[str] = None
+    # job_runs 보관 기간(일) - TTL 인덱스
+    run_retention_days: int = 90
+
+
+@dataclass
+class ProfilingSettings:
+    # --profile 결과(pstats, collapsed stack, 메모리 상위 목록) 저장 디렉토리 (상대 경로는 프로젝트 루트 기준)
+    output_dir: str = "logs/profiles"
+    # True면 Object Storage profiles/job=.../date=.../ 에도 업로드
+    upload: bool = False
+    # sample 프로파일러의 스택 수집 간격(ms)
+    sample_interval_ms: float = 10.0
+    # memory 프로파일러가 기록할 할당 위치 개수
+    memory_top: int = 30
+
+
+@dataclass
+class LoggingSettings:
+    # "text": Alert Center 키워드 한 줄 (기존 형식) | "json": 구조화된 JSON 한 줄
+    format: str = "text"
+    # syslog/콘솔 쓰기 대기 큐 크기 (가득 차면 INFO 이하만 버림, 0이면 무제한)
+    queue_size: int = 10000
+
+
+@dataclass
+class ForecastSettings:
+    # Daily Job에서 서비스별 월말 비용 예측(billing_forecasts) 여부
+    enabled: bool = True
+    # 모델 학습에 사용할 최근 일수 (7의 배수 단위로 사용, 최소 14일)
+    history_days: int = 56
+    # 예측 구간 폭 (표준편차 배수, 1.64 ≈ 90%)
+    interval_z: float = 1.64
+    # billing_forecasts 보관 기간(일) - TTL 인덱스
+    retention_days: int = 400
+
+
+@dataclass
+class ContributorSettings:
+    # Daily Job에서 범위별 기여도/전일 대비 변동 순위(billing_contributors) 저장 여부
+    enabled: bool = True
+    # 범위(전체/도메인/프로젝트)마다 저장할 순위 개수
+    top_n: int = 10
+    # [BILLING_DAILY_TOTAL] 로그에 함께 남길 증가 상위 서비스 수
+    log_movers: int = 3
+    # billing_contributors 보관 기간(일) - TTL 인덱스
+    retention_days: int = 400
+
+
+@dataclass
+class QueryApiSettings:
+    # 대시보드용 조회 API(python -m jobs.query_api) 바인드 주소
+    host: str = "127.0.0.1"
+    port: int = 8090
+    # 응답 캐시 (LRU): 최대 항목 수 / 최대 크기(MB) / 항목 유효 시간(초)
+    cache_max_entries: int = 1000
+    cache_max_mb: int = 256
+    cache_ttl_seconds: int = 300
+    # job_runs의 최근 완료 시각을 확인하는 간격(초) - 새 Job 완료가 보이면 캐시를 비웁니다.
+    invalidate_poll_seconds: float = 5.0
+    # 응답이 이 크기(KB)를 넘으면 캐시하지 않고 chunked로 스트리밍합니다.
+    stream_threshold_kb: int = 1024
+    # /daily 최대 조회 기간(일), /anomalies 최대 건수
+    max_range_days: int = 400
+    max_anomalies: int = 10000
+    # 아카이브 파트 캐시 최대 개수 (유효 시간은 cache_ttl_seconds, Job 완료가 보이면 비움)
+    archive_cache_parts: int = 32
+
+
+@dataclass
+class BudgetSettings:
+    # 예산 이름 - 상태 문서/로그에 사용 (전체 예산에서 유일)
+    name: str
+    domain_id: str
+    # 월 예산 금액 (원)
+    monthly_amount: float
+    # 지정하면 project / service 레벨 예산 (생략 시 domain 전체)
+    project_id: Optional[str] = None
+    service_id: Optional[str] = None
+    # 알림을 보낼 사용률(%) - 각 구간은 월마다 한 번만 발생
+    thresholds: List[float] = field(default_factory=lambda: [50.0, 80.0, 100.0])
+
+
+@dataclass
+class TenantSettings:
+    # 테넌트(조직) 이름 - 실행 키/Object Storage 파티션/로그에 사용
+    name: str
+    credential_id: str
+    credential_secret: str
+    # 이상치 탐지 임계값 (None이면 Job 기본값)
+    z_threshold: Optional[float] = None
+    ratio_threshold: Optional[float] = None
+    enabled: bool = True
 
 
 @dataclass
@@ -38,6 +235,22 @@ class Settings:
     mongo: MongoSettings
     object_storage: ObjectStorageSettings
     alert: AlertSettings
+    lifecycle: LifecycleSettings = field(default_factory=LifecycleSettings)
+    scheduler: SchedulerSettings = field(default_factory=SchedulerSettings)
+    checkpoint: CheckpointSettings = field(default_factory=CheckpointSettings)
+    cluster: ClusterSettings = field(default_factory=ClusterSettings)
+    metrics: MetricsSettings = field(default_factory=MetricsSettings)
+    profiling: ProfilingSettings = field(default_factory=ProfilingSettings)
+    logging: LoggingSettings = field(default_factory=LoggingSettings)
+    forecast: ForecastSettings = field(default_factory=ForecastSettings)
+    contributors: ContributorSettings = field(default_factory=ContributorSettings)
+    query_api: QueryApiSettings = field(default_factory=QueryApiSettings)
+    # 월 예산 목록 (domain / project / service 레벨)
+    budgets: List[BudgetSettings] = field(default_factory=list)
+    # 여러 조직의 Credential을 한 번에 처리할 때의 테넌트 목록 (비어 있으면 billingApi 1개만 처리)
+    tenants: List[TenantSettings] = field(default_factory=list)
+    # 테넌트별로 실행 중일 때 현재 테넌트 (core.tenants.tenant_settings가 지정)
+    tenant: Optional[TenantSettings] = None
 
 
 def load_settings(path: str | Path) -> Settings:
@@ -52,25 +265,151 @@ def load_settings(path: str | Path) -> Settings:
     mongo = raw.get("mongo", {})
     obj = raw.get("objectStorage", {})
     alert = raw.get("alert", {})
+    lifecycle = raw.get("lifecycle", {}) or {}
+    scheduler = raw.get("scheduler", {}) or {}
+    checkpoint = raw.get("checkpoint", {}) or {}
+    cluster = raw.get("cluster", {}) or {}
+    metrics = raw.get("metrics", {}) or {}
+    profiling = raw.get("profiling", {}) or {}
+    logging_cfg = raw.get("logging", {}) or {}
+    forecast = raw.get("forecast", {}) or {}
+    contributors = raw.get("contributors", {}) or {}
+    query_api = raw.get("queryApi", {}) or {}
+    socket_timeout_ms = mongo.get("socketTimeoutMs", 60000)
 
     return Settings(
         billing_api=BillingApiSettings(
             credential_id=billing.get("credentialId", ""),
             credential_secret=billing.get("credentialSecret", ""),
+            rate_limit_per_second=float(billing.get("rateLimitPerSecond", 0) or 0),
+            tenant_workers=int(billing.get("tenantWorkers", 4)),
+            api_url=billing.get("apiUrl") or None,
         ),
         mongo=MongoSettings(
             uri=mongo.get("uri", ""),
             db_name=mongo.get("dbName", "billing"),
+            max_pool_size=int(mongo.get("maxPoolSize", 20)),
+            min_pool_size=int(mongo.get("minPoolSize", 0)),
+            compressors=list(mongo.get("compressors", ["zlib"]) or []),
+            server_selection_timeout_ms=int(mongo.get("serverSelectionTimeoutMs", 5000)),
+            connect_timeout_ms=int(mongo.get("connectTimeoutMs", 5000)),
+            # null이면 소켓 타임아웃 없음
+            socket_timeout_ms=None if socket_timeout_ms is None else int(socket_timeout_ms),
+            read_preference=mongo.get("readPreference", "primary"),
+            daily_storage=mongo.get("dailyStorage", "document"),
         ),
         object_storage=ObjectStorageSettings(
             endpoint=obj.get("endpoint", ""),
             bucket=obj.get("bucket", ""),
             access_key=obj.get("accessKey", ""),
             secret_key=obj.get("secretKey", ""),
+            raw_compression=obj.get("rawCompression"),
+            columnar_export=bool(obj.get("columnarExport", False)),
+            max_pool_connections=int(obj.get("maxPoolConnections", 32)),
+            transfer_workers=int(obj.get("transferWorkers", 8)),
         ),
         alert=AlertSettings(
             slack_webhook_url=alert.get("slackWebhookUrl"),
+            channels=[
+                AlertChannelSettings(
+                    name=str(channel["name"]),
+                    webhook_url=channel.get("webhookUrl", ""),
+                    rate_limit_per_second=float(channel.get("rateLimitPerSecond", 1.0)),
+                )
+                for channel in (alert.get("channels") or [])
+            ],
+            max_attempts=int(alert.get("maxAttempts", 5)),
+            retry_base_seconds=int(alert.get("retryBaseSeconds", 60)),
+            dispatch_workers=int(alert.get("dispatchWorkers", 4)),
+            digest_max_items=int(alert.get("digestMaxItems", 20)),
+            timeout_seconds=float(alert.get("timeoutSeconds", 5.0)),
+        ),
+        lifecycle=LifecycleSettings(
+            retention_days={k: int(v) for k, v in (lifecycle.get("retentionDays") or {}).items()},
+            ttl_days={k: int(v) for k, v in (lifecycle.get("ttlDays") or {}).items()},
+            archive_prefix=lifecycle.get("archivePrefix", "archive"),
+            batch_size=int(lifecycle.get("batchSize", 5000)),
+            compact=bool(lifecycle.get("compact", False)),
+        ),
+        scheduler=SchedulerSettings(
+            hourly=scheduler.get("hourly", "10 * * * *") or "",
+            daily=scheduler.get("daily", "10 0 * * *") or "",
+            lifecycle=scheduler.get("lifecycle", "40 3 * * *") or "",
+            timezone=scheduler.get("timezone", "Asia/Seoul"),
+            baseline_cache_ttl_seconds=int(scheduler.get("baselineCacheTtlSeconds", 3600)),
+        ),
+        checkpoint=CheckpointSettings(
+            enabled=bool(checkpoint.get("enabled", True)),
+            artifact_dir=checkpoint.get("artifactDir", "logs/checkpoints"),
+        ),
+        cluster=ClusterSettings(
+            lock_enabled=bool(cluster.get("lockEnabled", True)),
+            lock_ttl_seconds=int(cluster.get("lockTtlSeconds", 300)),
+            shard_index=int(cluster.get("shardIndex", 0)),
+            shard_count=int(cluster.get("shardCount", 1)),
+            shard_key=cluster.get("shardKey", "domain"),
+        ),
+        metrics=MetricsSettings(
+            store_runs=bool(metrics.get("storeRuns", True)),
+            textfile_dir=metrics.get("textfileDir") or None,
+            run_retention_days=int(metrics.get("runRetentionDays", 90)),
+        ),
+        profiling=ProfilingSettings(
+            output_dir=profiling.get("outputDir", "logs/profiles"),
+            upload=bool(profiling.get("upload", False)),
+            sample_interval_ms=float(profiling.get("sampleIntervalMs", 10)),
+            memory_top=int(profiling.get("memoryTop", 30)),
+        ),
+        logging=LoggingSettings(
+            format=logging_cfg.get("format", "text"),
+            queue_size=int(logging_cfg.get("queueSize", 10000)),
+        ),
+        forecast=ForecastSettings(
+            enabled=bool(forecast.get("enabled", True)),
+            history_days=int(forecast.get("historyDays", 56)),
+            interval_z=float(forecast.get("intervalZ", 1.64)),
+            retention_days=int(forecast.get("retentionDays", 400)),
+        ),
+        contributors=ContributorSettings(
+            enabled=bool(contributors.get("enabled", True)),
+            top_n=int(contributors.get("topN", 10)),
+            log_movers=int(contributors.get("logMovers", 3)),
+            retention_days=int(contributors.get("retentionDays", 400)),
+        ),
+        query_api=QueryApiSettings(
+            host=query_api.get("host", "127.0.0.1"),
+            port=int(query_api.get("port", 8090)),
+            cache_max_entries=int(query_api.get("cacheMaxEntries", 1000)),
+            cache_max_mb=int(query_api.get("cacheMaxMb", 256)),
+            cache_ttl_seconds=int(query_api.get("cacheTtlSeconds", 300)),
+            invalidate_poll_seconds=float(query_api.get("invalidatePollSeconds", 5)),
+            stream_threshold_kb=int(query_api.get("streamThresholdKb", 1024)),
+            max_range_days=int(query_api.get("maxRangeDays", 400)),
+            max_anomalies=int(query_api.get("maxAnomalies", 10000)),
+            archive_cache_parts=int(query_api.get("archiveCacheParts", 32)),
         ),
+        budgets=[
+            BudgetSettings(
+                name=str(budget["name"]),
+                domain_id=str(budget["domainId"]),
+                monthly_amount=float(budget["monthlyAmount"]),
+                project_id=budget.get("projectId"),
+                service_id=budget.get("serviceId"),
+                thresholds=[float(t) for t in budget.get("thresholds") or [50, 80, 100]],
+            )
+            for budget in (raw.get("budgets") or [])
+        ],
+        tenants=[
+            TenantSettings(
+                name=str(tenant["name"]),
+                credential_id=tenant.get("credentialId", ""),
+                credential_secret=tenant.get("credentialSecret", ""),
+                z_threshold=tenant.get("zThreshold"),
+                ratio_threshold=tenant.get("ratioThreshold"),
+                enabled=bool(tenant.get("enabled", True)),
+            )
+            for tenant in (raw.get("tenants") or [])
+        ],
     )
 
 
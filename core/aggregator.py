@@ -5,6 +5,8 @@
 from typing import Dict, List, Any
 from dataclasses import dataclass
 
+from core import metrics
+
 
 @dataclass
 class DailySummary:
@@ -140,6 +142,8 @@ def aggregate_daily(entries: List[Dict[str, Any]]) -> List[DailySummary]:
         x.project_name,
         x.service_name
     ))
-    
+
+    metrics.inc("aggregate_rows_total", len(entries))
+    metrics.inc("aggregate_groups_total", len(summaries))
     return summaries
 
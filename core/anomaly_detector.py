@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
+from core import metrics
 from core.aggregator import DailySummary
 from core.baseline import Baseline
 
@@ -160,7 +161,9 @@ def detect_anomalies(
                 threshold_z=z_threshold,
                 threshold_ratio=ratio_threshold
             ))
-    
+
+    metrics.inc("anomaly_checked_total", len(summaries))
+    metrics.inc("anomalies_detected_total", len(anomalies))
     return anomalies
 
 
@@ -3,15 +3,16 @@ Baseline 계산 및 조회 모듈
 """
 
 from dataclasses import dataclass
-from typing import Optional, List, Set
+from typing import Dict, Iterable, Optional, List, Set, Tuple
 from pymongo.collection import Collection
 import statistics
 import math
+import threading
+import time
 
-from infra.mongo_client import (
-    get_all_daily_for_service,
-    upsert_baseline
-)
+from core import metrics
+from infra.daily_store import DailyStore
+from infra.mongo_client import upsert_baseline
 
 
 def percentile(data: List[float], p: float) -> float:
@@ -69,6 +70,10 @@ def get_baseline_data(
     if not doc:
         return None
     
+    return _doc_to_baseline(doc)
+
+
+def _doc_to_baseline(doc: dict) -> Baseline:
     stats = doc.get("statistics", {})
     return Baseline(
         mean=stats.get("mean", 0.0),
@@ -81,8 +86,58 @@ def get_baseline_data(
     )
 
 
+class BaselineCache:
+    """
+    billing_baseline 전체를 메모리에 올려 두고 재사용하는 캐시
+
+    상주 스케줄러에서 Hourly Job이 매 시간 서비스마다 find_one을 반복하지 않도록,
+    컬렉션을 한 번에 읽어 {(domainId, projectId, serviceId): Baseline}으로 보관합니다.
+    baseline은 Daily Job이 재계산하므로, Daily Job 이후 invalidate()하거나 ttl_seconds가 지나면 다시 읽습니다.
+    """
+
+    def __init__(self, collection: Collection, ttl_seconds: float = 3600.0):
+        self.collection = collection
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._baselines: Optional[Dict[Tuple[str, str, str], Baseline]] = None
+        self._loaded_at = 0.0
+
+    def invalidate(self) -> None:
+        """캐시를 비웁니다. (다음 조회 시 다시 읽음)"""
+        with self._lock:
+            self._baselines = None
+
+    def _load(self) -> Dict[Tuple[str, str, str], Baseline]:
+        with self._lock:
+            expired = time.monotonic() - self._loaded_at > self.ttl_seconds
+            if self._baselines is None or expired:
+                projection = {"domainId": 1, "projectId": 1, "serviceId": 1, "statistics": 1, "_id": 0}
+                self._baselines = {
+                    (doc.get("domainId"), doc.get("projectId"), doc.get("serviceId")): _doc_to_baseline(doc)
+                    for doc in self.collection.find({}, projection)
+                }
+                self._loaded_at = time.monotonic()
+                metrics.inc("baseline_cache_loads_total")
+                metrics.set_gauge("baseline_cache_size", len(self._baselines))
+            return self._baselines
+
+    def get(self, domain_id: str, project_id: str, service_id: str) -> Optional[Baseline]:
+        """
+        Baseline을 조회합니다. (캐시에 없으면 None)
+        
+        Args:
+            domain_id: 도메인 ID
+            project_id: 프로젝트 ID
+            service_id: 서비스 ID
+        
+        Returns:
+            Baseline 객체 (없으면 None)
+        """
+        return self._load().get((domain_id, project_id, service_id))
+
+
 def recompute_baseline(
-    daily_collection: Collection,
+    daily_store: DailyStore,
     baseline_collection: Collection,
     domain_id: str,
     project_id: str,
@@ -93,39 +148,31 @@ def recompute_baseline(
     billing_daily의 전체 데이터를 기반으로 baseline 통계를 재계산합니다.
     
     Args:
-        daily_collection: billing_daily 컬렉션
+        daily_store: 일별 집계 저장소 (billing_daily)
         baseline_collection: billing_baseline 컬렉션
         domain_id: 도메인 ID
         project_id: 프로젝트 ID
         service_id: 서비스 ID
         service_name: 서비스 이름
     """
-    # billing_daily에서 해당 서비스의 모든 데이터 조회
-    daily_docs = get_all_daily_for_service(
-        daily_collection,
+    # billing_daily에서 해당 서비스의 expectAmount만 스트리밍 조회 (covered query)
+    amounts = list(daily_store.iter_daily_amounts(
         domain_id,
         project_id,
         service_id
-    )
-    
-    if not daily_docs:
-        return
-    
-    # expectAmount 값 추출 및 pricingTypes 수집
-    amounts = []
-    pricing_types_set = set()
-
-    for doc in daily_docs:
-        amounts.append(float(doc.get("expectAmount") or 0))
-        
-        # pricingTypes 수집
-        p_types = doc.get("pricingTypes", [])
-        if isinstance(p_types, list):
-            pricing_types_set.update(p_types)
+    ))
     
+    metrics.inc("baseline_history_samples_total", len(amounts))
     if not amounts:
         return
     
+    # pricingTypes 수집 (서버 측 distinct)
+    pricing_types_list = daily_store.get_pricing_types(
+        domain_id,
+        project_id,
+        service_id
+    )
+    
     # 통계값 계산
     mean_val = statistics.mean(amounts)
     
@@ -154,9 +201,6 @@ def recompute_baseline(
         "sampleCount": len(amounts)
     }
     
-    # pricingTypes 리스트 변환 (정렬)
-    pricing_types_list = sorted(list(pricing_types_set))
-    
     # baseline 업데이트
     upsert_baseline(
         baseline_collection,
@@ -168,3 +212,34 @@ def recompute_baseline(
         pricing_types=pricing_types_list
     )
 
+
+
+def recompute_baselines(
+    daily_store: DailyStore,
+    baseline_collection: Collection,
+    services: Iterable[Tuple[str, str, str, str]]
+) -> int:
+    """
+    여러 서비스의 baseline을 한 번에 재계산합니다.
+    
+    Args:
+        daily_store: 일별 집계 저장소 (billing_daily)
+        baseline_collection: billing_baseline 컬렉션
+        services: (domain_id, project_id, service_id, service_name) 튜플 목록
+    
+    Returns:
+        재계산한 서비스 수
+    """
+    updated = 0
+    for domain_id, project_id, service_id, service_name in services:
+        recompute_baseline(
+            daily_store=daily_store,
+            baseline_collection=baseline_collection,
+            domain_id=domain_id,
+            project_id=project_id,
+            service_id=service_id,
+            service_name=service_name
+        )
+        updated += 1
+    metrics.inc("baseline_recomputed_total", updated)
+    return updated
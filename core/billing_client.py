@@ -3,13 +3,102 @@ Kakao Cloud Billing API 클라이언트 모듈
 """
 
 import requests
+import threading
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
 
 from config.settings import BillingApiSettings
+from core import metrics
 
 API_URL = "https://billing-api.kakaocloud.com/open/billing/public/v2/cost/resources"
 
+# 프로세스 내에서 재사용하는 HTTP 세션 (keep-alive 커넥션 풀 공유)
+# 스케줄러처럼 같은 프로세스에서 여러 번 호출할 때 TLS 연결을 매번 새로 맺지 않도록 합니다.
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+# 여러 테넌트가 동시에 호출해도 프로세스 전체 요청 속도를 제한하는 공유 limiter
+_RATE_LIMITER: Optional["RateLimiter"] = None
+_RATE_LIMITER_LOCK = threading.Lock()
+
+
+class RateLimiter:
+    """
+    스레드 간 공유하는 토큰 버킷 속도 제한기
+
+    초당 rate개의 토큰이 채워지며(최대 burst개), 요청마다 토큰 1개를 사용합니다.
+    토큰이 없으면 다음 토큰이 채워질 때까지 대기합니다.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """토큰 1개를 얻을 때까지 대기합니다."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def get_rate_limiter(rate_per_second: float) -> Optional[RateLimiter]:
+    """
+    프로세스 공유 rate limiter를 반환합니다.
+
+    Args:
+        rate_per_second: 초당 요청 수 (0 이하면 제한 없음)
+
+    Returns:
+        RateLimiter (제한 없음이면 None)
+    """
+    global _RATE_LIMITER
+    if not rate_per_second or rate_per_second <= 0:
+        return None
+    with _RATE_LIMITER_LOCK:
+        if _RATE_LIMITER is None or _RATE_LIMITER.rate != rate_per_second:
+            _RATE_LIMITER = RateLimiter(rate_per_second)
+        return _RATE_LIMITER
+
+
+def get_http_session() -> requests.Session:
+    """
+    Billing API 호출용 HTTP 세션을 반환합니다. (처음 호출 시 생성)
+    
+    Returns:
+        requests.Session
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSION = session
+        return _SESSION
+
+
+def close_http_session() -> None:
+    """
+    캐시된 HTTP 세션을 닫습니다. (프로세스 종료 시 호출)
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+            _SESSION = None
+
 
 def fetch_billing(
     from_date: str,
@@ -39,6 +128,9 @@ def fetch_billing(
     page = 0
     size = 10000
     contents = []
+    session = get_http_session()
+    limiter = get_rate_limiter(settings.rate_limit_per_second)
+    api_url = settings.api_url or API_URL
 
     try:
         while True:
@@ -53,8 +145,12 @@ def fetch_billing(
             last_exc = None
             for attempt in range(5):
                 try:
-                    response = requests.get(API_URL, params=params, headers=headers, timeout=60)
+                    if limiter is not None:
+                        limiter.acquire()
+                    with metrics.timer("billing_api_request_seconds"):
+                        response = session.get(api_url, params=params, headers=headers, timeout=60)
                     if response.status_code == 429:
+                        metrics.inc("billing_api_retries_total", reason="429")
                         time.sleep(min(2 ** attempt, 10))
                         continue
                     response.raise_for_status()
@@ -62,6 +158,7 @@ def fetch_billing(
                     break
                 except requests.exceptions.RequestException as e:
                     last_exc = e
+                    metrics.inc("billing_api_retries_total", reason="error")
                     time.sleep(min(2 ** attempt, 10))
             else:
                 raise last_exc  # type: ignore[misc]
@@ -73,6 +170,8 @@ def fetch_billing(
                 return data
 
             contents.extend(content)
+            metrics.inc("billing_api_pages_total")
+            metrics.inc("billing_api_rows_total", len(content))
 
             # 마지막 페이지 판단: 받은 개수가 size보다 작으면 끝
             if len(content) < size:
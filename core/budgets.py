@@ -0,0 +1,229 @@
+"""
+월 예산 평가 모듈
+
+설정(budgets)의 domain / project / service 레벨 월 예산에 대해, 집계 결과가 들어올 때마다
+월 누적 금액을 갱신하고 사용률 구간(기본 50/80/100%)을 처음 넘은 예산을 반환합니다.
+
+- 예산은 (domainId, projectId, serviceId) 키로 색인해 두고, 서비스마다 3개 레벨 키만 조회합니다.
+  (매 시간 전체 예산을 훑지 않음)
+- 서비스별 날짜 금액(billing_budget_usage)과 비교해 바뀐 서비스의 차이(delta)만 예산 누적에 더합니다.
+  평가 비용은 예산이 걸린 서비스 중 금액이 바뀐 서비스 수에 비례합니다.
+- 이번 달에 처음 보는 서비스는 billing_daily의 이번 달 이전 날짜 금액으로 채웁니다. (월 중간에 추가된 예산)
+- 구간 알림은 상태 문서의 조건부 갱신으로 (예산, 월, 구간)마다 한 번만 발생합니다.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pymongo.database import Database
+
+from config.settings import BudgetSettings
+from core import metrics
+from core.aggregator import DailySummary
+from core.rollup import month_of
+from infra.budgets import (
+    BUDGET_STATE_COLLECTION,
+    BUDGET_USAGE_COLLECTION,
+    ServiceKey,
+    add_budget_spend,
+    claim_threshold,
+    existing_states,
+    get_usage_days,
+    set_usage_days,
+    sum_usage
+)
+from infra.daily_store import DailyStore
+
+
+ScopeKey = Tuple[str, Optional[str], Optional[str]]
+
+BILLING_BUDGET = "BILLING_BUDGET"
+
+
+@dataclass
+class BudgetCrossing:
+    """예산 사용률 구간 도달"""
+    budget: BudgetSettings
+    month: str
+    threshold: float
+    spent: float
+
+    @property
+    def percent(self) -> float:
+        """현재 사용률 (%)"""
+        return self.spent / self.budget.monthly_amount * 100 if self.budget.monthly_amount else 0.0
+
+
+def budget_scope(budget: BudgetSettings) -> ScopeKey:
+    """예산 범위 키 (domainId, projectId | None, serviceId | None)"""
+    project_id = budget.project_id if budget.project_id else None
+    service_id = budget.service_id if project_id and budget.service_id else None
+    return budget.domain_id, project_id, service_id
+
+
+def budget_state_id(budget: BudgetSettings, month: str) -> str:
+    """예산 상태 문서 _id"""
+    return f"{budget.name}:{month}"
+
+
+class BudgetIndex:
+    """
+    예산 범위 키 → 예산 목록 색인
+
+    서비스 1개에 걸린 예산은 (domain), (domain, project), (domain, project, service) 3개 키로 찾습니다.
+    """
+
+    def __init__(self, budgets: Iterable[BudgetSettings]):
+        self._by_scope: Dict[ScopeKey, List[BudgetSettings]] = defaultdict(list)
+        for budget in budgets:
+            if budget.monthly_amount > 0:
+                self._by_scope[budget_scope(budget)].append(budget)
+
+    def __bool__(self) -> bool:
+        return bool(self._by_scope)
+
+    def match(self, key: ServiceKey) -> List[BudgetSettings]:
+        """서비스에 걸린 예산 목록"""
+        domain_id, project_id, service_id = key
+        matched = []
+        for scope in ((domain_id, None, None), (domain_id, project_id, None), (domain_id, project_id, service_id)):
+            matched.extend(self._by_scope.get(scope, ()))
+        return matched
+
+
+def _seed_prior_days(daily_store: DailyStore, keys: List[ServiceKey], date: str) -> Dict[ServiceKey, Dict[str, float]]:
+    """이번 달 1일부터 date 전날까지 billing_daily에 저장된 금액 (처음 보는 서비스용)"""
+    seeded: Dict[ServiceKey, Dict[str, float]] = {key: {} for key in keys}
+    day = datetime.strptime(date, "%Y%m%d").replace(day=1)
+    end = datetime.strptime(date, "%Y%m%d")
+    while day < end:
+        prior = day.strftime("%Y%m%d")
+        amounts = daily_store.get_daily_amounts_for_date(prior)
+        for key in keys:
+            if key in amounts:
+                seeded[key][prior] = amounts[key].get("expectAmount", 0.0)
+        day += timedelta(days=1)
+    return seeded
+
+
+def evaluate_budgets(
+    db: Database,
+    daily_store: DailyStore,
+    index: BudgetIndex,
+    summaries: List[DailySummary],
+    date: str
+) -> List[BudgetCrossing]:
+    """
+    date의 집계 결과로 예산 누적 금액을 갱신하고, 이번에 처음 넘은 사용률 구간을 반환합니다.
+
+    Args:
+        db: Database 인스턴스
+        daily_store: billing_daily 저장소 (처음 보는 서비스의 이번 달 이전 금액 조회)
+        index: 예산 색인
+        summaries: date의 서비스별 집계 (Hourly: 현재까지 누적, Daily: 확정)
+        date: 날짜 (YYYYMMDD)
+
+    Returns:
+        BudgetCrossing 리스트
+    """
+    if not index or not summaries:
+        return []
+    month = month_of(date)
+
+    # 1) 예산이 걸린 서비스만 남깁니다.
+    amounts: Dict[ServiceKey, float] = defaultdict(float)
+    budgets_by_key: Dict[ServiceKey, List[BudgetSettings]] = {}
+    for summary in summaries:
+        key = (summary.domain_id, summary.project_id, summary.service_id)
+        if key not in budgets_by_key:
+            budgets_by_key[key] = index.match(key)
+        if budgets_by_key[key]:
+            amounts[key] += summary.expect_amount
+    if not amounts:
+        return []
+
+    touched = {b.name: b for key in amounts for b in budgets_by_key[key]}
+    state_col = db[BUDGET_STATE_COLLECTION]
+    usage_col = db[BUDGET_USAGE_COLLECTION]
+
+    # 2) 이번 달 상태가 없는 예산은 지금까지 기록된 사용량으로 시작합니다. (사용량 갱신 전에 합산)
+    state_ids = {name: budget_state_id(budget, month) for name, budget in touched.items()}
+    existing = existing_states(state_col, list(state_ids.values()))
+    seed = {
+        name: sum_usage(usage_col, month, *budget_scope(budget))
+        for name, budget in touched.items()
+        if state_ids[name] not in existing
+    }
+
+    # 3) 서비스별 이전 값과 비교해 바뀐 서비스의 차이만 구합니다.
+    recorded = get_usage_days(usage_col, month, amounts)
+    new_keys = [key for key in amounts if key not in recorded]
+    if new_keys:
+        recorded.update(_seed_prior_days(daily_store, new_keys, date))
+    updates: Dict[ServiceKey, Dict[str, float]] = {}
+    deltas: Dict[str, float] = defaultdict(float)
+    for key, amount in amounts.items():
+        days = recorded[key]
+        previous = days.get(date, 0.0)
+        delta = amount - previous
+        if key in new_keys:
+            # 처음 보는 서비스는 이번 달 이전 날짜 금액도 함께 반영합니다.
+            delta += sum(v for d, v in days.items() if d != date)
+            updates[key] = dict(days, **{date: amount})
+        elif round(delta, 2) != 0:
+            updates[key] = {date: amount}
+        else:
+            continue
+        for budget in budgets_by_key[key]:
+            deltas[budget.name] += delta
+    set_usage_days(usage_col, month, updates)
+    metrics.inc("budget_services_changed_total", len(updates))
+
+    # 4) 바뀐 예산의 누적 금액을 갱신하고, 넘은 구간을 한 번만 기록합니다.
+    crossings = []
+    for name, budget in touched.items():
+        if name not in deltas and name not in seed:
+            continue
+        state = add_budget_spend(
+            state_col, state_ids[name], name, month, budget.monthly_amount,
+            deltas.get(name, 0.0) + seed.get(name, 0.0)
+        )
+        spent = float(state.get("spent") or 0)
+        fired = set(state.get("firedThresholds") or [])
+        for threshold in sorted(budget.thresholds):
+            if threshold in fired or spent < budget.monthly_amount * threshold / 100:
+                continue
+            if claim_threshold(state_col, state_ids[name], threshold, spent):
+                crossings.append(BudgetCrossing(budget, month, threshold, spent))
+    metrics.inc("budgets_evaluated_total", len(deltas.keys() | seed.keys()))
+    metrics.inc("budget_crossings_total", len(crossings))
+    return crossings
+
+
+def log_budget_crossings(crossings: List[BudgetCrossing], logger, tenant: Optional[str] = None) -> None:
+    """
+    예산 구간 도달을 syslog에 기록합니다. (Alert Center 키워드: BILLING_BUDGET)
+
+    예)
+    [BILLING_BUDGET] prod-compute 예산의 202501 누적 비용이 80% 구간을 넘었습니다. 현재 1,000,000원 / 예산 1,200,000원 (83.3%).
+    """
+    for crossing in crossings:
+        budget = crossing.budget
+        logger.warning(
+            f"[{BILLING_BUDGET}] {budget.name} 예산의 {crossing.month} 누적 비용이 "
+            f"{crossing.threshold:g}% 구간을 넘었습니다. "
+            f"현재 {crossing.spent:,.0f}원 / 예산 {budget.monthly_amount:,.0f}원 ({crossing.percent:.1f}%).",
+            extra={"fields": {
+                "budget": budget.name,
+                "month": crossing.month,
+                "tenant": tenant,
+                "domainId": budget.domain_id,
+                "projectId": budget.project_id,
+                "serviceId": budget.service_id,
+                "threshold": crossing.threshold,
+                "spent": round(crossing.spent, 2),
+                "monthlyAmount": budget.monthly_amount,
+            }}
+        )
@@ -0,0 +1,39 @@
+"""
+비용 엔트리 내용 해시 모듈
+
+API 응답의 엔트리 목록이 이전 실행과 같은지 판단하기 위한 해시를 계산합니다.
+엔트리마다 key 정렬된 compact JSON으로 정규화해 SHA-256을 구하고,
+엔트리 해시들을 정렬해 다시 해시하므로 API가 반환하는 순서가 바뀌어도 결과가 같습니다.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Iterable, Tuple
+
+
+HASH_ALGORITHM = "sha256"
+
+
+def entry_digest(entry: Dict[str, Any]) -> bytes:
+    """엔트리 1개의 정규화 해시(bytes)를 반환합니다."""
+    canonical = json.dumps(entry, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).digest()
+
+
+def compute_entries_hash(entries: Iterable[Dict[str, Any]]) -> Tuple[str, int]:
+    """
+    엔트리 목록의 순서 무관 내용 해시를 계산합니다.
+
+    Args:
+        entries: 비용 엔트리 이터러블
+
+    Returns:
+        ("sha256:<hex>", 엔트리 수)
+    """
+    digests = [entry_digest(entry) for entry in entries if isinstance(entry, dict)]
+    digests.sort()
+
+    combined = hashlib.sha256()
+    for digest in digests:
+        combined.update(digest)
+    return f"{HASH_ALGORITHM}:{combined.hexdigest()}", len(digests)
@@ -0,0 +1,253 @@
+"""
+비용 기여도 / 전일 대비 변동 순위 모듈
+
+하루치 서비스별 집계로 전체 / 도메인 / 프로젝트 범위마다 다음 순위를 만듭니다.
+
+- topServices   : 금액 상위 서비스
+- topIncreases  : 전일 대비 증가액 상위 서비스
+- topDecreases  : 전일 대비 감소액 상위 서비스 (오늘 비용이 없어진 서비스 포함)
+- topProjects / projectIncreases : (전체 / 도메인 범위) 금액 / 증가액 상위 프로젝트
+
+전일 데이터가 없는 도메인(첫 수집, 수집 누락 등)의 서비스는 전일 대비 순위에 넣지 않습니다.
+(모든 서비스가 "증가"로 잡혀 금액 상위와 같은 순위가 되므로) 범위 전체에 전일 데이터가 없으면
+hasPrevious=false로 표시하고 previousAmount/delta는 null, 변동 순위는 빈 목록으로 저장합니다.
+
+서비스를 한 번만 훑으면서 범위마다 크기 top_n의 최소 힙(heapq)만 유지하므로,
+서비스 수 N에 대해 O(N log top_n) 시간과 범위당 O(top_n) 메모리로 계산합니다.
+"""
+
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from core.aggregator import DailySummary
+
+
+LEVEL_TOTAL = "total"
+LEVEL_DOMAIN = "domain"
+LEVEL_PROJECT = "project"
+
+ServiceKey = Tuple[str, str, str]
+T = TypeVar("T")
+
+
+class TopN(Generic[T]):
+    """점수가 큰 n개만 유지하는 최소 힙"""
+
+    def __init__(self, n: int):
+        self.n = n
+        self._heap: List[Tuple[float, int, T]] = []
+        # 점수가 같을 때 item끼리 비교하지 않도록 순번을 함께 저장합니다.
+        self._seq = itertools.count()
+
+    def push(self, score: float, item: T) -> None:
+        if self.n <= 0:
+            return
+        entry = (score, next(self._seq), item)
+        if len(self._heap) < self.n:
+            heapq.heappush(self._heap, entry)
+        elif score > self._heap[0][0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self) -> List[T]:
+        """점수 내림차순 목록"""
+        return [item for _, _, item in sorted(self._heap, key=lambda e: (-e[0], e[1]))]
+
+
+@dataclass
+class Contributor:
+    """순위 항목 (서비스 또는 프로젝트)"""
+    domain_id: str
+    project_id: str
+    service_id: Optional[str]
+    name: str
+    amount: float
+    previous: float
+    project_name: str = ""
+    # False면 비교할 전일 데이터가 없음 (전일 대비 순위에서 제외)
+    has_previous: bool = True
+
+    @property
+    def delta(self) -> float:
+        return self.amount - self.previous
+
+    def to_dict(self, total: float = 0.0) -> Dict[str, Any]:
+        doc = {
+            "domainId": self.domain_id,
+            "projectId": self.project_id,
+            "name": self.name,
+            "amount": round(self.amount, 2),
+            "previousAmount": round(self.previous, 2) if self.has_previous else None,
+            "delta": round(self.delta, 2) if self.has_previous else None,
+        }
+        if self.service_id is not None:
+            doc["serviceId"] = self.service_id
+            doc["projectName"] = self.project_name
+        if total:
+            doc["share"] = round(self.amount / total, 4)
+        return doc
+
+
+@dataclass
+class ScopeRanking:
+    """범위(전체 / 도메인 / 프로젝트) 1개의 합계와 순위"""
+    level: str
+    domain_id: Optional[str]
+    project_id: Optional[str]
+    top_n: int
+    name: str = ""
+    total: float = 0.0
+    previous: float = 0.0
+    # 전일 데이터가 있는 서비스가 하나라도 있는지 (없으면 전일 대비 변동을 계산하지 않음)
+    has_previous: bool = False
+    top_services: TopN[Contributor] = field(init=False)
+    increases: TopN[Contributor] = field(init=False)
+    decreases: TopN[Contributor] = field(init=False)
+    top_projects: TopN[Contributor] = field(init=False)
+    project_increases: TopN[Contributor] = field(init=False)
+
+    def __post_init__(self):
+        self.top_services = TopN(self.top_n)
+        self.increases = TopN(self.top_n)
+        self.decreases = TopN(self.top_n)
+        self.top_projects = TopN(self.top_n)
+        self.project_increases = TopN(self.top_n)
+
+    @property
+    def delta(self) -> float:
+        return self.total - self.previous
+
+    def add_service(self, item: Contributor) -> None:
+        self.total += item.amount
+        self.previous += item.previous
+        if item.amount > 0:
+            self.top_services.push(item.amount, item)
+        if not item.has_previous:
+            return
+        self.has_previous = True
+        if item.delta > 0:
+            self.increases.push(item.delta, item)
+        elif item.delta < 0:
+            self.decreases.push(-item.delta, item)
+
+    def add_project(self, item: Contributor) -> None:
+        if item.amount > 0:
+            self.top_projects.push(item.amount, item)
+        if item.has_previous and item.delta > 0:
+            self.project_increases.push(item.delta, item)
+
+    def to_dict(self) -> Dict[str, Any]:
+        doc = {
+            "level": self.level,
+            "domainId": self.domain_id,
+            "projectId": self.project_id,
+            "name": self.name,
+            "totalAmount": round(self.total, 2),
+            "hasPrevious": self.has_previous,
+            "previousAmount": round(self.previous, 2) if self.has_previous else None,
+            "delta": round(self.delta, 2) if self.has_previous else None,
+            "topServices": [c.to_dict(self.total) for c in self.top_services.items()],
+            "topIncreases": [c.to_dict() for c in self.increases.items()],
+            "topDecreases": [c.to_dict() for c in self.decreases.items()],
+        }
+        if self.level != LEVEL_PROJECT:
+            doc["topProjects"] = [c.to_dict(self.total) for c in self.top_projects.items()]
+            doc["projectIncreases"] = [c.to_dict() for c in self.project_increases.items()]
+        return doc
+
+
+@dataclass
+class ContributorReport:
+    """하루치 범위별 순위"""
+    date: str
+    previous_date: str
+    total: ScopeRanking
+    domains: Dict[str, ScopeRanking]
+    projects: Dict[Tuple[str, str], ScopeRanking]
+
+    def scopes(self) -> Iterator[ScopeRanking]:
+        yield self.total
+        yield from self.domains.values()
+        yield from self.projects.values()
+
+
+def build_contributors(
+    summaries: Iterable[DailySummary],
+    previous_amounts: Dict[ServiceKey, Dict[str, float]],
+    date: str,
+    previous_date: str,
+    top_n: int = 10
+) -> ContributorReport:
+    """
+    범위별 기여도 / 변동 순위를 계산합니다.
+
+    Args:
+        summaries: date의 서비스별 집계
+        previous_amounts: previous_date의 서비스별 금액 (get_daily_amounts_for_date)
+            summaries에 있는 도메인의 서비스만 비교합니다. (다른 테넌트의 서비스 제외)
+            전일 금액이 하나도 없는 도메인은 전일 대비 순위에서 제외합니다.
+        date: 기준 날짜 (YYYYMMDD)
+        previous_date: 비교 날짜 (YYYYMMDD)
+        top_n: 순위 개수
+
+    Returns:
+        ContributorReport
+    """
+    total = ScopeRanking(LEVEL_TOTAL, None, None, top_n)
+    domains: Dict[str, ScopeRanking] = {}
+    projects: Dict[Tuple[str, str], ScopeRanking] = {}
+    previous_domains = {key[0] for key in previous_amounts}
+
+    def add(key: ServiceKey, name: str, project_name: str, domain_name: str, amount: float) -> None:
+        domain_id, project_id, service_id = key
+        previous = previous_amounts.get(key, {}).get("expectAmount", 0.0)
+        item = Contributor(
+            domain_id, project_id, service_id, name, amount, previous, project_name,
+            has_previous=domain_id in previous_domains
+        )
+        domain = domains.get(domain_id)
+        if domain is None:
+            domain = domains[domain_id] = ScopeRanking(LEVEL_DOMAIN, domain_id, None, top_n, domain_name)
+        project = projects.get((domain_id, project_id))
+        if project is None:
+            project = projects[(domain_id, project_id)] = ScopeRanking(
+                LEVEL_PROJECT, domain_id, project_id, top_n, project_name
+            )
+        for scope in (total, domain, project):
+            scope.add_service(item)
+
+    seen = set()
+    for summary in summaries:
+        key = (summary.domain_id, summary.project_id, summary.service_id)
+        seen.add(key)
+        add(key, summary.service_name, summary.project_name, summary.domain_name, summary.expect_amount)
+
+    # 오늘 비용이 없어진 서비스 (같은 도메인만, 이름은 전일 금액에 없으므로 ID로 표시)
+    for key in previous_amounts:
+        if key not in seen and key[0] in domains:
+            project = projects.get(key[:2])
+            add(key, key[2], project.name if project else key[1], domains[key[0]].name, 0.0)
+
+    # 프로젝트 합계로 상위 범위의 프로젝트 순위를 채웁니다.
+    for (domain_id, project_id), project in projects.items():
+        item = Contributor(
+            domain_id, project_id, None, project.name, project.total, project.previous,
+            has_previous=project.has_previous
+        )
+        domains[domain_id].add_project(item)
+        total.add_project(item)
+
+    return ContributorReport(date, previous_date, total, domains, projects)
+
+
+def describe_movers(ranking: ScopeRanking, limit: int = 3) -> str:
+    """
+    증가액 상위 서비스를 로그용 한 줄로 만듭니다.
+
+    예) "prod/Virtual Machine +120,000원, dev/Object Storage +30,000원"
+    """
+    return ", ".join(
+        f"{c.project_name}/{c.name} {c.delta:+,.0f}원"
+        for c in ranking.increases.items()[:limit]
+    )
@@ -0,0 +1,268 @@
+"""
+월말 비용 예측 모듈
+
+billing_daily 이력으로 서비스별 월말 총 비용과 예측 구간을 계산합니다.
+
+모델 (서비스마다 독립, 전체 서비스를 NumPy 행렬 연산 한 번으로 학습):
+- 최근 W주(history_days // 7)의 일별 금액을 (서비스, 주, 요일) 배열로 만듭니다.
+- 추세: 주 평균 금액에 대한 최소제곱 기울기 (원/주)
+- 계절성: 추세를 뺀 요일별 평균 → 마지막 주 수준으로 맞춘 요일 패턴 (seasonal naive)
+- 예측: k주 뒤 같은 요일 = 요일 패턴 + 기울기 × k (음수는 0)
+- 구간: 학습 잔차 표준편차 σ로 남은 H일 합계의 분산을 계산해 ± interval_z × 표준편차
+  (일별 노이즈 Hσ² + 같은 요일끼리 공유하는 요일 패턴 추정 오차 + 추세 추정 오차)
+
+월말 예측 = 이번 달 실제 누적(as_of까지) + 남은 날짜 예측 합계
+"""
+
+import calendar
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from core import metrics
+from core.rollup import month_of
+from infra.daily_store import DailyStore
+
+
+ServiceKey = Tuple[str, str, str]
+
+DAYS_PER_WEEK = 7
+# 추세/계절성을 구분하려면 최소 2주가 필요합니다.
+MIN_HISTORY_WEEKS = 2
+
+
+@dataclass
+class ForecastModel:
+    """서비스별 모델 파라미터 (행 순서는 keys와 같음)"""
+    # (n, 7) 마지막 주 수준의 요일 패턴 - 열 6이 기준일(as_of)과 같은 요일
+    profile: np.ndarray
+    # (n,) 주당 추세 (원/주)
+    slope: np.ndarray
+    # (n,) 일별 잔차 표준편차
+    sigma: np.ndarray
+    # (n,) 학습에 사용한 주 수
+    weeks: np.ndarray
+    # (n,) 학습 주 번호의 편차 제곱합 (추세 추정 오차 계산용)
+    spread: np.ndarray
+
+
+@dataclass
+class MonthEndForecast:
+    """서비스별 월말 예측 결과"""
+    as_of: str
+    month: str
+    keys: List[ServiceKey]
+    # 이번 달 실제 누적 (as_of까지)
+    actual: np.ndarray
+    # 월말 예측 / 하한 / 상한
+    forecast: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    # 남은 날짜 예측 합계의 표준편차
+    remaining_std: np.ndarray
+    # 주당 추세
+    slope: np.ndarray
+    remaining_days: int
+    history_days: int
+    interval_z: float
+
+    def totals(self) -> Dict[str, float]:
+        """
+        전체 서비스 합계를 반환합니다.
+
+        서비스별 오차를 독립으로 보고 합계 표준편차는 √(Σσ²)로 계산합니다.
+        """
+        actual = float(self.actual.sum())
+        forecast = float(self.forecast.sum())
+        std = float(np.sqrt(np.square(self.remaining_std).sum()))
+        return {
+            "actual": actual,
+            "forecast": forecast,
+            "lower": max(actual, forecast - self.interval_z * std),
+            "upper": forecast + self.interval_z * std,
+        }
+
+
+def history_dates(as_of: str, history_days: int) -> List[str]:
+    """
+    학습/월 누적에 필요한 날짜 목록 (오름차순, as_of 포함)
+
+    history_days를 7일 단위로 맞추고, 이번 달 1일부터의 누적이 포함되도록 더 길게 잡습니다.
+    """
+    end = datetime.strptime(as_of, "%Y%m%d")
+    weeks = max(MIN_HISTORY_WEEKS, history_days // DAYS_PER_WEEK)
+    days = max(weeks * DAYS_PER_WEEK, end.day)
+    return [(end - timedelta(days=offset)).strftime("%Y%m%d") for offset in range(days - 1, -1, -1)]
+
+
+def load_history(
+    daily_store: DailyStore,
+    dates: List[str],
+    scope: Optional[Iterable[Tuple[str, str]]] = None
+) -> Tuple[List[ServiceKey], np.ndarray]:
+    """
+    날짜별 서비스 금액을 (서비스, 날짜) 행렬로 읽습니다. (데이터가 없는 날은 0)
+
+    Args:
+        daily_store: billing_daily 저장소
+        dates: 날짜 목록 (오름차순)
+        scope: (domainId, projectId) 목록 - 지정하면 해당 프로젝트의 서비스만 (테넌트/shard 단위)
+
+    Returns:
+        (서비스 키 목록, float64 행렬 [서비스 수, 날짜 수])
+    """
+    projects = set(scope) if scope is not None else None
+    index: Dict[ServiceKey, int] = {}
+    columns: List[Tuple[List[int], List[float]]] = []
+    for date in dates:
+        rows, values = [], []
+        for key, amounts in daily_store.get_daily_amounts_for_date(date).items():
+            if projects is not None and key[:2] not in projects:
+                continue
+            rows.append(index.setdefault(key, len(index)))
+            values.append(amounts.get("expectAmount", 0.0))
+        columns.append((rows, values))
+
+    matrix = np.zeros((len(index), len(dates)), dtype=np.float64)
+    for col, (rows, values) in enumerate(columns):
+        if rows:
+            matrix[rows, col] = values
+    return list(index), matrix
+
+
+def fit(history: np.ndarray) -> ForecastModel:
+    """
+    서비스별 요일 패턴 + 주간 추세 모델을 학습합니다.
+
+    처음 비용이 생긴 날 이전의 주는 학습에서 제외합니다. (신규 서비스의 0원 구간이 추세를 부풀리지 않도록)
+
+    Args:
+        history: [서비스 수, 날짜 수] 일별 금액 (마지막 열이 기준일)
+
+    Returns:
+        ForecastModel
+    """
+    n, days = history.shape
+    weeks = days // DAYS_PER_WEEK
+    if weeks < MIN_HISTORY_WEEKS:
+        raise ValueError(f"예측에는 최소 {MIN_HISTORY_WEEKS * DAYS_PER_WEEK}일 이력이 필요합니다. (현재 {days}일)")
+
+    # (서비스, 주, 요일) - 마지막 주의 마지막 요일이 기준일
+    recent = history[:, -weeks * DAYS_PER_WEEK:]
+    weekly = recent.reshape(n, weeks, DAYS_PER_WEEK)
+    week_means = weekly.mean(axis=2)
+
+    # 학습에 쓸 주: 첫 날부터 비용이 있었던 주 (2주 미만이면 비용이 생긴 주, 그래도 없으면 전체)
+    started = np.maximum.accumulate(recent > 0, axis=1).reshape(n, weeks, DAYS_PER_WEEK)
+    mask = started[:, :, 0]
+    short = mask.sum(axis=1) < MIN_HISTORY_WEEKS
+    mask[short] = started[short].any(axis=2)
+    mask[~mask.any(axis=1)] = True
+    mask = mask.astype(np.float64)
+    count = mask.sum(axis=1)
+
+    # 학습 주의 주 평균에 대한 (가중) 최소제곱 기울기
+    w = np.arange(weeks, dtype=np.float64)
+    centered = w[None, :] - (mask @ w / count)[:, None]
+    spread = (mask * np.square(centered)).sum(axis=1)
+    level = (mask * week_means).sum(axis=1) / count
+    covariance = (mask * centered * (week_means - level[:, None])).sum(axis=1)
+    slope = np.divide(covariance, spread, out=np.zeros(n), where=spread > 0)
+
+    # 추세를 빼고 요일별 평균을 낸 뒤, 마지막 주 수준으로 되돌립니다.
+    trend = slope[:, None, None] * centered[:, :, None]
+    pattern = (mask[:, :, None] * (weekly - trend)).sum(axis=1) / count[:, None]
+    profile = pattern + slope[:, None] * centered[:, -1:]
+
+    residual = mask[:, :, None] * (weekly - pattern[:, None, :] - trend)
+    dof = np.maximum(count * DAYS_PER_WEEK - DAYS_PER_WEEK - 1, 1)
+    sigma = np.sqrt(np.square(residual).sum(axis=(1, 2)) / dof)
+    return ForecastModel(profile=profile, slope=slope, sigma=sigma, weeks=count, spread=spread)
+
+
+def _horizon(horizon: int) -> Tuple[np.ndarray, np.ndarray]:
+    """기준일 다음 날부터 horizon일의 (요일 위치, 몇 주 뒤)"""
+    h = np.arange(1, horizon + 1)
+    return (DAYS_PER_WEEK - 1 + h) % DAYS_PER_WEEK, (DAYS_PER_WEEK - 1 + h) // DAYS_PER_WEEK
+
+
+def predict_days(model: ForecastModel, horizon: int) -> np.ndarray:
+    """
+    기준일 다음 날부터 horizon일의 일별 예측 (음수는 0)
+
+    Returns:
+        [서비스 수, horizon] 행렬
+    """
+    position, weeks_ahead = _horizon(horizon)
+    return np.maximum(model.profile[:, position] + model.slope[:, None] * weeks_ahead, 0.0)
+
+
+def remaining_sum_std(model: ForecastModel, horizon: int) -> np.ndarray:
+    """
+    horizon일 예측 합계의 표준편차 (서비스별)
+
+    - 일별 노이즈: horizon × σ²
+    - 요일 패턴 추정 오차(분산 σ²/W)는 같은 요일끼리 공유하므로 요일별 등장 횟수의 제곱으로 더합니다.
+    - 추세 추정 오차(주 평균 분산 σ²/7 기준)는 Σ(몇 주 뒤)의 제곱으로 더합니다.
+    """
+    position, weeks_ahead = _horizon(horizon)
+    per_weekday = np.bincount(position, minlength=DAYS_PER_WEEK)
+    trend_error = np.divide(
+        float(weeks_ahead.sum()) ** 2,
+        DAYS_PER_WEEK * model.spread,
+        out=np.zeros_like(model.spread),
+        where=model.spread > 0
+    )
+    factor = horizon + np.square(per_weekday).sum() / model.weeks + trend_error
+    return model.sigma * np.sqrt(factor)
+
+
+def forecast_month_end(
+    keys: List[ServiceKey],
+    history: np.ndarray,
+    dates: List[str],
+    interval_z: float = 1.64
+) -> MonthEndForecast:
+    """
+    기준일(dates의 마지막 날)이 속한 달의 월말 총 비용을 예측합니다.
+
+    Args:
+        keys: 서비스 키 목록 (history 행 순서)
+        history: [서비스 수, 날짜 수] 일별 금액
+        dates: history 열의 날짜 (오름차순, history_dates 결과)
+        interval_z: 예측 구간 폭 (표준편차 배수)
+
+    Returns:
+        MonthEndForecast
+    """
+    as_of = dates[-1]
+    month = month_of(as_of)
+    in_month = np.fromiter((d[:6] == month for d in dates), dtype=bool, count=len(dates))
+    actual = history[:, in_month].sum(axis=1)
+
+    as_of_dt = datetime.strptime(as_of, "%Y%m%d")
+    remaining_days = calendar.monthrange(as_of_dt.year, as_of_dt.month)[1] - as_of_dt.day
+
+    with metrics.timer("forecast_fit_seconds"):
+        model = fit(history)
+        remaining = predict_days(model, remaining_days).sum(axis=1)
+        remaining_std = remaining_sum_std(model, remaining_days)
+    forecast = actual + remaining
+    metrics.inc("forecast_services_total", len(keys))
+
+    return MonthEndForecast(
+        as_of=as_of,
+        month=month,
+        keys=keys,
+        actual=actual,
+        forecast=forecast,
+        lower=actual + np.maximum(remaining - interval_z * remaining_std, 0.0),
+        upper=forecast + interval_z * remaining_std,
+        remaining_std=remaining_std,
+        slope=model.slope,
+        remaining_days=remaining_days,
+        history_days=len(dates),
+        interval_z=interval_z,
+    )
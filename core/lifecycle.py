@@ -0,0 +1,200 @@
+"""
+데이터 보관 정책(lifecycle) 모듈
+
+- 보관 기간이 지난 문서를 월 단위 gzip JSON Lines 파트로 Object Storage에 아카이브한 뒤 삭제
+- 아카이브가 필요 없는 컬렉션은 createdAt TTL 인덱스로 자동 만료
+- 선택적으로 삭제 후 compact 실행
+
+아카이브는 "업로드 → manifest 기록 → 삭제" 순서로 진행하므로,
+중간에 실패해도 MongoDB에서 데이터가 먼저 사라지는 일은 없습니다.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from pymongo import ASCENDING
+from pymongo.database import Database
+from pymongo.errors import OperationFailure
+
+from config.settings import LifecycleSettings, ObjectStorageSettings
+from infra.archive import write_archive_part
+from infra.transfer import ObjectTransferManager
+
+
+TTL_INDEX_NAME = "ttl_createdAt"
+
+
+@dataclass
+class ArchiveResult:
+    """컬렉션별 아카이브 결과"""
+    collection: str
+    cutoff_date: str
+    archived: int
+    deleted: int
+    parts: List[str]
+
+
+def cutoff_date_for(retention_days: int, today: Optional[datetime] = None) -> str:
+    """
+    보관 기간 기준 날짜(YYYYMMDD)를 반환합니다. 이 날짜보다 이전(date < cutoff) 문서가 대상입니다.
+    """
+    today = today or datetime.utcnow()
+    return (today - timedelta(days=retention_days)).strftime("%Y%m%d")
+
+
+def archive_collection(
+    db: Database,
+    collection: str,
+    retention_days: int,
+    object_storage: ObjectStorageSettings,
+    prefix: str = "archive",
+    batch_size: int = 5000,
+    today: Optional[datetime] = None,
+    dry_run: bool = False
+) -> ArchiveResult:
+    """
+    보관 기간이 지난 문서를 아카이브하고 삭제합니다.
+
+    Args:
+        db: Database 인스턴스
+        collection: 대상 컬렉션 (date 필드 YYYYMMDD 필요)
+        retention_days: 보관 기간(일)
+        object_storage: Object Storage 설정
+        prefix: 아카이브 key prefix
+        batch_size: 파트 1개당 최대 문서 수
+        today: 기준 시각 (테스트/재처리용, 기본값: 현재)
+        dry_run: True면 대상 건수만 계산
+
+    Returns:
+        ArchiveResult
+    """
+    cutoff = cutoff_date_for(retention_days, today)
+    query = {"date": {"$lt": cutoff}}
+    coll = db[collection]
+
+    if dry_run:
+        return ArchiveResult(collection, cutoff, coll.count_documents(query), 0, [])
+
+    archived = 0
+    deleted = 0
+    parts: List[str] = []
+    batch: List[Dict] = []
+    # 업로드 중인 파트 (future, 문서 _id 목록) - 제출 순서대로 완료를 확인합니다.
+    in_flight = deque()
+
+    def settle(limit: int):
+        nonlocal archived, deleted
+        while len(in_flight) > limit:
+            future, ids = in_flight.popleft()
+            parts.append(future.result())
+            archived += len(ids)
+            # 업로드/manifest 기록이 끝난 뒤에만 삭제합니다.
+            result = coll.delete_many({"_id": {"$in": ids}})
+            deleted += result.deleted_count
+
+    with ObjectTransferManager(object_storage) as transfer:
+        def flush():
+            nonlocal batch
+            if not batch:
+                return
+            # 다음 파트를 읽는 동안 업로드가 병렬로 진행됩니다.
+            future = transfer.submit(write_archive_part, db, collection, batch, object_storage, prefix)
+            in_flight.append((future, [doc["_id"] for doc in batch]))
+            batch = []
+            settle(transfer.workers)
+
+        cursor = coll.find(query).sort([("date", ASCENDING), ("_id", ASCENDING)]).batch_size(batch_size)
+        current_month = None
+        for doc in cursor:
+            month = str(doc.get("date", ""))[:6]
+            # 파트는 월 단위로 끊어서 manifest 조회 범위를 좁힙니다.
+            if batch and (month != current_month or len(batch) >= batch_size):
+                flush()
+            current_month = month
+            batch.append(doc)
+        flush()
+        settle(0)
+
+    return ArchiveResult(collection, cutoff, archived, deleted, parts)
+
+
+def apply_ttl_indexes(db: Database, ttl_days: Dict[str, int]) -> List[str]:
+    """
+    createdAt 기준 TTL 인덱스를 생성하거나 만료 시간을 갱신합니다.
+
+    Args:
+        db: Database 인스턴스
+        ttl_days: {컬렉션: 보관 일수}
+
+    Returns:
+        적용된 컬렉션 이름 리스트
+    """
+    applied = []
+    for collection, days in ttl_days.items():
+        seconds = int(days) * 24 * 60 * 60
+        try:
+            db[collection].create_index(
+                [("createdAt", ASCENDING)],
+                expireAfterSeconds=seconds,
+                name=TTL_INDEX_NAME
+            )
+        except OperationFailure:
+            # 이미 다른 만료 시간으로 존재하면 collMod로 변경합니다.
+            db.command(
+                "collMod",
+                collection,
+                index={"name": TTL_INDEX_NAME, "expireAfterSeconds": seconds}
+            )
+        applied.append(collection)
+    return applied
+
+
+def compact_collection(db: Database, collection: str) -> bool:
+    """
+    compact 명령으로 삭제된 공간을 회수합니다. (권한/엔진에 따라 실패할 수 있음)
+
+    Returns:
+        성공 여부
+    """
+    try:
+        db.command("compact", collection)
+        return True
+    except OperationFailure:
+        return False
+
+
+def run_lifecycle(
+    db: Database,
+    lifecycle: LifecycleSettings,
+    object_storage: ObjectStorageSettings,
+    today: Optional[datetime] = None,
+    dry_run: bool = False
+) -> List[ArchiveResult]:
+    """
+    설정된 보관 정책 전체(아카이브, TTL, compact)를 실행합니다.
+
+    Returns:
+        컬렉션별 ArchiveResult 리스트
+    """
+    results = []
+    for collection, days in lifecycle.retention_days.items():
+        result = archive_collection(
+            db,
+            collection,
+            days,
+            object_storage,
+            prefix=lifecycle.archive_prefix,
+            batch_size=lifecycle.batch_size,
+            today=today,
+            dry_run=dry_run
+        )
+        results.append(result)
+        if lifecycle.compact and result.deleted and not dry_run:
+            compact_collection(db, collection)
+
+    if lifecycle.ttl_days and not dry_run:
+        apply_ttl_indexes(db, lifecycle.ttl_days)
+
+    return results
@@ -4,11 +4,24 @@
 이 모듈은 Billing Job에서 사용하는 공통 로거를 제공합니다.
 특히 Kakao Cloud 모니터링 에이전트가 수집하는 `/var/log/syslog`로
 이상치 로그를 보내기 위해 Syslog 핸들러를 구성합니다.
+
+- Job 스레드는 레코드를 큐에 넣기만 하고(QueueHandler), syslog/콘솔 쓰기는
+  백그라운드 스레드(QueueListener)가 처리합니다. 이상치가 한꺼번에 많이 나와도 탐지/저장이 느려지지 않습니다.
+- 큐가 가득 차면 INFO 이하 레코드만 버리고 log_records_dropped_total 카운터(core.metrics)를 올립니다. (처음 한 번 경고 출력)
+  WARNING 이상([BILLING_ANOMALY], [BILLING_BUDGET] 등 Alert Center 연동 로그)은 큐 크기와 관계없이 항상 넣습니다.
+- 프로세스 종료 시(atexit) 큐에 남은 레코드를 모두 쓴 뒤 종료합니다.
+- logging.format: "text"(기본, Alert Center 키워드 한 줄) | "json"(구조화된 JSON 한 줄)
 """
 
+import atexit
+import json
 import logging
-from logging.handlers import SysLogHandler
+import queue
+import re
+import threading
+from logging.handlers import QueueHandler, QueueListener, SysLogHandler
 from datetime import datetime
+from typing import Optional
 try:
     # Python 3.9+
     from zoneinfo import ZoneInfo
@@ -16,9 +29,21 @@ except ImportError:  # pragma: no cover
     # Python 3.8 (e.g., Ubuntu 20.04 기본 python3)
     from backports.zoneinfo import ZoneInfo
 
+from config.settings import LoggingSettings
+from core import metrics
+
 
 LOGGER_NAME = "billing_alert"
 
+# 레코드마다 tz 데이터베이스를 조회하지 않도록 한 번만 만듭니다.
+KST = ZoneInfo("Asia/Seoul")
+
+# 메시지 앞의 Alert Center 키워드 (예: "[BILLING_ANOMALY] ...")
+_EVENT_PATTERN = re.compile(r"^\[([A-Z0-9_]+)\]\s*")
+
+_LISTENERS = {}
+_LISTENERS_LOCK = threading.Lock()
+
 
 class KSTFormatter(logging.Formatter):
     """
@@ -27,19 +52,93 @@ class KSTFormatter(logging.Formatter):
 
     def formatTime(self, record, datefmt=None):
         # record.created (epoch seconds)를 KST로 변환
-        dt = datetime.fromtimestamp(record.created, ZoneInfo("Asia/Seoul"))
+        dt = datetime.fromtimestamp(record.created, KST)
         if datefmt:
             return dt.strftime(datefmt)
         # 기본 포맷과 비슷하게: YYYY-MM-DD HH:MM:SS,mmm
         return dt.strftime("%Y-%m-%d %H:%M:%S,%f")[:-3]
 
 
-def get_logger(name: str = LOGGER_NAME) -> logging.Logger:
+class JsonFormatter(KSTFormatter):
+    """
+    레코드를 JSON 한 줄로 출력하는 Formatter.
+
+    메시지 앞의 [KEYWORD]는 event 필드로 분리하고,
+    logger.info(..., extra={"fields": {...}})로 넘긴 값을 그대로 포함합니다.
+    """
+
+    def format(self, record):
+        message = record.getMessage()
+        match = _EVENT_PATTERN.match(message)
+        doc = {
+            "ts": datetime.fromtimestamp(record.created, KST).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": match.group(1) if match else None,
+            "message": message[match.end():] if match else message,
+        }
+        fields = getattr(record, "fields", None)
+        if isinstance(fields, dict):
+            doc.update(fields)
+        if record.exc_info:
+            doc["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            doc["exception"] = record.exc_text
+        return json.dumps(doc, ensure_ascii=False, default=str)
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """
+    포맷팅 없이 레코드만 큐에 넣는 QueueHandler.
+    (포맷팅은 listener 쪽 핸들러가 하고, 대기 레코드가 max_size개 이상이면 INFO 이하 레코드는 기다리지 않고 버립니다)
+
+    큐 자체는 무제한으로 두어, 종료 시 listener의 종료 신호(sentinel)와 WARNING 이상 레코드는 항상 들어가도록 합니다.
+    """
+
+    def __init__(self, records: queue.Queue, max_size: int = 0):
+        super().__init__(records)
+        self.max_size = max_size
+        self._warned = False
+
+    def prepare(self, record):
+        # 다른 스레드에서 안전하게 쓰도록 메시지 인자만 미리 합치고, 예외는 문자열로 바꿉니다.
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        if record.levelno < logging.WARNING and self.max_size and self.queue.qsize() >= self.max_size:
+            metrics.inc("log_records_dropped_total")
+            if not self._warned:
+                self._warned = True
+                print(f"⚠️ 로그 큐가 가득 차 INFO 이하 로그를 버립니다. (logging.queueSize={self.max_size}, WARNING 이상은 유지)")
+            return
+        self.queue.put_nowait(record)
+
+
+def _build_formatter(settings: LoggingSettings) -> logging.Formatter:
+    if settings.format == "json":
+        return JsonFormatter()
+    # Alert Center에서 사용하기 위해, 최종 로그 라인은 message 본문만 남기도록 설정
+    # (예: "[BILLING_ANOMALY] {domain}/{project} 프로젝트의 {service} 비용이 ...")
+    return KSTFormatter("%(message)s")
+
+
+def get_logger(name: str = LOGGER_NAME, settings: Optional[LoggingSettings] = None) -> logging.Logger:
     """
     공통 로거를 반환합니다.
 
     - Syslog 핸들러를 통해 /var/log/syslog 에 로그를 남기도록 시도합니다.
     - 개발 환경 등에서 /dev/log 가 없을 경우, 콘솔 출력만 동작합니다.
+    - 실제 쓰기는 백그라운드 listener 스레드에서 수행합니다.
+
+    Args:
+        name: 로거 이름
+        settings: 로깅 설정 (처음 호출할 때만 적용, None이면 기본값)
     """
     logger = logging.getLogger(name)
 
@@ -47,26 +146,50 @@ def get_logger(name: str = LOGGER_NAME) -> logging.Logger:
     if logger.handlers:
         return logger
 
-    logger.setLevel(logging.INFO)
-
-    # Alert Center에서 사용하기 위해, 최종 로그 라인은 message 본문만 남기도록 설정
-    # (예: "[BILLING_ANOMALY] {domain}/{project} 프로젝트의 {service} 비용이 ...")
-    formatter = KSTFormatter("%(message)s")
-
-    # Syslog 핸들러 설정 (/dev/log는 대부분의 Linux 배포판에서 syslog 소켓)
-    try:
-        syslog_handler = SysLogHandler(address="/dev/log")
-        syslog_handler.setFormatter(formatter)
-        logger.addHandler(syslog_handler)
-    except OSError:
-        # 로컬 개발 환경(macOS 등)에서 /dev/log가 없을 수 있으므로 무시
-        pass
-
-    # 콘솔 출력용 핸들러도 함께 추가
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(formatter)
-    logger.addHandler(stream_handler)
+    with _LISTENERS_LOCK:
+        if logger.handlers:
+            return logger
+        settings = settings or LoggingSettings()
+        logger.setLevel(logging.INFO)
+        formatter = _build_formatter(settings)
+        handlers = []
+
+        # Syslog 핸들러 설정 (/dev/log는 대부분의 Linux 배포판에서 syslog 소켓)
+        try:
+            syslog_handler = SysLogHandler(address="/dev/log")
+            syslog_handler.setFormatter(formatter)
+            handlers.append(syslog_handler)
+        except OSError:
+            # 로컬 개발 환경(macOS 등)에서 /dev/log가 없을 수 있으므로 무시
+            pass
+
+        # 콘솔 출력용 핸들러도 함께 추가
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        handlers.append(stream_handler)
+
+        records: queue.Queue = queue.Queue()
+        listener = QueueListener(records, *handlers, respect_handler_level=True)
+        listener.start()
+        _LISTENERS[name] = listener
+        logger.addHandler(_NonBlockingQueueHandler(records, max(0, settings.queue_size)))
+        # 상위 로거로 전파되면 같은 줄이 다른 핸들러로 동기 출력되므로 막습니다.
+        logger.propagate = False
 
     return logger
 
 
+def shutdown_logging() -> None:
+    """큐에 남은 레코드를 모두 쓰고 listener 스레드를 종료합니다. (종료 시 자동 호출)"""
+    with _LISTENERS_LOCK:
+        for name, listener in list(_LISTENERS.items()):
+            listener.stop()
+            logger = logging.getLogger(name)
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+            for handler in listener.handlers:
+                handler.close()
+            del _LISTENERS[name]
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,326 @@
+"""
+Job 계측(metrics) 모듈
+
+core/ · infra/ 코드에서 카운터, 히스토그램(타이머)을 기록하고,
+Job 실행 1회 단위로 모아 Prometheus textfile / job_runs 컬렉션으로 내보냅니다.
+
+- 값은 프로세스 전체 레지스트리(REGISTRY)와, 현재 실행 중인 Job run(있으면)에 함께 기록됩니다.
+  Job run은 contextvars로 전달되므로, 파이프라인 단계/테넌트 스레드에서도 각자의 run에 기록됩니다.
+- 행 단위 루프 안에서는 호출하지 않고, 페이지/배치/함수 호출 단위로 한 번씩 기록합니다.
+  (기록 1회 = lock 1번 + dict 갱신, 수 µs 이하)
+
+사용 예:
+    from core import metrics
+
+    metrics.inc("billing_api_pages_total")
+    with metrics.timer("mongo_write_batch_seconds", collection="billing_daily"):
+        collection.bulk_write(operations)
+
+    with metrics.job_run("hourly", "20250101-10") as run:
+        ...
+    run.to_dict()
+"""
+
+import bisect
+import contextvars
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+# 초 단위 히스토그램 기본 bucket (API 페이지, Mongo 배치, 단계 소요 시간 등)
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _key(name: str, labels: Dict[str, Any]) -> MetricKey:
+    if not labels:
+        return name, ()
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Histogram:
+    """누적 bucket 히스토그램 (count/sum/min/max 포함)"""
+
+    __slots__ = ("buckets", "counts", "count", "sum", "min", "max")
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Prometheus _bucket 형식의 (le, 누적 count) 목록"""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((f"{bound:g}", total))
+        result.append(("+Inf", self.count))
+        return result
+
+
+class MetricsRegistry:
+    """스레드 안전한 카운터/게이지/히스토그램 저장소"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Dict[MetricKey, float] = {}
+        self.gauges: Dict[MetricKey, float] = {}
+        self.histograms: Dict[MetricKey, Histogram] = {}
+
+    def inc(self, key: MetricKey, value: float) -> None:
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set(self, key: MetricKey, value: float) -> None:
+        with self._lock:
+            self.gauges[key] = value
+
+    def observe(self, key: MetricKey, value: float) -> None:
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 저장용 요약 ({"counters": {"name{a=b}": v}, "histograms": {...}})"""
+        def label(key: MetricKey) -> str:
+            name, labels = key
+            if not labels:
+                return name
+            return name + "{" + ",".join(f"{k}={v}" for k, v in labels) + "}"
+
+        with self._lock:
+            return {
+                "counters": {label(k): v for k, v in sorted(self.counters.items())},
+                "gauges": {label(k): v for k, v in sorted(self.gauges.items())},
+                "histograms": {
+                    label(k): {
+                        "count": h.count,
+                        "sum": round(h.sum, 6),
+                        "min": h.min,
+                        "max": h.max,
+                    }
+                    for k, h in sorted(self.histograms.items())
+                },
+            }
+
+
+# 프로세스 전체 누적값 (상주 스케줄러에서 여러 실행에 걸쳐 누적)
+REGISTRY = MetricsRegistry()
+
+_CURRENT_RUN: contextvars.ContextVar[Optional["JobRun"]] = contextvars.ContextVar("billing_job_run", default=None)
+
+
+class JobRun:
+    """Job 실행 1회의 계측 결과"""
+
+    def __init__(self, job: str, run_key: str, tenant: Optional[str] = None):
+        self.job = job
+        self.run_key = run_key
+        self.tenant = tenant
+        self.registry = MetricsRegistry()
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.status = "running"
+        self.error: Optional[str] = None
+        self.stages: Dict[str, float] = {}
+
+    @property
+    def duration(self) -> float:
+        return (self.finished_at or time.time()) - self.started_at
+
+    def finish(self, status: str, error: Optional[BaseException] = None, stages: Optional[Dict[str, float]] = None):
+        """
+        실행 결과를 기록합니다.
+
+        Args:
+            status: success | failed | skipped
+            error: 실패 원인 예외
+            stages: 단계별 소요 시간(초) (PipelineResult.timings)
+        """
+        self.finished_at = time.time()
+        self.status = status
+        self.error = str(error)[:1000] if error is not None else None
+        if stages:
+            self.stages = {name: round(seconds, 4) for name, seconds in stages.items()}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job": self.job,
+            "runKey": self.run_key,
+            "tenant": self.tenant,
+            "status": self.status,
+            "error": self.error,
+            "startedAt": self.started_at,
+            "finishedAt": self.finished_at,
+            "durationSeconds": round(self.duration, 4),
+            "stages": self.stages,
+            **self.registry.to_dict(),
+        }
+
+
+def inc(name: str, value: float = 1, **labels) -> None:
+    """카운터를 증가시킵니다."""
+    key = _key(name, labels)
+    REGISTRY.inc(key, value)
+    run = _CURRENT_RUN.get()
+    if run is not None:
+        run.registry.inc(key, value)
+
+
+def set_gauge(name: str, value: float, **labels) -> None:
+    """게이지 값을 설정합니다."""
+    key = _key(name, labels)
+    REGISTRY.set(key, value)
+    run = _CURRENT_RUN.get()
+    if run is not None:
+        run.registry.set(key, value)
+
+
+def observe(name: str, value: float, **labels) -> None:
+    """히스토그램에 값을 기록합니다. (초 단위 소요 시간 등)"""
+    key = _key(name, labels)
+    REGISTRY.observe(key, value)
+    run = _CURRENT_RUN.get()
+    if run is not None:
+        run.registry.observe(key, value)
+
+
+@contextmanager
+def timer(name: str, **labels) -> Iterator[None]:
+    """블록 실행 시간(초)을 히스토그램에 기록합니다. (예외가 나도 기록)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - started, **labels)
+
+
+def current_run() -> Optional[JobRun]:
+    """현재 컨텍스트의 Job run (없으면 None)"""
+    return _CURRENT_RUN.get()
+
+
+@contextmanager
+def job_run(job: str, run_key: str, tenant: Optional[str] = None) -> Iterator[JobRun]:
+    """
+    블록 안에서 기록되는 값을 Job run 1회로 모읍니다.
+
+    스레드로 작업을 넘길 때는 contextvars.copy_context().run 으로 실행해야 같은 run에 기록됩니다.
+    (core.pipeline의 단계 실행은 이미 그렇게 실행)
+    """
+    run = JobRun(job, run_key, tenant)
+    token = _CURRENT_RUN.set(run)
+    try:
+        yield run
+    finally:
+        _CURRENT_RUN.reset(token)
+        if run.finished_at is None:
+            run.finish("failed" if run.status == "running" else run.status)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Tuple[Tuple[str, str], ...], extra: Dict[str, str], le: Optional[str] = None) -> str:
+    items = list(extra.items()) + list(labels)
+    if le is not None:
+        items.append(("le", le))
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in items) + "}"
+
+
+def render_prometheus(run: JobRun, prefix: str = "billing") -> str:
+    """
+    Job run 1회를 Prometheus text exposition 형식으로 변환합니다.
+
+    textfile collector는 파일 내용을 그대로 노출하므로, 카운터도 "마지막 실행의 값"을 게이지로 내보냅니다.
+    """
+    extra = {"job": run.job}
+    if run.tenant:
+        extra["tenant"] = run.tenant
+    lines: List[str] = []
+
+    def header(name: str, kind: str, help_text: str) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    header(f"{prefix}_job_last_run_timestamp_seconds", "gauge", "마지막 실행 종료 시각")
+    lines.append(f"{prefix}_job_last_run_timestamp_seconds{_labels((), extra)} {run.finished_at or time.time():.3f}")
+    header(f"{prefix}_job_last_run_duration_seconds", "gauge", "마지막 실행 소요 시간")
+    lines.append(f"{prefix}_job_last_run_duration_seconds{_labels((), extra)} {run.duration:.4f}")
+    header(f"{prefix}_job_last_run_success", "gauge", "마지막 실행 성공 여부 (skipped 포함 1)")
+    lines.append(f"{prefix}_job_last_run_success{_labels((), extra)} {0 if run.status == 'failed' else 1}")
+
+    if run.stages:
+        name = f"{prefix}_job_stage_seconds"
+        header(name, "gauge", "마지막 실행의 단계별 소요 시간")
+        for stage, seconds in sorted(run.stages.items()):
+            lines.append(f"{name}{_labels((('stage', stage),), extra)} {seconds}")
+
+    registry = run.registry
+    with registry._lock:
+        counters = sorted(registry.counters.items())
+        gauges = sorted(registry.gauges.items())
+        histograms = sorted(registry.histograms.items())
+
+    seen = set()
+    for (metric, labels), value in counters + gauges:
+        name = f"{prefix}_{metric}"
+        if name not in seen:
+            seen.add(name)
+            header(name, "gauge", "마지막 실행 값")
+        lines.append(f"{name}{_labels(labels, extra)} {value:g}")
+
+    for (metric, labels), histogram in histograms:
+        name = f"{prefix}_{metric}"
+        if name not in seen:
+            seen.add(name)
+            header(name, "histogram", "마지막 실행 분포")
+        for le, count in histogram.cumulative():
+            lines.append(f"{name}_bucket{_labels(labels, extra, le)} {count}")
+        lines.append(f"{name}_sum{_labels(labels, extra)} {histogram.sum:.6f}")
+        lines.append(f"{name}_count{_labels(labels, extra)} {histogram.count}")
+
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(directory: str, run: JobRun, prefix: str = "billing") -> str:
+    """
+    node_exporter textfile collector 디렉토리에 Job run 결과를 씁니다.
+    (임시 파일에 쓴 뒤 rename하여, 수집 중에 절반만 쓰인 파일이 읽히지 않도록 함)
+
+    Args:
+        directory: textfile collector 디렉토리
+        run: Job run
+        prefix: metric 이름 접두어
+
+    Returns:
+        작성한 파일 경로 (billing_{job}[_{tenant}].prom)
+    """
+    os.makedirs(directory, exist_ok=True)
+    name = f"{prefix}_{run.job}" + (f"_{run.tenant}" if run.tenant else "")
+    path = os.path.join(directory, f"{name}.prom")
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(render_prometheus(run, prefix))
+    os.replace(tmp_path, path)
+    return path
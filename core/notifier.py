@@ -1,11 +1,247 @@
 """
 알림 발송 모듈
+
+Hourly Job이 notification_outbox(infra/notification_outbox.py)에 쌓은 이상치 알림을 채널(webhook)별로 발송합니다.
+
+- 채널마다 이번에 발송할 알림을 digest 메시지 1건으로 묶습니다. (상위 digest_max_items개는 자세히, 나머지는 건수)
+- 채널은 dispatch_workers개 스레드에서 동시에 발송하며, HTTP 세션(keep-alive 커넥션 풀)은 프로세스 전체에서 공유합니다.
+- webhook마다 rate limiter(토큰 버킷)로 초당 발송 수를 제한하고, 429 응답의 Retry-After를 따릅니다.
+- 실행 안에서 SEND_RETRIES번까지 바로 재시도하고, 그래도 실패하면 outbox에 backoff 시각을 기록해
+  다음 실행의 dispatcher가 다시 보냅니다.
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
 import requests
-from typing import Optional
+from pymongo.collection import Collection
+from requests.adapters import HTTPAdapter
 
+from config.settings import AlertChannelSettings, AlertSettings
+from core import metrics
 from core.anomaly_detector import AnomalyRecord
+from core.billing_client import RateLimiter
+from infra.job_lock import default_owner
+from infra.notification_outbox import claim_notifications, mark_failed_attempt, mark_sent
+
+
+# 실행 안에서 바로 재시도하는 횟수 (429/5xx/연결 오류)
+SEND_RETRIES = 3
+# Retry-After 최대 대기(초) - 이보다 길면 outbox backoff로 넘깁니다.
+MAX_RETRY_AFTER_SECONDS = 30
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+# webhook URL별 rate limiter (여러 테넌트/스레드가 같은 webhook을 쓰면 공유)
+_LIMITERS: Dict[str, RateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+class WebhookError(Exception):
+    """webhook 발송 실패"""
+
+
+def get_webhook_session() -> requests.Session:
+    """
+    webhook 발송용 HTTP 세션을 반환합니다. (처음 호출 시 생성)
+
+    Returns:
+        requests.Session
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSION = session
+        return _SESSION
+
+
+def get_webhook_limiter(url: str, rate_per_second: float) -> Optional[RateLimiter]:
+    """webhook URL별 공유 rate limiter (0 이하면 제한 없음)"""
+    if not rate_per_second or rate_per_second <= 0:
+        return None
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(url)
+        if limiter is None or limiter.rate != rate_per_second:
+            limiter = _LIMITERS[url] = RateLimiter(rate_per_second)
+        return limiter
+
+
+def post_webhook(
+    url: str,
+    payload: Dict[str, Any],
+    timeout: float = 5.0,
+    limiter: Optional[RateLimiter] = None,
+    session: Optional[requests.Session] = None
+) -> None:
+    """
+    webhook에 JSON을 POST합니다. (429/5xx/연결 오류는 SEND_RETRIES번까지 재시도)
+
+    Args:
+        url: webhook URL
+        payload: 요청 본문
+        timeout: 요청 타임아웃 (초)
+        limiter: rate limiter
+        session: HTTP 세션 (None이면 공유 세션)
+
+    Raises:
+        WebhookError: 재시도 후에도 실패한 경우, 또는 재시도해도 소용없는 4xx 응답
+    """
+    session = session or get_webhook_session()
+    last_error = ""
+    for attempt in range(SEND_RETRIES):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            response = session.post(url, json=payload, timeout=timeout)
+        except requests.exceptions.RequestException as e:
+            last_error = str(e)
+            delay = 0.5 * 2 ** attempt
+        else:
+            if response.status_code < 300:
+                return
+            last_error = f"HTTP {response.status_code}: {response.text[:200]}"
+            if response.status_code == 429:
+                metrics.inc("notification_throttled_total")
+                delay = float(response.headers.get("Retry-After") or 2 ** attempt)
+                if delay > MAX_RETRY_AFTER_SECONDS:
+                    break
+            elif response.status_code >= 500:
+                delay = 0.5 * 2 ** attempt
+            else:
+                break
+        if attempt < SEND_RETRIES - 1:
+            time.sleep(delay)
+    raise WebhookError(last_error)
+
+
+def format_digest(payloads: List[Dict[str, Any]], max_items: int = 20) -> str:
+    """
+    이상치 여러 건을 Slack 메시지 1건으로 만듭니다. (기준 평균 대비 증가 금액이 큰 순)
+
+    Args:
+        payloads: 이상치 dict 리스트 (anomaly_to_dict)
+        max_items: 자세히 표시할 최대 개수
+
+    Returns:
+        Slack mrkdwn 텍스트
+    """
+    ordered = sorted(
+        payloads,
+        key=lambda p: float(p.get("observedAmount") or 0) - float(p.get("baselineMean") or 0),
+        reverse=True
+    )
+    periods = sorted({f"{p['date'][:4]}-{p['date'][4:6]}-{p['date'][6:8]} {int(p['hour']):02d}:00" for p in payloads})
+    period = periods[0] if len(periods) == 1 else f"{periods[0]} ~ {periods[-1]}"
+    lines = [f"🚨 *Billing Anomaly Detected* - {len(payloads)}건 ({period})", ""]
+    for p in ordered[:max_items]:
+        lines.append(
+            f"• *{p.get('domainName')}/{p.get('projectName')}* {p.get('serviceName')}: "
+            f"{float(p.get('observedAmount') or 0):,.0f}원 "
+            f"(평균 {float(p.get('baselineMean') or 0):,.0f}원, "
+            f"{float(p.get('deviationRatio') or 0):.1f}x, z {float(p.get('zScore') or 0):.1f})"
+        )
+    if len(ordered) > max_items:
+        lines.append(f"… 외 {len(ordered) - max_items}건")
+    return "\n".join(lines)
+
+
+@dataclass
+class ChannelResult:
+    """채널 1개의 발송 결과"""
+    channel: str
+    claimed: int = 0
+    sent: int = 0
+    failed: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class DispatchResult:
+    """dispatcher 1회 실행 결과"""
+    channels: List[ChannelResult] = field(default_factory=list)
+
+    @property
+    def sent(self) -> int:
+        return sum(c.sent for c in self.channels)
+
+    @property
+    def retrying(self) -> int:
+        return sum(c.claimed - c.sent - c.failed for c in self.channels)
+
+    @property
+    def failed(self) -> int:
+        return sum(c.failed for c in self.channels)
+
+
+class NotificationDispatcher:
+    """
+    outbox의 알림을 채널별 digest로 묶어 동시에 발송하는 dispatcher
+
+    사용 예:
+        dispatcher = NotificationDispatcher(settings.alert, db[NOTIFICATION_OUTBOX_COLLECTION])
+        result = dispatcher.dispatch()
+    """
+
+    def __init__(
+        self,
+        alert: AlertSettings,
+        collection: Collection,
+        tenant: Optional[str] = None,
+        session: Optional[requests.Session] = None
+    ):
+        self.alert = alert
+        self.collection = collection
+        self.tenant = tenant
+        self.session = session
+        self.owner = default_owner()
+
+    def dispatch(self) -> DispatchResult:
+        """발송 대상 알림을 모든 채널로 발송합니다."""
+        channels = self.alert.all_channels()
+        if not channels:
+            return DispatchResult()
+        workers = max(1, min(self.alert.dispatch_workers, len(channels)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notify") as executor:
+            return DispatchResult(list(executor.map(self._dispatch_channel, channels)))
+
+    def _dispatch_channel(self, channel: AlertChannelSettings) -> ChannelResult:
+        result = ChannelResult(channel.name)
+        docs = claim_notifications(self.collection, channel.name, self.owner, tenant=self.tenant)
+        result.claimed = len(docs)
+        if not docs:
+            return result
+
+        text = format_digest([doc["payload"] for doc in docs], self.alert.digest_max_items)
+        try:
+            with metrics.timer("notification_send_seconds", channel=channel.name):
+                post_webhook(
+                    channel.webhook_url,
+                    {"text": text},
+                    timeout=self.alert.timeout_seconds,
+                    limiter=get_webhook_limiter(channel.webhook_url, channel.rate_limit_per_second),
+                    session=self.session
+                )
+        except WebhookError as e:
+            result.error = str(e)
+            result.failed = mark_failed_attempt(
+                self.collection, docs, str(e), self.alert.max_attempts, self.alert.retry_base_seconds
+            )
+            metrics.inc("notification_failures_total", channel=channel.name)
+            return result
+
+        mark_sent(self.collection, [doc["_id"] for doc in docs])
+        result.sent = len(docs)
+        metrics.inc("notification_messages_total", channel=channel.name)
+        metrics.inc("notifications_sent_total", len(docs), channel=channel.name)
+        return result
 
 
 def send_slack_alert(
@@ -14,45 +250,36 @@ def send_slack_alert(
     timeout: int = 5
 ) -> bool:
     """
-    Slack Webhook을 통해 이상치 알림을 발송합니다.
-    
+    Slack Webhook을 통해 이상치 알림 1건을 바로 발송합니다. (outbox를 거치지 않는 수동 발송용)
+
     Args:
         anomaly: 이상치 기록
         webhook_url: Slack Webhook URL
         timeout: 요청 타임아웃 (초)
-    
+
     Returns:
         발송 성공 여부
     """
     if not webhook_url or not webhook_url.strip():
         return False
-    
+
+    # Slack 메시지 구성
+    text = (
+        f"🚨 *Billing Anomaly Detected*\n\n"
+        f"*Date/Time:* {anomaly.date} {anomaly.hour:02d}:00\n"
+        f"*Domain:* {anomaly.domain_name} ({anomaly.domain_id[:8]}...)\n"
+        f"*Project:* {anomaly.project_name} ({anomaly.project_id[:8]}...)\n"
+        f"*Service:* {anomaly.service_name} ({anomaly.service_id})\n\n"
+        f"*Observed Amount:* {anomaly.observed_amount:,.2f}\n"
+        f"*Baseline Mean:* {anomaly.baseline_mean:,.2f}\n"
+        f"*Z-Score:* {anomaly.z_score:.2f}\n"
+        f"*Deviation Ratio:* {anomaly.deviation_ratio:.2f}x\n\n"
+        f"*Threshold:* Z-Score >= {anomaly.threshold_z} or Ratio >= {anomaly.threshold_ratio}x"
+    )
+
     try:
-        # Slack 메시지 구성
-        text = (
-            f"🚨 *Billing Anomaly Detected*\n\n"
-            f"*Date/Time:* {anomaly.date} {anomaly.hour:02d}:00\n"
-            f"*Domain:* {anomaly.domain_name} ({anomaly.domain_id[:8]}...)\n"
-            f"*Project:* {anomaly.project_name} ({anomaly.project_id[:8]}...)\n"
-            f"*Service:* {anomaly.service_name} ({anomaly.service_id})\n\n"
-            f"*Observed Amount:* {anomaly.observed_amount:,.2f}\n"
-            f"*Baseline Mean:* {anomaly.baseline_mean:,.2f}\n"
-            f"*Z-Score:* {anomaly.z_score:.2f}\n"
-            f"*Deviation Ratio:* {anomaly.deviation_ratio:.2f}x\n\n"
-            f"*Threshold:* Z-Score >= {anomaly.threshold_z} or Ratio >= {anomaly.threshold_ratio}x"
-        )
-        
-        payload = {"text": text}
-        
-        response = requests.post(
-            webhook_url,
-            json=payload,
-            timeout=timeout
-        )
-        response.raise_for_status()
+        post_webhook(webhook_url, {"text": text}, timeout=timeout)
         return True
-    
-    except Exception as e:
+    except WebhookError as e:
         print(f"⚠️ Slack 알림 발송 실패: {e}")
         return False
-
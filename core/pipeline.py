@@ -0,0 +1,255 @@
+"""
+단계(stage) 기반 Job 파이프라인 모듈
+
+Hourly / Daily Job을 "fetch → archive → aggregate → persist → baseline → detect → notify" 같은
+단계의 조합으로 정의합니다.
+
+- 각 단계는 필요한 입력(requires)과 만들어 내는 출력(provides)의 이름을 선언합니다.
+  단계 함수는 requires 값을 키워드 인자로 받고, provides 키를 가진 dict를 반환합니다.
+- 입력이 모두 준비된 단계는 바로 시작하므로, 서로 의존하지 않는 단계
+  (예: Raw 업로드와 MongoDB 저장, API 호출과 MongoDB 연결)는 병렬로 실행됩니다.
+- 데이터 의존은 없지만 순서가 필요한 경우 after에 앞 단계 이름을 지정합니다.
+- 단계별 소요 시간을 기록하고, 마지막에 요약을 출력합니다.
+- 단계에서 StopPipeline을 발생시키면 (변경 없음 등) 이후 단계를 시작하지 않고 정상 종료합니다.
+- checkpoint를 넘기면 resumable 단계의 출력을 저장하고, 다시 실행할 때 끝난 단계는 건너뛰고
+  저장된 출력을 복원합니다. (infra/job_checkpoint.py)
+- guard를 넘기면 단계를 시작하거나 checkpoint에 기록하기 전마다 호출합니다. guard가 예외를 발생시키면
+  (lease를 잃음 등) 새 단계를 시작하지 않고, 실행 중인 단계가 끝난 뒤 그 예외를 전달합니다.
+"""
+
+import contextvars
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from core import metrics
+from core.profiling import current_session
+
+
+class StopPipeline(Exception):
+    """이후 단계를 실행하지 않고 파이프라인을 정상 종료할 때 발생시키는 예외"""
+
+
+class PipelineError(Exception):
+    """파이프라인 정의가 잘못되었거나 단계 출력이 선언과 다를 때 발생하는 예외"""
+
+
+@dataclass
+class Stage:
+    """파이프라인 단계"""
+    name: str
+    func: Callable[..., Optional[Dict[str, Any]]]
+    requires: Tuple[str, ...] = ()
+    provides: Tuple[str, ...] = ()
+    after: Tuple[str, ...] = ()
+    # 단계 시작 시 출력할 설명 (예: "Billing API 호출 중...")
+    label: str = ""
+    # True면 완료 후 출력을 checkpoint에 저장하고, 재실행 시 복원해 건너뜁니다.
+    # (DB 연결처럼 출력을 저장할 수 없는 단계는 False로 두고 매번 실행)
+    resumable: bool = False
+
+
+class StageCheckpoint(ABC):
+    """단계 출력 저장/복원 인터페이스"""
+
+    @abstractmethod
+    def load(self, stage: str) -> Optional[Dict[str, Any]]:
+        """완료된 단계의 출력을 반환합니다. (완료되지 않았거나 복원할 수 없으면 None)"""
+
+    @abstractmethod
+    def save(self, stage: str, outputs: Dict[str, Any], seconds: float) -> None:
+        """단계 완료와 출력을 기록합니다."""
+
+
+@dataclass
+class PipelineResult:
+    """파이프라인 실행 결과"""
+    values: Dict[str, Any]
+    timings: Dict[str, float] = field(default_factory=dict)
+    completed: List[str] = field(default_factory=list)
+    restored: List[str] = field(default_factory=list)
+    stopped: Optional[str] = None
+    elapsed: float = 0.0
+
+    def summary(self) -> str:
+        """단계별 소요 시간 요약 문자열 (완료 순서)"""
+        parts = [
+            f"{name} (복원)" if name in self.restored else f"{name} {self.timings[name] * 1000:.0f}ms"
+            for name in self.completed
+        ]
+        serial = sum(self.timings.values())
+        return f"{', '.join(parts)} | 합계 {serial:.2f}s, 실제 {self.elapsed:.2f}s"
+
+
+class Pipeline:
+    """
+    requires/provides 의존성에 따라 단계를 실행하는 파이프라인
+    """
+
+    def __init__(self, name: str, stages: Iterable[Stage], max_workers: int = 4):
+        self.name = name
+        self.stages = list(stages)
+        self.max_workers = max_workers
+        self._providers: Dict[str, str] = {}
+        for stage in self.stages:
+            for key in stage.provides:
+                if key in self._providers:
+                    raise PipelineError(f"'{key}'를 두 단계가 제공합니다: {self._providers[key]}, {stage.name}")
+                self._providers[key] = stage.name
+
+    def dependencies(self, stage: Stage) -> List[str]:
+        """단계가 먼저 끝나기를 기다려야 하는 단계 이름 목록"""
+        deps = [self._providers[key] for key in stage.requires if key in self._providers]
+        return sorted(set(deps) | set(stage.after))
+
+    def validate(self, inputs: Iterable[str]) -> None:
+        """
+        모든 단계의 입력이 초기 입력 또는 앞 단계 출력으로 제공되는지, 순환 의존이 없는지 확인합니다.
+
+        Raises:
+            PipelineError: 정의가 잘못된 경우
+        """
+        available = set(inputs)
+        names = {stage.name for stage in self.stages}
+        for stage in self.stages:
+            missing = [k for k in stage.requires if k not in available and k not in self._providers]
+            if missing:
+                raise PipelineError(f"{stage.name} 단계의 입력이 없습니다: {', '.join(missing)}")
+            unknown = [n for n in stage.after if n not in names]
+            if unknown:
+                raise PipelineError(f"{stage.name} 단계의 after에 없는 단계가 있습니다: {', '.join(unknown)}")
+
+        done: set = set()
+        remaining = list(self.stages)
+        while remaining:
+            ready = [s for s in remaining if set(self.dependencies(s)) <= done]
+            if not ready:
+                raise PipelineError(f"순환 의존이 있습니다: {', '.join(s.name for s in remaining)}")
+            done.update(s.name for s in ready)
+            remaining = [s for s in remaining if s not in ready]
+
+    def _restore(self, checkpoint: StageCheckpoint, result: "PipelineResult") -> None:
+        # 의존하는 resumable 단계가 모두 복원된 경우에만 복원합니다.
+        # (앞 단계를 다시 실행하면 출력이 달라질 수 있으므로 그 뒤 단계도 다시 실행)
+        by_name = {stage.name: stage for stage in self.stages}
+        remaining = list(self.stages)
+        visited: set = set()
+        while remaining:
+            ready = [s for s in remaining if set(self.dependencies(s)) <= visited]
+            for stage in ready:
+                remaining.remove(stage)
+                visited.add(stage.name)
+                if not stage.resumable:
+                    continue
+                upstream_ok = all(
+                    name in result.restored or not by_name[name].resumable
+                    for name in self.dependencies(stage)
+                )
+                outputs = checkpoint.load(stage.name) if upstream_ok else None
+                if outputs is None or any(key not in outputs for key in stage.provides):
+                    continue
+                result.values.update({key: outputs[key] for key in stage.provides})
+                result.timings[stage.name] = 0.0
+                result.completed.append(stage.name)
+                result.restored.append(stage.name)
+
+    def _run_stage(self, stage: Stage, values: Dict[str, Any]) -> Tuple[Dict[str, Any], float]:
+        session = current_session()
+        started = time.perf_counter()
+        if session is None:
+            output = stage.func(**{key: values[key] for key in stage.requires}) or {}
+        else:
+            with session.stage(stage.name):
+                output = stage.func(**{key: values[key] for key in stage.requires}) or {}
+        elapsed = time.perf_counter() - started
+        metrics.observe("pipeline_stage_seconds", elapsed, stage=stage.name)
+        missing = [key for key in stage.provides if key not in output]
+        if missing:
+            raise PipelineError(f"{stage.name} 단계가 선언한 출력을 반환하지 않았습니다: {', '.join(missing)}")
+        return {key: output[key] for key in stage.provides}, elapsed
+
+    def run(
+        self,
+        inputs: Dict[str, Any],
+        checkpoint: Optional[StageCheckpoint] = None,
+        guard: Optional[Callable[[], None]] = None
+    ) -> PipelineResult:
+        """
+        파이프라인을 실행합니다.
+
+        Args:
+            inputs: 초기 입력 값 (settings, target_date 등)
+            checkpoint: 단계 출력 저장/복원 (None이면 사용하지 않음)
+            guard: 단계 시작/checkpoint 기록 전에 호출할 함수 (예: JobLease.check, None이면 사용하지 않음)
+
+        Returns:
+            PipelineResult
+
+        Raises:
+            단계에서 발생한 첫 번째 예외 (실행 중이던 다른 단계가 끝난 뒤 전달)
+        """
+        self.validate(inputs)
+        result = PipelineResult(values=dict(inputs))
+        if checkpoint is not None:
+            self._restore(checkpoint, result)
+        pending = [stage for stage in self.stages if stage.name not in result.restored]
+        running: Dict[Future, Stage] = {}
+        labeled_total = sum(1 for stage in self.stages if stage.label)
+        started_count = 0
+        for stage in self.stages:
+            if stage.name in result.restored and stage.label:
+                started_count += 1
+                print(f"\n[{started_count}/{labeled_total}] {stage.label} ↩️ checkpoint에서 복원")
+        error: Optional[BaseException] = None
+        run_started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"{self.name}-stage") as executor:
+            while pending or running:
+                if error is None and result.stopped is None:
+                    done = set(result.completed)
+                    ready = [s for s in pending if set(self.dependencies(s)) <= done]
+                    if ready and guard is not None:
+                        try:
+                            guard()
+                        except BaseException as e:
+                            error = e
+                            ready = []
+                    for stage in ready:
+                        pending.remove(stage)
+                        if stage.label:
+                            started_count += 1
+                            print(f"\n[{started_count}/{labeled_total}] {stage.label}")
+                        # 단계 스레드에서도 현재 Job run(core.metrics)에 기록되도록 context를 복사해 실행합니다.
+                        context = contextvars.copy_context()
+                        running[executor.submit(context.run, self._run_stage, stage, result.values)] = stage
+                if not running:
+                    break
+
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    stage = running.pop(future)
+                    try:
+                        output, elapsed = future.result()
+                    except StopPipeline as stop:
+                        result.stopped = str(stop) or stage.name
+                        continue
+                    except BaseException as e:
+                        error = error or e
+                        continue
+                    result.values.update(output)
+                    result.timings[stage.name] = elapsed
+                    result.completed.append(stage.name)
+                    if checkpoint is not None and stage.resumable:
+                        try:
+                            if guard is not None:
+                                guard()
+                            checkpoint.save(stage.name, output, elapsed)
+                        except Exception as e:
+                            error = error or e
+
+        result.elapsed = time.perf_counter() - run_started
+        if error is not None:
+            raise error
+        return result
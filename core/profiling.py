@@ -0,0 +1,383 @@
+"""
+Job 프로파일링 모듈
+
+코드를 고치지 않고 운영 Job이 어디서 시간/메모리를 쓰는지 확인할 수 있도록,
+`--profile` 옵션으로 다음 프로파일러를 켭니다. (여러 개를 쉼표로 지정, all = 전부)
+
+- cprofile: 파이프라인 단계마다 cProfile을 켜고 합쳐서 pstats 파일과 cumulative 상위 목록을 남깁니다.
+  (단계는 별도 스레드에서 실행되므로 단계 스레드마다 프로파일러를 켭니다)
+- memory  : tracemalloc으로 단계별 최대 메모리와, 실행 종료 시점의 할당 위치 상위 N개를 남깁니다.
+  동시에 실행된 단계의 peak에는 서로의 할당이 섞여 있습니다.
+- sample  : 백그라운드 스레드가 sample_interval_ms마다 모든 스레드의 스택을 수집합니다. (오버헤드가 가장 낮음)
+  결과는 flamegraph.pl / speedscope에서 바로 열 수 있는 collapsed stack 형식입니다.
+
+결과 파일은 profiling.outputDir/{job}/ 아래에 {job}_{날짜}[-{시}].* 이름으로 저장되고,
+profiling.upload(또는 --profile-upload)가 켜져 있으면 Object Storage profiles/job={job}/date={날짜}/ 에도 올립니다.
+"""
+
+import contextvars
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from config.settings import Settings
+from infra.object_storage import upload_file
+
+
+PROFILE_MODES = ("cprofile", "memory", "sample")
+PROFILE_PREFIX = "profiles"
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+_CURRENT_SESSION: contextvars.ContextVar[Optional["ProfileSession"]] = contextvars.ContextVar(
+    "billing_profile_session", default=None
+)
+
+
+def parse_profile_modes(value: Optional[str]) -> List[str]:
+    """
+    --profile 값을 프로파일러 목록으로 변환합니다.
+
+    Args:
+        value: "cprofile,sample" / "all" / None
+
+    Returns:
+        PROFILE_MODES 순서의 프로파일러 목록
+
+    Raises:
+        ValueError: 알 수 없는 프로파일러가 있는 경우
+    """
+    if not value:
+        return []
+    names = {name.strip().lower() for name in value.split(",") if name.strip()}
+    if "all" in names:
+        return list(PROFILE_MODES)
+    unknown = sorted(names - set(PROFILE_MODES))
+    if unknown:
+        raise ValueError(f"알 수 없는 프로파일러: {', '.join(unknown)} (사용 가능: {', '.join(PROFILE_MODES)}, all)")
+    return [mode for mode in PROFILE_MODES if mode in names]
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _thread_group(name: str) -> str:
+    # ThreadPoolExecutor 스레드 이름(hourly-stage_3)의 번호를 떼어 같은 풀의 스택을 합칩니다.
+    head, _, tail = name.rpartition("_")
+    return head if head and tail.isdigit() else name
+
+
+class StackSampler:
+    """
+    모든 스레드의 스택을 주기적으로 수집하는 샘플링 프로파일러
+    """
+
+    def __init__(self, interval_seconds: float = 0.01):
+        self.interval_seconds = interval_seconds
+        self.counts: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        names: Dict[int, str] = {}
+        while not self._stop.wait(self.interval_seconds):
+            frames = sys._current_frames()
+            if any(ident not in names for ident in frames):
+                names = {t.ident: _thread_group(t.name) for t in threading.enumerate()}
+            for ident, frame in frames.items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(ident, f"thread-{ident}"))
+                self.counts[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        """flamegraph collapsed stack 형식 ("root;caller;callee count" 한 줄씩)"""
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.counts.items()))
+
+
+class ProfileSession:
+    """
+    Job 실행 1회의 프로파일링 상태
+
+    파이프라인은 단계를 실행할 때 current_session()이 있으면 stage(name)으로 감싸 실행합니다.
+    """
+
+    def __init__(self, modes: Sequence[str], tag: str, sample_interval_ms: float = 10.0, memory_top: int = 30):
+        self.modes = list(modes)
+        self.tag = tag
+        self.memory_top = memory_top
+        self.started_at = time.perf_counter()
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+        self._profiles: List[cProfile.Profile] = []
+        self._skipped_profiles: List[str] = []
+        self._active_stages = 0
+        self.stage_memory: Dict[str, Dict[str, float]] = {}
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._started_tracemalloc = False
+        self.sampler = StackSampler(sample_interval_ms / 1000) if "sample" in self.modes else None
+
+    def start(self) -> None:
+        if "memory" in self.modes and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if self.sampler is not None:
+            self.sampler.start()
+
+    def stop(self) -> None:
+        self.elapsed = time.perf_counter() - self.started_at
+        if self.sampler is not None:
+            self.sampler.stop()
+        if "memory" in self.modes and tracemalloc.is_tracing():
+            self._snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            ))
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """단계 1개 실행을 프로파일링합니다. (단계 스레드에서 호출)"""
+        profile = None
+        if "cprofile" in self.modes:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # 같은 스레드에 이미 다른 프로파일러가 켜져 있는 경우 (Python 3.12+는 프로세스에 1개만 가능)
+                profile = None
+                with self._lock:
+                    self._skipped_profiles.append(name)
+
+        tracing = "memory" in self.modes and tracemalloc.is_tracing()
+        if tracing:
+            with self._lock:
+                if self._active_stages == 0:
+                    tracemalloc.reset_peak()
+                self._active_stages += 1
+            start_bytes = tracemalloc.get_traced_memory()[0]
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+                with self._lock:
+                    self._profiles.append(profile)
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                record = {
+                    "peakMb": round((peak - start_bytes) / 1024 / 1024, 2),
+                    "retainedMb": round((current - start_bytes) / 1024 / 1024, 2),
+                }
+                with self._lock:
+                    self._active_stages -= 1
+                    # 테넌트마다 같은 단계가 실행되면 가장 큰 값을 남깁니다.
+                    previous = self.stage_memory.get(name)
+                    if previous is None or previous["peakMb"] < record["peakMb"]:
+                        self.stage_memory[name] = record
+
+    def _merged_stats(self, stream=None) -> pstats.Stats:
+        stats = pstats.Stats(self._profiles[0], stream=stream)
+        for profile in self._profiles[1:]:
+            stats.add(profile)
+        return stats
+
+    def _cprofile_report(self) -> str:
+        stream = io.StringIO()
+        stats = self._merged_stats(stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(60)
+        if self._skipped_profiles:
+            stream.write(f"\n프로파일링하지 못한 단계: {', '.join(self._skipped_profiles)}\n")
+        return stream.getvalue()
+
+    def _memory_report(self) -> str:
+        lines = [f"# {self.tag} 단계별 메모리 (동시에 실행된 단계는 서로의 할당 포함)", ""]
+        lines.append(f"{'stage':<16}{'peak(MB)':>10}{'retained(MB)':>14}")
+        for name, record in sorted(self.stage_memory.items(), key=lambda item: -item[1]["peakMb"]):
+            lines.append(f"{name:<16}{record['peakMb']:>10.2f}{record['retainedMb']:>14.2f}")
+        if self._snapshot is not None:
+            lines += ["", f"# 종료 시점 할당 위치 상위 {self.memory_top}개"]
+            for stat in self._snapshot.statistics("lineno")[:self.memory_top]:
+                lines.append(str(stat))
+        return "\n".join(lines) + "\n"
+
+    def write(self, directory: Path) -> List[Path]:
+        """
+        결과 파일을 씁니다.
+
+        Args:
+            directory: 저장 디렉토리
+
+        Returns:
+            작성한 파일 경로 목록
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        written = []
+        if self._profiles:
+            path = directory / f"{self.tag}.pstats"
+            self._merged_stats().dump_stats(str(path))
+            written.append(path)
+            path = directory / f"{self.tag}.cprofile.txt"
+            path.write_text(self._cprofile_report(), encoding="utf-8")
+            written.append(path)
+        if "memory" in self.modes:
+            path = directory / f"{self.tag}.memory.txt"
+            path.write_text(self._memory_report(), encoding="utf-8")
+            written.append(path)
+        if self.sampler is not None:
+            path = directory / f"{self.tag}.collapsed"
+            path.write_text(self.sampler.collapsed(), encoding="utf-8")
+            written.append(path)
+        return written
+
+
+def current_session() -> Optional[ProfileSession]:
+    """현재 컨텍스트의 프로파일링 세션 (없으면 None)"""
+    return _CURRENT_SESSION.get()
+
+
+def profile_tag(job: str, target_date: str, hour: Optional[int] = None) -> str:
+    """결과 파일 이름 접두어 (hourly_20250101-10, daily_20250101)"""
+    return f"{job}_{target_date}" + (f"-{hour:02d}" if hour is not None else "")
+
+
+def save_profile(settings: Settings, session: ProfileSession, job: str, target_date: str) -> List[str]:
+    """
+    결과 파일을 profiling.outputDir에 쓰고, 설정되어 있으면 Object Storage에도 올립니다.
+
+    Args:
+        settings: 설정 객체 (profiling, object_storage)
+        session: 종료된 프로파일링 세션
+        job: Job 이름
+        target_date: 대상 날짜 (YYYYMMDD)
+
+    Returns:
+        저장 위치 목록 (로컬 경로, Object Storage key)
+    """
+    directory = Path(settings.profiling.output_dir)
+    if not directory.is_absolute():
+        directory = PROJECT_ROOT / directory
+    paths = session.write(directory / job)
+    locations = [str(path) for path in paths]
+
+    if settings.profiling.upload:
+        for path in paths:
+            key = f"{PROFILE_PREFIX}/job={job}/date={target_date}/{path.name}"
+            try:
+                upload_file(str(path), key, settings.object_storage, content_type="application/octet-stream")
+                locations.append(key)
+            except RuntimeError as e:
+                print(f"⚠️ 프로파일 업로드 실패 ({path.name}): {e}")
+    return locations
+
+
+@contextmanager
+def profile_run(
+    settings: Settings,
+    modes: Sequence[str],
+    job: str,
+    target_date: str,
+    hour: Optional[int] = None
+) -> Iterator[Optional[ProfileSession]]:
+    """
+    블록 실행을 프로파일링하고, 끝나면 (실패/sys.exit 포함) 결과 파일을 저장합니다.
+
+    modes가 비어 있으면 아무것도 하지 않습니다.
+
+    Args:
+        settings: 설정 객체
+        modes: 켤 프로파일러 목록 (parse_profile_modes)
+        job: Job 이름
+        target_date: 대상 날짜 (YYYYMMDD)
+        hour: 시각 (Hourly Job)
+    """
+    if not modes:
+        yield None
+        return
+
+    session = ProfileSession(
+        modes,
+        profile_tag(job, target_date, hour),
+        sample_interval_ms=settings.profiling.sample_interval_ms,
+        memory_top=settings.profiling.memory_top
+    )
+    token = _CURRENT_SESSION.set(session)
+    session.start()
+    try:
+        yield session
+    finally:
+        session.stop()
+        _CURRENT_SESSION.reset(token)
+        try:
+            locations = save_profile(settings, session, job, target_date)
+        except OSError as e:
+            print(f"⚠️ 프로파일 저장 실패: {e}")
+        else:
+            print(f"\n🔬 프로파일 ({', '.join(session.modes)}, {session.elapsed:.1f}s):")
+            for location in locations:
+                print(f"   {location}")
+
+
+def add_profile_arguments(parser) -> None:
+    """Job CLI에 --profile / --profile-dir / --profile-upload 옵션을 추가합니다."""
+    parser.add_argument(
+        '--profile',
+        type=str,
+        help=f'프로파일러 ({", ".join(PROFILE_MODES)} 중 쉼표 구분, all = 전부)'
+    )
+    parser.add_argument(
+        '--profile-dir',
+        type=str,
+        help='프로파일 결과 디렉토리 (기본값: 설정 profiling.outputDir)'
+    )
+    parser.add_argument(
+        '--profile-upload',
+        action='store_true',
+        help='프로파일 결과를 Object Storage에도 업로드'
+    )
+
+
+def apply_profile_arguments(parser, args, settings: Settings) -> List[str]:
+    """
+    --profile 옵션을 검증하고 설정에 반영합니다.
+
+    Returns:
+        켤 프로파일러 목록 (옵션이 없으면 빈 리스트)
+    """
+    try:
+        modes = parse_profile_modes(args.profile)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.profile_dir:
+        settings.profiling.output_dir = args.profile_dir
+    if args.profile_upload:
+        settings.profiling.upload = True
+    return modes
@@ -0,0 +1,580 @@
+"""
+대시보드 조회 API 모듈
+
+대시보드가 Job이 쓰는 MongoDB(billing_daily, billing_baseline, billing_anomalies, billing_monthly)를
+임의 조건으로 직접 조회하지 않도록, 읽기 전용 HTTP API와 프로세스 내 응답 캐시를 제공합니다.
+(실행: python -m jobs.query_api)
+
+엔드포인트 (GET / HEAD, 응답 본문: {"items": [...], "count": n}):
+- /daily     ?domainId&from&to[&projectId[&serviceId]]              일별 series (DailyStore - 저장 방식/아카이브 무관)
+- /baselines ?domainId[&projectId[&serviceId]]                      서비스별 baseline 통계
+- /anomalies ?from&to | date [&domainId[&projectId]][&status][&limit]  이상치 (최신순)
+- /rollups   ?month[&level][&domainId[&projectId]]                  월별 롤업 (level: domain | project | service)
+- /health                                                           캐시 상태 (캐시하지 않음)
+
+캐시:
+- (경로, 정규화한 파라미터)마다 직렬화된 응답 바이트를 LRU로 보관합니다. (항목 수 / 총 크기 / TTL 제한)
+- 요청을 처리할 때 최대 invalidate_poll_seconds 간격으로 job_runs의 최근 완료 시각을 확인하고,
+  바뀌었으면 캐시 전체를 비웁니다. (Hourly/Daily Job이 끝나면 다음 요청부터 새 결과가 보임)
+- 캐시된 응답은 본문 해시 ETag를 가지며, If-None-Match가 일치하면 MongoDB 조회 없이 304를 응답합니다.
+- 아카이브 리더를 넘기면 /daily는 아카이브가 있을 때 아카이브를 함께 읽습니다.
+  아카이브 유무는 generation마다(최대 cache_ttl_seconds) 다시 확인하고, 파트 캐시는 캐시를 비울 때 함께 비웁니다.
+
+스트리밍:
+- 커서를 읽으며 JSON을 조각 단위로 직렬화하고, 크기가 stream_threshold를 넘으면
+  그 시점부터 Transfer-Encoding: chunked로 나머지를 이어서 보냅니다.
+  큰 응답은 메모리에 모으지 않으며, 캐시/ETag 대상이 아닙니다. (기간을 나눠 조회하면 캐시됨)
+"""
+
+import hashlib
+import itertools
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from pymongo.database import Database
+from pymongo.errors import PyMongoError
+
+from config.settings import QueryApiSettings
+from core import metrics
+from core.rollup import LEVEL_DOMAIN, LEVEL_PROJECT, LEVEL_SERVICE
+from infra.archive import ArchiveReader
+from infra.daily_store import ArchivedDailyStore, DailyStore
+from infra.job_runs import latest_finished_at
+from infra.mongo_client import find_anomalies, find_baselines, find_monthly_rollups
+
+
+# 직렬화/스트리밍 시 한 번에 쓰는 조각 크기
+STREAM_CHUNK_BYTES = 64 * 1024
+
+QueryParams = Dict[str, str]
+QueryPlan = Tuple[QueryParams, Callable[[], Iterable[Dict[str, Any]]]]
+
+
+class QueryError(Exception):
+    """잘못된 요청 (HTTP 상태 코드와 함께)"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class CachedResponse:
+    """캐시된 응답 본문"""
+    body: bytes
+    etag: str
+    expires_at: float
+
+
+class ResponseCache:
+    """
+    직렬화된 응답의 LRU + TTL 캐시
+
+    generation(최근 Job 완료 시각)이 바뀌면 전체를 비우고,
+    이전 generation에서 조회를 시작한 응답은 저장하지 않습니다. (무효화 직후 옛 결과가 다시 들어가지 않도록)
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.generation: Optional[str] = None
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """캐시된 응답 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._pop(key)
+                entry = None
+            if entry is None:
+                metrics.inc("query_cache_misses_total")
+                return None
+            self._entries.move_to_end(key)
+        metrics.inc("query_cache_hits_total")
+        return entry
+
+    def put(self, key: str, body: bytes, etag: str, generation: Optional[str]) -> None:
+        """
+        응답을 저장하고 한도를 넘으면 오래 쓰지 않은 항목부터 비웁니다.
+
+        Args:
+            key: 캐시 키
+            body: 응답 본문
+            etag: ETag
+            generation: 조회를 시작할 때의 generation
+        """
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = CachedResponse(body, etag, time.monotonic() + self.ttl_seconds)
+            self._bytes += len(body)
+            evicted = 0
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+                evicted += 1
+            size = self._bytes
+        if evicted:
+            metrics.inc("query_cache_evictions_total", evicted)
+        metrics.set_gauge("query_cache_bytes", size)
+
+    def reset(self, generation: Optional[str]) -> bool:
+        """
+        generation이 바뀌었으면 캐시를 비웁니다.
+
+        Returns:
+            비웠으면 True
+        """
+        with self._lock:
+            if generation == self.generation:
+                return False
+            previous = self.generation
+            self._entries.clear()
+            self._bytes = 0
+            self.generation = generation
+        if previous is not None:
+            metrics.inc("query_cache_invalidations_total")
+        return True
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.body)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "generation": self.generation,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "maxEntries": self.max_entries,
+                "maxBytes": self.max_bytes,
+                "ttlSeconds": self.ttl_seconds,
+            }
+
+
+class RunWatcher:
+    """
+    job_runs의 최근 완료 시각을 poll_seconds 간격으로 확인합니다.
+
+    요청 스레드에서 호출하며, 간격 안에서는 MongoDB를 조회하지 않고 마지막 값을 반환합니다.
+    """
+
+    def __init__(self, db: Database, poll_seconds: float):
+        self.db = db
+        self.poll_seconds = poll_seconds
+        self._lock = threading.Lock()
+        self._checked_at = float("-inf")
+        self._generation: Optional[str] = None
+
+    def generation(self) -> Optional[str]:
+        """최근 Job 완료 시각 (ISO 문자열, 기록이 없으면 빈 문자열)"""
+        if time.monotonic() - self._checked_at < self.poll_seconds:
+            return self._generation
+        with self._lock:
+            if time.monotonic() - self._checked_at >= self.poll_seconds:
+                try:
+                    finished = latest_finished_at(self.db)
+                    self._generation = finished.isoformat() if finished else ""
+                except PyMongoError as e:
+                    # 조회에 실패하면 이전 generation을 유지합니다. (캐시는 TTL로 만료)
+                    print(f"⚠️ job_runs 조회 실패: {e}")
+                self._checked_at = time.monotonic()
+            return self._generation
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def iter_json_chunks(items: Iterable[Dict[str, Any]], chunk_bytes: int = STREAM_CHUNK_BYTES) -> Iterator[bytes]:
+    """
+    {"items": [...], "count": n} 응답을 chunk_bytes 안팎의 조각으로 직렬화합니다.
+
+    Args:
+        items: 응답 항목 (커서 등)
+        chunk_bytes: 조각 크기
+
+    Returns:
+        bytes 조각 이터레이터
+    """
+    parts = [b'{"items":[']
+    size = len(parts[0])
+    count = 0
+    for item in items:
+        data = json.dumps(item, ensure_ascii=False, separators=(",", ":"), default=_json_default).encode("utf-8")
+        if count:
+            data = b"," + data
+        parts.append(data)
+        size += len(data)
+        count += 1
+        if size >= chunk_bytes:
+            yield b"".join(parts)
+            parts, size = [], 0
+    parts.append(f'],"count":{count}}}'.encode("utf-8"))
+    yield b"".join(parts)
+
+
+def compute_etag(body: bytes) -> str:
+    """응답 본문의 strong ETag"""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 etag와 일치하는지 확인합니다. (weak 비교)"""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or (tag[2:] if tag.startswith("W/") else tag) == etag:
+            return True
+    return False
+
+
+def _required(params: QueryParams, name: str) -> str:
+    value = params.get(name)
+    if not value:
+        raise QueryError(400, f"{name} 파라미터가 필요합니다.")
+    return value
+
+
+def _date(params: QueryParams, name: str, fmt: str = "%Y%m%d") -> str:
+    value = _required(params, name)
+    try:
+        datetime.strptime(value, fmt)
+    except ValueError:
+        raise QueryError(400, f"{name} 형식이 올바르지 않습니다: {value}")
+    return value
+
+
+def _date_range(params: QueryParams, max_days: int) -> Tuple[str, str]:
+    if params.get("date"):
+        day = _date(params, "date")
+        return day, day
+    from_date, to_date = _date(params, "from"), _date(params, "to")
+    days = (datetime.strptime(to_date, "%Y%m%d") - datetime.strptime(from_date, "%Y%m%d")).days + 1
+    if days <= 0:
+        raise QueryError(400, "to는 from 이후 날짜여야 합니다.")
+    if days > max_days:
+        raise QueryError(400, f"조회 기간은 최대 {max_days}일입니다. (요청 {days}일)")
+    return from_date, to_date
+
+
+def _scope(params: QueryParams, domain_required: bool = True) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    domain_id = _required(params, "domainId") if domain_required else params.get("domainId") or None
+    project_id = params.get("projectId") or None
+    service_id = params.get("serviceId") or None
+    if project_id and not domain_id:
+        raise QueryError(400, "projectId는 domainId와 함께 지정해야 합니다.")
+    if service_id and not project_id:
+        raise QueryError(400, "serviceId는 projectId와 함께 지정해야 합니다.")
+    return domain_id, project_id, service_id
+
+
+def _normalized(**params: Optional[Any]) -> QueryParams:
+    return {name: str(value) for name, value in params.items() if value is not None}
+
+
+class QueryService:
+    """
+    엔드포인트별 파라미터 검증 / MongoDB 조회와 응답 캐시
+
+    사용 예:
+        service = QueryService(db, daily_store, settings.query_api)
+        with QueryApiServer(service, port=0) as server:
+            requests.get(server.url("/daily"), params={"domainId": ..., "from": "20250101", "to": "20250131"})
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        daily_store: DailyStore,
+        settings: QueryApiSettings,
+        archive_reader: Optional[ArchiveReader] = None
+    ):
+        self.db = db
+        self.daily_store = daily_store
+        self.settings = settings
+        self.archive_reader = archive_reader
+        # (generation, 만료 시각, 아카이브 유무) - 아카이브는 Job 실행 사이에도 생길 수 있으므로 TTL도 둡니다.
+        self._archive_state: Optional[Tuple[Optional[str], float, bool]] = None
+        self._archive_lock = threading.Lock()
+        self.stream_threshold = settings.stream_threshold_kb * 1024
+        self.cache = ResponseCache(
+            settings.cache_max_entries,
+            settings.cache_max_mb * 1024 * 1024,
+            settings.cache_ttl_seconds
+        )
+        self.watcher = RunWatcher(db, settings.invalidate_poll_seconds)
+        self.routes: Dict[str, Callable[[QueryParams], QueryPlan]] = {
+            "/daily": self._daily,
+            "/baselines": self._baselines,
+            "/anomalies": self._anomalies,
+            "/rollups": self._rollups,
+        }
+
+    def refresh(self) -> Optional[str]:
+        """Job 완료를 확인하고(간격 제한) 바뀌었으면 캐시를 비운 뒤 현재 generation을 반환합니다."""
+        generation = self.watcher.generation()
+        if self.cache.reset(generation) and self.archive_reader is not None:
+            self.archive_reader.clear()
+        return generation
+
+    def store(self) -> DailyStore:
+        """/daily가 읽을 저장소 (아카이브가 있으면 아카이브를 함께 읽는 래퍼)"""
+        if self.archive_reader is None:
+            return self.daily_store
+        generation = self.cache.generation
+        with self._archive_lock:
+            state = self._archive_state
+            if state is None or state[0] != generation or state[1] <= time.monotonic():
+                has_archive = self.archive_reader.has_archive(self.daily_store.collection.name)
+                state = (generation, time.monotonic() + self.settings.cache_ttl_seconds, has_archive)
+                self._archive_state = state
+        if not state[2]:
+            return self.daily_store
+        return ArchivedDailyStore(self.daily_store, self.archive_reader)
+
+    def resolve(self, path: str, query: Dict[str, List[str]]) -> Tuple[str, Callable[[], Iterable[Dict[str, Any]]]]:
+        """
+        요청을 캐시 키와 조회 함수로 바꿉니다. (조회는 캐시에 없을 때만 실행)
+
+        Args:
+            path: 요청 경로
+            query: parse_qs 결과
+
+        Returns:
+            (캐시 키, 조회 함수)
+        """
+        route = self.routes.get(path)
+        if route is None:
+            raise QueryError(404, f"지원하지 않는 경로입니다: {path}")
+        params, run = route({name: values[-1] for name, values in query.items()})
+        return f"{path}?{urlencode(sorted(params.items()))}", run
+
+    def health(self) -> Dict[str, Any]:
+        return {"status": "ok", "cache": self.cache.stats()}
+
+    def _daily(self, params: QueryParams) -> QueryPlan:
+        domain_id, project_id, service_id = _scope(params)
+        from_date, to_date = _date_range(params, self.settings.max_range_days)
+        return (
+            _normalized(domainId=domain_id, projectId=project_id, serviceId=service_id, **{"from": from_date, "to": to_date}),
+            lambda: self.store().iter_daily_series(domain_id, from_date, to_date, project_id, service_id)
+        )
+
+    def _baselines(self, params: QueryParams) -> QueryPlan:
+        domain_id, project_id, service_id = _scope(params)
+        return (
+            _normalized(domainId=domain_id, projectId=project_id, serviceId=service_id),
+            lambda: find_baselines(self.db.billing_baseline, domain_id, project_id, service_id)
+        )
+
+    def _anomalies(self, params: QueryParams) -> QueryPlan:
+        domain_id, project_id, _ = _scope(params, domain_required=False)
+        from_date, to_date = _date_range(params, self.settings.max_range_days)
+        status = params.get("status") or None
+        try:
+            limit = int(params.get("limit") or self.settings.max_anomalies)
+        except ValueError:
+            raise QueryError(400, f"limit 형식이 올바르지 않습니다: {params.get('limit')}")
+        limit = max(1, min(limit, self.settings.max_anomalies))
+        return (
+            _normalized(
+                domainId=domain_id, projectId=project_id, status=status, limit=limit,
+                **{"from": from_date, "to": to_date}
+            ),
+            lambda: find_anomalies(
+                self.db.billing_anomalies, from_date, to_date, domain_id, project_id, status, limit
+            )
+        )
+
+    def _rollups(self, params: QueryParams) -> QueryPlan:
+        month = _date(params, "month", "%Y%m")
+        level = params.get("level") or LEVEL_DOMAIN
+        if level not in (LEVEL_DOMAIN, LEVEL_PROJECT, LEVEL_SERVICE):
+            raise QueryError(400, f"level은 {LEVEL_DOMAIN} | {LEVEL_PROJECT} | {LEVEL_SERVICE} 중 하나입니다.")
+        domain_id, project_id, _ = _scope(params, domain_required=False)
+        return (
+            _normalized(month=month, level=level, domainId=domain_id, projectId=project_id),
+            lambda: find_monthly_rollups(self.db.billing_monthly, month, level, domain_id, project_id)
+        )
+
+
+class _QueryHandler(BaseHTTPRequestHandler):
+    # chunked 스트리밍과 keep-alive를 위해 HTTP/1.1로 응답합니다.
+    protocol_version = "HTTP/1.1"
+    server: "_QueryHTTPServer"
+
+    def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler 시그니처
+        pass
+
+    def do_GET(self):
+        self._handle(head=False)
+
+    def do_HEAD(self):
+        self._handle(head=True)
+
+    def _handle(self, head: bool) -> None:
+        service = self.server.service
+        parsed = urlparse(self.path)
+        route = parsed.path if parsed.path in service.routes or parsed.path == "/health" else "other"
+        metrics.inc("query_api_requests_total", path=route)
+        with metrics.timer("query_api_request_seconds", path=route):
+            try:
+                if parsed.path == "/health":
+                    self._send_body(200, self._encode(service.health()), head, cache_control="no-store")
+                    return
+                generation = service.refresh()
+                key, run = service.resolve(parsed.path, parse_qs(parsed.query))
+                entry = service.cache.get(key)
+                if entry is not None:
+                    self._send_cached(entry.body, entry.etag, head)
+                    return
+                self._send_query(key, run, generation, head)
+            except QueryError as e:
+                self._send_body(e.status, self._encode({"error": str(e)}), head, cache_control="no-store")
+            except PyMongoError as e:
+                print(f"⚠️ 조회 API MongoDB 조회 실패 ({self.path}): {e}")
+                self._send_body(503, self._encode({"error": "MongoDB 조회에 실패했습니다."}), head, cache_control="no-store")
+
+    @staticmethod
+    def _encode(body: Dict[str, Any]) -> bytes:
+        return json.dumps(body, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+    def _send_body(
+        self,
+        status: int,
+        body: bytes,
+        head: bool,
+        etag: Optional[str] = None,
+        cache_control: str = "no-cache"
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", cache_control)
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def _send_cached(self, body: bytes, etag: str, head: bool) -> None:
+        if etag_matches(self.headers.get("If-None-Match"), etag):
+            metrics.inc("query_api_not_modified_total")
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            return
+        self._send_body(200, body, head, etag=etag)
+
+    def _send_query(
+        self,
+        key: str,
+        run: Callable[[], Iterable[Dict[str, Any]]],
+        generation: Optional[str],
+        head: bool
+    ) -> None:
+        service = self.server.service
+        chunks = iter_json_chunks(run())
+        buffered: List[bytes] = []
+        size = 0
+        for chunk in chunks:
+            buffered.append(chunk)
+            size += len(chunk)
+            if size > service.stream_threshold:
+                break
+        else:
+            # 작은 응답: 캐시에 넣고 ETag와 함께 보냅니다.
+            body = b"".join(buffered)
+            etag = compute_etag(body)
+            service.cache.put(key, body, etag, generation)
+            self._send_cached(body, etag, head)
+            return
+
+        # 큰 응답: 이미 직렬화한 조각부터 chunked로 이어서 보냅니다.
+        metrics.inc("query_api_streamed_total")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if head:
+            chunks.close()
+            return
+        try:
+            for chunk in itertools.chain(buffered, chunks):
+                self.wfile.write(b"%x\r\n%b\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+        except (PyMongoError, OSError) as e:
+            # 헤더를 이미 보냈으므로 종료 chunk 없이 연결을 끊어 클라이언트가 잘린 응답임을 알 수 있게 합니다.
+            self.close_connection = True
+            print(f"⚠️ 조회 API 스트리밍 중단 ({key}): {e}")
+
+
+class _QueryHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    service: QueryService
+
+
+class QueryApiServer:
+    """
+    QueryService를 제공하는 HTTP 서버
+
+    사용 예:
+        with QueryApiServer(service, port=0) as server:
+            print(server.url("/health"))
+    """
+
+    def __init__(self, service: QueryService, host: str = "127.0.0.1", port: int = 8090):
+        self.service = service
+        self._httpd = _QueryHTTPServer((host, port), _QueryHandler)
+        self._httpd.service = service
+        self._thread: Optional[threading.Thread] = None
+
+    def url(self, path: str = "/") -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+    def start(self) -> "QueryApiServer":
+        """백그라운드 스레드에서 서버를 시작합니다."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="query-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """현재 스레드에서 서버를 실행합니다. (Ctrl+C로 종료)"""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "QueryApiServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
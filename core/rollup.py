@@ -0,0 +1,331 @@
+"""
+월별 롤업(billing_monthly) 계산 및 리포트 모듈
+
+Daily Job이 하루치 집계를 저장할 때, 롤업에 이미 반영된 값과의 차이(delta)만
+domain / project / service 레벨 월별 합계에 $inc로 반영합니다.
+같은 날짜를 재집계(restatement)하면 delta가 이전 값과의 차이가 되므로 합계가 자동으로 보정됩니다.
+
+롤업 문서는 날짜별로 반영한 금액을 days에 함께 저장합니다.
+- service 레벨: days.<날짜> = 그 서비스의 금액. delta는 billing_daily가 아니라 이 기록과 비교해 계산하며,
+  $inc와 같은 update로 저장되므로 일별 저장 후 반영이 실패해도 다시 실행하면 누락된 문서에만 반영됩니다.
+- domain / project 레벨: days.<날짜> = 하위 service 문서의 같은 날짜 금액 합계.
+  service 문서를 반영한 뒤 합계를 다시 계산해 compare-and-set으로 바꾸므로, 여러 번 실행하거나
+  여러 shard가 같은 도메인을 동시에 갱신해도 결과가 같습니다. (문서 크기는 날짜 수에만 비례)
+
+문서 구조 (days):
+    {"days": {"20250301": {"expectAmount", "generalAmount", "discountAmount"}}}
+
+days가 없는 기존 롤업 문서는 scripts/rebuild_monthly_rollup.py로 한 번 재구축해야 합니다.
+"""
+
+import calendar
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from pymongo.collection import Collection
+
+from core.aggregator import DailySummary
+from infra.daily_store import DailyStore
+from infra.mongo_client import (
+    ROLLUP_AMOUNT_FIELDS,
+    apply_monthly_deltas,
+    find_monthly_days,
+    get_monthly_rollup,
+    replace_monthly_rollup,
+    set_monthly_day
+)
+
+
+LEVEL_DOMAIN = "domain"
+LEVEL_PROJECT = "project"
+LEVEL_SERVICE = "service"
+
+
+def month_of(date_str: str) -> str:
+    """YYYYMMDD -> YYYYMM"""
+    return date_str[:6]
+
+
+def previous_month(month: str) -> str:
+    """YYYYMM 기준 전월(YYYYMM)을 반환합니다."""
+    first = datetime.strptime(month + "01", "%Y%m%d")
+    return (first - timedelta(days=1)).strftime("%Y%m")
+
+
+def _level_keys(domain_id: str, project_id: str, service_id: str) -> List[Tuple[str, str, Optional[str], Optional[str]]]:
+    return [
+        (LEVEL_DOMAIN, domain_id, None, None),
+        (LEVEL_PROJECT, domain_id, project_id, None),
+        (LEVEL_SERVICE, domain_id, project_id, service_id),
+    ]
+
+
+def _level_names(level: str, summary: DailySummary) -> Dict[str, str]:
+    names = {"domainName": summary.domain_name}
+    if level in (LEVEL_PROJECT, LEVEL_SERVICE):
+        names["projectName"] = summary.project_name
+    if level == LEVEL_SERVICE:
+        names["serviceName"] = summary.service_name
+    return names
+
+
+def _summary_amounts(summary: DailySummary) -> Dict[str, float]:
+    return {
+        "expectAmount": summary.expect_amount,
+        "generalAmount": summary.general_amount,
+        "discountAmount": summary.discount_amount,
+    }
+
+
+def compute_monthly_deltas(
+    summaries: List[DailySummary],
+    applied: Dict[Tuple[str, str, str, str], Dict[str, dict]]
+) -> List[dict]:
+    """
+    새 일별 집계와 service 레벨 롤업 문서의 반영 기록 차이를 delta로 변환합니다.
+
+    Args:
+        summaries: 저장할 일별 집계 결과
+        applied: service 레벨 문서별 반영 기록 ({(month, domainId, projectId, serviceId): {date: amounts}})
+
+    Returns:
+        apply_monthly_deltas에 전달할 service 레벨 delta 리스트 (이미 같은 값이 반영된 항목은 제외)
+    """
+    merged: Dict[Tuple, dict] = {}
+
+    for summary in summaries:
+        new = _summary_amounts(summary)
+        month = month_of(summary.metering_date)
+        key = (month, summary.domain_id, summary.project_id, summary.service_id)
+        old = applied.get(key, {}).get(summary.metering_date)
+        if old is not None and all(old.get(field, 0.0) == new[field] for field in ROLLUP_AMOUNT_FIELDS):
+            continue
+
+        entry = merged.get(key)
+        if entry is None:
+            entry = merged[key] = {
+                "month": month,
+                "level": LEVEL_SERVICE,
+                "domainId": summary.domain_id,
+                "projectId": summary.project_id,
+                "serviceId": summary.service_id,
+                "names": _level_names(LEVEL_SERVICE, summary),
+                "amounts": {field: 0.0 for field in ROLLUP_AMOUNT_FIELDS},
+                "days": {},
+                "lastDate": summary.metering_date,
+            }
+        for field in ROLLUP_AMOUNT_FIELDS:
+            entry["amounts"][field] += new[field] - (old or {}).get(field, 0.0)
+        entry["days"][summary.metering_date] = new
+        entry["lastDate"] = max(entry["lastDate"], summary.metering_date)
+
+    return list(merged.values())
+
+
+def _load_service_days(
+    monthly_collection: Collection,
+    summaries: List[DailySummary]
+) -> Dict[Tuple[str, str, str, str], Dict[str, dict]]:
+    """저장할 집계의 월/도메인/날짜에 해당하는 service 레벨 반영 기록을 읽습니다."""
+    applied: Dict[Tuple[str, str, str, str], Dict[str, dict]] = {}
+    for month in sorted({month_of(s.metering_date) for s in summaries}):
+        in_month = [s for s in summaries if month_of(s.metering_date) == month]
+        domain_ids = sorted({s.domain_id for s in in_month})
+        dates = sorted({s.metering_date for s in in_month})
+        for doc in find_monthly_days(monthly_collection, month, LEVEL_SERVICE, domain_ids, dates):
+            applied[(month, doc["domainId"], doc["projectId"], doc["serviceId"])] = doc.get("days") or {}
+    return applied
+
+
+def _sync_day_totals(
+    monthly_collection: Collection,
+    date: str,
+    domain_id: str,
+    names: Dict[Tuple[str, str, Optional[str]], Dict[str, str]],
+    max_attempts: int = 5
+) -> int:
+    """
+    도메인 1개의 date 하루치 domain / project 레벨 금액을 service 문서 합계로 맞춥니다.
+
+    상위 문서의 현재 값을 먼저 읽고 service 문서를 합산한 뒤 compare-and-set으로 바꿉니다.
+    그 사이 다른 실행(다른 shard)이 바꿨으면 처음부터 다시 읽습니다.
+
+    Returns:
+        값을 바꾼 상위 문서 수
+    """
+    month = month_of(date)
+    for _ in range(max_attempts):
+        current = {
+            (doc["level"], doc.get("projectId")): (doc.get("days") or {}).get(date)
+            for level in (LEVEL_DOMAIN, LEVEL_PROJECT)
+            for doc in find_monthly_days(monthly_collection, month, level, [domain_id], [date])
+        }
+        totals: Dict[Tuple[str, Optional[str]], Dict[str, float]] = {}
+        for doc in find_monthly_days(monthly_collection, month, LEVEL_SERVICE, [domain_id], [date]):
+            amounts = (doc.get("days") or {}).get(date)
+            if amounts is None:
+                continue
+            for scope in ((LEVEL_DOMAIN, None), (LEVEL_PROJECT, doc["projectId"])):
+                total = totals.setdefault(scope, {field: 0.0 for field in ROLLUP_AMOUNT_FIELDS})
+                for field in ROLLUP_AMOUNT_FIELDS:
+                    total[field] += amounts.get(field, 0.0)
+        # 하위 service 기록이 없어진 범위는 0으로 맞춥니다.
+        for scope, old in current.items():
+            if old is not None and scope not in totals:
+                totals[scope] = {field: 0.0 for field in ROLLUP_AMOUNT_FIELDS}
+
+        changed = 0
+        conflict = False
+        for (level, project_id), new in totals.items():
+            old = current.get((level, project_id))
+            if old is not None and all(old.get(field, 0.0) == new[field] for field in ROLLUP_AMOUNT_FIELDS):
+                continue
+            key = {"month": month, "level": level, "domainId": domain_id, "projectId": project_id, "serviceId": None}
+            if not set_monthly_day(monthly_collection, key, date, old, new, names.get((level, domain_id, project_id), {})):
+                conflict = True
+                break
+            changed += 1
+        if not conflict:
+            return changed
+    raise RuntimeError(f"월별 롤업 합계 갱신 충돌이 반복됩니다: {domain_id} {date}")
+
+
+def save_daily_with_rollup(
+    daily_store: DailyStore,
+    monthly_collection: Collection,
+    summaries: List[DailySummary]
+) -> Tuple[int, int]:
+    """
+    일별 집계를 저장하고 롤업에 아직 반영되지 않은 변화량을 월별 롤업에 반영합니다.
+
+    service 레벨은 반영 기록(days) 기준 delta로, domain / project 레벨은 service 문서 합계로 갱신하므로
+    일별 저장 후 롤업 반영이 실패했더라도 같은 집계로 다시 호출하면 롤업이 billing_daily와 일치하게 됩니다.
+
+    Args:
+        daily_store: 일별 집계 저장소
+        monthly_collection: billing_monthly 컬렉션
+        summaries: 일별 집계 결과 (여러 날짜 가능)
+
+    Returns:
+        (저장된 일별 문서 수, 반영된 롤업 문서 수)
+    """
+    saved = daily_store.bulk_upsert_daily_summaries(summaries)
+    deltas = compute_monthly_deltas(summaries, _load_service_days(monthly_collection, summaries))
+    apply_monthly_deltas(monthly_collection, deltas)
+
+    # 이번 delta가 없어도 이전 실행이 service 반영 후 실패했을 수 있으므로 상위 합계는 항상 맞춥니다.
+    names: Dict[Tuple[str, str, Optional[str]], Dict[str, str]] = {}
+    for summary in summaries:
+        names[(LEVEL_DOMAIN, summary.domain_id, None)] = _level_names(LEVEL_DOMAIN, summary)
+        names[(LEVEL_PROJECT, summary.domain_id, summary.project_id)] = _level_names(LEVEL_PROJECT, summary)
+    changed = 0
+    for date, domain_id in sorted({(s.metering_date, s.domain_id) for s in summaries}):
+        changed += _sync_day_totals(monthly_collection, date, domain_id, names)
+    return saved, len(deltas) + changed
+
+
+def rebuild_monthly_rollup(
+    daily_store: DailyStore,
+    monthly_collection: Collection,
+    month: str
+) -> int:
+    """
+    billing_daily에서 해당 월 전체를 다시 읽어 롤업과 날짜별 반영 금액(days)을 재구축합니다.
+    (billing_daily를 직접 수정했거나 반영 기록이 없는 기존 롤업을 보정할 때 사용)
+
+    Args:
+        daily_store: 일별 집계 저장소
+        monthly_collection: billing_monthly 컬렉션
+        month: 월 (YYYYMM)
+
+    Returns:
+        저장된 롤업 문서 개수
+    """
+    year, mon = int(month[:4]), int(month[4:6])
+    days_in_month = calendar.monthrange(year, mon)[1]
+
+    totals: Dict[Tuple, dict] = {}
+    for day in range(1, days_in_month + 1):
+        date = f"{month}{day:02d}"
+        for (domain_id, project_id, service_id), amounts in daily_store.get_daily_amounts_for_date(date).items():
+            for level, d, p, s in _level_keys(domain_id, project_id, service_id):
+                entry = totals.setdefault((level, d, p, s), {
+                    "level": level,
+                    "domainId": d,
+                    "projectId": p,
+                    "serviceId": s,
+                    "lastDate": date,
+                    **{field: 0.0 for field in ROLLUP_AMOUNT_FIELDS},
+                    "days": {},
+                })
+                day = entry["days"].setdefault(date, {field: 0.0 for field in ROLLUP_AMOUNT_FIELDS})
+                for field in ROLLUP_AMOUNT_FIELDS:
+                    entry[field] += amounts.get(field, 0.0)
+                    day[field] += amounts.get(field, 0.0)
+                entry["lastDate"] = date
+
+    return replace_monthly_rollup(monthly_collection, month, list(totals.values()))
+
+
+def month_to_date(
+    monthly_collection: Collection,
+    month: str,
+    domain_id: str,
+    project_id: Optional[str] = None,
+    service_id: Optional[str] = None
+) -> float:
+    """
+    월 누적 expectAmount를 조회합니다. (point read 1회)
+
+    Args:
+        monthly_collection: billing_monthly 컬렉션
+        month: 월 (YYYYMM)
+        domain_id: 도메인 ID
+        project_id: 프로젝트 ID (지정 시 project 레벨)
+        service_id: 서비스 ID (지정 시 service 레벨)
+
+    Returns:
+        월 누적 금액 (데이터가 없으면 0.0)
+    """
+    if service_id is not None:
+        level = LEVEL_SERVICE
+    elif project_id is not None:
+        level = LEVEL_PROJECT
+    else:
+        level = LEVEL_DOMAIN
+
+    doc = get_monthly_rollup(monthly_collection, month, level, domain_id, project_id, service_id)
+    if not doc:
+        return 0.0
+    return float(doc.get("expectAmount") or 0)
+
+
+def month_over_month(
+    monthly_collection: Collection,
+    month: str,
+    domain_id: str,
+    project_id: Optional[str] = None,
+    service_id: Optional[str] = None
+) -> Dict[str, float]:
+    """
+    이번 달 누적 금액과 전월 금액을 비교합니다. (point read 2회)
+
+    Args:
+        monthly_collection: billing_monthly 컬렉션
+        month: 기준 월 (YYYYMM)
+        domain_id: 도메인 ID
+        project_id: 프로젝트 ID
+        service_id: 서비스 ID
+
+    Returns:
+        {"current": ..., "previous": ..., "changeRatio": ...}
+        (전월 금액이 0이면 changeRatio는 0.0)
+    """
+    current = month_to_date(monthly_collection, month, domain_id, project_id, service_id)
+    previous = month_to_date(monthly_collection, previous_month(month), domain_id, project_id, service_id)
+    change_ratio = (current - previous) / previous if previous else 0.0
+    return {
+        "current": current,
+        "previous": previous,
+        "changeRatio": change_ratio,
+    }
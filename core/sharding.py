@@ -0,0 +1,149 @@
+"""
+일관 해시(consistent hashing) 기반 작업 분할 모듈
+
+여러 노드가 같은 Job을 나눠 처리할 때, 각 노드(shard)는 도메인(또는 도메인/프로젝트) 해시 링에서
+자기 구간에 속한 엔트리만 집계/저장/탐지합니다.
+노드 수가 바뀌어도 대부분의 도메인은 같은 shard에 남으므로 baseline/캐시 지역성이 유지됩니다.
+
+- shard_count가 1이면 분할하지 않습니다. (기존 동작)
+- 같은 도메인의 엔트리는 항상 같은 shard로 가므로, 서비스별 집계/baseline이 shard를 넘나들지 않습니다.
+"""
+
+import argparse
+import bisect
+import hashlib
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple
+
+from config.settings import ClusterSettings, Settings
+
+
+SHARD_KEY_DOMAIN = "domain"
+SHARD_KEY_PROJECT = "project"
+# shard 1개당 링 위의 가상 노드 수 (많을수록 분포가 고르게 됨)
+VIRTUAL_NODES = 128
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.md5(value.encode("utf-8")).digest()[:8], "big")
+
+
+class ShardRing:
+    """
+    shard 번호(0 ~ shard_count-1)를 가상 노드로 배치한 해시 링
+    """
+
+    def __init__(self, shard_count: int, virtual_nodes: int = VIRTUAL_NODES):
+        if shard_count < 1:
+            raise ValueError("shard_count는 1 이상이어야 합니다.")
+        self.shard_count = shard_count
+        points: List[Tuple[int, int]] = sorted(
+            (_hash(f"shard-{shard}#{vnode}"), shard)
+            for shard in range(shard_count)
+            for vnode in range(virtual_nodes)
+        )
+        self._points = [point for point, _ in points]
+        self._shards = [shard for _, shard in points]
+
+    def shard_of(self, key: str) -> int:
+        """key가 속한 shard 번호를 반환합니다."""
+        if self.shard_count == 1:
+            return 0
+        index = bisect.bisect(self._points, _hash(key)) % len(self._points)
+        return self._shards[index]
+
+
+@lru_cache(maxsize=16)
+def get_ring(shard_count: int) -> ShardRing:
+    """shard 수별 해시 링을 반환합니다. (프로세스 내 캐시)"""
+    return ShardRing(shard_count)
+
+
+def entry_shard_key(entry: Dict[str, Any], shard_key: str = SHARD_KEY_DOMAIN) -> str:
+    """엔트리의 분할 기준 key (domainId 또는 domainId|projectId)"""
+    if shard_key == SHARD_KEY_PROJECT:
+        return f"{entry.get('domainId', '')}|{entry.get('projectId', '')}"
+    return str(entry.get("domainId", ""))
+
+
+def is_sharded(cluster: ClusterSettings) -> bool:
+    """분할 실행 여부"""
+    return cluster.shard_count > 1
+
+
+def shard_label(cluster: ClusterSettings) -> str:
+    """lock/checkpoint 실행 키에 붙일 shard 표시 (분할하지 않으면 빈 문자열)"""
+    if not is_sharded(cluster):
+        return ""
+    return f"s{cluster.shard_index}of{cluster.shard_count}"
+
+
+def shard_run_key(run_key: str, cluster: ClusterSettings) -> str:
+    """
+    실행 키에 shard 표시를 붙입니다. (lock/checkpoint/manifest가 shard별로 분리되도록)
+
+    Args:
+        run_key: 실행 키 (예: 20250101, 20250101-10)
+        cluster: 클러스터 설정
+
+    Returns:
+        분할하지 않으면 run_key 그대로, 분할하면 "20250101-s0of2" 형태
+    """
+    label = shard_label(cluster)
+    return f"{run_key}-{label}" if label else run_key
+
+
+def is_primary_shard(cluster: ClusterSettings) -> bool:
+    """전체 데이터 대상 작업(Raw 저장, 일 총액 로그)을 맡는 shard인지 여부"""
+    return cluster.shard_index == 0
+
+
+def filter_entries(entries: Iterable[Dict[str, Any]], cluster: ClusterSettings) -> List[Dict[str, Any]]:
+    """
+    이 노드(shard_index)가 처리할 엔트리만 남깁니다.
+
+    Args:
+        entries: 비용 엔트리 이터러블
+        cluster: 클러스터 설정 (shard_index, shard_count, shard_key)
+
+    Returns:
+        이 shard에 속한 엔트리 리스트
+    """
+    entries = list(entries)
+    if not is_sharded(cluster):
+        return entries
+    if not 0 <= cluster.shard_index < cluster.shard_count:
+        raise ValueError(f"shard_index({cluster.shard_index})는 0 ~ {cluster.shard_count - 1} 범위여야 합니다.")
+    ring = get_ring(cluster.shard_count)
+    return [
+        entry for entry in entries
+        if isinstance(entry, dict)
+        and ring.shard_of(entry_shard_key(entry, cluster.shard_key)) == cluster.shard_index
+    ]
+
+
+def add_shard_arguments(parser: argparse.ArgumentParser) -> None:
+    """Job CLI에 --shard-index / --shard-count 옵션을 추가합니다. (설정 파일의 cluster 값보다 우선)"""
+    parser.add_argument(
+        '--shard-index',
+        type=int,
+        help='이 노드가 담당할 shard 번호 (0 ~ shard-count-1, 기본값: 설정 파일)'
+    )
+    parser.add_argument(
+        '--shard-count',
+        type=int,
+        help='전체 shard(노드) 수 (기본값: 설정 파일, 1이면 분할하지 않음)'
+    )
+
+
+def apply_shard_arguments(parser: argparse.ArgumentParser, args: argparse.Namespace, settings: Settings) -> None:
+    """CLI로 지정한 shard 값을 설정에 반영하고 범위를 검증합니다."""
+    if args.shard_index is not None:
+        settings.cluster.shard_index = args.shard_index
+    if args.shard_count is not None:
+        settings.cluster.shard_count = args.shard_count
+    cluster = settings.cluster
+    if cluster.shard_count < 1:
+        parser.error('--shard-count 는 1 이상이어야 합니다.')
+    if not 0 <= cluster.shard_index < cluster.shard_count:
+        parser.error(f'--shard-index 는 0 ~ {cluster.shard_count - 1} 범위여야 합니다.')
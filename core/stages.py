@@ -0,0 +1,87 @@
+"""
+Hourly / Daily Job이 공통으로 사용하는 파이프라인 단계
+
+각 함수는 core.pipeline.Stage의 func로 사용되며, requires 이름을 키워드 인자로 받고
+provides 이름을 키로 가진 dict를 반환합니다.
+"""
+
+import time
+from typing import Any, Dict, List
+
+from config.settings import Settings
+from core.aggregator import extract_entries, aggregate_daily
+from core.billing_client import fetch_billing
+from core.budgets import BudgetIndex, evaluate_budgets, log_budget_crossings
+from core.pipeline import Stage
+from core.sharding import filter_entries, is_sharded
+from infra.daily_store import get_daily_store
+from infra.mongo_client import get_mongo_client, get_database
+from infra.schema import ensure_schema
+
+
+def connect(settings: Settings) -> Dict[str, Any]:
+    """MongoDB에 연결하고 스키마를 확인합니다."""
+    connect_started = time.perf_counter()
+    client = get_mongo_client(settings.mongo)
+    db = get_database(client, settings.mongo.db_name)
+    schema_version = ensure_schema(db)
+    connect_ms = (time.perf_counter() - connect_started) * 1000
+    print(f"✅ MongoDB 연결 성공 (schema v{schema_version}, {connect_ms:.0f}ms)")
+    return {
+        "db": db,
+        "daily_store": get_daily_store(db, settings.mongo, settings.object_storage),
+    }
+
+
+def fetch(settings: Settings, target_date: str) -> Dict[str, Any]:
+    """Billing API에서 대상 날짜의 비용 데이터를 가져옵니다."""
+    response = fetch_billing(
+        from_date=target_date,
+        to_date=target_date,
+        settings=settings.billing_api
+    )
+    entries = extract_entries(response)
+    if is_sharded(settings.cluster):
+        # 응답 전체(response)는 Raw 저장/총액 계산용으로 유지하고, 집계 대상만 이 shard로 좁힙니다.
+        total = len(entries)
+        entries = filter_entries(entries, settings.cluster)
+        print(
+            f"✅ API 호출 성공 ({total}개 엔트리 중 shard "
+            f"{settings.cluster.shard_index}/{settings.cluster.shard_count} 담당 {len(entries)}개)"
+        )
+    else:
+        print(f"✅ API 호출 성공 ({len(entries)}개 엔트리)")
+    return {"response": response, "entries": entries}
+
+
+def aggregate(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """엔트리를 서비스별 일 누적 합계로 집계합니다."""
+    if not entries:
+        print("⚠️ 처리할 데이터가 없습니다.")
+        return {"summaries": []}
+    summaries = aggregate_daily(entries)
+    print(f"✅ {len(summaries)}개 서비스별 집계 완료")
+    return {"summaries": summaries}
+
+
+def budgets(settings: Settings, db, daily_store, summaries, target_date: str, logger) -> Dict[str, Any]:
+    """집계 결과로 월 예산 누적 금액을 갱신하고, 처음 넘은 사용률 구간을 기록합니다."""
+    index = BudgetIndex(settings.budgets)
+    if not index or not summaries:
+        return {}
+    crossings = evaluate_budgets(db, daily_store, index, summaries, target_date)
+    log_budget_crossings(crossings, logger, tenant=settings.tenant.name if settings.tenant else None)
+    if crossings:
+        print(f"⚠️ 예산 구간 도달 {len(crossings)}건: " + ", ".join(
+            f"{c.budget.name} {c.threshold:g}%" for c in crossings
+        ))
+    else:
+        print("✅ 예산 확인 완료 (새로 넘은 구간 없음)")
+    return {}
+
+
+CONNECT = Stage("connect", connect, requires=("settings",), provides=("db", "daily_store"), label="MongoDB 연결 중...")
+FETCH = Stage(
+    "fetch", fetch, requires=("settings", "target_date"), provides=("response", "entries"),
+    label="Billing API 호출 중...", resumable=True
+)
@@ -0,0 +1,112 @@
+"""
+멀티 테넌트 실행 모듈
+
+settings.tenants에 여러 조직(Credential)이 지정되면, Job은 테넌트마다 설정을 복제해
+같은 프로세스에서 동시에 실행합니다.
+
+- 테넌트별 설정: billing_api credential, Object Storage 파티션(tenant=NAME), 이상치 임계값
+- HTTP 세션/MongoDB 커넥션 풀/API rate limiter는 프로세스 전체에서 공유합니다.
+- 한 테넌트의 실패는 다른 테넌트 실행에 영향을 주지 않으며, 결과에 오류로 기록됩니다.
+"""
+
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, Callable, List, Optional
+
+from config.settings import Settings, TenantSettings
+
+
+@dataclass
+class TenantResult:
+    """테넌트 1개의 실행 결과"""
+    name: str
+    seconds: float
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def active_tenants(settings: Settings) -> List[TenantSettings]:
+    """활성화된 테넌트 목록 (설정이 없으면 빈 리스트 → 단일 credential 실행)"""
+    return [tenant for tenant in settings.tenants if tenant.enabled]
+
+
+def tenant_settings(settings: Settings, tenant: TenantSettings) -> Settings:
+    """
+    테넌트 1개를 실행하기 위한 설정을 만듭니다. (공유 설정은 그대로, credential/파티션만 교체)
+
+    Args:
+        settings: 전체 설정
+        tenant: 테넌트 설정
+
+    Returns:
+        테넌트용 Settings (tenant 지정, tenants 비움)
+    """
+    return replace(
+        settings,
+        billing_api=replace(
+            settings.billing_api,
+            credential_id=tenant.credential_id,
+            credential_secret=tenant.credential_secret
+        ),
+        object_storage=replace(settings.object_storage, tenant=tenant.name),
+        tenants=[],
+        tenant=tenant
+    )
+
+
+def tenant_run_key(run_key: str, settings: Settings) -> str:
+    """실행 키에 테넌트 이름을 붙입니다. (lock/checkpoint/manifest가 테넌트별로 분리되도록)"""
+    return f"{run_key}-{settings.tenant.name}" if settings.tenant else run_key
+
+
+def run_for_tenants(
+    settings: Settings,
+    func: Callable[[Settings], Any],
+    workers: Optional[int] = None
+) -> List[TenantResult]:
+    """
+    활성화된 테넌트마다 func(테넌트 설정)를 동시에 실행합니다.
+
+    Args:
+        settings: 전체 설정
+        func: 테넌트 설정을 받아 실행하는 함수 (예외는 해당 테넌트의 실패로 기록)
+        workers: 동시 실행 수 (None이면 billing_api.tenant_workers)
+
+    Returns:
+        TenantResult 리스트 (설정 순서)
+    """
+    tenants = active_tenants(settings)
+    workers = max(1, min(workers or settings.billing_api.tenant_workers, len(tenants) or 1))
+
+    def run_one(tenant: TenantSettings) -> TenantResult:
+        started = time.perf_counter()
+        try:
+            value = func(tenant_settings(settings, tenant))
+        except Exception as e:
+            print(f"❌ [{tenant.name}] 오류 발생: {e}")
+            return TenantResult(tenant.name, time.perf_counter() - started, error=e)
+        return TenantResult(tenant.name, time.perf_counter() - started, value=value)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tenant") as executor:
+        # 프로파일링 세션(core.profiling) 등 호출 측 context를 테넌트 스레드에서도 쓰도록 복사해 실행합니다.
+        futures = [executor.submit(contextvars.copy_context().run, run_one, tenant) for tenant in tenants]
+        return [future.result() for future in futures]
+
+
+def print_tenant_summary(results: List[TenantResult]) -> None:
+    """테넌트별 소요 시간/결과를 출력합니다."""
+    print(f"\n⏱️ 테넌트별 실행 결과 ({sum(r.ok for r in results)}/{len(results)} 성공)")
+    for result in sorted(results, key=lambda r: r.seconds, reverse=True):
+        if not result.ok:
+            detail = f"실패: {result.error}"
+        elif result.value is None:
+            detail = "건너뜀 (다른 노드에서 처리)"
+        else:
+            detail = result.value.summary() if hasattr(result.value, "summary") else "완료"
+        print(f"   {'✅' if result.ok else '❌'} {result.name}: {result.seconds:.2f}s - {detail}")
@@ -0,0 +1,437 @@
+"""
+Object Storage 아카이브 모듈
+
+보관 기간이 지난 MongoDB 문서를 gzip JSON Lines 파트 파일로 Object Storage에 저장하고,
+어떤 범위가 어느 key에 있는지 `billing_archive_manifest` 컬렉션에 기록합니다.
+
+파트를 올릴 때 서비스별 색인(`billing_archive_service_index`)도 함께 기록합니다.
+baseline 재계산은 이 색인(날짜별 expectAmount/isAnomaly/pricingTypes)만 읽으므로 파트를 내려받지 않고,
+서비스의 전체 문서가 필요할 때도 그 서비스가 들어 있는 파트만 내려받습니다.
+
+아카이브 key 구조:
+    {prefix}/{collection}/year=YYYY/month=MM/part-{minDate}-{maxDate}-{첫 _id}-{마지막 _id}.jsonl.gz
+
+key는 파트에 담긴 문서 범위로 정해지므로, manifest 기록 후 원본 삭제 전에 중단된 아카이브를 다시 실행하면
+같은 파트를 덮어씁니다. 그래도 여러 파트에 같은 문서가 있으면 리더는 (서비스, 날짜, pricingType)마다
+나중에 아카이브한 파트의 문서 하나만 반환합니다.
+
+서비스별 색인 문서 구조 (파트 1개 × 서비스 1개):
+    {"collection", "key", "domainId", "projectId", "serviceId", "minDate", "maxDate",
+     "days": [{"date", "expectAmount", "isAnomaly", "pricingType", "pricingTypes"}]}
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from bson import json_util
+from pymongo import ASCENDING
+from pymongo.database import Database
+
+from config.settings import ObjectStorageSettings
+from infra.object_storage import upload_jsonl_gz, iter_jsonl
+from infra.transfer import ObjectTransferManager
+
+
+MANIFEST_COLLECTION = "billing_archive_manifest"
+SERVICE_INDEX_COLLECTION = "billing_archive_service_index"
+
+# 파트 조회 순서 (같은 문서가 여러 파트에 있으면 나중에 아카이브한 파트 우선)
+_PART_ORDER = [("minDate", ASCENDING), ("archivedAt", ASCENDING)]
+
+
+def ensure_archive_indexes(db: Database):
+    """
+    아카이브 manifest 인덱스를 생성합니다.
+
+    Args:
+        db: Database 인스턴스
+    """
+    db[MANIFEST_COLLECTION].create_index(
+        [("collection", ASCENDING), ("month", ASCENDING)],
+        name="collection_month"
+    )
+    db[MANIFEST_COLLECTION].create_index(
+        [("key", ASCENDING)],
+        unique=True,
+        name="unique_archive_key"
+    )
+
+
+def ensure_archive_service_index(db: Database):
+    """
+    아카이브 서비스별 색인 인덱스를 생성합니다.
+
+    Args:
+        db: Database 인스턴스
+    """
+    db[SERVICE_INDEX_COLLECTION].create_index(
+        [
+            ("collection", ASCENDING),
+            ("domainId", ASCENDING),
+            ("projectId", ASCENDING),
+            ("serviceId", ASCENDING),
+            ("minDate", ASCENDING)
+        ],
+        name="collection_service_minDate"
+    )
+    db[SERVICE_INDEX_COLLECTION].create_index(
+        [("key", ASCENDING)],
+        name="archive_key"
+    )
+
+
+def _service_key(doc: Dict[str, Any]) -> Tuple[str, str, str]:
+    meta = doc.get("meta") or doc
+    return (meta.get("domainId", ""), meta.get("projectId", ""), meta.get("serviceId", ""))
+
+
+def _doc_key(doc: Dict[str, Any]) -> Tuple:
+    # 같은 (서비스, 날짜, pricingType) 문서가 여러 파트에 있으면 나중 파트의 문서 하나만 사용합니다.
+    return (*_service_key(doc), doc.get("date", ""), doc.get("pricingType"))
+
+
+def _index_day(doc: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "date": doc.get("date", ""),
+        "expectAmount": float(doc.get("expectAmount") or 0),
+        "isAnomaly": bool(doc.get("isAnomaly", False)),
+        "pricingType": doc.get("pricingType"),
+        "pricingTypes": doc.get("pricingTypes") or []
+    }
+
+
+def build_service_index(collection: str, key: str, docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    아카이브 파트 1개의 서비스별 색인 문서를 만듭니다.
+
+    Args:
+        collection: 원본 컬렉션 이름
+        key: 아카이브 파트 key
+        docs: 파트에 들어 있는 문서 리스트
+
+    Returns:
+        서비스별 색인 문서 리스트
+    """
+    by_service: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+    for doc in docs:
+        by_service.setdefault(_service_key(doc), []).append(_index_day(doc))
+
+    entries = []
+    for (domain_id, project_id, service_id), days in by_service.items():
+        days.sort(key=lambda day: day["date"])
+        entries.append({
+            "collection": collection,
+            "key": key,
+            "domainId": domain_id,
+            "projectId": project_id,
+            "serviceId": service_id,
+            "minDate": days[0]["date"],
+            "maxDate": days[-1]["date"],
+            "days": days
+        })
+    return entries
+
+
+def build_archive_key(
+    prefix: str,
+    collection: str,
+    month: str,
+    min_date: str,
+    max_date: str,
+    first_id: Any,
+    last_id: Any
+) -> str:
+    """
+    아카이브 파트 key를 생성합니다. (같은 문서 범위는 항상 같은 key)
+    """
+    suffix = f"{first_id}-{last_id}"
+    return (
+        f"{prefix}/{collection}/year={month[:4]}/month={month[4:6]}/"
+        f"part-{min_date}-{max_date}-{suffix}.jsonl.gz"
+    )
+
+
+def write_archive_part(
+    db: Database,
+    collection: str,
+    docs: List[Dict[str, Any]],
+    settings: ObjectStorageSettings,
+    prefix: str
+) -> str:
+    """
+    같은 월(date 기준)의 문서 묶음을 아카이브 파트 1개로 업로드하고 manifest에 기록합니다.
+
+    Args:
+        db: Database 인스턴스
+        collection: 원본 컬렉션 이름
+        docs: 아카이브할 문서 리스트 (모두 같은 월)
+        settings: Object Storage 설정
+        prefix: 아카이브 key prefix
+
+    Returns:
+        업로드한 Object Storage key
+    """
+    dates = [doc["date"] for doc in docs]
+    min_date, max_date = min(dates), max(dates)
+    month = min_date[:6]
+    key = build_archive_key(prefix, collection, month, min_date, max_date, docs[0]["_id"], docs[-1]["_id"])
+
+    count = upload_jsonl_gz(
+        (json_util.dumps(doc, ensure_ascii=False) for doc in docs),
+        key,
+        settings,
+        metadata={"collection": collection, "count": str(len(docs))}
+    )
+
+    # 색인을 먼저 기록하고 manifest에 serviceIndex를 남깁니다.
+    # (manifest 기록 전에 실패하면 색인만 남고, 리더는 manifest에 있는 파트의 색인만 사용합니다.)
+    db[SERVICE_INDEX_COLLECTION].delete_many({"key": key})
+    db[SERVICE_INDEX_COLLECTION].insert_many(build_service_index(collection, key, docs), ordered=False)
+
+    # 재실행으로 같은 key를 다시 올린 경우 기존 manifest를 갱신합니다.
+    db[MANIFEST_COLLECTION].update_one(
+        {"key": key},
+        {"$set": {
+            "collection": collection,
+            "month": month,
+            "count": count,
+            "minDate": min_date,
+            "maxDate": max_date,
+            "serviceIndex": True,
+            "archivedAt": datetime.utcnow()
+        }},
+        upsert=True
+    )
+    return key
+
+
+@dataclass
+class _CachedPart:
+    """캐시된 아카이브 파트"""
+    docs: List[Dict[str, Any]]
+    expires_at: float
+    # 서비스별로 나눈 문서 (서비스 단위 조회 시 처음 한 번 계산)
+    services: Optional[Dict[Tuple[str, str, str], List[Dict[str, Any]]]] = None
+
+
+class ArchiveReader:
+    """
+    아카이브된 문서를 읽는 리더
+
+    manifest를 조회해 필요한 파트만 내려받으며, 한 번 읽은 파트는 인스턴스 안에 캐시합니다.
+    (잡 1회 실행 동안 여러 서비스의 baseline을 계산할 때 같은 파트를 반복해서 받지 않도록)
+    서비스 단위 조회는 서비스별 색인을 사용하고, 색인이 없는 기존 파트만 내려받아 서비스별로 나눕니다.
+
+    오래 실행되는 프로세스(조회 API)는 max_parts / ttl_seconds로 캐시를 제한하고,
+    새 Job 결과가 보이면 clear()로 비웁니다.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        settings: ObjectStorageSettings,
+        max_parts: int = 0,
+        ttl_seconds: float = 0
+    ):
+        """
+        Args:
+            db: Database 인스턴스
+            settings: Object Storage 설정
+            max_parts: 캐시에 둘 최대 파트 수 (0이면 제한 없음 - 잡 1회 실행용)
+            ttl_seconds: 캐시한 파트/manifest의 유효 시간(초, 0이면 만료 없음)
+        """
+        self.db = db
+        self.settings = settings
+        self.max_parts = max_parts
+        self.ttl_seconds = ttl_seconds
+        self._parts: "OrderedDict[str, _CachedPart]" = OrderedDict()
+        self._manifest: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+    def has_archive(self, collection: str, month: Optional[str] = None) -> bool:
+        """해당 컬렉션(및 월)에 아카이브가 있는지 확인합니다."""
+        query = {"collection": collection}
+        if month is not None:
+            query["month"] = month
+        return self.db[MANIFEST_COLLECTION].find_one(query, {"_id": 1}) is not None
+
+    def clear(self) -> None:
+        """캐시한 파트와 manifest를 비웁니다. (새 아카이브/재집계가 반영된 뒤 다시 읽도록)"""
+        with self._lock:
+            self._parts.clear()
+            self._manifest.clear()
+
+    def _expires_at(self) -> float:
+        return time.monotonic() + self.ttl_seconds if self.ttl_seconds > 0 else float("inf")
+
+    def _cached(self, key: str) -> Optional[_CachedPart]:
+        with self._lock:
+            part = self._parts.get(key)
+            if part is not None and part.expires_at <= time.monotonic():
+                del self._parts[key]
+                part = None
+            if part is not None:
+                self._parts.move_to_end(key)
+            return part
+
+    def _store(self, key: str, lines: Iterable[str]) -> _CachedPart:
+        part = _CachedPart([json_util.loads(line) for line in lines], self._expires_at())
+        with self._lock:
+            self._parts[key] = part
+            self._parts.move_to_end(key)
+            while self.max_parts and len(self._parts) > self.max_parts:
+                self._parts.popitem(last=False)
+        return part
+
+    def _load_parts(self, keys: List[str]) -> Dict[str, _CachedPart]:
+        """파트들을 캐시에서 찾고, 없는 파트는 내려받습니다. (2개 이상이면 병렬)"""
+        loaded: Dict[str, _CachedPart] = {}
+        missing = []
+        for key in keys:
+            part = self._cached(key)
+            if part is None:
+                missing.append(key)
+            else:
+                loaded[key] = part
+        if len(missing) == 1:
+            loaded[missing[0]] = self._store(missing[0], iter_jsonl(missing[0], self.settings))
+        elif missing:
+            with ObjectTransferManager(self.settings) as transfer:
+                for key, lines in transfer.download_many(missing):
+                    loaded[key] = self._store(key, lines)
+        return loaded
+
+    def prefetch(self, keys: List[str]) -> None:
+        """아직 읽지 않은 파트들을 병렬로 내려받아 캐시에 넣습니다."""
+        self._load_parts(keys)
+
+    def iter_documents(
+        self,
+        collection: str,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        날짜 범위(YYYYMMDD, 양끝 포함)에 해당하는 아카이브 문서를 날짜 오름차순 파트 순서로 반환합니다.
+        (여러 파트에 있는 같은 문서는 한 번만)
+
+        Args:
+            collection: 원본 컬렉션 이름
+            from_date: 시작 날짜 (None이면 처음부터)
+            to_date: 종료 날짜 (None이면 끝까지)
+        """
+        query: Dict[str, Any] = {"collection": collection}
+        if from_date:
+            query["maxDate"] = {"$gte": from_date}
+        if to_date:
+            query["minDate"] = {"$lte": to_date}
+
+        parts = list(self.db[MANIFEST_COLLECTION].find(query).sort(_PART_ORDER))
+        # 캐시 한도보다 파트가 많아도 이번 조회에서 읽은 파트는 끝까지 사용합니다.
+        loaded = self._load_parts([part["key"] for part in parts])
+        docs: Dict[Tuple, Dict[str, Any]] = {}
+        for part in parts:
+            for doc in loaded[part["key"]].docs:
+                date = doc.get("date", "")
+                if from_date and date < from_date:
+                    continue
+                if to_date and date > to_date:
+                    continue
+                docs[_doc_key(doc)] = doc
+        yield from docs.values()
+
+    def _manifest_parts(self, collection: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            cached = self._manifest.get(collection)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        parts = list(
+            self.db[MANIFEST_COLLECTION]
+            .find({"collection": collection}, {"_id": 0, "key": 1, "minDate": 1, "serviceIndex": 1, "archivedAt": 1})
+            .sort(_PART_ORDER)
+        )
+        with self._lock:
+            self._manifest[collection] = (self._expires_at(), parts)
+        return parts
+
+    @staticmethod
+    def _services_in_part(part: _CachedPart) -> Dict[Tuple[str, str, str], List[Dict[str, Any]]]:
+        services = part.services
+        if services is None:
+            services = {}
+            for doc in part.docs:
+                services.setdefault(_service_key(doc), []).append(doc)
+            part.services = services
+        return services
+
+    def _service_parts(
+        self,
+        collection: str,
+        domain_id: str,
+        project_id: str,
+        service_id: str
+    ) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+        """서비스가 들어 있는 파트를 (key, 색인 문서) 순서로 반환합니다. (색인이 없는 기존 파트는 색인 None)"""
+        index = {
+            entry["key"]: entry
+            for entry in self.db[SERVICE_INDEX_COLLECTION].find({
+                "collection": collection,
+                "domainId": domain_id,
+                "projectId": project_id,
+                "serviceId": service_id
+            }, {"_id": 0})
+        }
+        parts = []
+        for part in self._manifest_parts(collection):
+            if not part.get("serviceIndex"):
+                parts.append((part["key"], None))
+            elif part["key"] in index:
+                parts.append((part["key"], index[part["key"]]))
+        return parts
+
+    def iter_service_days(
+        self,
+        collection: str,
+        domain_id: str,
+        project_id: str,
+        service_id: str
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        특정 서비스의 아카이브 일별 요약({"date", "expectAmount", "isAnomaly", "pricingType", "pricingTypes"})을
+        날짜 순서대로 반환합니다. 색인이 있는 파트는 내려받지 않습니다.
+        """
+        service = (domain_id, project_id, service_id)
+        parts = self._service_parts(collection, domain_id, project_id, service_id)
+        loaded = self._load_parts([key for key, entry in parts if entry is None])
+        days: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+        for key, entry in parts:
+            if entry is not None:
+                part_days = entry["days"]
+            else:
+                part_days = [_index_day(doc) for doc in self._services_in_part(loaded[key]).get(service, [])]
+            for day in part_days:
+                days[(day["date"], day.get("pricingType"))] = day
+        yield from sorted(days.values(), key=lambda day: day["date"])
+
+    def get_service_documents(
+        self,
+        collection: str,
+        domain_id: str,
+        project_id: str,
+        service_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        특정 서비스의 아카이브 문서를 반환합니다. (서비스가 들어 있는 파트만 내려받음)
+        """
+        service = (domain_id, project_id, service_id)
+        keys = [key for key, _ in self._service_parts(collection, domain_id, project_id, service_id)]
+        loaded = self._load_parts(keys)
+        docs: Dict[Tuple, Dict[str, Any]] = {}
+        for key in keys:
+            for doc in self._services_in_part(loaded[key]).get(service, []):
+                docs[_doc_key(doc)] = doc
+        return sorted(docs.values(), key=lambda doc: doc.get("date", ""))
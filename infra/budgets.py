@@ -0,0 +1,215 @@
+"""
+예산 사용량 저장 모듈
+
+예산 평가(core/budgets.py)가 사용하는 두 컬렉션을 다룹니다.
+
+- billing_budget_usage: 예산이 걸린 서비스의 (월, 서비스)별 날짜 금액
+    Hourly Job은 오늘 누적 금액으로, Daily Job은 확정 금액으로 days.<날짜>를 덮어씁니다.
+    이전 값과의 차이(delta)만 예산 상태에 더하므로 같은 시간대를 다시 실행해도 중복 합산되지 않습니다.
+- billing_budget_state: (예산, 월)별 누적 금액(spent)과 이미 알린 사용률 구간(firedThresholds)
+    구간 기록은 조건부 $addToSet 한 번으로 처리해, 여러 노드/재실행에서도 구간마다 한 번만 알립니다.
+
+두 컬렉션 모두 BUDGET_RETENTION_DAYS가 지나면 TTL로 삭제됩니다.
+
+문서 구조:
+    usage: {_id: "202501:domainId:projectId:serviceId", month, domainId, projectId, serviceId,
+            days: {"20250115": 금액, ...}, updatedAt, expiresAt}
+    state: {_id: "예산이름:202501", budget, month, monthlyAmount, spent, firedThresholds: [50.0, ...],
+            events: [{threshold, spent, at}], updatedAt, expiresAt}
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.collection import Collection
+from pymongo.database import Database
+from pymongo.operations import UpdateOne
+
+from infra.mongo_client import write_batch
+
+
+BUDGET_USAGE_COLLECTION = "billing_budget_usage"
+BUDGET_STATE_COLLECTION = "billing_budget_state"
+
+# 월이 지난 사용량/상태 보관 기간
+BUDGET_RETENTION_DAYS = 100
+
+ServiceKey = Tuple[str, str, str]
+
+
+def ensure_budget_indexes(db: Database):
+    """
+    예산 컬렉션 인덱스를 생성합니다. (예산 범위별 사용량 합계 조회 + expiresAt TTL)
+
+    Args:
+        db: Database 인스턴스
+    """
+    usage = db[BUDGET_USAGE_COLLECTION]
+    usage.create_index(
+        [("month", ASCENDING), ("domainId", ASCENDING), ("projectId", ASCENDING), ("serviceId", ASCENDING)],
+        name="month_domain_project_service"
+    )
+    for collection in (usage, db[BUDGET_STATE_COLLECTION]):
+        collection.create_index(
+            [("expiresAt", ASCENDING)],
+            expireAfterSeconds=0,
+            name="ttl_expiresAt"
+        )
+
+
+def usage_id(month: str, key: ServiceKey) -> str:
+    """사용량 문서 _id (월 + 서비스)"""
+    return ":".join((month,) + tuple(key))
+
+
+def get_usage_days(collection: Collection, month: str, keys: Iterable[ServiceKey]) -> Dict[ServiceKey, Dict[str, float]]:
+    """
+    서비스별로 기록된 날짜 금액을 조회합니다. (문서가 없는 서비스는 결과에 없음)
+
+    Args:
+        collection: billing_budget_usage 컬렉션
+        month: 월 (YYYYMM)
+        keys: 서비스 키 목록
+
+    Returns:
+        {(domainId, projectId, serviceId): {"YYYYMMDD": 금액}}
+    """
+    ids = [usage_id(month, key) for key in keys]
+    if not ids:
+        return {}
+    projection = {"domainId": 1, "projectId": 1, "serviceId": 1, "days": 1}
+    return {
+        (doc["domainId"], doc["projectId"], doc["serviceId"]): {
+            date: float(amount or 0) for date, amount in (doc.get("days") or {}).items()
+        }
+        for doc in collection.find({"_id": {"$in": ids}}, projection)
+    }
+
+
+def set_usage_days(collection: Collection, month: str, updates: Dict[ServiceKey, Dict[str, float]]) -> None:
+    """
+    서비스별 날짜 금액을 기록합니다. (지정한 날짜만 덮어씀)
+
+    Args:
+        collection: billing_budget_usage 컬렉션
+        month: 월 (YYYYMM)
+        updates: {(domainId, projectId, serviceId): {"YYYYMMDD": 금액}}
+    """
+    now = datetime.utcnow()
+    expires_at = now + timedelta(days=BUDGET_RETENTION_DAYS)
+    operations = []
+    for key, days in updates.items():
+        fields = {f"days.{date}": round(amount, 2) for date, amount in days.items()}
+        fields.update(updatedAt=now, expiresAt=expires_at)
+        operations.append(UpdateOne(
+            {"_id": usage_id(month, key)},
+            {
+                "$set": fields,
+                "$setOnInsert": {"month": month, "domainId": key[0], "projectId": key[1], "serviceId": key[2]},
+            },
+            upsert=True
+        ))
+    if operations:
+        write_batch(collection, operations)
+
+
+def sum_usage(
+    collection: Collection,
+    month: str,
+    domain_id: str,
+    project_id: Optional[str] = None,
+    service_id: Optional[str] = None
+) -> float:
+    """
+    예산 범위(domain / project / service)에 기록된 월 사용량 합계
+
+    Args:
+        collection: billing_budget_usage 컬렉션
+        month: 월 (YYYYMM)
+        domain_id: 도메인 ID
+        project_id: 프로젝트 ID
+        service_id: 서비스 ID
+
+    Returns:
+        합계 금액
+    """
+    query = {"month": month, "domainId": domain_id}
+    if project_id is not None:
+        query["projectId"] = project_id
+    if service_id is not None:
+        query["serviceId"] = service_id
+    return sum(
+        float(amount or 0)
+        for doc in collection.find(query, {"_id": 0, "days": 1})
+        for amount in (doc.get("days") or {}).values()
+    )
+
+
+def existing_states(collection: Collection, ids: List[str]) -> Set[str]:
+    """이미 있는 예산 상태 문서 _id"""
+    if not ids:
+        return set()
+    return {doc["_id"] for doc in collection.find({"_id": {"$in": ids}}, {"_id": 1})}
+
+
+def add_budget_spend(
+    collection: Collection,
+    state_id: str,
+    budget: str,
+    month: str,
+    monthly_amount: float,
+    amount: float
+) -> dict:
+    """
+    예산 누적 금액에 amount를 더하고 갱신된 상태 문서를 반환합니다.
+
+    Args:
+        collection: billing_budget_state 컬렉션
+        state_id: 상태 문서 _id
+        budget: 예산 이름
+        month: 월 (YYYYMM)
+        monthly_amount: 월 예산 금액
+        amount: 더할 금액 (음수면 재집계로 줄어든 금액)
+
+    Returns:
+        갱신 후 상태 문서
+    """
+    now = datetime.utcnow()
+    return collection.find_one_and_update(
+        {"_id": state_id},
+        {
+            "$inc": {"spent": amount},
+            "$set": {
+                "monthlyAmount": monthly_amount,
+                "updatedAt": now,
+                "expiresAt": now + timedelta(days=BUDGET_RETENTION_DAYS),
+            },
+            "$setOnInsert": {"budget": budget, "month": month, "firedThresholds": [], "events": []},
+        },
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+
+
+def claim_threshold(collection: Collection, state_id: str, threshold: float, spent: float) -> bool:
+    """
+    사용률 구간 알림을 기록합니다. (이미 기록된 구간이면 False)
+
+    Args:
+        collection: billing_budget_state 컬렉션
+        state_id: 상태 문서 _id
+        threshold: 사용률 구간 (%)
+        spent: 현재 누적 금액
+
+    Returns:
+        이번 호출이 처음 기록했으면 True
+    """
+    result = collection.update_one(
+        {"_id": state_id, "firedThresholds": {"$ne": threshold}},
+        {
+            "$addToSet": {"firedThresholds": threshold},
+            "$push": {"events": {"threshold": threshold, "spent": round(spent, 2), "at": datetime.utcnow()}},
+        }
+    )
+    return result.modified_count == 1
@@ -0,0 +1,178 @@
+"""
+Raw 비용 엔트리 컬럼 포맷(Parquet / Arrow IPC) 내보내기 모듈
+
+Daily Job이 받은 엔트리를 타입이 지정된 컬럼 파일로 Object Storage에 저장합니다.
+오프라인 분석/백필에서 필요한 컬럼과 파티션만 읽을 수 있도록 Hive 스타일 경로를 사용합니다.
+
+key 구조:
+    columnar/year=YYYY/month=MM/day=DD/billing_YYYYMMDD.parquet   (pyarrow.parquet 사용 가능 시)
+    columnar/year=YYYY/month=MM/day=DD/billing_YYYYMMDD.arrow     (Arrow IPC fallback)
+    (테넌트 실행 시 columnar/tenant=NAME/year=... 파티션)
+
+고정 스키마에 없는 필드(API에 새로 추가된 필드 등)는 버리지 않고, 엔트리별로 모아
+JSON 문자열 컬럼(extra)에 저장합니다. (없으면 null)
+
+pyarrow는 선택 의존성입니다. 설치되어 있지 않으면 내보내기를 건너뜁니다.
+"""
+
+import json
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from botocore.exceptions import ClientError
+
+from config.settings import ObjectStorageSettings
+from infra.object_storage import get_s3_client, partition_root, SPOOL_MAX_BYTES, TRANSFER_CONFIG
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    # pyarrow가 parquet 지원 없이 빌드된 경우 Arrow IPC로 저장합니다.
+    pq = None
+
+
+# 정렬 키이자 row group 안에서 연속 구간을 이루는 컬럼
+SORT_COLUMNS = ("domainId", "projectId", "serviceId")
+STRING_COLUMNS = (
+    "meteringDate", "domainId", "domainName", "projectId", "projectName",
+    "serviceId", "serviceName", "resourceId", "region", "pricingType",
+)
+FLOAT_COLUMNS = (
+    "usageTime", "usageSize", "generalAmount", "discountAmount", "expectAmount",
+)
+# 위 컬럼에 없는 필드를 JSON 객체로 담는 컬럼
+EXTRA_COLUMN = "extra"
+ROW_GROUP_SIZE = 100_000
+
+_KNOWN_COLUMNS = frozenset(STRING_COLUMNS + FLOAT_COLUMNS)
+
+
+@dataclass
+class ColumnarExportResult:
+    """컬럼 포맷 내보내기 결과"""
+    key: str
+    format: str
+    rows: int
+    bytes: int
+
+
+def is_available() -> bool:
+    """pyarrow 사용 가능 여부"""
+    return pa is not None
+
+
+def _schema():
+    return pa.schema(
+        [(name, pa.string()) for name in STRING_COLUMNS]
+        + [(name, pa.float64()) for name in FLOAT_COLUMNS]
+        + [(EXTRA_COLUMN, pa.string())]
+    )
+
+
+def _extra_json(item: Dict[str, Any]) -> Optional[str]:
+    extra = {k: v for k, v in item.items() if k not in _KNOWN_COLUMNS}
+    if not extra:
+        return None
+    return json.dumps(extra, ensure_ascii=False, sort_keys=True, default=str)
+
+
+def entries_to_table(entries: List[Dict[str, Any]]):
+    """
+    엔트리 리스트를 domain/project/service 순으로 정렬한 Arrow Table로 변환합니다.
+    금액/사용량은 float64로 변환하고, 스키마에 없는 필드는 extra 컬럼(JSON)에 담습니다.
+
+    Args:
+        entries: 비용 엔트리 리스트
+
+    Returns:
+        pyarrow.Table
+    """
+    rows = sorted(
+        (item for item in entries if isinstance(item, dict)),
+        key=lambda item: tuple(str(item.get(c) or "") for c in SORT_COLUMNS)
+    )
+
+    columns = {}
+    for name in STRING_COLUMNS:
+        columns[name] = [None if item.get(name) is None else str(item.get(name)) for item in rows]
+    for name in FLOAT_COLUMNS:
+        columns[name] = [float(item.get(name) or 0) for item in rows]
+    columns[EXTRA_COLUMN] = [_extra_json(item) for item in rows]
+
+    return pa.Table.from_pydict(columns, schema=_schema())
+
+
+def build_columnar_key(date_str: str, extension: str, root: str = "columnar") -> str:
+    """Hive 스타일 파티션 key를 생성합니다."""
+    return (
+        f"{root}/year={date_str[:4]}/month={date_str[4:6]}/day={date_str[6:8]}/"
+        f"billing_{date_str}.{extension}"
+    )
+
+
+def export_columnar(
+    entries: List[Dict[str, Any]],
+    date_str: str,
+    settings: ObjectStorageSettings,
+    row_group_size: int = ROW_GROUP_SIZE
+) -> Optional[ColumnarExportResult]:
+    """
+    엔트리를 Parquet(불가 시 Arrow IPC) 파일로 변환해 업로드합니다.
+
+    Args:
+        entries: 비용 엔트리 리스트
+        date_str: 날짜 문자열 (YYYYMMDD)
+        settings: Object Storage 설정
+        row_group_size: Parquet row group / IPC record batch 크기
+
+    Returns:
+        ColumnarExportResult (pyarrow 미설치 시 None)
+
+    Raises:
+        RuntimeError: 업로드 실패 시
+    """
+    if pa is None:
+        return None
+
+    table = entries_to_table(entries)
+
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as spool:
+        if pq is not None:
+            fmt, extension, content_type = "parquet", "parquet", "application/vnd.apache.parquet"
+            pq.write_table(
+                table,
+                spool,
+                row_group_size=row_group_size,
+                compression="zstd"
+            )
+        else:
+            fmt, extension, content_type = "arrow", "arrow", "application/vnd.apache.arrow.file"
+            with pa.ipc.new_file(spool, table.schema) as writer:
+                for batch in table.to_batches(max_chunksize=row_group_size):
+                    writer.write_batch(batch)
+
+        size = spool.tell()
+        spool.seek(0)
+        key = build_columnar_key(date_str, extension, partition_root("columnar", settings))
+
+        s3_client = get_s3_client(settings)
+        try:
+            s3_client.upload_fileobj(
+                spool,
+                settings.bucket,
+                key,
+                ExtraArgs={
+                    "ContentType": content_type,
+                    "Metadata": {"format": fmt, "row-count": str(table.num_rows)},
+                },
+                Config=TRANSFER_CONFIG
+            )
+        except ClientError as e:
+            raise RuntimeError(f"Object Storage 업로드 실패: {e}") from e
+
+    return ColumnarExportResult(key=key, format=fmt, rows=table.num_rows, bytes=size)
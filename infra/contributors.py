@@ -0,0 +1,94 @@
+"""
+비용 기여도 순위 저장 모듈
+
+Daily Job이 계산한 범위별 기여도 / 전일 대비 변동 순위(core/contributors.py)를
+`billing_contributors` 컬렉션에 날짜 × 범위당 문서 1개로 저장합니다.
+대시보드와 리포트는 billing_daily를 집계하지 않고 문서 1개를 읽어 "무엇이 늘었는지"를 보여줄 수 있습니다.
+
+- _id는 (날짜, 범위)로 정해지므로 같은 날짜를 다시 처리하면 덮어씁니다.
+- retentionDays가 지난 문서는 TTL로 삭제됩니다.
+- 전일 데이터가 없는 범위는 hasPrevious=false, previousAmount/delta=null, 변동 순위는 빈 목록입니다.
+
+문서 구조:
+    {_id: "20250115:project:domainId:projectId", date, previousDate, level: total|domain|project,
+     domainId, projectId, tenant, name, totalAmount, hasPrevious, previousAmount, delta,
+     topServices: [{domainId, projectId, serviceId, name, projectName, amount, previousAmount, delta, share}],
+     topIncreases, topDecreases, topProjects, projectIncreases, updatedAt, expiresAt}
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from pymongo import ASCENDING, DESCENDING
+from pymongo.collection import Collection
+from pymongo.database import Database
+from pymongo.operations import ReplaceOne
+
+from core.contributors import LEVEL_TOTAL, ContributorReport, ScopeRanking
+from infra.mongo_client import write_batch
+
+
+CONTRIBUTORS_COLLECTION = "billing_contributors"
+
+
+def ensure_contributor_indexes(db: Database):
+    """
+    billing_contributors 인덱스를 생성합니다. (범위별 최근 날짜 조회 + expiresAt TTL)
+
+    Args:
+        db: Database 인스턴스
+    """
+    collection = db[CONTRIBUTORS_COLLECTION]
+    collection.create_index(
+        [("level", ASCENDING), ("domainId", ASCENDING), ("projectId", ASCENDING), ("date", DESCENDING)],
+        name="level_domain_project_date"
+    )
+    collection.create_index(
+        [("expiresAt", ASCENDING)],
+        expireAfterSeconds=0,
+        name="ttl_expiresAt"
+    )
+
+
+def contributor_doc_id(date: str, scope: ScopeRanking, tenant: Optional[str] = None) -> str:
+    """범위 문서 _id (전체 범위는 테넌트별)"""
+    if scope.level == LEVEL_TOTAL:
+        return f"{date}:{LEVEL_TOTAL}:{tenant or ''}"
+    return ":".join(part for part in (date, scope.level, scope.domain_id, scope.project_id) if part is not None)
+
+
+def save_contributors(
+    collection: Collection,
+    report: ContributorReport,
+    retention_days: int,
+    tenant: Optional[str] = None
+) -> int:
+    """
+    범위별 순위 문서를 저장합니다.
+
+    Args:
+        collection: billing_contributors 컬렉션
+        report: build_contributors 결과
+        retention_days: 보관 기간(일)
+        tenant: 테넌트 이름
+
+    Returns:
+        저장한 문서 수
+    """
+    now = datetime.utcnow()
+    expires_at = now + timedelta(days=retention_days)
+    operations = []
+    for scope in report.scopes():
+        doc = scope.to_dict()
+        doc.update(
+            _id=contributor_doc_id(report.date, scope, tenant),
+            date=report.date,
+            previousDate=report.previous_date,
+            tenant=tenant,
+            updatedAt=now,
+            expiresAt=expires_at,
+        )
+        operations.append(ReplaceOne({"_id": doc["_id"]}, doc, upsert=True))
+    if operations:
+        write_batch(collection, operations)
+    return len(operations)
@@ -0,0 +1,579 @@
+"""
+billing_daily 저장소 모듈
+
+일별 집계 데이터를 저장/조회하는 인터페이스(DailyStore)와 두 가지 구현을 제공합니다.
+
+- DocumentDailyStore  : 기존 billing_daily 일반 컬렉션 (기본값)
+- TimeSeriesDailyStore: MongoDB time-series 컬렉션 (metaField = domainId/projectId/serviceId)
+
+잡과 baseline 계산은 DailyStore 메서드만 사용하므로, 설정(mongo.dailyStorage)만 바꾸면
+저장 방식이 전환됩니다. time-series 모드는 MongoDB 7.0 이상이 필요합니다.
+(timeField 조건 삭제, 측정값 필드 update 지원)
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from pymongo import ASCENDING
+from pymongo.database import Database
+from pymongo.errors import OperationFailure
+
+from config.settings import MongoSettings, ObjectStorageSettings
+from core import metrics
+from core.aggregator import DailySummary
+from infra.archive import ArchiveReader
+from infra.mongo_client import (
+    DAILY_HISTORY_BATCH_SIZE,
+    DAILY_SERIES_FIELDS,
+    ROLLUP_AMOUNT_FIELDS,
+    bulk_upsert_daily_summaries,
+    find_daily_series,
+    get_daily_amounts_for_date,
+    get_all_daily_for_service,
+    iter_daily_amounts_for_service,
+    get_pricing_types_for_service,
+    update_daily_anomaly_status
+)
+
+
+DAILY_STORAGE_DOCUMENT = "document"
+DAILY_STORAGE_TIMESERIES = "timeseries"
+
+TIMESERIES_DAILY_COLLECTION = "billing_daily_ts"
+TIMESERIES_HOURLY_COLLECTION = "billing_hourly_ts"
+# time-series 측정값은 upsert가 불가하므로 이상치 마킹은 별도 컬렉션에 먼저 기록합니다.
+DAILY_FLAGS_COLLECTION = "billing_daily_flags"
+
+
+def date_to_datetime(date_str: str, hour: int = 0) -> datetime:
+    """
+    YYYYMMDD (+hour) 문자열을 time-series timeField용 datetime으로 변환합니다.
+    """
+    return datetime.strptime(date_str, "%Y%m%d") + timedelta(hours=hour)
+
+
+def summary_to_timeseries_doc(summary: DailySummary, ts: datetime, is_anomaly: bool = False) -> Dict[str, Any]:
+    """
+    DailySummary를 time-series 측정 문서로 변환합니다.
+    """
+    return {
+        "ts": ts,
+        "meta": {
+            "domainId": summary.domain_id,
+            "projectId": summary.project_id,
+            "serviceId": summary.service_id
+        },
+        "date": summary.metering_date,
+        "domainName": summary.domain_name,
+        "projectName": summary.project_name,
+        "serviceName": summary.service_name,
+        "expectAmount": summary.expect_amount,
+        "usageTime": summary.usage_time,
+        "usageSize": summary.usage_size,
+        "generalAmount": summary.general_amount,
+        "discountAmount": summary.discount_amount,
+        "pricingTypes": summary.pricing_types,
+        "regions": summary.regions,
+        "isAnomaly": is_anomaly
+    }
+
+
+def daily_doc_to_timeseries_doc(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    기존 billing_daily 문서를 time-series 측정 문서로 변환합니다. (마이그레이션용)
+    """
+    return {
+        "ts": date_to_datetime(doc["date"]),
+        "meta": {
+            "domainId": doc.get("domainId", ""),
+            "projectId": doc.get("projectId", ""),
+            "serviceId": doc.get("serviceId", "")
+        },
+        "date": doc["date"],
+        "domainName": doc.get("domainName", ""),
+        "projectName": doc.get("projectName", ""),
+        "serviceName": doc.get("serviceName", ""),
+        "expectAmount": float(doc.get("expectAmount") or 0),
+        "usageTime": float(doc.get("usageTime") or 0),
+        "usageSize": float(doc.get("usageSize") or 0),
+        "generalAmount": float(doc.get("generalAmount") or 0),
+        "discountAmount": float(doc.get("discountAmount") or 0),
+        "pricingTypes": doc.get("pricingTypes", []),
+        "regions": doc.get("regions", []),
+        "isAnomaly": bool(doc.get("isAnomaly", False))
+    }
+
+
+def series_doc(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    일반/time-series/아카이브 문서를 조회 API용 일별 문서(DAILY_SERIES_FIELDS)로 맞춥니다.
+    """
+    flat = dict(doc.get("meta") or {})
+    flat.update((k, v) for k, v in doc.items() if k != "meta")
+    return {field: flat.get(field) for field in DAILY_SERIES_FIELDS}
+
+
+def _series_match(doc: Dict[str, Any], domain_id: str, project_id: Optional[str], service_id: Optional[str]) -> bool:
+    if doc.get("pricingType") is not None:
+        return False
+    meta = doc.get("meta") or doc
+    return (
+        meta.get("domainId") == domain_id
+        and (project_id is None or meta.get("projectId") == project_id)
+        and (service_id is None or meta.get("serviceId") == service_id)
+    )
+
+
+class DailyStore(ABC):
+    """
+    일별 집계 저장소 인터페이스
+    """
+
+    @abstractmethod
+    def bulk_upsert_daily_summaries(self, summaries: List[DailySummary]) -> int:
+        """일별 집계 결과를 저장합니다. (같은 날짜/서비스는 덮어씀)"""
+
+    @abstractmethod
+    def record_hourly_summaries(self, summaries: List[DailySummary], hour: int) -> int:
+        """시간대별 누적 집계 스냅샷을 저장합니다. (지원하지 않는 저장소는 0 반환)"""
+
+    @abstractmethod
+    def get_all_daily_for_service(self, domain_id: str, project_id: str, service_id: str) -> List[dict]:
+        """특정 서비스의 (이상치 제외) 일별 문서를 날짜 오름차순으로 조회합니다."""
+
+    @abstractmethod
+    def iter_daily_amounts(self, domain_id: str, project_id: str, service_id: str) -> Iterator[float]:
+        """특정 서비스의 (이상치 제외) 일별 expectAmount를 스트리밍합니다."""
+
+    @abstractmethod
+    def get_pricing_types(self, domain_id: str, project_id: str, service_id: str) -> List[str]:
+        """특정 서비스의 일별 데이터에 등장한 pricingType 목록을 조회합니다."""
+
+    @abstractmethod
+    def get_daily_amounts_for_date(self, date: str) -> Dict[Tuple[str, str, str], Dict[str, float]]:
+        """특정 날짜에 저장된 서비스별 금액을 조회합니다. (이상치 포함)"""
+
+    @abstractmethod
+    def mark_anomaly(self, date: str, domain_id: str, project_id: str, service_id: str, is_anomaly: bool) -> None:
+        """일별 데이터의 이상치 상태를 기록합니다."""
+
+    @abstractmethod
+    def iter_daily_series(
+        self,
+        domain_id: str,
+        from_date: str,
+        to_date: str,
+        project_id: Optional[str] = None,
+        service_id: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """도메인(/프로젝트/서비스)의 기간별 일별 문서(series_doc)를 날짜 오름차순으로 스트리밍합니다. (이상치 포함)"""
+
+
+class DocumentDailyStore(DailyStore):
+    """
+    billing_daily 일반 컬렉션 저장소 (기존 동작)
+    """
+
+    def __init__(self, db: Database):
+        self.collection = db.billing_daily
+
+    def bulk_upsert_daily_summaries(self, summaries: List[DailySummary]) -> int:
+        return bulk_upsert_daily_summaries(self.collection, summaries)
+
+    def record_hourly_summaries(self, summaries: List[DailySummary], hour: int) -> int:
+        # 일반 컬렉션 모드에서는 시간대별 스냅샷을 저장하지 않습니다.
+        return 0
+
+    def get_all_daily_for_service(self, domain_id: str, project_id: str, service_id: str) -> List[dict]:
+        return get_all_daily_for_service(self.collection, domain_id, project_id, service_id)
+
+    def iter_daily_amounts(self, domain_id: str, project_id: str, service_id: str) -> Iterator[float]:
+        return iter_daily_amounts_for_service(self.collection, domain_id, project_id, service_id)
+
+    def get_pricing_types(self, domain_id: str, project_id: str, service_id: str) -> List[str]:
+        return get_pricing_types_for_service(self.collection, domain_id, project_id, service_id)
+
+    def get_daily_amounts_for_date(self, date: str) -> Dict[Tuple[str, str, str], Dict[str, float]]:
+        return get_daily_amounts_for_date(self.collection, date)
+
+    def iter_daily_series(
+        self,
+        domain_id: str,
+        from_date: str,
+        to_date: str,
+        project_id: Optional[str] = None,
+        service_id: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        for doc in find_daily_series(self.collection, domain_id, from_date, to_date, project_id, service_id):
+            yield series_doc(doc)
+
+    def mark_anomaly(self, date: str, domain_id: str, project_id: str, service_id: str, is_anomaly: bool) -> None:
+        update_daily_anomaly_status(
+            collection=self.collection,
+            date=date,
+            domain_id=domain_id,
+            project_id=project_id,
+            service_id=service_id,
+            is_anomaly=is_anomaly
+        )
+
+
+class TimeSeriesDailyStore(DailyStore):
+    """
+    MongoDB time-series 컬렉션 저장소
+
+    - billing_daily_ts : 하루 1건 (ts = 해당 날짜 00:00)
+    - billing_hourly_ts: 시간대별 누적 스냅샷 (ts = 해당 날짜 + hour)
+    - metaField(meta) = {domainId, projectId, serviceId}
+
+    컬렉션은 get_daily_store(dailyStorage: timeseries) 또는 scripts/migrate_daily_timeseries.py가 생성합니다.
+    """
+
+    def __init__(self, db: Database):
+        self.db = db
+        self.collection = db[TIMESERIES_DAILY_COLLECTION]
+        self.hourly_collection = db[TIMESERIES_HOURLY_COLLECTION]
+        self.flags = db[DAILY_FLAGS_COLLECTION]
+
+    def _replace_measurements(self, collection, summaries: List[DailySummary], ts: datetime, flagged=frozenset()) -> int:
+        # time-series 컬렉션은 upsert가 없으므로 같은 시각의 같은 서비스 측정값만 지우고 다시 넣습니다.
+        # (도메인 단위로 지우면 project 기준 shard끼리 서로의 측정값을 지움)
+        services: Dict[Tuple[str, str], List[str]] = {}
+        for s in summaries:
+            services.setdefault((s.domain_id, s.project_id), []).append(s.service_id)
+        collection.delete_many({
+            "ts": ts,
+            "$or": [
+                {"meta.domainId": domain_id, "meta.projectId": project_id, "meta.serviceId": {"$in": service_ids}}
+                for (domain_id, project_id), service_ids in sorted(services.items())
+            ]
+        })
+        docs = [
+            summary_to_timeseries_doc(
+                s,
+                ts,
+                is_anomaly=(s.domain_id, s.project_id, s.service_id) in flagged
+            )
+            for s in summaries
+        ]
+        with metrics.timer("mongo_write_batch_seconds", collection=collection.name):
+            collection.insert_many(docs, ordered=False)
+        metrics.inc("mongo_write_batches_total", collection=collection.name)
+        metrics.inc("mongo_written_docs_total", len(docs), collection=collection.name)
+        return len(docs)
+
+    def bulk_upsert_daily_summaries(self, summaries: List[DailySummary]) -> int:
+        if not summaries:
+            return 0
+
+        count = 0
+        by_date: Dict[str, List[DailySummary]] = {}
+        for summary in summaries:
+            by_date.setdefault(summary.metering_date, []).append(summary)
+
+        for date, day_summaries in by_date.items():
+            # Hourly Job이 미리 남긴 이상치 마킹을 측정값에 반영합니다.
+            flagged = {
+                (f["domainId"], f["projectId"], f["serviceId"])
+                for f in self.flags.find(
+                    {"date": date, "isAnomaly": True},
+                    {"_id": 0, "domainId": 1, "projectId": 1, "serviceId": 1}
+                )
+            }
+            count += self._replace_measurements(
+                self.collection, day_summaries, date_to_datetime(date), flagged
+            )
+        return count
+
+    def record_hourly_summaries(self, summaries: List[DailySummary], hour: int) -> int:
+        if not summaries:
+            return 0
+        count = 0
+        by_date: Dict[str, List[DailySummary]] = {}
+        for summary in summaries:
+            by_date.setdefault(summary.metering_date, []).append(summary)
+        for date, day_summaries in by_date.items():
+            count += self._replace_measurements(
+                self.hourly_collection, day_summaries, date_to_datetime(date, hour)
+            )
+        return count
+
+    def _history_query(self, domain_id: str, project_id: str, service_id: str) -> dict:
+        return {
+            "meta.domainId": domain_id,
+            "meta.projectId": project_id,
+            "meta.serviceId": service_id,
+            "isAnomaly": {"$ne": True}
+        }
+
+    def get_all_daily_for_service(self, domain_id: str, project_id: str, service_id: str) -> List[dict]:
+        cursor = self.collection.find(
+            self._history_query(domain_id, project_id, service_id)
+        ).sort("ts", ASCENDING)
+        docs = []
+        for doc in cursor:
+            # 기존 billing_daily 문서 형태로 맞춰 반환합니다.
+            meta = doc.pop("meta", {})
+            doc.update(meta)
+            doc["pricingType"] = None
+            docs.append(doc)
+        return docs
+
+    def iter_daily_amounts(self, domain_id: str, project_id: str, service_id: str) -> Iterator[float]:
+        cursor = (
+            self.collection.find(
+                self._history_query(domain_id, project_id, service_id),
+                {"_id": 0, "expectAmount": 1}
+            )
+            .sort("ts", ASCENDING)
+            .batch_size(DAILY_HISTORY_BATCH_SIZE)
+        )
+        for doc in cursor:
+            yield float(doc.get("expectAmount") or 0)
+
+    def get_pricing_types(self, domain_id: str, project_id: str, service_id: str) -> List[str]:
+        values = self.collection.distinct(
+            "pricingTypes",
+            self._history_query(domain_id, project_id, service_id)
+        )
+        return sorted(v for v in values if isinstance(v, str))
+
+    def get_daily_amounts_for_date(self, date: str) -> Dict[Tuple[str, str, str], Dict[str, float]]:
+        projection = {"_id": 0, "meta": 1}
+        projection.update({field: 1 for field in ROLLUP_AMOUNT_FIELDS})
+        amounts = {}
+        for doc in self.collection.find({"ts": date_to_datetime(date)}, projection):
+            meta = doc.get("meta", {})
+            key = (meta.get("domainId", ""), meta.get("projectId", ""), meta.get("serviceId", ""))
+            amounts[key] = {field: float(doc.get(field) or 0) for field in ROLLUP_AMOUNT_FIELDS}
+        return amounts
+
+    def iter_daily_series(
+        self,
+        domain_id: str,
+        from_date: str,
+        to_date: str,
+        project_id: Optional[str] = None,
+        service_id: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        query = {
+            "meta.domainId": domain_id,
+            "ts": {"$gte": date_to_datetime(from_date), "$lte": date_to_datetime(to_date)}
+        }
+        if project_id is not None:
+            query["meta.projectId"] = project_id
+            if service_id is not None:
+                query["meta.serviceId"] = service_id
+        cursor = (
+            self.collection.find(query, {"_id": 0, "ts": 0})
+            .sort([("ts", ASCENDING), ("meta.projectId", ASCENDING), ("meta.serviceId", ASCENDING)])
+            .batch_size(DAILY_HISTORY_BATCH_SIZE)
+        )
+        for doc in cursor:
+            yield series_doc(doc)
+
+    def mark_anomaly(self, date: str, domain_id: str, project_id: str, service_id: str, is_anomaly: bool) -> None:
+        now = datetime.utcnow()
+        self.flags.update_one(
+            {"date": date, "domainId": domain_id, "projectId": project_id, "serviceId": service_id},
+            {"$set": {"isAnomaly": is_anomaly, "updatedAt": now}, "$setOnInsert": {"createdAt": now}},
+            upsert=True
+        )
+        # 이미 저장된 측정값이 있으면 함께 갱신합니다. (재실행 등)
+        self.collection.update_many(
+            {
+                "ts": date_to_datetime(date),
+                "meta.domainId": domain_id,
+                "meta.projectId": project_id,
+                "meta.serviceId": service_id
+            },
+            {"$set": {"isAnomaly": is_anomaly}}
+        )
+
+
+class ArchivedDailyStore(DailyStore):
+    """
+    아카이브(Object Storage)된 과거 데이터를 함께 읽는 저장소 래퍼
+
+    쓰기는 내부 저장소에 그대로 위임하고, 이력 조회 시 아카이브 범위를 앞에 이어 붙입니다.
+    baseline/리포트 코드는 데이터가 MongoDB에 있는지 아카이브에 있는지 알 필요가 없습니다.
+    아카이브된 날짜를 다시 집계(restatement)해 MongoDB에도 있으면 MongoDB 문서를 사용합니다.
+    """
+
+    def __init__(self, inner: DailyStore, reader: ArchiveReader):
+        self.inner = inner
+        self.reader = reader
+        self.collection = inner.collection
+        self.collection_name = inner.collection.name
+
+    def _current_dates(self, domain_id: str, project_id: str, service_id: str, dates: List[str]) -> set:
+        """아카이브 날짜 범위 안에서 MongoDB에도 남아 있는 날짜를 반환합니다. (이상치 포함)"""
+        if not dates:
+            return set()
+        return {
+            doc["date"]
+            for doc in self.inner.iter_daily_series(domain_id, min(dates), max(dates), project_id, service_id)
+        }
+
+    def _archived_days(self, domain_id: str, project_id: str, service_id: str) -> List[Dict[str, Any]]:
+        days = list(self.reader.iter_service_days(self.collection_name, domain_id, project_id, service_id))
+        current = self._current_dates(domain_id, project_id, service_id, [day["date"] for day in days])
+        return [day for day in days if not day.get("isAnomaly") and day["date"] not in current]
+
+    def bulk_upsert_daily_summaries(self, summaries: List[DailySummary]) -> int:
+        return self.inner.bulk_upsert_daily_summaries(summaries)
+
+    def record_hourly_summaries(self, summaries: List[DailySummary], hour: int) -> int:
+        return self.inner.record_hourly_summaries(summaries, hour)
+
+    def get_all_daily_for_service(self, domain_id: str, project_id: str, service_id: str) -> List[dict]:
+        docs = self.reader.get_service_documents(self.collection_name, domain_id, project_id, service_id)
+        current = self._current_dates(domain_id, project_id, service_id, [doc.get("date", "") for doc in docs])
+        archived = []
+        for doc in docs:
+            if doc.get("isAnomaly") or doc.get("date") in current:
+                continue
+            doc = dict(doc)
+            doc.update(doc.pop("meta", {}) or {})
+            archived.append(doc)
+        return archived + self.inner.get_all_daily_for_service(domain_id, project_id, service_id)
+
+    def iter_daily_amounts(self, domain_id: str, project_id: str, service_id: str) -> Iterator[float]:
+        for day in self._archived_days(domain_id, project_id, service_id):
+            yield day["expectAmount"]
+        yield from self.inner.iter_daily_amounts(domain_id, project_id, service_id)
+
+    def get_pricing_types(self, domain_id: str, project_id: str, service_id: str) -> List[str]:
+        values = set(self.inner.get_pricing_types(domain_id, project_id, service_id))
+        for day in self._archived_days(domain_id, project_id, service_id):
+            values.update(v for v in day.get("pricingTypes") or [] if isinstance(v, str))
+        return sorted(values)
+
+    def get_daily_amounts_for_date(self, date: str) -> Dict[Tuple[str, str, str], Dict[str, float]]:
+        amounts = self.inner.get_daily_amounts_for_date(date)
+        if amounts or not self.reader.has_archive(self.collection_name, date[:6]):
+            return amounts
+        for doc in self.reader.iter_documents(self.collection_name, date, date):
+            if doc.get("pricingType") is not None:
+                continue
+            meta = doc.get("meta") or doc
+            key = (meta.get("domainId", ""), meta.get("projectId", ""), meta.get("serviceId", ""))
+            amounts[key] = {field: float(doc.get(field) or 0) for field in ROLLUP_AMOUNT_FIELDS}
+        return amounts
+
+    def iter_daily_series(
+        self,
+        domain_id: str,
+        from_date: str,
+        to_date: str,
+        project_id: Optional[str] = None,
+        service_id: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        # 아카이브와 MongoDB 문서를 날짜 순으로 합칩니다.
+        # (다시 집계되어 MongoDB에도 있는 날짜/서비스는 MongoDB 문서만 사용)
+        current = list(self.inner.iter_daily_series(domain_id, from_date, to_date, project_id, service_id))
+        current_keys = {(d["date"], d["projectId"], d["serviceId"]) for d in current}
+        archived = [
+            series_doc(doc)
+            for doc in self.reader.iter_documents(self.collection_name, from_date, to_date)
+            if _series_match(doc, domain_id, project_id, service_id)
+        ]
+        docs = [d for d in archived if (d["date"], d["projectId"], d["serviceId"]) not in current_keys] + current
+        docs.sort(key=lambda d: (d["date"], d["projectId"] or "", d["serviceId"] or ""))
+        yield from docs
+
+    def mark_anomaly(self, date: str, domain_id: str, project_id: str, service_id: str, is_anomaly: bool) -> None:
+        self.inner.mark_anomaly(date, domain_id, project_id, service_id, is_anomaly)
+
+
+def ensure_daily_flags_index(db: Database) -> None:
+    """
+    billing_daily_flags 고유 인덱스를 생성합니다. (스키마 마이그레이션용, 저장 방식과 무관)
+
+    Args:
+        db: Database 인스턴스
+    """
+    db[DAILY_FLAGS_COLLECTION].create_index(
+        [
+            ("date", ASCENDING),
+            ("domainId", ASCENDING),
+            ("projectId", ASCENDING),
+            ("serviceId", ASCENDING)
+        ],
+        unique=True,
+        name="unique_daily_flag"
+    )
+
+
+def ensure_timeseries_collections(db: Database) -> None:
+    """
+    time-series 컬렉션과 보조 인덱스를 생성합니다. (이미 있으면 건너뜀)
+    dailyStorage가 timeseries일 때만 호출합니다. (get_daily_store, scripts/migrate_daily_timeseries.py)
+
+    Args:
+        db: Database 인스턴스
+
+    Raises:
+        RuntimeError: 서버가 time-series 컬렉션을 지원하지 않는 경우
+    """
+    names = (TIMESERIES_DAILY_COLLECTION, TIMESERIES_HOURLY_COLLECTION)
+    existing = set(db.list_collection_names())
+    for name in names:
+        if name in existing:
+            continue
+        try:
+            db.create_collection(
+                name,
+                timeseries={
+                    "timeField": "ts",
+                    "metaField": "meta",
+                    "granularity": "hours"
+                }
+            )
+        except (OperationFailure, NotImplementedError) as e:
+            raise RuntimeError(
+                f"time-series 컬렉션({name})을 생성할 수 없습니다. "
+                f"dailyStorage: timeseries 는 MongoDB 7.0 이상이 필요합니다: {e}"
+            ) from e
+        db[name].create_index(
+            [
+                ("meta.domainId", ASCENDING),
+                ("meta.projectId", ASCENDING),
+                ("meta.serviceId", ASCENDING),
+                ("ts", ASCENDING)
+            ],
+            name="meta_ts"
+        )
+
+
+def get_daily_store(
+    db: Database,
+    settings: MongoSettings,
+    object_storage: Optional[ObjectStorageSettings] = None
+) -> DailyStore:
+    """
+    설정(mongo.dailyStorage)에 맞는 일별 저장소를 반환합니다.
+    object_storage가 주어지고 아카이브된 범위가 있으면, 아카이브를 함께 읽는 래퍼를 반환합니다.
+
+    Args:
+        db: Database 인스턴스
+        settings: MongoDB 설정
+        object_storage: Object Storage 설정 (아카이브 조회용, 선택)
+
+    Returns:
+        DailyStore 구현체
+    """
+    if settings.daily_storage == DAILY_STORAGE_TIMESERIES:
+        ensure_timeseries_collections(db)
+        store: DailyStore = TimeSeriesDailyStore(db)
+    elif settings.daily_storage == DAILY_STORAGE_DOCUMENT:
+        store = DocumentDailyStore(db)
+    else:
+        raise ValueError(f"지원하지 않는 dailyStorage 값입니다: {settings.daily_storage}")
+
+    if object_storage is not None:
+        reader = ArchiveReader(db, object_storage)
+        if reader.has_archive(store.collection.name):
+            store = ArchivedDailyStore(store, reader)
+    return store
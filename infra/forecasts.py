@@ -0,0 +1,115 @@
+"""
+월말 예측 저장 모듈
+
+Daily Job이 매일 밤 계산한 서비스별 월말 예측(core/forecast.py)을 `billing_forecasts` 컬렉션에 기록합니다.
+
+- 기준일(asOfDate)마다 문서를 새로 쌓으므로 날짜별 예측 변화와 월말 실제 금액 대비 정확도를 볼 수 있습니다.
+- _id는 (기준일, 서비스)로 정해지므로 같은 날짜를 다시 실행하면 덮어씁니다.
+- 이번 달 비용도 없고 예측도 0인 서비스는 저장하지 않습니다.
+- retentionDays가 지난 문서는 TTL로 삭제됩니다.
+
+문서 구조:
+    {_id: "20250115:domainId:projectId:serviceId", month, asOfDate, domainId, projectId, serviceId, tenant,
+     actualToDate, forecastAmount, lowerAmount, upperAmount, trendPerWeek, remainingDays, historyDays,
+     updatedAt, expiresAt}
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from pymongo import ASCENDING, DESCENDING
+from pymongo.collection import Collection
+from pymongo.database import Database
+from pymongo.operations import UpdateOne
+
+from core.forecast import MonthEndForecast
+from infra.mongo_client import write_batch
+
+
+FORECASTS_COLLECTION = "billing_forecasts"
+
+
+def ensure_forecast_indexes(db: Database):
+    """
+    billing_forecasts 인덱스를 생성합니다. (월별/서비스별 최신 예측 조회 + expiresAt TTL)
+
+    Args:
+        db: Database 인스턴스
+    """
+    collection = db[FORECASTS_COLLECTION]
+    collection.create_index(
+        [("month", ASCENDING), ("asOfDate", DESCENDING)],
+        name="month_asOfDate"
+    )
+    collection.create_index(
+        [
+            ("domainId", ASCENDING),
+            ("projectId", ASCENDING),
+            ("serviceId", ASCENDING),
+            ("month", ASCENDING),
+            ("asOfDate", DESCENDING)
+        ],
+        name="service_month_asOfDate"
+    )
+    collection.create_index(
+        [("expiresAt", ASCENDING)],
+        expireAfterSeconds=0,
+        name="ttl_expiresAt"
+    )
+
+
+def save_forecasts(
+    collection: Collection,
+    result: MonthEndForecast,
+    retention_days: int,
+    tenant: Optional[str] = None
+) -> int:
+    """
+    서비스별 월말 예측을 저장합니다.
+
+    Args:
+        collection: billing_forecasts 컬렉션
+        result: forecast_month_end 결과
+        retention_days: 보관 기간(일)
+        tenant: 테넌트 이름
+
+    Returns:
+        저장한 서비스 수
+    """
+    now = datetime.utcnow()
+    expires_at = now + timedelta(days=retention_days)
+    # 행마다 numpy 스칼라를 꺼내지 않도록 한 번에 파이썬 리스트로 변환합니다.
+    actual = result.actual.round(2).tolist()
+    forecast = result.forecast.round(2).tolist()
+    lower = result.lower.round(2).tolist()
+    upper = result.upper.round(2).tolist()
+    slope = result.slope.round(2).tolist()
+
+    operations = []
+    for i, (domain_id, project_id, service_id) in enumerate(result.keys):
+        if actual[i] == 0 and forecast[i] == 0:
+            continue
+        operations.append(UpdateOne(
+            {"_id": f"{result.as_of}:{domain_id}:{project_id}:{service_id}"},
+            {"$set": {
+                "month": result.month,
+                "asOfDate": result.as_of,
+                "domainId": domain_id,
+                "projectId": project_id,
+                "serviceId": service_id,
+                "tenant": tenant,
+                "actualToDate": actual[i],
+                "forecastAmount": forecast[i],
+                "lowerAmount": lower[i],
+                "upperAmount": upper[i],
+                "trendPerWeek": slope[i],
+                "remainingDays": result.remaining_days,
+                "historyDays": result.history_days,
+                "updatedAt": now,
+                "expiresAt": expires_at,
+            }},
+            upsert=True
+        ))
+    if operations:
+        write_batch(collection, operations)
+    return len(operations)
@@ -0,0 +1,190 @@
+"""
+Job 실행 단위 checkpoint 모듈
+
+(job, 실행 키) 단위로 어떤 파이프라인 단계가 끝났는지를 `job_checkpoints` 컬렉션에 기록하고,
+단계 출력(API 응답, 집계 결과 등)은 로컬 디렉토리에 artifact 파일로 저장합니다.
+잡이 중간에 실패한 뒤 다시 실행되면, 끝난 단계는 artifact에서 출력을 복원하고
+첫 번째 미완료 단계부터 이어서 실행합니다. (API 재호출/재업로드 방지)
+
+- 실행이 성공하면 상태를 completed로 바꾸고 artifact 디렉토리를 삭제합니다.
+  completed 상태의 checkpoint는 다음 실행에서 사용하지 않습니다. (새 실행으로 시작)
+- artifact 파일이 없는 호스트에서 다시 실행하면 해당 단계는 처음부터 다시 실행합니다.
+- artifact는 같은 잡이 쓰고 읽는 로컬 파일이므로 pickle로 저장합니다.
+  단계 기록에 artifact 포맷 버전(format)을 남기고, 버전이 다르거나 복원 중 어떤 예외가 나도
+  (배포로 클래스 구조가 바뀐 경우 등) 해당 단계를 다시 실행합니다.
+
+문서 구조:
+    {_id: "daily:20250101", job, runKey, status, stages: {name: {seconds, artifact, format, completedAt}},
+     error, createdAt, updatedAt}
+"""
+
+import os
+import pickle
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from pymongo import ASCENDING
+from pymongo.collection import Collection
+from pymongo.database import Database
+
+from config.settings import Settings
+from core.pipeline import StageCheckpoint
+from infra.mongo_client import get_mongo_client, get_database
+
+
+JOB_CHECKPOINT_COLLECTION = "job_checkpoints"
+# 오래된 checkpoint 문서는 updatedAt 기준으로 자동 삭제합니다.
+JOB_CHECKPOINT_TTL_SECONDS = 14 * 24 * 3600
+
+# 단계 출력(DailySummary 등)의 구조가 바뀌어 이전 artifact를 복원할 수 없게 되면 올립니다.
+CHECKPOINT_FORMAT_VERSION = 1
+
+STATUS_RUNNING = "running"
+STATUS_FAILED = "failed"
+STATUS_COMPLETED = "completed"
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def ensure_job_checkpoint_indexes(db: Database):
+    """
+    job_checkpoints 인덱스를 생성합니다.
+
+    Args:
+        db: Database 인스턴스
+    """
+    collection = db[JOB_CHECKPOINT_COLLECTION]
+    collection.create_index([("job", ASCENDING), ("status", ASCENDING)], name="job_status")
+    collection.create_index(
+        [("updatedAt", ASCENDING)],
+        expireAfterSeconds=JOB_CHECKPOINT_TTL_SECONDS,
+        name="ttl_updatedAt"
+    )
+
+
+class MongoStageCheckpoint(StageCheckpoint):
+    """
+    job_checkpoints 문서 + 로컬 artifact 파일로 구현한 단계 checkpoint
+    """
+
+    def __init__(
+        self,
+        collection: Collection,
+        job: str,
+        run_key: str,
+        artifact_dir: str,
+        resume: bool = True
+    ):
+        self.collection = collection
+        self.job = job
+        self.run_key = run_key
+        self.doc_id = f"{job}:{run_key}"
+        self.artifact_root = Path(artifact_dir) / job / run_key
+        self._stages: Dict[str, Dict[str, Any]] = {}
+
+        doc = collection.find_one({"_id": self.doc_id}) if resume else None
+        if doc and doc.get("status") != STATUS_COMPLETED:
+            self._stages = doc.get("stages") or {}
+
+        now = datetime.utcnow()
+        update: Dict[str, Any] = {
+            "$set": {"job": job, "runKey": run_key, "status": STATUS_RUNNING, "updatedAt": now},
+            "$setOnInsert": {"createdAt": now},
+        }
+        if not self._stages:
+            # 새 실행: 이전(완료/비활성) 실행의 단계 기록을 지웁니다.
+            update["$set"]["stages"] = {}
+            update["$unset"] = {"error": ""}
+        collection.update_one({"_id": self.doc_id}, update, upsert=True)
+
+    @property
+    def resumed_stages(self):
+        """이전 실행에서 완료된 단계 이름 목록"""
+        return sorted(self._stages)
+
+    def load(self, stage: str) -> Optional[Dict[str, Any]]:
+        record = self._stages.get(stage)
+        if not record:
+            return None
+        if record.get("format") != CHECKPOINT_FORMAT_VERSION:
+            # 다른 버전의 코드가 남긴 기록: 해당 단계를 다시 실행합니다.
+            return None
+        artifact = record.get("artifact")
+        if not artifact:
+            return {}
+        try:
+            with open(artifact, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            # 다른 호스트에서 실행됐거나 파일이 지워진 경우, 복원할 수 없는 artifact인 경우:
+            # 해당 단계를 다시 실행합니다.
+            print(f"⚠️ checkpoint 복원 실패 ({stage}), 단계를 다시 실행합니다: {e}")
+            return None
+
+    def save(self, stage: str, outputs: Dict[str, Any], seconds: float) -> None:
+        artifact = None
+        if outputs:
+            self.artifact_root.mkdir(parents=True, exist_ok=True)
+            path = self.artifact_root / f"{stage}.pkl"
+            tmp_path = path.with_suffix(".pkl.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(outputs, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            artifact = str(path)
+
+        record = {
+            "seconds": round(seconds, 3),
+            "artifact": artifact,
+            "format": CHECKPOINT_FORMAT_VERSION,
+            "completedAt": datetime.utcnow()
+        }
+        self._stages[stage] = record
+        self.collection.update_one(
+            {"_id": self.doc_id},
+            {"$set": {f"stages.{stage}": record, "updatedAt": record["completedAt"]}}
+        )
+
+    def complete(self) -> None:
+        """실행 성공을 기록하고 artifact를 삭제합니다."""
+        self.collection.update_one(
+            {"_id": self.doc_id},
+            {"$set": {"status": STATUS_COMPLETED, "updatedAt": datetime.utcnow()}}
+        )
+        shutil.rmtree(self.artifact_root, ignore_errors=True)
+
+    def fail(self, error: BaseException) -> None:
+        """실행 실패를 기록합니다. (artifact는 다음 실행을 위해 남겨 둠)"""
+        self.collection.update_one(
+            {"_id": self.doc_id},
+            {"$set": {"status": STATUS_FAILED, "error": str(error)[:1000], "updatedAt": datetime.utcnow()}}
+        )
+
+
+def open_job_checkpoint(
+    settings: Settings,
+    job: str,
+    run_key: str,
+    resume: bool = True
+) -> Optional[MongoStageCheckpoint]:
+    """
+    설정에 맞는 Job checkpoint를 엽니다.
+
+    Args:
+        settings: 설정 객체
+        job: Job 이름 (hourly, daily 등)
+        run_key: 실행 키 (날짜, 날짜-시간 등)
+        resume: False면 이전 실패 기록을 무시하고 새로 시작
+
+    Returns:
+        MongoStageCheckpoint (checkpoint.enabled가 false면 None)
+    """
+    if not settings.checkpoint.enabled:
+        return None
+    artifact_dir = Path(settings.checkpoint.artifact_dir)
+    if not artifact_dir.is_absolute():
+        artifact_dir = PROJECT_ROOT / artifact_dir
+    client = get_mongo_client(settings.mongo)
+    db = get_database(client, settings.mongo.db_name)
+    return MongoStageCheckpoint(db[JOB_CHECKPOINT_COLLECTION], job, run_key, str(artifact_dir), resume)
@@ -0,0 +1,218 @@
+"""
+MongoDB lease lock 모듈
+
+여러 노드에서 같은 Job을 cron/스케줄러로 실행할 때, (job, 실행 키) 단위로 한 노드만 실행하도록
+`job_locks` 컬렉션에 만료 시간이 있는 lease를 기록합니다.
+
+- 획득: 문서가 없거나 만료됐거나 내가 가진 lease일 때만 원자적으로 owner/expiresAt을 갱신합니다.
+  (다른 노드가 가진 유효한 lease면 upsert가 _id 중복으로 실패 → 획득 실패)
+- heartbeat: 실행 중에는 백그라운드 스레드가 ttl/3 간격으로 expiresAt을 연장합니다.
+  노드가 죽으면 ttl이 지난 뒤 다른 노드가 lease를 가져갈 수 있습니다.
+- 펜싱: heartbeat가 늦어 lease가 만료되거나 다른 노드가 가져가면 lost가 설정되고, check()가
+  LeaseLostError를 발생시킵니다. 파이프라인은 단계를 시작/기록하기 전에 check()를 호출해
+  lease를 잃은 노드가 새 owner와 함께 쓰지 않도록 중단합니다.
+- 성공 후: hold_seconds를 주면 lease를 completed 상태로 남겨, 조금 늦게 시작한 다른 노드가
+  같은 실행을 반복하지 않도록 합니다. 그 외(실패 포함)에는 바로 삭제해 다른 노드/재시도가 실행할 수 있게 합니다.
+
+문서 구조:
+    {_id: "hourly:20250101-10", owner, status, acquiredAt, heartbeatAt, expiresAt, completedAt}
+"""
+
+import os
+import socket
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+
+from pymongo import ASCENDING
+from pymongo.collection import Collection
+from pymongo.database import Database
+from pymongo.errors import DuplicateKeyError, PyMongoError
+
+from config.settings import Settings
+from infra.mongo_client import get_mongo_client, get_database
+
+
+JOB_LOCK_COLLECTION = "job_locks"
+
+STATUS_RUNNING = "running"
+STATUS_COMPLETED = "completed"
+
+
+class LeaseLostError(Exception):
+    """실행 중 lease를 잃었을 때 (다른 노드가 이어서 처리) 발생하는 예외"""
+
+
+def ensure_job_lock_indexes(db: Database):
+    """
+    job_locks 인덱스를 생성합니다. (만료된 lease는 TTL로 정리)
+
+    Args:
+        db: Database 인스턴스
+    """
+    db[JOB_LOCK_COLLECTION].create_index(
+        [("expiresAt", ASCENDING)],
+        expireAfterSeconds=0,
+        name="ttl_expiresAt"
+    )
+
+
+def default_owner() -> str:
+    """lease owner 식별자 (호스트:PID:임의값)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class JobLease:
+    """
+    heartbeat로 유지되는 lease lock
+
+    사용 예:
+        lease = JobLease(db.job_locks, "hourly:20250101-10", ttl_seconds=300)
+        if lease.acquire():
+            try:
+                ...
+                lease.release(completed=True, hold_seconds=3600)
+            except Exception:
+                lease.release()
+                raise
+    """
+
+    def __init__(
+        self,
+        collection: Collection,
+        name: str,
+        ttl_seconds: int = 300,
+        owner: Optional[str] = None
+    ):
+        self.collection = collection
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.owner = owner or default_owner()
+        self.holder: Optional[str] = None
+        self.lost = False
+        self.expires_at: Optional[datetime] = None
+        self._stop = threading.Event()
+        self._heartbeat: Optional[threading.Thread] = None
+
+    def acquire(self, ignore_completed: bool = False) -> bool:
+        """
+        lease를 획득하고 heartbeat를 시작합니다.
+
+        Args:
+            ignore_completed: True면 다른 노드가 완료 처리한 lease도 가져옴 (강제 재실행)
+
+        Returns:
+            획득 여부 (실패 시 holder에 현재 owner 기록)
+        """
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=self.ttl_seconds)
+        takeover = [{"expiresAt": {"$lt": now}}, {"owner": self.owner}]
+        if ignore_completed:
+            takeover.append({"status": STATUS_COMPLETED})
+        try:
+            self.collection.update_one(
+                {"_id": self.name, "$or": takeover},
+                {
+                    "$set": {
+                        "owner": self.owner,
+                        "status": STATUS_RUNNING,
+                        "acquiredAt": now,
+                        "heartbeatAt": now,
+                        "expiresAt": expires_at,
+                    },
+                    "$unset": {"completedAt": ""}
+                },
+                upsert=True
+            )
+        except DuplicateKeyError:
+            doc = self.collection.find_one({"_id": self.name}, {"owner": 1, "status": 1})
+            if doc:
+                self.holder = f"{doc.get('owner')} ({doc.get('status')})"
+            return False
+
+        self.lost = False
+        self.expires_at = expires_at
+        self._stop.clear()
+        self._heartbeat = threading.Thread(target=self._beat, name=f"lease-{self.name}", daemon=True)
+        self._heartbeat.start()
+        return True
+
+    def _beat(self) -> None:
+        interval = max(1.0, self.ttl_seconds / 3)
+        while not self._stop.wait(interval):
+            now = datetime.utcnow()
+            expires_at = now + timedelta(seconds=self.ttl_seconds)
+            try:
+                result = self.collection.update_one(
+                    {"_id": self.name, "owner": self.owner},
+                    {"$set": {"heartbeatAt": now, "expiresAt": expires_at}}
+                )
+            except PyMongoError:
+                # 일시적인 연결 오류는 다음 heartbeat에서 다시 시도합니다. (그 사이 만료되면 check()에서 감지)
+                continue
+            if result.matched_count == 0:
+                # 만료되어 다른 노드가 가져간 경우
+                self.lost = True
+                print(f"⚠️ lease를 잃었습니다: {self.name} (heartbeat 지연)", flush=True)
+                return
+            self.expires_at = expires_at
+
+    def check(self) -> None:
+        """
+        lease를 아직 가지고 있는지 확인합니다. (파이프라인 단계 사이에서 호출)
+
+        heartbeat가 실패해 마지막으로 연장한 만료 시각이 지난 경우도 잃은 것으로 봅니다.
+
+        Raises:
+            LeaseLostError: lease를 잃은 경우
+        """
+        if not self.lost and self.expires_at is not None and datetime.utcnow() >= self.expires_at:
+            self.lost = True
+        if self.lost:
+            raise LeaseLostError(f"lease를 잃었습니다: {self.name} - 다른 노드가 처리하므로 중단합니다.")
+
+    def release(self, completed: bool = False, hold_seconds: int = 0) -> None:
+        """
+        heartbeat를 멈추고 lease를 반납합니다.
+
+        Args:
+            completed: True면 완료 상태로 hold_seconds 동안 유지 (다른 노드의 중복 실행 방지)
+            hold_seconds: 완료 상태 유지 시간(초, 0이면 바로 삭제)
+        """
+        self._stop.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+            self._heartbeat = None
+
+        if completed and hold_seconds > 0:
+            now = datetime.utcnow()
+            self.collection.update_one(
+                {"_id": self.name, "owner": self.owner},
+                {"$set": {
+                    "status": STATUS_COMPLETED,
+                    "completedAt": now,
+                    "expiresAt": now + timedelta(seconds=hold_seconds)
+                }}
+            )
+        else:
+            self.collection.delete_one({"_id": self.name, "owner": self.owner})
+
+
+def open_job_lease(settings: Settings, job: str, run_key: str) -> Optional[JobLease]:
+    """
+    설정에 맞는 Job lease를 만듭니다. (획득은 호출 측에서 acquire)
+
+    Args:
+        settings: 설정 객체
+        job: Job 이름 (hourly, daily 등)
+        run_key: 실행 키 (shard 표시 포함)
+
+    Returns:
+        JobLease (cluster.lockEnabled가 false면 None)
+    """
+    if not settings.cluster.lock_enabled:
+        return None
+    client = get_mongo_client(settings.mongo)
+    db = get_database(client, settings.mongo.db_name)
+    return JobLease(db[JOB_LOCK_COLLECTION], f"{job}:{run_key}", settings.cluster.lock_ttl_seconds)
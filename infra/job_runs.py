@@ -0,0 +1,149 @@
+"""
+Job 실행 기록 모듈
+
+Hourly / Daily Job 실행 1회의 계측 결과(core.metrics.JobRun)를 내보냅니다.
+
+- job_runs 컬렉션: 상태, 단계별 소요 시간, 카운터/히스토그램 요약 (runRetentionDays가 지나면 TTL로 삭제)
+- Prometheus textfile: metrics.textfileDir에 billing_{job}[_{tenant}].prom 파일을 갱신
+  (node_exporter --collector.textfile.directory 로 수집)
+
+기록 실패는 경고만 출력하고 Job 결과에는 영향을 주지 않습니다.
+
+문서 구조:
+    {job, runKey, tenant, host, status, error, startedAt, finishedAt, durationSeconds,
+     stages: {stage: seconds}, counters: {"name{label=value}": n}, gauges, histograms, expiresAt}
+"""
+
+import socket
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
+
+from pymongo import ASCENDING, DESCENDING
+from pymongo.database import Database
+
+from config.settings import Settings
+from core.metrics import JobRun, job_run, write_textfile
+from infra.mongo_client import get_mongo_client, get_database
+
+
+JOB_RUNS_COLLECTION = "job_runs"
+
+
+def ensure_job_run_indexes(db: Database):
+    """
+    job_runs 인덱스를 생성합니다. (최근 실행 조회 + expiresAt TTL)
+
+    Args:
+        db: Database 인스턴스
+    """
+    collection = db[JOB_RUNS_COLLECTION]
+    collection.create_index(
+        [("job", ASCENDING), ("startedAt", DESCENDING)],
+        name="job_startedAt"
+    )
+    collection.create_index(
+        [("expiresAt", ASCENDING)],
+        expireAfterSeconds=0,
+        name="ttl_expiresAt"
+    )
+
+
+def ensure_job_run_finished_index(db: Database):
+    """
+    job_runs 최근 완료 시각 조회(latest_finished_at) 인덱스를 생성합니다.
+
+    Args:
+        db: Database 인스턴스
+    """
+    db[JOB_RUNS_COLLECTION].create_index(
+        [("finishedAt", DESCENDING)],
+        name="finishedAt_desc"
+    )
+
+
+def latest_finished_at(db: Database) -> Optional[datetime]:
+    """
+    가장 최근에 끝난 Job run의 종료 시각을 조회합니다. (조회 API 캐시 무효화용)
+
+    Args:
+        db: Database 인스턴스
+
+    Returns:
+        finishedAt (기록이 없으면 None)
+    """
+    doc = db[JOB_RUNS_COLLECTION].find_one(
+        {"finishedAt": {"$ne": None}},
+        {"_id": 0, "finishedAt": 1},
+        sort=[("finishedAt", DESCENDING)]
+    )
+    return doc["finishedAt"] if doc else None
+
+
+def job_run_document(run: JobRun, retention_days: int) -> dict:
+    """
+    JobRun을 job_runs 문서로 변환합니다.
+
+    Args:
+        run: Job run
+        retention_days: 보관 기간(일)
+
+    Returns:
+        MongoDB 문서
+    """
+    doc = run.to_dict()
+    doc["startedAt"] = datetime.utcfromtimestamp(run.started_at)
+    doc["finishedAt"] = datetime.utcfromtimestamp(run.finished_at) if run.finished_at else None
+    doc["host"] = socket.gethostname()
+    doc["expiresAt"] = datetime.utcnow() + timedelta(days=retention_days)
+    return doc
+
+
+def record_job_run(settings: Settings, run: JobRun) -> None:
+    """
+    Job run을 job_runs 컬렉션과 Prometheus textfile로 내보냅니다.
+
+    Args:
+        settings: 설정 객체 (metrics)
+        run: 종료된 Job run
+    """
+    if settings.metrics.store_runs:
+        try:
+            client = get_mongo_client(settings.mongo)
+            db = get_database(client, settings.mongo.db_name)
+            db[JOB_RUNS_COLLECTION].insert_one(job_run_document(run, settings.metrics.run_retention_days))
+        except Exception as e:
+            print(f"⚠️ job_runs 기록 실패: {e}")
+
+    if settings.metrics.textfile_dir:
+        try:
+            write_textfile(settings.metrics.textfile_dir, run)
+        except OSError as e:
+            print(f"⚠️ metrics textfile 기록 실패: {e}")
+
+
+@contextmanager
+def track_job_run(settings: Settings, job: str, run_key: str) -> Iterator[JobRun]:
+    """
+    블록 안의 계측 값을 Job run 1회로 모으고, 끝나면 record_job_run으로 내보냅니다.
+
+    블록에서 run.finish(...)를 호출하지 않고 예외로 끝나면 failed로 기록합니다.
+
+    사용 예:
+        with track_job_run(settings, "daily", run_key) as run:
+            result = pipeline.run(inputs)
+            run.finish("success", stages=result.timings)
+    """
+    tenant = settings.tenant.name if settings.tenant else None
+    with job_run(job, run_key, tenant) as run:
+        try:
+            yield run
+        except BaseException as e:
+            if run.finished_at is None:
+                run.finish("failed", e)
+            raise
+        else:
+            if run.finished_at is None:
+                run.finish("success")
+        finally:
+            record_job_run(settings, run)
@@ -2,29 +2,112 @@
 MongoDB 클라이언트 및 CRUD 함수 모듈
 """
 
-from typing import List, Optional
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 from pymongo import MongoClient, ASCENDING, DESCENDING
-from pymongo.errors import OperationFailure
+from pymongo.errors import DuplicateKeyError, OperationFailure
 from pymongo.collection import Collection
+from pymongo.cursor import Cursor
 from pymongo.database import Database
 from pymongo.operations import UpdateOne
 
 from config.settings import MongoSettings
+from core import metrics
 from core.aggregator import DailySummary
 
 
+# baseline 이력 조회 시 커서 배치 크기 (문서가 작으므로 기본값 101보다 크게 가져옵니다)
+DAILY_HISTORY_BATCH_SIZE = 2000
+DAILY_HISTORY_INDEX = "daily_history_covering"
+
+# 프로세스 내에서 재사용하는 MongoClient 캐시
+# MongoClient는 스레드 안전하며 내부에 커넥션 풀을 가지므로, 같은 설정이면 하나만 만들어 공유합니다.
+_CLIENT_CACHE: Dict[Tuple, MongoClient] = {}
+_CLIENT_LOCK = threading.Lock()
+
+
+def _client_cache_key(settings: MongoSettings) -> Tuple:
+    return (
+        settings.uri,
+        settings.max_pool_size,
+        settings.min_pool_size,
+        tuple(settings.compressors or ()),
+        settings.server_selection_timeout_ms,
+        settings.connect_timeout_ms,
+        settings.socket_timeout_ms,
+        settings.read_preference,
+    )
+
+
+def create_mongo_client(settings: MongoSettings) -> MongoClient:
+    """
+    MongoSettings의 커넥션 옵션을 적용한 새 MongoDB 클라이언트를 생성합니다.
+    
+    Args:
+        settings: MongoDB 설정
+    
+    Returns:
+        MongoClient 인스턴스
+    """
+    options = {
+        "maxPoolSize": settings.max_pool_size,
+        "minPoolSize": settings.min_pool_size,
+        "serverSelectionTimeoutMS": settings.server_selection_timeout_ms,
+        "connectTimeoutMS": settings.connect_timeout_ms,
+        "socketTimeoutMS": settings.socket_timeout_ms,
+        "readPreference": settings.read_preference,
+    }
+    if settings.compressors:
+        options["compressors"] = ",".join(settings.compressors)
+    return MongoClient(settings.uri, **options)
+
+
 def get_mongo_client(settings: MongoSettings) -> MongoClient:
     """
-    MongoDB 클라이언트를 생성합니다.
+    MongoDB 클라이언트를 반환합니다.
+    같은 설정으로 이미 생성된 클라이언트가 있으면 재사용합니다.
     
     Args:
-        settings: MongoDB 설정 (uri, db_name)
+        settings: MongoDB 설정 (uri, db_name, 커넥션 옵션)
     
     Returns:
         MongoClient 인스턴스
     """
-    return MongoClient(settings.uri)
+    key = _client_cache_key(settings)
+    with _CLIENT_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = create_mongo_client(settings)
+            _CLIENT_CACHE[key] = client
+        return client
+
+
+def get_client_uri(client: MongoClient) -> Optional[str]:
+    """
+    get_mongo_client로 만든 클라이언트의 설정 URI를 반환합니다.
+
+    Args:
+        client: MongoClient 인스턴스
+
+    Returns:
+        설정의 mongo.uri (캐시에 없는 클라이언트면 None)
+    """
+    with _CLIENT_LOCK:
+        for key, cached in _CLIENT_CACHE.items():
+            if cached is client:
+                return key[0]
+    return None
+
+
+def close_mongo_clients() -> None:
+    """
+    캐시된 MongoDB 클라이언트를 모두 닫습니다. (프로세스 종료 시 호출)
+    """
+    with _CLIENT_LOCK:
+        for client in _CLIENT_CACHE.values():
+            client.close()
+        _CLIENT_CACHE.clear()
 
 
 def get_database(client: MongoClient, db_name: str) -> Database:
@@ -44,6 +127,7 @@ def get_database(client: MongoClient, db_name: str) -> Database:
 def ensure_indexes(db: Database):
     """
     필요한 인덱스를 생성합니다.
+    잡에서는 직접 호출하지 않고, infra.schema.ensure_schema의 1번 마이그레이션으로 실행됩니다.
     
     Args:
         db: Database 인스턴스
@@ -115,6 +199,25 @@ def ensure_indexes(db: Database):
 
 
 
+def write_batch(collection: Collection, operations: List, ordered: bool = False):
+    """
+    bulk_write를 실행하고 배치 수/문서 수/소요 시간을 기록합니다. (core.metrics)
+
+    Args:
+        collection: 대상 컬렉션
+        operations: UpdateOne 등 write 연산 리스트
+        ordered: 순서 보장 여부
+
+    Returns:
+        BulkWriteResult
+    """
+    with metrics.timer("mongo_write_batch_seconds", collection=collection.name):
+        result = collection.bulk_write(operations, ordered=ordered)
+    metrics.inc("mongo_write_batches_total", collection=collection.name)
+    metrics.inc("mongo_written_docs_total", len(operations), collection=collection.name)
+    return result
+
+
 def upsert_daily_summary(
     collection: Collection,
     summary: DailySummary
@@ -231,7 +334,7 @@ def bulk_upsert_daily_summaries(
         )
     
     if operations:
-        result = collection.bulk_write(operations, ordered=False)
+        result = write_batch(collection, operations)
         return result.upserted_count + result.modified_count
     
     return 0
@@ -275,6 +378,198 @@ def get_all_daily_for_service(
     return list(cursor)
 
 
+# 월별 롤업에서 누적하는 금액 필드
+ROLLUP_AMOUNT_FIELDS = ("expectAmount", "generalAmount", "discountAmount")
+
+
+def get_daily_amounts_for_date(
+    collection: Collection,
+    date: str
+) -> Dict[Tuple[str, str, str], Dict[str, float]]:
+    """
+    특정 날짜에 이미 저장된 서비스별 금액을 조회합니다. (재집계 시 변화량 계산용)
+    
+    Args:
+        collection: billing_daily 컬렉션
+        date: 날짜 (YYYYMMDD)
+    
+    Returns:
+        {(domainId, projectId, serviceId): {"expectAmount": ..., ...}} 딕셔너리
+    """
+    projection = {"_id": 0, "domainId": 1, "projectId": 1, "serviceId": 1}
+    projection.update({field: 1 for field in ROLLUP_AMOUNT_FIELDS})
+
+    amounts = {}
+    for doc in collection.find({"date": date, "pricingType": None}, projection):
+        key = (doc.get("domainId", ""), doc.get("projectId", ""), doc.get("serviceId", ""))
+        amounts[key] = {field: float(doc.get(field) or 0) for field in ROLLUP_AMOUNT_FIELDS}
+    return amounts
+
+
+def ensure_daily_history_index(db: Database):
+    """
+    baseline 이력 조회(find_daily_amounts)를 커버하는 복합 인덱스를 생성합니다.
+    (equality: domainId/projectId/serviceId → sort: date → range: isAnomaly → projection: expectAmount)
+    
+    Args:
+        db: Database 인스턴스
+    """
+    db.billing_daily.create_index(
+        [
+            ("domainId", ASCENDING),
+            ("projectId", ASCENDING),
+            ("serviceId", ASCENDING),
+            ("date", ASCENDING),
+            ("isAnomaly", ASCENDING),
+            ("expectAmount", ASCENDING)
+        ],
+        name=DAILY_HISTORY_INDEX
+    )
+
+
+def _daily_history_query(domain_id: str, project_id: str, service_id: str) -> dict:
+    # 이상치로 마킹된(isAnomaly=True) 데이터는 baseline 계산에서 제외합니다.
+    return {
+        "domainId": domain_id,
+        "projectId": project_id,
+        "serviceId": service_id,
+        "isAnomaly": {"$ne": True}
+    }
+
+
+def find_daily_amounts(
+    collection: Collection,
+    domain_id: str,
+    project_id: str,
+    service_id: str,
+    batch_size: int = DAILY_HISTORY_BATCH_SIZE
+) -> Cursor:
+    """
+    특정 서비스의 일별 expectAmount만 조회하는 커서를 반환합니다.
+    projection이 인덱스 필드만 포함하므로 문서를 읽지 않는 covered query로 실행됩니다.
+    
+    Args:
+        collection: billing_daily 컬렉션
+        domain_id: 도메인 ID
+        project_id: 프로젝트 ID
+        service_id: 서비스 ID
+        batch_size: 커서 배치 크기
+    
+    Returns:
+        {"expectAmount": ...} 문서를 반환하는 커서
+    """
+    return (
+        collection.find(
+            _daily_history_query(domain_id, project_id, service_id),
+            {"_id": 0, "expectAmount": 1}
+        )
+        .sort("date", ASCENDING)
+        .hint(DAILY_HISTORY_INDEX)
+        .batch_size(batch_size)
+    )
+
+
+def iter_daily_amounts_for_service(
+    collection: Collection,
+    domain_id: str,
+    project_id: str,
+    service_id: str,
+    batch_size: int = DAILY_HISTORY_BATCH_SIZE
+) -> Iterator[float]:
+    """
+    특정 서비스의 일별 expectAmount 값을 날짜 오름차순으로 스트리밍합니다.
+    
+    Args:
+        collection: billing_daily 컬렉션
+        domain_id: 도메인 ID
+        project_id: 프로젝트 ID
+        service_id: 서비스 ID
+        batch_size: 커서 배치 크기
+    
+    Returns:
+        expectAmount 이터레이터
+    """
+    cursor = find_daily_amounts(collection, domain_id, project_id, service_id, batch_size)
+    for doc in cursor:
+        yield float(doc.get("expectAmount") or 0)
+
+
+# 조회 API(/daily)가 반환하는 일별 필드
+DAILY_SERIES_FIELDS = (
+    "date", "domainId", "domainName", "projectId", "projectName", "serviceId", "serviceName",
+    "expectAmount", "generalAmount", "discountAmount", "usageTime", "usageSize", "isAnomaly"
+)
+
+
+def find_daily_series(
+    collection: Collection,
+    domain_id: str,
+    from_date: str,
+    to_date: str,
+    project_id: Optional[str] = None,
+    service_id: Optional[str] = None,
+    batch_size: int = DAILY_HISTORY_BATCH_SIZE
+) -> Cursor:
+    """
+    도메인(/프로젝트/서비스)의 기간별 L1 일별 데이터를 조회하는 커서를 반환합니다. (이상치 포함)
+
+    Args:
+        collection: billing_daily 컬렉션
+        domain_id: 도메인 ID
+        from_date: 시작 날짜 (YYYYMMDD, 포함)
+        to_date: 종료 날짜 (YYYYMMDD, 포함)
+        project_id: 프로젝트 ID (None이면 도메인 전체)
+        service_id: 서비스 ID (None이면 프로젝트 전체)
+        batch_size: 커서 배치 크기
+
+    Returns:
+        DAILY_SERIES_FIELDS 문서를 (date, projectId, serviceId) 순으로 반환하는 커서
+    """
+    query = {
+        "domainId": domain_id,
+        "date": {"$gte": from_date, "$lte": to_date},
+        "pricingType": None
+    }
+    if project_id is not None:
+        query["projectId"] = project_id
+        if service_id is not None:
+            query["serviceId"] = service_id
+
+    projection = {"_id": 0}
+    projection.update({field: 1 for field in DAILY_SERIES_FIELDS})
+    return (
+        collection.find(query, projection)
+        .sort([("date", ASCENDING), ("projectId", ASCENDING), ("serviceId", ASCENDING)])
+        .batch_size(batch_size)
+    )
+
+
+def get_pricing_types_for_service(
+    collection: Collection,
+    domain_id: str,
+    project_id: str,
+    service_id: str
+) -> List[str]:
+    """
+    특정 서비스의 일별 데이터에 등장한 pricingType 목록을 조회합니다.
+    (서버에서 distinct로 계산하므로 문서 전체를 전송하지 않습니다)
+    
+    Args:
+        collection: billing_daily 컬렉션
+        domain_id: 도메인 ID
+        project_id: 프로젝트 ID
+        service_id: 서비스 ID
+    
+    Returns:
+        정렬된 pricingType 리스트
+    """
+    values = collection.distinct(
+        "pricingTypes",
+        _daily_history_query(domain_id, project_id, service_id)
+    )
+    return sorted(v for v in values if isinstance(v, str))
+
+
 def update_daily_anomaly_status(
     collection: Collection,
     date: str,
@@ -401,6 +696,253 @@ def upsert_baseline(
     collection.update_one(filter_query, update_data, upsert=True)
 
 
+def ensure_monthly_indexes(db: Database):
+    """
+    billing_monthly 롤업 컬렉션 인덱스를 생성합니다.
+    
+    Args:
+        db: Database 인스턴스
+    """
+    db.billing_monthly.create_index(
+        [
+            ("month", ASCENDING),
+            ("level", ASCENDING),
+            ("domainId", ASCENDING),
+            ("projectId", ASCENDING),
+            ("serviceId", ASCENDING)
+        ],
+        unique=True,
+        name="unique_monthly_rollup"
+    )
+
+
+def apply_monthly_deltas(
+    collection: Collection,
+    deltas: List[dict]
+) -> int:
+    """
+    월별 롤업에 금액 변화량을 $inc로 반영합니다.
+
+    delta의 days(날짜별 반영 금액)는 같은 update의 $set으로 저장되므로,
+    문서 하나에 대해 변화량과 반영 기록은 항상 함께 반영되거나 함께 누락됩니다.
+    
+    Args:
+        collection: billing_monthly 컬렉션
+        deltas: 변화량 리스트
+            ({"month", "level", "domainId", "projectId", "serviceId", "names", "amounts", "days", "lastDate"})
+    
+    Returns:
+        처리된 문서 개수
+    """
+    if not deltas:
+        return 0
+
+    now = datetime.utcnow()
+    operations = []
+    for delta in deltas:
+        filter_query = {
+            "month": delta["month"],
+            "level": delta["level"],
+            "domainId": delta["domainId"],
+            "projectId": delta["projectId"],
+            "serviceId": delta["serviceId"]
+        }
+        update_data = {
+            "$inc": dict(delta["amounts"]),
+            "$set": {
+                **delta.get("names", {}),
+                **{f"days.{date}": amounts for date, amounts in delta.get("days", {}).items()},
+                "updatedAt": now
+            },
+            "$max": {"lastDate": delta["lastDate"]},
+            "$setOnInsert": {"createdAt": now}
+        }
+        operations.append(UpdateOne(filter_query, update_data, upsert=True))
+
+    result = write_batch(collection, operations)
+    return result.upserted_count + result.modified_count
+
+
+def find_monthly_days(
+    collection: Collection,
+    month: str,
+    level: str,
+    domain_ids: List[str],
+    dates: List[str]
+) -> Cursor:
+    """
+    월별 롤업 문서의 날짜별 반영 금액(days)을 조회하는 커서를 반환합니다.
+    
+    Args:
+        collection: billing_monthly 컬렉션
+        month: 월 (YYYYMM)
+        level: 집계 레벨 (domain | project | service)
+        domain_ids: 도메인 ID 리스트
+        dates: 읽을 날짜 리스트 (YYYYMMDD)
+    
+    Returns:
+        level/domainId/projectId/serviceId와 days.<날짜>만 포함한 커서
+    """
+    projection = {"_id": 0, "level": 1, "domainId": 1, "projectId": 1, "serviceId": 1}
+    projection.update({f"days.{date}": 1 for date in dates})
+    return collection.find({"month": month, "level": level, "domainId": {"$in": domain_ids}}, projection)
+
+
+def set_monthly_day(
+    collection: Collection,
+    key: dict,
+    date: str,
+    old: Optional[Dict[str, float]],
+    new: Dict[str, float],
+    names: Dict[str, str]
+) -> bool:
+    """
+    롤업 문서 1건의 날짜별 금액을 old → new로 바꾸고 합계에 차이를 $inc로 반영합니다. (compare-and-set)
+    
+    Args:
+        collection: billing_monthly 컬렉션
+        key: 문서 키 ({"month", "level", "domainId", "projectId", "serviceId"})
+        date: 날짜 (YYYYMMDD)
+        old: 읽어 둔 현재 days.<날짜> 값 (없으면 None)
+        new: 새 날짜별 금액
+        names: 이름 필드
+    
+    Returns:
+        반영했으면 True, 그 사이 다른 실행이 값을 바꿨으면 False (다시 읽고 재시도)
+    """
+    filter_query = dict(key)
+    if old is None:
+        filter_query[f"days.{date}"] = {"$exists": False}
+    else:
+        filter_query.update({f"days.{date}.{field}": old.get(field, 0.0) for field in ROLLUP_AMOUNT_FIELDS})
+
+    now = datetime.utcnow()
+    try:
+        result = collection.update_one(
+            filter_query,
+            {
+                "$inc": {field: new[field] - (old or {}).get(field, 0.0) for field in ROLLUP_AMOUNT_FIELDS},
+                "$set": {**names, f"days.{date}": new, "updatedAt": now},
+                "$max": {"lastDate": date},
+                "$setOnInsert": {"createdAt": now}
+            },
+            # 처음 반영하는 날짜만 문서를 새로 만들 수 있습니다.
+            upsert=old is None
+        )
+    except DuplicateKeyError:
+        # 문서는 있지만 그 사이 같은 날짜가 기록되어 upsert가 새 문서를 만들려 한 경우
+        return False
+    return old is None or result.matched_count == 1
+
+
+def replace_monthly_rollup(
+    collection: Collection,
+    month: str,
+    docs: List[dict]
+) -> int:
+    """
+    특정 월의 롤업 문서를 통째로 교체합니다. (재구축용)
+    
+    Args:
+        collection: billing_monthly 컬렉션
+        month: 월 (YYYYMM)
+        docs: 새 롤업 문서 리스트
+    
+    Returns:
+        저장된 문서 개수
+    """
+    collection.delete_many({"month": month})
+    if not docs:
+        return 0
+    now = datetime.utcnow()
+    collection.insert_many(
+        [{**doc, "month": month, "createdAt": now, "updatedAt": now} for doc in docs],
+        ordered=False
+    )
+    return len(docs)
+
+
+def get_monthly_rollup(
+    collection: Collection,
+    month: str,
+    level: str,
+    domain_id: str,
+    project_id: Optional[str] = None,
+    service_id: Optional[str] = None
+) -> Optional[dict]:
+    """
+    월별 롤업 문서 1건을 조회합니다.
+    
+    Args:
+        collection: billing_monthly 컬렉션
+        month: 월 (YYYYMM)
+        level: 집계 레벨 (domain | project | service)
+        domain_id: 도메인 ID
+        project_id: 프로젝트 ID (project/service 레벨)
+        service_id: 서비스 ID (service 레벨)
+    
+    Returns:
+        롤업 문서 (없으면 None)
+    """
+    return collection.find_one({
+        "month": month,
+        "level": level,
+        "domainId": domain_id,
+        "projectId": project_id,
+        "serviceId": service_id
+    }, {"_id": 0, "days": 0})
+
+
+def get_raw_manifest(
+    collection: Collection,
+    date: str
+) -> Optional[dict]:
+    """
+    날짜별 Raw 데이터 처리 기록(내용 해시)을 조회합니다.
+    
+    Args:
+        collection: billing_raw_manifest 컬렉션
+        date: 날짜 (YYYYMMDD)
+    
+    Returns:
+        manifest 문서 (없으면 None)
+    """
+    return collection.find_one({"_id": date})
+
+
+def upsert_raw_manifest(
+    collection: Collection,
+    date: str,
+    content_hash: str,
+    entry_count: int,
+    storage_path: Optional[str] = None
+) -> None:
+    """
+    날짜별 Raw 데이터 처리 기록(내용 해시)을 저장합니다.
+    
+    Args:
+        collection: billing_raw_manifest 컬렉션
+        date: 날짜 (YYYYMMDD)
+        content_hash: 정규화된 엔트리 내용 해시
+        entry_count: 엔트리 수
+        storage_path: Raw 데이터 Object Storage key
+    """
+    now = datetime.utcnow()
+    collection.update_one(
+        {"_id": date},
+        {
+            "$set": {
+                "contentHash": content_hash,
+                "entryCount": entry_count,
+                "storagePath": storage_path,
+                "processedAt": now
+            },
+            "$setOnInsert": {"createdAt": now}
+        },
+        upsert=True
+    )
+
+
 def get_baseline(
     collection: Collection,
     domain_id: str,
@@ -427,3 +969,99 @@ def get_baseline(
         "serviceId": service_id,
         "pricingType": pricing_type
     })
+
+
+def find_baselines(
+    collection: Collection,
+    domain_id: str,
+    project_id: Optional[str] = None,
+    service_id: Optional[str] = None
+) -> Cursor:
+    """
+    도메인(/프로젝트/서비스)의 L1 Baseline 문서를 조회하는 커서를 반환합니다. (unique_baseline 인덱스 prefix)
+
+    Args:
+        collection: billing_baseline 컬렉션
+        domain_id: 도메인 ID
+        project_id: 프로젝트 ID (None이면 도메인 전체)
+        service_id: 서비스 ID (None이면 프로젝트 전체)
+
+    Returns:
+        (projectId, serviceId) 순 커서
+    """
+    query = {"domainId": domain_id, "pricingType": None}
+    if project_id is not None:
+        query["projectId"] = project_id
+        if service_id is not None:
+            query["serviceId"] = service_id
+    return collection.find(query, {"_id": 0, "createdAt": 0, "days": 0}).sort(
+        [("projectId", ASCENDING), ("serviceId", ASCENDING)]
+    )
+
+
+def find_anomalies(
+    collection: Collection,
+    from_date: str,
+    to_date: str,
+    domain_id: Optional[str] = None,
+    project_id: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = 0
+) -> Cursor:
+    """
+    기간별 이상치를 최신순으로 조회하는 커서를 반환합니다. (date_hour_desc 인덱스)
+
+    Args:
+        collection: billing_anomalies 컬렉션
+        from_date: 시작 날짜 (YYYYMMDD, 포함)
+        to_date: 종료 날짜 (YYYYMMDD, 포함)
+        domain_id: 도메인 ID
+        project_id: 프로젝트 ID
+        status: 처리 상태 (NEW 등)
+        limit: 최대 건수 (0이면 제한 없음)
+
+    Returns:
+        (date, hour) 내림차순 커서
+    """
+    query = {"date": {"$gte": from_date, "$lte": to_date}}
+    if domain_id is not None:
+        query["domainId"] = domain_id
+    if project_id is not None:
+        query["projectId"] = project_id
+    if status is not None:
+        query["status"] = status
+    return (
+        collection.find(query, {"_id": 0})
+        .sort([("date", DESCENDING), ("hour", DESCENDING), ("projectId", ASCENDING), ("serviceId", ASCENDING)])
+        .limit(limit)
+    )
+
+
+def find_monthly_rollups(
+    collection: Collection,
+    month: str,
+    level: str,
+    domain_id: Optional[str] = None,
+    project_id: Optional[str] = None
+) -> Cursor:
+    """
+    월별 롤업 문서를 레벨 단위로 조회하는 커서를 반환합니다. (unique_monthly_rollup 인덱스 prefix)
+
+    Args:
+        collection: billing_monthly 컬렉션
+        month: 월 (YYYYMM)
+        level: 집계 레벨 (domain | project | service)
+        domain_id: 도메인 ID (None이면 전체 도메인)
+        project_id: 프로젝트 ID (service 레벨에서 프로젝트 하나만)
+
+    Returns:
+        (domainId, projectId, serviceId) 순 커서
+    """
+    query = {"month": month, "level": level}
+    if domain_id is not None:
+        query["domainId"] = domain_id
+        if project_id is not None:
+            query["projectId"] = project_id
+    return collection.find(query, {"_id": 0, "createdAt": 0, "days": 0}).sort(
+        [("domainId", ASCENDING), ("projectId", ASCENDING), ("serviceId", ASCENDING)]
+    )
@@ -0,0 +1,215 @@
+"""
+알림 outbox 모듈
+
+Hourly Job은 이상치를 저장할 때 채널별 알림을 `notification_outbox` 컬렉션에 함께 기록하고,
+dispatcher(core/notifier.py)가 outbox에서 꺼내 발송합니다.
+발송 중 프로세스가 죽거나 webhook이 실패해도 알림이 사라지지 않고, 다음 실행에서 다시 발송됩니다.
+
+- _id는 (채널, 날짜-시간, 서비스)로 정해지므로 같은 시간대를 다시 실행해도 알림이 중복되지 않습니다.
+- 꺼내기(claim): pending이면서 nextAttemptAt이 지난 문서를 owner와 함께 sending으로 바꿉니다.
+  (다른 프로세스가 먼저 바꾼 문서는 가져가지 않음, sending에서 멈춘 문서는 CLAIM_TIMEOUT 뒤 다시 가져감)
+- 실패: attempts를 올리고 retry_base_seconds * 2^(attempts-1) 뒤로 nextAttemptAt을 미룹니다.
+  max_attempts를 넘으면 failed로 남깁니다.
+- 발송/실패가 끝난 문서는 SENT_RETENTION_DAYS 뒤 TTL로 삭제됩니다.
+
+문서 구조:
+    {_id: "slack:20250101-10:domainId:projectId:serviceId", channel, tenant, runKey, status,
+     attempts, nextAttemptAt, owner, claimedAt, payload: {이상치}, lastError, createdAt, sentAt, expiresAt}
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from pymongo import ASCENDING
+from pymongo.collection import Collection
+from pymongo.database import Database
+from pymongo.operations import UpdateOne
+
+from infra.mongo_client import write_batch
+
+
+NOTIFICATION_OUTBOX_COLLECTION = "notification_outbox"
+
+STATUS_PENDING = "pending"
+STATUS_SENDING = "sending"
+STATUS_SENT = "sent"
+STATUS_FAILED = "failed"
+
+# sending 상태로 이 시간(초) 넘게 남아 있으면 발송 중 죽은 것으로 보고 다시 가져갑니다.
+CLAIM_TIMEOUT_SECONDS = 600
+# 발송 완료/최종 실패 문서 보관 기간
+SENT_RETENTION_DAYS = 30
+
+
+def ensure_notification_outbox_indexes(db: Database):
+    """
+    notification_outbox 인덱스를 생성합니다. (발송 대상 조회 + 완료 문서 TTL)
+
+    Args:
+        db: Database 인스턴스
+    """
+    collection = db[NOTIFICATION_OUTBOX_COLLECTION]
+    collection.create_index(
+        [("channel", ASCENDING), ("status", ASCENDING), ("nextAttemptAt", ASCENDING)],
+        name="channel_status_nextAttemptAt"
+    )
+    collection.create_index(
+        [("expiresAt", ASCENDING)],
+        expireAfterSeconds=0,
+        name="ttl_expiresAt"
+    )
+
+
+def outbox_id(channel: str, anomaly: Dict[str, Any]) -> str:
+    """알림 문서 _id (채널 + 시간대 + 서비스)"""
+    return ":".join([
+        channel,
+        f"{anomaly['date']}-{int(anomaly['hour']):02d}",
+        anomaly["domainId"],
+        anomaly["projectId"],
+        anomaly["serviceId"],
+    ])
+
+
+def enqueue_notifications(
+    collection: Collection,
+    channels: Iterable[str],
+    anomalies: List[Dict[str, Any]],
+    run_key: str,
+    tenant: Optional[str] = None
+) -> int:
+    """
+    채널마다 이상치 알림을 outbox에 추가합니다. (이미 있는 알림은 그대로 둠)
+
+    Args:
+        collection: notification_outbox 컬렉션
+        channels: 채널 이름 목록
+        anomalies: 이상치 dict 리스트 (anomaly_to_dict)
+        run_key: 실행 키
+        tenant: 테넌트 이름
+
+    Returns:
+        새로 추가된 알림 수
+    """
+    now = datetime.utcnow()
+    operations = [
+        UpdateOne(
+            {"_id": outbox_id(channel, anomaly)},
+            {"$setOnInsert": {
+                "channel": channel,
+                "tenant": tenant,
+                "runKey": run_key,
+                "status": STATUS_PENDING,
+                "attempts": 0,
+                "nextAttemptAt": now,
+                "payload": anomaly,
+                "createdAt": now,
+            }},
+            upsert=True
+        )
+        for channel in channels
+        for anomaly in anomalies
+    ]
+    if not operations:
+        return 0
+    return write_batch(collection, operations).upserted_count
+
+
+def claim_notifications(
+    collection: Collection,
+    channel: str,
+    owner: str,
+    tenant: Optional[str] = None,
+    limit: int = 1000
+) -> List[Dict[str, Any]]:
+    """
+    발송할 알림을 가져옵니다. (가져간 문서는 owner의 sending 상태)
+
+    Args:
+        collection: notification_outbox 컬렉션
+        channel: 채널 이름
+        owner: 발송 프로세스 식별자
+        tenant: 테넌트 이름 (해당 테넌트 알림만)
+        limit: 최대 개수
+
+    Returns:
+        알림 문서 리스트 (생성 순)
+    """
+    now = datetime.utcnow()
+    due = {
+        "channel": channel,
+        "tenant": tenant,
+        "$or": [
+            {"status": STATUS_PENDING, "nextAttemptAt": {"$lte": now}},
+            {"status": STATUS_SENDING, "claimedAt": {"$lt": now - timedelta(seconds=CLAIM_TIMEOUT_SECONDS)}},
+        ],
+    }
+    ids = [doc["_id"] for doc in collection.find(due, {"_id": 1}).sort("createdAt", ASCENDING).limit(limit)]
+    if not ids:
+        return []
+    # 조회와 변경 사이에 다른 프로세스가 가져간 문서는 조건이 맞지 않아 변경되지 않습니다.
+    collection.update_many(
+        {**due, "_id": {"$in": ids}},
+        {"$set": {"status": STATUS_SENDING, "owner": owner, "claimedAt": now}}
+    )
+    return list(
+        collection.find({"_id": {"$in": ids}, "status": STATUS_SENDING, "owner": owner})
+        .sort("createdAt", ASCENDING)
+    )
+
+
+def mark_sent(collection: Collection, ids: List[str]) -> None:
+    """발송 완료로 표시합니다."""
+    now = datetime.utcnow()
+    collection.update_many(
+        {"_id": {"$in": ids}},
+        {
+            "$set": {
+                "status": STATUS_SENT,
+                "sentAt": now,
+                "expiresAt": now + timedelta(days=SENT_RETENTION_DAYS),
+            },
+            "$inc": {"attempts": 1},
+            "$unset": {"owner": "", "lastError": ""},
+        }
+    )
+
+
+def mark_failed_attempt(
+    collection: Collection,
+    docs: List[Dict[str, Any]],
+    error: str,
+    max_attempts: int,
+    retry_base_seconds: int
+) -> int:
+    """
+    발송 실패를 기록합니다. (max_attempts 이내면 backoff 후 다시 pending)
+
+    Args:
+        collection: notification_outbox 컬렉션
+        docs: claim_notifications로 가져온 문서
+        error: 실패 사유
+        max_attempts: 최대 시도 횟수
+        retry_base_seconds: 재시도 간격 기준(초)
+
+    Returns:
+        최종 실패(failed)로 남긴 알림 수
+    """
+    now = datetime.utcnow()
+    operations = []
+    failed = 0
+    for doc in docs:
+        attempts = int(doc.get("attempts", 0)) + 1
+        update = {"attempts": attempts, "lastError": error[:500]}
+        if attempts >= max_attempts:
+            update.update(status=STATUS_FAILED, expiresAt=now + timedelta(days=SENT_RETENTION_DAYS))
+            failed += 1
+        else:
+            update.update(
+                status=STATUS_PENDING,
+                nextAttemptAt=now + timedelta(seconds=retry_base_seconds * 2 ** (attempts - 1))
+            )
+        operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": update, "$unset": {"owner": ""}}))
+    if operations:
+        write_batch(collection, operations)
+    return failed
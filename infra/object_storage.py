@@ -3,18 +3,58 @@ Object Storage 업로드 모듈
 Kakao Cloud Object Storage (S3 호환) 연동
 """
 
+import gzip
+import io
 import json
+import tempfile
+import threading
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 import boto3
+from boto3.s3.transfer import TransferConfig, S3UploadFailedError
+from botocore.config import Config
 from botocore.exceptions import ClientError
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    # zstd 압축은 선택 기능입니다. (pip install zstandard)
+    zstandard = None
 
 from config.settings import ObjectStorageSettings
+from core import metrics
 
 
-def get_s3_client(settings: ObjectStorageSettings):
+# 압축 결과가 이 크기를 넘으면 메모리 대신 임시 파일에 씁니다.
+SPOOL_MAX_BYTES = 32 * 1024 * 1024
+# 이 크기를 넘는 오브젝트는 multipart로 업로드합니다.
+MULTIPART_THRESHOLD = 16 * 1024 * 1024
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=MULTIPART_THRESHOLD,
+    max_concurrency=4
+)
+COMPRESSION_EXTENSIONS = {"gzip": "gz", "zstd": "zst"}
+
+# 프로세스 내에서 재사용하는 S3 클라이언트 캐시
+# boto3 클라이언트는 스레드 안전하며 내부에 HTTP 커넥션 풀을 가지므로, 같은 설정이면 하나만 만들어 공유합니다.
+# (생성 시 엔드포인트/서비스 모델 로딩에 수십~수백 ms가 걸립니다)
+_S3_CLIENT_CACHE: Dict[Tuple, Any] = {}
+_S3_CLIENT_LOCK = threading.Lock()
+
+
+def _s3_client_cache_key(settings: ObjectStorageSettings) -> Tuple:
+    return (
+        settings.endpoint,
+        settings.access_key,
+        settings.secret_key,
+        settings.max_pool_connections,
+    )
+
+
+def create_s3_client(settings: ObjectStorageSettings):
     """
-    S3 클라이언트를 생성합니다.
+    커넥션 풀/재시도 옵션을 적용한 새 S3 클라이언트를 생성합니다.
     
     Args:
         settings: Object Storage 설정
@@ -22,15 +62,64 @@ def get_s3_client(settings: ObjectStorageSettings):
     Returns:
         boto3 S3 클라이언트
     """
-    return boto3.client(
+    config = Config(
+        max_pool_connections=settings.max_pool_connections,
+        retries={"max_attempts": 5, "mode": "standard"},
+        connect_timeout=5,
+        read_timeout=60,
+        tcp_keepalive=True
+    )
+    # boto3 기본 세션은 스레드 안전하지 않으므로 클라이언트마다 세션을 따로 만듭니다.
+    session = boto3.session.Session()
+    return session.client(
         's3',
         endpoint_url=settings.endpoint,
         aws_access_key_id=settings.access_key,
         aws_secret_access_key=settings.secret_key,
-        region_name='kr-standard'  # Kakao Cloud 기본 리전
+        region_name='kr-standard',  # Kakao Cloud 기본 리전
+        config=config
     )
 
 
+def get_s3_client(settings: ObjectStorageSettings):
+    """
+    S3 클라이언트를 반환합니다.
+    같은 설정으로 이미 생성된 클라이언트가 있으면 재사용합니다.
+    
+    Args:
+        settings: Object Storage 설정
+    
+    Returns:
+        boto3 S3 클라이언트
+    """
+    key = _s3_client_cache_key(settings)
+    with _S3_CLIENT_LOCK:
+        client = _S3_CLIENT_CACHE.get(key)
+        if client is None:
+            client = create_s3_client(settings)
+            _S3_CLIENT_CACHE[key] = client
+        return client
+
+
+def close_s3_clients() -> None:
+    """
+    캐시된 S3 클라이언트를 모두 닫습니다. (프로세스 종료 시 호출)
+    """
+    with _S3_CLIENT_LOCK:
+        for client in _S3_CLIENT_CACHE.values():
+            client.close()
+        _S3_CLIENT_CACHE.clear()
+
+
+def partition_root(root: str, settings: ObjectStorageSettings) -> str:
+    """
+    key 최상위 prefix에 테넌트 파티션을 붙입니다. (테넌트 실행이 아니면 그대로)
+
+    예) raw → raw/tenant=org-a
+    """
+    return f"{root}/tenant={settings.tenant}" if settings.tenant else root
+
+
 def upload_json(
     data: Dict[str, Any],
     date_str: str,
@@ -54,8 +143,8 @@ def upload_json(
     month = date_str[4:6]
     day = date_str[6:8]
     
-    # Object Storage key 구조: raw/year=YYYY/month=MM/day=DD/billing_YYYYMMDD.json
-    key = f"raw/year={year}/month={month}/day={day}/billing_{date_str}.json"
+    # Object Storage key 구조: raw[/tenant=NAME]/year=YYYY/month=MM/day=DD/billing_YYYYMMDD.json
+    key = f"{partition_root('raw', settings)}/year={year}/month={month}/day={day}/billing_{date_str}.json"
     
     # JSON을 문자열로 변환
     json_str = json.dumps(data, ensure_ascii=False, indent=2)
@@ -115,6 +204,41 @@ def upload_json_with_metadata(
     return upload_json(data_with_meta, date_str, settings)
 
 
+def upload_file(
+    path: str,
+    key: str,
+    settings: ObjectStorageSettings,
+    content_type: str = "application/octet-stream"
+) -> str:
+    """
+    로컬 파일을 그대로 업로드합니다. (프로파일 결과 등)
+
+    Args:
+        path: 로컬 파일 경로
+        key: Object Storage key
+        settings: Object Storage 설정
+        content_type: Content-Type
+
+    Returns:
+        Object Storage key
+
+    Raises:
+        RuntimeError: 업로드 실패 시
+    """
+    s3_client = get_s3_client(settings)
+    try:
+        s3_client.upload_file(
+            path,
+            settings.bucket,
+            key,
+            ExtraArgs={"ContentType": content_type},
+            Config=TRANSFER_CONFIG
+        )
+    except (ClientError, S3UploadFailedError) as e:
+        raise RuntimeError(f"Object Storage 업로드 실패: {e}") from e
+    return key
+
+
 def check_bucket_exists(settings: ObjectStorageSettings) -> bool:
     """
     버킷이 존재하는지 확인합니다.
@@ -131,3 +255,232 @@ def check_bucket_exists(settings: ObjectStorageSettings) -> bool:
         return True
     except ClientError:
         return False
+
+
+
+@dataclass
+class UploadResult:
+    """스트리밍 업로드 결과"""
+    key: str
+    records: int
+    original_bytes: int
+    compressed_bytes: int
+    content_encoding: str
+
+
+def _open_compressor(fileobj, compression: str):
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=6)
+    if compression == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd 압축을 사용하려면 zstandard 패키지가 필요합니다.")
+        return zstandard.ZstdCompressor(level=3).stream_writer(fileobj, closefd=False)
+    raise ValueError(f"지원하지 않는 압축 방식입니다: {compression}")
+
+
+def compressed_extension(compression: str) -> str:
+    """압축 방식에 맞는 파일 확장자를 반환합니다."""
+    return COMPRESSION_EXTENSIONS[compression]
+
+
+def upload_jsonl_stream(
+    records: Iterable[Any],
+    key: str,
+    settings: ObjectStorageSettings,
+    compression: str = "gzip",
+    metadata: Optional[Dict[str, str]] = None
+) -> UploadResult:
+    """
+    레코드를 compact JSON Lines로 직렬화하면서 바로 압축하여 업로드합니다.
+    
+    - 전체 JSON 문자열/바이트 사본을 만들지 않고, 압축된 결과만 SpooledTemporaryFile에 씁니다.
+      (작으면 메모리, SPOOL_MAX_BYTES를 넘으면 디스크)
+    - MULTIPART_THRESHOLD를 넘는 오브젝트는 multipart로 업로드됩니다.
+    - 압축 방식과 원본 크기는 오브젝트 메타데이터(content-encoding, original-size)에 기록합니다.
+    
+    Args:
+        records: dict(직렬화 대상) 또는 이미 직렬화된 JSON 문자열 이터러블
+        key: Object Storage key
+        settings: Object Storage 설정
+        compression: "gzip" | "zstd"
+        metadata: 추가 오브젝트 메타데이터 (문자열 값)
+    
+    Returns:
+        UploadResult
+    
+    Raises:
+        RuntimeError: 업로드 실패 시
+    """
+    count = 0
+    original_bytes = 0
+
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as spool:
+        writer = _open_compressor(spool, compression)
+        for record in records:
+            line = record if isinstance(record, str) else json.dumps(
+                record, ensure_ascii=False, separators=(",", ":")
+            )
+            encoded = line.encode("utf-8") + b"\n"
+            writer.write(encoded)
+            original_bytes += len(encoded)
+            count += 1
+        writer.close()
+
+        compressed_bytes = spool.tell()
+        spool.seek(0)
+
+        object_metadata = {
+            **(metadata or {}),
+            "content-encoding": compression,
+            "original-size": str(original_bytes),
+            "record-count": str(count),
+        }
+
+        s3_client = get_s3_client(settings)
+        try:
+            with metrics.timer("object_storage_upload_seconds"):
+                s3_client.upload_fileobj(
+                    spool,
+                    settings.bucket,
+                    key,
+                    ExtraArgs={
+                        "ContentType": "application/x-ndjson",
+                        "ContentEncoding": compression,
+                        "Metadata": object_metadata,
+                    },
+                    Config=TRANSFER_CONFIG
+                )
+        except (ClientError, S3UploadFailedError) as e:
+            raise RuntimeError(f"Object Storage 업로드 실패: {e}") from e
+    metrics.inc("object_storage_uploads_total")
+    metrics.inc("object_storage_uploaded_bytes_total", compressed_bytes)
+    metrics.inc("object_storage_uploaded_records_total", count)
+
+    return UploadResult(
+        key=key,
+        records=count,
+        original_bytes=original_bytes,
+        compressed_bytes=compressed_bytes,
+        content_encoding=compression
+    )
+
+
+def upload_raw_entries(
+    entries: Iterable[Dict[str, Any]],
+    date_str: str,
+    settings: ObjectStorageSettings,
+    compression: str = "gzip",
+    metadata: Optional[Dict[str, Any]] = None
+) -> UploadResult:
+    """
+    Billing API 엔트리(result.content)를 압축 JSON Lines로 업로드합니다.
+    
+    key 구조: raw[/tenant=NAME]/year=YYYY/month=MM/day=DD/billing_YYYYMMDD.jsonl.{gz|zst}
+    
+    Args:
+        entries: 비용 엔트리 이터러블
+        date_str: 날짜 문자열 (YYYYMMDD)
+        settings: Object Storage 설정
+        compression: "gzip" | "zstd"
+        metadata: 추가 메타데이터 (fetchedAt, apiParams 등, 값은 JSON 문자열로 기록)
+    
+    Returns:
+        UploadResult
+    """
+    year = date_str[:4]
+    month = date_str[4:6]
+    day = date_str[6:8]
+    key = (
+        f"{partition_root('raw', settings)}/year={year}/month={month}/day={day}/"
+        f"billing_{date_str}.jsonl.{compressed_extension(compression)}"
+    )
+
+    # S3 메타데이터 값은 ASCII만 허용되므로 JSON 직렬화 시 escape 합니다.
+    object_metadata = {
+        name: value if isinstance(value, str) else json.dumps(value)
+        for name, value in (metadata or {}).items()
+    }
+    object_metadata["uploadedAt"] = datetime.utcnow().isoformat()
+
+    return upload_jsonl_stream(entries, key, settings, compression, object_metadata)
+
+
+def upload_jsonl_gz(
+    records: Iterable[str],
+    key: str,
+    settings: ObjectStorageSettings,
+    metadata: Optional[Dict[str, str]] = None
+) -> int:
+    """
+    JSON Lines(한 줄에 JSON 1개) 레코드를 gzip으로 압축하여 업로드합니다.
+    
+    Args:
+        records: 직렬화된 JSON 문자열 이터러블 (줄바꿈 제외)
+        key: Object Storage key
+        settings: Object Storage 설정
+        metadata: 오브젝트 메타데이터 (문자열 값)
+    
+    Returns:
+        업로드한 레코드 수
+    """
+    return upload_jsonl_stream(records, key, settings, "gzip", metadata).records
+
+
+def iter_jsonl(
+    key: str,
+    settings: ObjectStorageSettings
+) -> Iterator[str]:
+    """
+    압축된 JSON Lines 오브젝트를 스트리밍으로 내려받아 줄 단위 문자열을 반환합니다.
+    압축 방식은 key 확장자(.gz / .zst)로 판단합니다.
+    
+    Args:
+        key: Object Storage key
+        settings: Object Storage 설정
+    
+    Returns:
+        JSON 문자열 이터레이터
+    """
+    s3_client = get_s3_client(settings)
+    try:
+        body = s3_client.get_object(Bucket=settings.bucket, Key=key)["Body"]
+    except ClientError as e:
+        raise RuntimeError(f"Object Storage 다운로드 실패: {e}") from e
+
+    if key.endswith(".zst"):
+        if zstandard is None:
+            raise RuntimeError("zstd 오브젝트를 읽으려면 zstandard 패키지가 필요합니다.")
+        stream = zstandard.ZstdDecompressor().stream_reader(body)
+    elif key.endswith(".gz"):
+        stream = gzip.GzipFile(fileobj=body, mode="rb")
+    else:
+        stream = body
+
+    with io.TextIOWrapper(stream, encoding="utf-8") as text:
+        for line in text:
+            line = line.rstrip("\n")
+            if line:
+                yield line
+
+
+def list_keys(
+    prefix: str,
+    settings: ObjectStorageSettings
+) -> List[str]:
+    """
+    prefix로 시작하는 오브젝트 key 목록을 조회합니다.
+    
+    Args:
+        prefix: key prefix
+        settings: Object Storage 설정
+    
+    Returns:
+        key 리스트 (사전순)
+    """
+    s3_client = get_s3_client(settings)
+    keys = []
+    paginator = s3_client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=settings.bucket, Prefix=prefix):
+        for obj in page.get("Contents", []):
+            keys.append(obj["Key"])
+    return sorted(keys)
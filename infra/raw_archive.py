@@ -0,0 +1,149 @@
+"""
+Raw 데이터 아카이브 조회 모듈
+
+Daily Job이 저장한 Raw 오브젝트(raw[/tenant=NAME]/year=YYYY/month=MM/day=DD/billing_YYYYMMDD.*)를
+날짜 범위로 찾아 엔트리로 읽어옵니다. 재처리(replay)/백필에서 사용합니다.
+
+- S3RawArchive   : Kakao Cloud Object Storage / MinIO 등 S3 호환 저장소
+- LocalRawArchive: 같은 key 구조를 가진 로컬 디렉토리 (테스트/오프라인 재처리용)
+
+지원 포맷:
+- billing_YYYYMMDD.json       : 기존 API 응답 JSON (result.content)
+- billing_YYYYMMDD.jsonl.gz   : 압축 JSON Lines (엔트리 1개/줄)
+- billing_YYYYMMDD.jsonl.zst  : zstd 압축 JSON Lines (zstandard 필요)
+"""
+
+import gzip
+import io
+import json
+import os
+import re
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from config.settings import ObjectStorageSettings
+from core.aggregator import extract_entries
+from infra.object_storage import get_s3_client, list_keys, partition_root, zstandard
+
+
+RAW_PREFIX = "raw"
+RAW_KEY_PATTERN = re.compile(r"billing_(\d{8})\.(json|jsonl\.gz|jsonl\.zst)$")
+# 같은 날짜에 여러 포맷이 있으면 앞쪽 포맷을 우선 사용합니다.
+FORMAT_PRIORITY = ("jsonl.zst", "jsonl.gz", "json")
+
+
+def iter_dates(from_date: str, to_date: str) -> Iterator[str]:
+    """YYYYMMDD 범위(양끝 포함)의 날짜를 순서대로 반환합니다."""
+    current = datetime.strptime(from_date, "%Y%m%d")
+    end = datetime.strptime(to_date, "%Y%m%d")
+    while current <= end:
+        yield current.strftime("%Y%m%d")
+        current += timedelta(days=1)
+
+
+def month_prefixes(from_date: str, to_date: str, root: str = RAW_PREFIX) -> List[str]:
+    """날짜 범위에 걸친 월별 raw prefix 목록을 반환합니다. (root: raw 또는 raw/tenant=NAME)"""
+    months = sorted({date[:6] for date in iter_dates(from_date, to_date)})
+    return [f"{root}/year={m[:4]}/month={m[4:6]}/" for m in months]
+
+
+def select_raw_keys(keys: Iterable[str], from_date: str, to_date: str) -> Dict[str, str]:
+    """
+    key 목록에서 날짜 범위에 해당하는 Raw 오브젝트를 날짜별로 1개씩 고릅니다.
+
+    Returns:
+        {YYYYMMDD: key} (날짜 오름차순)
+    """
+    selected: Dict[str, str] = {}
+    for key in keys:
+        match = RAW_KEY_PATTERN.search(key)
+        if not match:
+            continue
+        date, fmt = match.group(1), match.group(2)
+        if date < from_date or date > to_date:
+            continue
+        current = selected.get(date)
+        if current is None or FORMAT_PRIORITY.index(fmt) < FORMAT_PRIORITY.index(
+            RAW_KEY_PATTERN.search(current).group(2)
+        ):
+            selected[date] = key
+    return dict(sorted(selected.items()))
+
+
+def parse_raw_bytes(key: str, stream) -> List[Dict[str, Any]]:
+    """
+    Raw 오브젝트 스트림을 포맷(key 확장자)에 맞게 엔트리 리스트로 변환합니다.
+    """
+    if key.endswith(".json"):
+        return extract_entries(json.load(stream))
+
+    if key.endswith(".jsonl.zst"):
+        if zstandard is None:
+            raise RuntimeError("zstd 오브젝트를 읽으려면 zstandard 패키지가 필요합니다.")
+        stream = zstandard.ZstdDecompressor().stream_reader(stream)
+    elif key.endswith(".jsonl.gz"):
+        stream = gzip.GzipFile(fileobj=stream, mode="rb")
+
+    entries = []
+    with io.TextIOWrapper(stream, encoding="utf-8") as text:
+        for line in text:
+            line = line.strip()
+            if line:
+                entries.append(json.loads(line))
+    return entries
+
+
+class RawArchive(ABC):
+    """Raw 오브젝트 저장소 인터페이스"""
+
+    @abstractmethod
+    def list_raw_keys(self, from_date: str, to_date: str) -> Dict[str, str]:
+        """날짜 범위의 Raw 오브젝트 key를 {날짜: key}로 반환합니다."""
+
+    @abstractmethod
+    def read_entries(self, key: str) -> List[Dict[str, Any]]:
+        """Raw 오브젝트를 내려받아 엔트리 리스트로 반환합니다."""
+
+
+class S3RawArchive(RawArchive):
+    """S3 호환 Object Storage (Kakao Cloud, MinIO 등)"""
+
+    def __init__(self, settings: ObjectStorageSettings):
+        self.settings = settings
+
+    def list_raw_keys(self, from_date: str, to_date: str) -> Dict[str, str]:
+        keys: List[str] = []
+        for prefix in month_prefixes(from_date, to_date, partition_root(RAW_PREFIX, self.settings)):
+            keys.extend(list_keys(prefix, self.settings))
+        return select_raw_keys(keys, from_date, to_date)
+
+    def read_entries(self, key: str) -> List[Dict[str, Any]]:
+        s3_client = get_s3_client(self.settings)
+        body = s3_client.get_object(Bucket=self.settings.bucket, Key=key)["Body"]
+        return parse_raw_bytes(key, body)
+
+
+class LocalRawArchive(RawArchive):
+    """Object Storage와 같은 key 구조를 가진 로컬 디렉토리"""
+
+    def __init__(self, root: str, tenant: Optional[str] = None):
+        self.root = Path(root)
+        self.tenant = tenant
+
+    def list_raw_keys(self, from_date: str, to_date: str) -> Dict[str, str]:
+        keys: List[str] = []
+        raw_root = f"{RAW_PREFIX}/tenant={self.tenant}" if self.tenant else RAW_PREFIX
+        for prefix in month_prefixes(from_date, to_date, raw_root):
+            base = self.root / prefix
+            if not base.is_dir():
+                continue
+            for dirpath, _, filenames in os.walk(base):
+                for name in filenames:
+                    keys.append(Path(dirpath, name).relative_to(self.root).as_posix())
+        return select_raw_keys(keys, from_date, to_date)
+
+    def read_entries(self, key: str) -> List[Dict[str, Any]]:
+        with open(self.root / key, "rb") as f:
+            return parse_raw_bytes(key, f)
@@ -0,0 +1,123 @@
+"""
+MongoDB 스키마(인덱스) 마이그레이션 모듈
+
+인덱스 생성 같은 스키마 작업을 버전이 붙은 마이그레이션으로 관리합니다.
+적용된 버전은 `schema_migrations` 컬렉션에 기록되며,
+잡은 매 실행마다 버전 문서 1건만 조회하고 최신이면 인덱스 생성을 건너뜁니다.
+"""
+
+import threading
+from datetime import datetime
+from typing import Callable, List, Set, Tuple
+
+from pymongo.database import Database
+
+from infra.mongo_client import (
+    get_client_uri,
+    ensure_indexes,
+    ensure_daily_history_index,
+    ensure_monthly_indexes
+)
+from infra.archive import ensure_archive_indexes, ensure_archive_service_index
+from infra.daily_store import ensure_daily_flags_index
+from infra.budgets import ensure_budget_indexes
+from infra.contributors import ensure_contributor_indexes
+from infra.job_checkpoint import ensure_job_checkpoint_indexes
+from infra.job_lock import ensure_job_lock_indexes
+from infra.forecasts import ensure_forecast_indexes
+from infra.job_runs import ensure_job_run_finished_index, ensure_job_run_indexes
+from infra.notification_outbox import ensure_notification_outbox_indexes
+
+
+SCHEMA_COLLECTION = "schema_migrations"
+SCHEMA_DOC_ID = "billing"
+
+# (버전, 설명, 마이그레이션 함수)
+# 새 인덱스/컬렉션이 필요하면 기존 항목을 수정하지 말고 다음 버전으로 추가합니다.
+MIGRATIONS: List[Tuple[int, str, Callable[[Database], None]]] = [
+    (1, "initial indexes (billing_daily, billing_baseline, billing_anomalies)", ensure_indexes),
+    (2, "covering index for baseline history reads", ensure_daily_history_index),
+    (3, "billing_monthly rollup indexes", ensure_monthly_indexes),
+    (4, "archive manifest indexes", ensure_archive_indexes),
+    (5, "job checkpoint indexes (TTL on updatedAt)", ensure_job_checkpoint_indexes),
+    (6, "job lease lock indexes (TTL on expiresAt)", ensure_job_lock_indexes),
+    (7, "job run summary indexes (TTL on expiresAt)", ensure_job_run_indexes),
+    (8, "notification outbox indexes (TTL on expiresAt)", ensure_notification_outbox_indexes),
+    (9, "month-end forecast indexes (TTL on expiresAt)", ensure_forecast_indexes),
+    (10, "budget usage/state indexes (TTL on expiresAt)", ensure_budget_indexes),
+    (11, "daily contributor ranking indexes (TTL on expiresAt)", ensure_contributor_indexes),
+    (12, "job run finishedAt index for query API cache invalidation", ensure_job_run_finished_index),
+    # time-series 컬렉션은 dailyStorage=timeseries일 때 get_daily_store가 생성합니다.
+    (13, "billing_daily_flags unique index", ensure_daily_flags_index),
+    (14, "archive per-service index (billing_archive_service_index)", ensure_archive_service_index),
+    # 13번이 time-series 컬렉션 생성에 실패한 채 기록된 DB에도 flags 인덱스를 만듭니다.
+    (15, "billing_daily_flags unique index (retry for DBs where migration 13 skipped it)", ensure_daily_flags_index),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+# 같은 프로세스(스케줄러 등)에서 이미 최신임을 확인한 DB(mongo.uri, DB 이름)는 다시 조회하지 않습니다.
+# (클라이언트 객체 id는 닫힌 뒤 다른 클라이언트에 재사용될 수 있으므로 키로 쓰지 않음)
+_VERIFIED: Set[Tuple[str, str]] = set()
+_VERIFIED_LOCK = threading.Lock()
+
+
+def get_schema_version(db: Database) -> int:
+    """
+    DB에 기록된 스키마 버전을 조회합니다.
+
+    Args:
+        db: Database 인스턴스
+
+    Returns:
+        적용된 스키마 버전 (기록이 없으면 0)
+    """
+    doc = db[SCHEMA_COLLECTION].find_one({"_id": SCHEMA_DOC_ID}, {"version": 1})
+    if not doc:
+        return 0
+    return int(doc.get("version") or 0)
+
+
+def ensure_schema(db: Database) -> int:
+    """
+    적용되지 않은 마이그레이션을 순서대로 실행하고 버전을 기록합니다.
+    이미 최신 버전이면 아무 작업도 하지 않습니다.
+
+    Args:
+        db: Database 인스턴스
+
+    Returns:
+        적용 후 스키마 버전
+    """
+    uri = get_client_uri(db.client)
+    # get_mongo_client로 만들지 않은 클라이언트는 어느 서버인지 알 수 없으므로 매번 조회합니다.
+    cache_key = (uri, db.name) if uri is not None else None
+    with _VERIFIED_LOCK:
+        if cache_key in _VERIFIED:
+            return SCHEMA_VERSION
+
+    current = get_schema_version(db)
+
+    for version, description, migrate in MIGRATIONS:
+        if version <= current:
+            continue
+        migrate(db)
+        now = datetime.utcnow()
+        db[SCHEMA_COLLECTION].update_one(
+            {"_id": SCHEMA_DOC_ID},
+            {
+                "$set": {"version": version, "updatedAt": now},
+                "$push": {"history": {
+                    "version": version,
+                    "description": description,
+                    "appliedAt": now
+                }}
+            },
+            upsert=True
+        )
+        current = version
+
+    if cache_key is not None:
+        with _VERIFIED_LOCK:
+            _VERIFIED.add(cache_key)
+    return current
@@ -0,0 +1,118 @@
+"""
+Object Storage 병렬 전송 모듈
+
+파티션 오브젝트(raw/, archive/ 등) 여러 개를 제한된 스레드 수로 동시에 업로드/다운로드합니다.
+모든 작업은 캐시된 S3 클라이언트(커넥션 풀 공유)를 사용하므로, 오브젝트마다 클라이언트 생성/연결 비용을
+치르지 않고 대역폭을 채울 수 있습니다.
+
+동시에 진행 중인 작업 수는 workers * 2로 제한되며, 이를 넘으면 submit이 기다립니다.
+(생성기에서 레코드를 읽어 올리는 경우에도 메모리 사용량이 무한히 늘지 않도록)
+
+사용 예:
+    with ObjectTransferManager(settings.object_storage) as transfer:
+        for key, lines in transfer.download_many(keys):
+            ...
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from config.settings import ObjectStorageSettings
+from infra.object_storage import UploadResult, iter_jsonl, upload_jsonl_stream
+
+
+class ObjectTransferManager:
+    """
+    제한된 스레드 풀로 Object Storage 오브젝트를 병렬 전송하는 매니저
+    """
+
+    def __init__(self, settings: ObjectStorageSettings, workers: Optional[int] = None):
+        self.settings = settings
+        self.workers = max(1, workers or settings.transfer_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="s3-transfer")
+        self._slots = threading.BoundedSemaphore(self.workers * 2)
+
+    def __enter__(self) -> "ObjectTransferManager":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """스레드 풀을 종료합니다."""
+        self._executor.shutdown(wait=wait)
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        전송 작업 1개를 제출합니다. 진행 중인 작업이 workers * 2개면 하나가 끝날 때까지 기다립니다.
+
+        Args:
+            fn: worker 스레드에서 실행할 함수
+            *args, **kwargs: fn 인자
+
+        Returns:
+            Future
+        """
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def upload_many(
+        self,
+        items: Iterable[Tuple[str, Iterable[Any]]],
+        compression: str = "gzip",
+        metadata: Optional[Dict[str, str]] = None
+    ) -> List[UploadResult]:
+        """
+        (key, 레코드 이터러블) 목록을 압축 JSON Lines로 병렬 업로드합니다.
+
+        Args:
+            items: (Object Storage key, 레코드 이터러블) 이터러블
+            compression: "gzip" | "zstd"
+            metadata: 모든 오브젝트에 공통으로 붙일 메타데이터
+
+        Returns:
+            UploadResult 리스트 (items 순서)
+
+        Raises:
+            실패한 업로드의 예외 (items 순서상 첫 번째)
+        """
+        futures = [
+            self.submit(upload_jsonl_stream, records, key, self.settings, compression, metadata)
+            for key, records in items
+        ]
+        return [future.result() for future in futures]
+
+    def download_many(
+        self,
+        keys: Iterable[str],
+        loader: Optional[Callable[[str], Any]] = None
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        여러 오브젝트를 병렬로 내려받아 끝나는 순서대로 반환합니다.
+
+        Args:
+            keys: Object Storage key 이터러블
+            loader: key -> 결과 함수 (기본값: 압축 JSON Lines를 줄 문자열 리스트로 읽기)
+
+        Returns:
+            (key, loader 결과) 이터레이터 (완료 순서)
+        """
+        loader = loader or self._read_lines
+        pending: Dict[Future, str] = {}
+        for key in keys:
+            pending[self.submit(loader, key)] = key
+            # 끝난 작업은 바로 돌려줘 결과가 메모리에 쌓이지 않도록 합니다.
+            for future in [f for f in pending if f.done()]:
+                yield pending.pop(future), future.result()
+        for future in as_completed(list(pending)):
+            yield pending.pop(future), future.result()
+
+    def _read_lines(self, key: str) -> List[str]:
+        return list(iter_jsonl(key, self.settings))
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Backfill Job: 날짜 범위의 Billing 데이터를 API에서 한 번에 가져와 billing_daily를 채움
+
+장애 복구나 새 도메인 온보딩처럼 여러 날짜를 처리해야 할 때,
+Daily Job을 날짜마다 반복 실행하는 대신 범위를 chunk(기본 7일)로 나눠
+병렬로 API 호출/집계하고, chunk 단위로 bulk 저장한 뒤 baseline은 마지막에 한 번만 재계산합니다.
+checkpoint 파일에 완료된 날짜를 기록하므로, 중단 후 같은 명령으로 다시 실행하면 이어서 처리합니다.
+
+사용 예:
+    python jobs/backfill_job.py --from 20250101 --to 20250331
+    python jobs/backfill_job.py --from 20250101 --to 20250331 --chunk-days 3 --workers 2 --archive-raw
+    python jobs/backfill_job.py --from 20250101 --to 20250331 --tenant acme
+"""
+
+import sys
+import time
+import argparse
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.settings import load_settings, Settings
+from core.aggregator import extract_entries, aggregate_daily
+from core.baseline import recompute_baselines
+from core.billing_client import fetch_billing
+from core.rollup import save_daily_with_rollup
+from core.tenants import tenant_settings
+from infra.mongo_client import (
+    get_mongo_client,
+    get_database
+)
+from infra.object_storage import upload_raw_entries
+from infra.raw_archive import iter_dates
+from infra.schema import ensure_schema
+from infra.daily_store import get_daily_store
+from utils.checkpoint import FileCheckpoint
+
+
+def split_chunks(dates: List[str], chunk_days: int) -> List[List[str]]:
+    """
+    날짜 목록을 연속된 날짜끼리 최대 chunk_days개씩 묶습니다.
+    (checkpoint로 일부 날짜가 빠진 경우에도 API 호출 범위가 끊기지 않도록 연속 구간으로만 묶음)
+    """
+    chunks: List[List[str]] = []
+    previous = None
+    for date in sorted(dates):
+        current = datetime.strptime(date, "%Y%m%d")
+        contiguous = previous is not None and (current - previous).days == 1
+        if chunks and contiguous and len(chunks[-1]) < chunk_days:
+            chunks[-1].append(date)
+        else:
+            chunks.append([date])
+        previous = current
+    return chunks
+
+
+def load_chunk(settings: Settings, dates: List[str], archive_raw: bool):
+    """
+    chunk 1개를 API에서 가져와 집계합니다. (worker 스레드에서 실행)
+
+    Returns:
+        (엔트리 수, DailySummary 리스트)
+    """
+    response = fetch_billing(
+        from_date=dates[0],
+        to_date=dates[-1],
+        settings=settings.billing_api
+    )
+    entries = extract_entries(response)
+
+    if archive_raw:
+        # Daily Job과 같은 key 구조(raw/year=/month=/day=)로 날짜별 Raw 데이터를 저장합니다.
+        by_date: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for entry in entries:
+            by_date[str(entry.get("meteringDate", ""))].append(entry)
+        metadata = {
+            "fetchedAt": datetime.utcnow().isoformat(),
+            "apiParams": {"from": dates[0], "to": dates[-1]},
+            "source": "backfill"
+        }
+        for date in dates:
+            upload_raw_entries(
+                entries=by_date.get(date, []),
+                date_str=date,
+                settings=settings.object_storage,
+                compression=settings.object_storage.raw_compression or "gzip",
+                metadata=metadata
+            )
+
+    return len(entries), aggregate_daily(entries)
+
+
+def run_backfill_job(
+    settings: Settings,
+    from_date: str,
+    to_date: str,
+    checkpoint_path: str,
+    chunk_days: int = 7,
+    workers: int = 4,
+    archive_raw: bool = False,
+    skip_baseline: bool = False
+):
+    """
+    Backfill Job을 실행합니다.
+
+    Args:
+        settings: 설정 객체
+        from_date: 시작 날짜 (YYYYMMDD, 포함)
+        to_date: 종료 날짜 (YYYYMMDD, 포함)
+        checkpoint_path: checkpoint 파일 경로
+        chunk_days: API 호출 1회에 묶을 날짜 수
+        workers: 병렬 API 호출/집계 수
+        archive_raw: True면 날짜별 Raw 데이터도 Object Storage에 저장
+        skip_baseline: True면 baseline 재계산 생략
+    """
+    print("=" * 60)
+    print(f"⏩ Backfill Job 실행 - {from_date} ~ {to_date}")
+    print("=" * 60)
+
+    try:
+        checkpoint = FileCheckpoint(checkpoint_path)
+
+        # 1. 처리 대상 날짜 / chunk 구성
+        print("\n[1/3] 처리 대상 확인 중...")
+        dates = list(iter_dates(from_date, to_date))
+        pending = checkpoint.pending(dates)
+        chunks = split_chunks(pending, chunk_days)
+        print(f"✅ {len(dates)}일 중 {len(pending)}일 처리 대상 ({len(chunks)}개 chunk, chunk당 최대 {chunk_days}일)")
+
+        client = get_mongo_client(settings.mongo)
+        db = get_database(client, settings.mongo.db_name)
+        ensure_schema(db)
+        daily_store = get_daily_store(db, settings.mongo, settings.object_storage)
+
+        # 2. 병렬 API 호출/집계 → chunk별 bulk 저장
+        print(f"\n[2/3] API 호출/집계/저장 중... (workers={workers})")
+        started = time.perf_counter()
+        done_days = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(load_chunk, settings, chunk, archive_raw): chunk
+                for chunk in chunks
+            }
+            for future in as_completed(futures):
+                chunk = futures[future]
+                entry_count, summaries = future.result()
+                if summaries:
+                    save_daily_with_rollup(daily_store, db.billing_monthly, summaries)
+                checkpoint.mark_done(
+                    chunk,
+                    {(s.domain_id, s.project_id, s.service_id, s.service_name) for s in summaries}
+                )
+                done_days += len(chunk)
+                elapsed = time.perf_counter() - started
+                eta = elapsed / done_days * (len(pending) - done_days)
+                print(
+                    f"   [{done_days}/{len(pending)}일] {chunk[0]}~{chunk[-1]}: "
+                    f"{entry_count}개 엔트리 → {len(summaries)}개 일별 집계 저장 "
+                    f"(경과 {elapsed:.1f}s, 남은 예상 {eta:.0f}s)"
+                )
+        print(f"✅ {done_days}일 저장 완료 ({time.perf_counter() - started:.1f}s)")
+
+        # 3. Baseline 재계산 (마지막에 1회)
+        if skip_baseline:
+            print("\n[3/3] Baseline 재계산 생략 (--skip-baseline)")
+        elif checkpoint.baseline_done:
+            print("\n[3/3] Baseline 재계산이 이미 완료되었습니다.")
+        else:
+            print(f"\n[3/3] Baseline 재계산 중... ({len(checkpoint.services)}개 서비스)")
+            updated = recompute_baselines(daily_store, db.billing_baseline, sorted(checkpoint.services))
+            checkpoint.mark_baseline_done()
+            print(f"✅ {updated}개 서비스 Baseline 업데이트 완료")
+
+        print("\n" + "=" * 60)
+        print("✅ Backfill Job 완료!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ 오류 발생: {e}")
+        print(f"   같은 명령으로 다시 실행하면 checkpoint({checkpoint_path})부터 이어서 처리합니다.")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='Billing Backfill Job')
+    parser.add_argument('--config', type=str, default='config/settings.yaml', help='설정 파일 경로')
+    parser.add_argument('--from', dest='from_date', type=str, required=True, help='시작 날짜 (YYYYMMDD)')
+    parser.add_argument('--to', dest='to_date', type=str, required=True, help='종료 날짜 (YYYYMMDD)')
+    parser.add_argument('--chunk-days', type=int, default=7, help='API 호출 1회에 묶을 날짜 수')
+    parser.add_argument('--workers', type=int, default=4, help='병렬 API 호출/집계 수')
+    parser.add_argument('--archive-raw', action='store_true', help='날짜별 Raw 데이터도 Object Storage에 저장')
+    parser.add_argument('--checkpoint', type=str, help='checkpoint 파일 경로 (기본값: logs/backfill_{from}_{to}.json)')
+    parser.add_argument('--skip-baseline', action='store_true', help='baseline 재계산 생략')
+    parser.add_argument('--tenant', type=str, help='테넌트 credential로 API를 호출 (Raw는 raw/tenant=NAME/...에 저장)')
+
+    args = parser.parse_args()
+
+    if args.from_date > args.to_date:
+        parser.error('--from 은 --to 보다 이전 날짜여야 합니다.')
+    if args.chunk_days < 1:
+        parser.error('--chunk-days 는 1 이상이어야 합니다.')
+
+    # 설정 로드
+    settings = load_settings(args.config)
+
+    if args.tenant:
+        tenant = next((t for t in settings.tenants if t.name == args.tenant), None)
+        if tenant is None:
+            parser.error(f'설정 파일에 없는 테넌트입니다: {args.tenant}')
+        settings = tenant_settings(settings, tenant)
+
+    run_name = f"backfill_{args.from_date}_{args.to_date}" + (f"_{args.tenant}" if args.tenant else "")
+    checkpoint_path = args.checkpoint or str(project_root / "logs" / f"{run_name}.json")
+
+    # Job 실행
+    run_backfill_job(
+        settings,
+        args.from_date,
+        args.to_date,
+        checkpoint_path,
+        chunk_days=args.chunk_days,
+        workers=args.workers,
+        archive_raw=args.archive_raw,
+        skip_baseline=args.skip_baseline
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,7 @@ import sys
 import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Set, Tuple
+from typing import Any, Dict, List, Sequence, Set, Tuple
 try:
     # Python 3.9+
     from zoneinfo import ZoneInfo
@@ -20,17 +20,35 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from config.settings import load_settings, Settings
-from core.billing_client import fetch_billing
-from core.aggregator import extract_entries, aggregate_daily
-from core.baseline import recompute_baseline
+from core import stages
+from core.baseline import recompute_baselines
+from core.forecast import forecast_month_end, history_dates, load_history
+from core.rollup import save_daily_with_rollup, month_of, month_to_date
+from core.content_hash import compute_entries_hash
 from core.logger import get_logger
+from core.aggregator import aggregate_daily, extract_entries
+from core.contributors import build_contributors, describe_movers
+from core.pipeline import Pipeline, Stage, StopPipeline
+from core.profiling import add_profile_arguments, apply_profile_arguments, profile_run
+from core.sharding import (
+    add_shard_arguments,
+    apply_shard_arguments,
+    is_sharded,
+    is_primary_shard,
+    shard_run_key
+)
+from core.tenants import active_tenants, print_tenant_summary, run_for_tenants, tenant_run_key
+from infra.contributors import CONTRIBUTORS_COLLECTION, save_contributors
+from infra.forecasts import FORECASTS_COLLECTION, save_forecasts
+from infra.job_checkpoint import open_job_checkpoint
+from infra.job_lock import open_job_lease
+from infra.job_runs import track_job_run
 from infra.mongo_client import (
-    get_mongo_client,
-    get_database,
-    ensure_indexes,
-    bulk_upsert_daily_summaries
+    get_raw_manifest,
+    upsert_raw_manifest
 )
-from infra.object_storage import upload_json_with_metadata
+from infra.object_storage import upload_json_with_metadata, upload_raw_entries
+from infra.columnar_export import export_columnar, is_available as columnar_available
 
 KST = ZoneInfo("Asia/Seoul")
 BILLING_DAILY_TOTAL = "BILLING_DAILY_TOTAL"
@@ -79,112 +97,414 @@ def extract_unique_services(summaries) -> Set[Tuple[str, str, str, str]]:
     return services 
 
 
-def run_daily_job(settings: Settings, target_date: str = None):
-    """
-    Daily Job을 실행합니다.
-    
-    Args:
-        settings: 설정 객체
-        target_date: 대상 날짜 (YYYYMMDD), None이면 어제
-    """
-    if target_date is None:
-        target_date = get_target_date(offset_days=-1)  # 어제 날짜
-
-    logger = get_logger()
-    
-    print("=" * 60)
-    print(f"📅 Daily Job 실행 - {target_date}")
-    print("=" * 60)
-    
-    try:
-        # 1. API 호출
-        print("\n[1/5] Billing API 호출 중...")
-        response = fetch_billing(
-            from_date=target_date,
-            to_date=target_date,
-            settings=settings.billing_api
+def check_changed(
+    settings: Settings,
+    db,
+    response,
+    entries: List[Dict[str, Any]],
+    target_date: str,
+    run_key: str,
+    force: bool,
+    logger
+) -> Dict[str, Any]:
+    """이전 실행과 내용이 같으면 업로드/저장/baseline 재계산을 건너뜁니다. (shard별로 비교)"""
+    if is_sharded(settings.cluster) and is_primary_shard(settings.cluster):
+        # primary shard는 응답 전체로 Raw 저장/총 요금/기여도를 처리하므로,
+        # 다른 shard 몫만 바뀐 경우에도 다시 처리하도록 응답 전체의 해시를 비교합니다.
+        entries = extract_entries(response)
+    content_hash, entry_count = compute_entries_hash(entries)
+    manifest = get_raw_manifest(db.billing_raw_manifest, run_key)
+    if manifest and manifest.get("contentHash") == content_hash and not force:
+        logger.info(
+            f"[BILLING_DAILY_SKIP] {format_yyyymmdd(target_date)} 데이터가 이전 처리와 동일하여 "
+            f"건너뜁니다. ({entry_count}개 엔트리, {content_hash[:19]})",
+            extra={"fields": {"date": target_date, "runKey": run_key, "entryCount": entry_count}}
         )
-        print(f"✅ API 호출 성공")
-        
-        # 2. Object Storage에 Raw 데이터 저장
-        print("\n[2/5] Object Storage에 Raw 데이터 저장 중...")
-        metadata = {
-            "fetchedAt": datetime.utcnow().isoformat(),
-            "apiParams": {
-                "from": target_date,
-                "to": target_date
-            }
+        print("✅ 변경 사항 없음 - Daily Job 건너뜀 (--force 로 강제 실행 가능)")
+        raise StopPipeline("unchanged")
+    print(f"✅ 내용 변경 확인 ({entry_count}개 엔트리, {content_hash[:19]})")
+    return {"content_hash": content_hash, "entry_count": entry_count}
+
+
+def archive_raw(
+    settings: Settings,
+    response: Dict[str, Any],
+    entries: List[Dict[str, Any]],
+    target_date: str
+) -> Dict[str, Any]:
+    """Raw 데이터를 Object Storage에 저장합니다. (선택적으로 컬럼 포맷도 함께)"""
+    if is_sharded(settings.cluster):
+        # Raw 데이터는 날짜별 오브젝트 1개이므로 primary shard만 응답 전체를 저장합니다.
+        # (primary shard의 check_changed는 응답 전체 해시를 비교하므로 다른 shard 몫만 바뀌어도 다시 저장)
+        if not is_primary_shard(settings.cluster):
+            print("✅ Raw 데이터 저장은 shard 0에서 처리합니다. (건너뜀)")
+            return {"storage_path": None}
+        entries = extract_entries(response)
+
+    metadata = {
+        "fetchedAt": datetime.utcnow().isoformat(),
+        "apiParams": {
+            "from": target_date,
+            "to": target_date
         }
+    }
+    if settings.object_storage.raw_compression:
+        # 압축 JSON Lines 스트리밍 업로드 (entries만 저장, 메타데이터는 오브젝트 메타데이터로)
+        upload_result = upload_raw_entries(
+            entries=entries,
+            date_str=target_date,
+            settings=settings.object_storage,
+            compression=settings.object_storage.raw_compression,
+            metadata=metadata
+        )
+        storage_path = upload_result.key
+        print(
+            f"   {upload_result.original_bytes:,} bytes → "
+            f"{upload_result.compressed_bytes:,} bytes ({upload_result.content_encoding})"
+        )
+    else:
         storage_path = upload_json_with_metadata(
             data=response,
             date_str=target_date,
             settings=settings.object_storage,
             metadata=metadata
         )
-        print(f"✅ Raw 데이터 저장 완료: {storage_path}")
-        
-        # 3. Entries 추출 및 집계
-        print("\n[3/5] 데이터 집계 중...")
-        entries = extract_entries(response)
-        print(f"✅ {len(entries)}개 엔트리 추출")
-        
-        if not entries:
-            print("⚠️ 처리할 데이터가 없습니다.")
-            return
-        
-        summaries = aggregate_daily(entries)
-        print(f"✅ {len(summaries)}개 서비스별 집계 완료")
-        
-        # 4. MongoDB 연결 및 일별 데이터 저장 (Bulk Upsert)
-        print("\n[4/5] MongoDB에 일별 집계 데이터 저장 중...")
-        client = get_mongo_client(settings.mongo)
-        db = get_database(client, settings.mongo.db_name)
-        ensure_indexes(db)
-
-        daily_col = db.billing_daily
-        saved_count = bulk_upsert_daily_summaries(daily_col, summaries)
-        print(f"✅ {saved_count}개 일별 집계 데이터 저장 완료")
-        
-        # 5. Baseline 업데이트 (각 서비스별로)
-        print("\n[5/5] Baseline 업데이트 중...")
-        baseline_col = db.billing_baseline
-        
-        unique_services = extract_unique_services(summaries)
-        baseline_updated = 0
-        
-        for domain_id, project_id, service_id, service_name in unique_services:
-            recompute_baseline(
-                daily_collection=daily_col,
-                baseline_collection=baseline_col,
-                domain_id=domain_id,
-                project_id=project_id,
-                service_id=service_id,
-                service_name=service_name
+    print(f"✅ Raw 데이터 저장 완료: {storage_path}")
+
+    # 분석용 컬럼 포맷 내보내기 (선택)
+    if settings.object_storage.columnar_export:
+        if columnar_available():
+            export_result = export_columnar(entries, target_date, settings.object_storage)
+            print(
+                f"✅ 컬럼 포맷 저장 완료: {export_result.key} "
+                f"({export_result.rows}행, {export_result.bytes:,} bytes)"
             )
-            baseline_updated += 1
-        
-        print(f"✅ {baseline_updated}개 서비스 Baseline 업데이트 완료")
+        else:
+            print("⚠️ pyarrow가 설치되어 있지 않아 컬럼 포맷 저장을 건너뜁니다.")
+    return {"storage_path": storage_path}
+
+
+def persist(db, daily_store, summaries) -> Dict[str, Any]:
+    """일별 집계를 저장하고 월별 롤업(billing_monthly)에 변화량만 반영합니다."""
+    saved_count, delta_count = save_daily_with_rollup(daily_store, db.billing_monthly, summaries)
+    print(f"✅ {saved_count}개 일별 집계 데이터 저장 완료")
+    print(f"✅ 월별 롤업 {delta_count}건 반영")
+    return {"saved_count": saved_count}
+
+
+def update_baselines(db, daily_store, summaries) -> Dict[str, Any]:
+    """저장된 서비스의 baseline을 재계산합니다."""
+    unique_services = extract_unique_services(summaries)
+    baseline_updated = recompute_baselines(daily_store, db.billing_baseline, unique_services)
+    print(f"✅ {baseline_updated}개 서비스 Baseline 업데이트 완료")
+    return {"baseline_updated": baseline_updated}
+
+
+def forecast(settings: Settings, db, daily_store, summaries, target_date: str) -> Dict[str, Any]:
+    """이번 실행에서 집계한 프로젝트의 서비스별 월말 비용을 예측해 저장합니다."""
+    if not settings.forecast.enabled or not summaries:
+        return {}
+
+    # 테넌트/shard가 처리한 프로젝트만 예측합니다. (다른 테넌트/shard의 서비스는 각자의 실행에서)
+    projects = {(s.domain_id, s.project_id) for s in summaries}
+    dates = history_dates(target_date, settings.forecast.history_days)
+    keys, history = load_history(daily_store, dates, scope=projects)
+    if not keys:
+        return {}
+
+    result = forecast_month_end(keys, history, dates, settings.forecast.interval_z)
+    saved = save_forecasts(
+        db[FORECASTS_COLLECTION],
+        result,
+        settings.forecast.retention_days,
+        tenant=settings.tenant.name if settings.tenant else None
+    )
+    totals = result.totals()
+    print(
+        f"✅ {saved}개 서비스 월말 예측 저장 완료 - {result.month} 예상 {totals['forecast']:,.0f}원 "
+        f"({totals['lower']:,.0f} ~ {totals['upper']:,.0f}원, 누적 {totals['actual']:,.0f}원, "
+        f"남은 {result.remaining_days}일)"
+    )
+    return {}
+
+
+def rank_contributors(settings: Settings, db, daily_store, response, summaries, target_date: str) -> Dict[str, Any]:
+    """전체/도메인/프로젝트별 금액 상위와 전일 대비 변동 상위를 계산해 저장합니다."""
+    if not settings.contributors.enabled or not summaries:
+        return {"top_movers": None}
+
+    # 총 요금 로그와 같은 기준: 분할 실행 시에는 primary shard가 응답 전체로 계산합니다.
+    if not is_sharded(settings.cluster):
+        day_summaries = summaries
+    elif is_primary_shard(settings.cluster):
+        day_summaries = aggregate_daily(extract_entries(response))
+    else:
+        return {"top_movers": None}
 
-        # 6. Alert Center 연동용: 일별 총 요금 로그 기록 (키워드 기반)
-        # - Alert Center에서 Syslog(/var/log/syslog) 수집 + 키워드 필터로 알림을 만들 수 있습니다.
+    previous_date = (datetime.strptime(target_date, "%Y%m%d") - timedelta(days=1)).strftime("%Y%m%d")
+    report = build_contributors(
+        day_summaries,
+        daily_store.get_daily_amounts_for_date(previous_date),
+        target_date,
+        previous_date,
+        settings.contributors.top_n
+    )
+    saved = save_contributors(
+        db[CONTRIBUTORS_COLLECTION],
+        report,
+        settings.contributors.retention_days,
+        tenant=settings.tenant.name if settings.tenant else None
+    )
+    if not report.total.has_previous:
+        # 전일 데이터가 없으면 증가 상위가 금액 상위와 같아지므로 변동 로그를 남기지 않습니다.
+        print(f"✅ 기여도 순위 {saved}개 범위 저장 완료 (전일 {previous_date} 데이터 없음 - 변동 순위 생략)")
+        return {"top_movers": None}
+    print(f"✅ 기여도 순위 {saved}개 범위 저장 완료 (전일 대비 {report.total.delta:+,.0f}원)")
+    return {"top_movers": report.total}
+
+
+def report_total(
+    settings: Settings,
+    db,
+    response,
+    summaries,
+    target_date: str,
+    top_movers,
+    logger
+) -> Dict[str, Any]:
+    """Alert Center 연동용 일별 총 요금 로그를 기록합니다."""
+    if not summaries:
+        return {}
+
+    # Alert Center에서 Syslog(/var/log/syslog) 수집 + 키워드 필터로 알림을 만들 수 있습니다.
+    # 분할 실행 시에는 총 요금 로그가 shard 수만큼 중복되지 않도록 primary shard가 응답 전체로 계산합니다.
+    if not is_sharded(settings.cluster):
         total_expect_amount = sum(s.expect_amount for s in summaries)
+    elif is_primary_shard(settings.cluster):
+        total_expect_amount = sum(
+            float(entry.get("expectAmount") or 0) for entry in extract_entries(response)
+        )
+    else:
+        total_expect_amount = None
+
+    if total_expect_amount is not None:
         date_label = format_yyyymmdd(target_date)
+        tenant_label = f"[{settings.tenant.name}] " if settings.tenant else ""
         log_message = (
-            f"[{BILLING_DAILY_TOTAL}] "
+            f"[{BILLING_DAILY_TOTAL}] {tenant_label}"
             f"[{date_label}]의 총 요금은 {total_expect_amount:,.2f}원 입니다."
         )
-        logger.info(log_message)
+        fields = {
+            "date": target_date,
+            "tenant": settings.tenant.name if settings.tenant else None,
+            "totalExpectAmount": round(total_expect_amount, 2),
+        }
+        # 기여도 단계의 전일 대비 변동과 증가 상위 서비스를 함께 남깁니다. (추가 조회 없음)
+        limit = settings.contributors.log_movers
+        if top_movers is not None and limit > 0:
+            log_message += f" 전일 대비 {top_movers.delta:+,.2f}원"
+            movers = describe_movers(top_movers, limit)
+            if movers:
+                log_message += f" (증가 상위: {movers})"
+            fields["deltaAmount"] = round(top_movers.delta, 2)
+            fields["topIncreases"] = [c.to_dict() for c in top_movers.increases.items()[:limit]]
+        logger.info(log_message, extra={"fields": fields})
         print("✅ 일별 총 요금 로그 전송 완료 (Alert Center 연동용)")
+
+    # 도메인별 월 누적 금액 (billing_monthly point read)
+    month = month_of(target_date)
+    for domain_id in sorted({s.domain_id for s in summaries}):
+        mtd = month_to_date(db.billing_monthly, month, domain_id)
+        print(f"   - {domain_id[:8]}... {month} 월 누적: {mtd:,.2f}원")
+    return {}
+
+
+def record_manifest(db, run_key: str, content_hash: str, entry_count: int, storage_path: str) -> Dict[str, Any]:
+    """모든 단계가 끝난 뒤에 내용 해시를 기록합니다. (중간 실패 시 다음 실행에서 다시 처리)"""
+    upsert_raw_manifest(db.billing_raw_manifest, run_key, content_hash, entry_count, storage_path)
+    return {}
+
+
+def build_daily_pipeline() -> Pipeline:
+    """
+    Daily Job 파이프라인을 구성합니다.
+
+    connect ∥ fetch → check_changed → (archive ∥ aggregate → persist → (baseline ∥ forecast ∥ budget ∥ contributors) → report) → manifest
+    """
+    return Pipeline("daily", [
+        stages.CONNECT,
+        stages.FETCH,
+        Stage("check_changed", check_changed,
+              requires=("settings", "db", "response", "entries", "target_date", "run_key", "force", "logger"),
+              provides=("content_hash", "entry_count"),
+              label="내용 변경 여부 확인 중...",
+              resumable=True),
+        Stage("archive", archive_raw,
+              requires=("settings", "response", "entries", "target_date"),
+              provides=("storage_path",),
+              after=("check_changed",),
+              label="Object Storage에 Raw 데이터 저장 중...",
+              resumable=True),
+        Stage("aggregate", stages.aggregate,
+              requires=("entries",),
+              provides=("summaries",),
+              label="데이터 집계 중...",
+              resumable=True),
+        Stage("persist", persist,
+              requires=("db", "daily_store", "summaries"),
+              provides=("saved_count",),
+              after=("check_changed",),
+              label="MongoDB에 일별 집계 데이터 저장 중...",
+              resumable=True),
+        Stage("baseline", update_baselines,
+              requires=("db", "daily_store", "summaries"),
+              provides=("baseline_updated",),
+              after=("persist",),
+              label="Baseline 업데이트 중...",
+              resumable=True),
+        Stage("forecast", forecast,
+              requires=("settings", "db", "daily_store", "summaries", "target_date"),
+              after=("persist",),
+              label="월말 비용 예측 중...",
+              resumable=True),
+        # Hourly Job이 누적한 예산 사용량을 확정 금액으로 보정합니다.
+        Stage("budget", stages.budgets,
+              requires=("settings", "db", "daily_store", "summaries", "target_date", "logger"),
+              after=("persist",),
+              label="예산 확인 중...",
+              resumable=True),
+        Stage("contributors", rank_contributors,
+              requires=("settings", "db", "daily_store", "response", "summaries", "target_date"),
+              provides=("top_movers",),
+              after=("persist",),
+              label="기여도/변동 순위 계산 중...",
+              resumable=True),
+        Stage("report", report_total,
+              requires=("settings", "db", "response", "summaries", "target_date", "top_movers", "logger"),
+              after=("baseline", "forecast", "budget"),
+              label="일별 총 요금 기록 중...",
+              resumable=True),
+        Stage("manifest", record_manifest,
+              requires=("db", "run_key", "content_hash", "entry_count", "storage_path"),
+              after=("report",),
+              resumable=True),
+    ])
+
+
+def execute_daily(settings: Settings, target_date: str, force: bool = False, resume: bool = True):
+    """
+    lease/checkpoint와 함께 Daily 파이프라인을 1회 실행합니다. (테넌트 1개 단위)
+
+    Args:
+        settings: 설정 객체 (테넌트 실행 시 테넌트용 설정)
+        target_date: 대상 날짜 (YYYYMMDD)
+        force: True면 내용 해시가 같아도 다시 처리
+        resume: True면 이전에 실패한 실행의 완료 단계를 건너뛰고 이어서 실행
+
+    Returns:
+        PipelineResult (다른 노드가 처리 중이거나 완료해서 건너뛰면 None)
+
+    Raises:
+        Exception: 단계 실패 시 (lease 반납/checkpoint 실패 기록 후 다시 발생)
+    """
+    run_key = shard_run_key(tenant_run_key(target_date, settings), settings.cluster)
+
+    # 실행 1회의 단계별 소요 시간/카운터를 job_runs 컬렉션과 Prometheus textfile로 내보냅니다.
+    with track_job_run(settings, "daily", run_key) as run:
+        # 여러 노드에서 실행될 때 같은 날짜(테넌트/shard)는 한 노드만 처리합니다.
+        lease = open_job_lease(settings, "daily", run_key)
+        if lease and not lease.acquire(ignore_completed=force):
+            print(f"✅ 다른 노드가 이미 처리 중입니다: daily:{run_key} ({lease.holder}) - 건너뜀")
+            run.finish("skipped")
+            return None
+
+        checkpoint = None
+        try:
+            checkpoint = open_job_checkpoint(settings, "daily", run_key, resume=resume and not force)
+            if checkpoint and checkpoint.resumed_stages:
+                print(f"↩️ [{run_key}] 이전 실행에서 이어서 처리합니다. (완료 단계: {', '.join(checkpoint.resumed_stages)})")
+
+            result = build_daily_pipeline().run({
+                "settings": settings,
+                "target_date": target_date,
+                "run_key": run_key,
+                "force": force,
+                "logger": get_logger(settings=settings.logging),
+            }, checkpoint=checkpoint, guard=lease.check if lease else None)
+            if checkpoint:
+                checkpoint.complete()
+        except Exception as e:
+            if lease:
+                lease.release()
+            # lease를 잃었으면 checkpoint는 이어서 처리하는 노드의 것이므로 건드리지 않습니다.
+            if checkpoint and not (lease and lease.lost):
+                checkpoint.fail(e)
+            raise
+
+        # 완료된 lease는 바로 반납합니다. 늦게 시작한 노드나 같은 날짜 재실행(--today 등)은
+        # check_changed의 내용 해시 비교로 변경 여부를 판단합니다.
+        if lease:
+            lease.release()
+        run.finish("skipped" if result.stopped else "success", stages=result.timings)
+        return result
+
+
+def run_daily_job(
+    settings: Settings,
+    target_date: str = None,
+    force: bool = False,
+    resume: bool = True,
+    profile: Sequence[str] = ()
+):
+    """
+    Daily Job을 실행합니다. (settings.tenants가 있으면 테넌트별로 동시에 실행)
+    
+    Args:
+        settings: 설정 객체
+        target_date: 대상 날짜 (YYYYMMDD), None이면 어제
+        force: True면 내용 해시가 같아도 다시 처리
+        resume: True면 이전에 실패한 실행의 완료 단계를 건너뛰고 이어서 실행
+        profile: 켤 프로파일러 목록 (core.profiling, 비어 있으면 프로파일링하지 않음)
+    """
+    if target_date is None:
+        target_date = get_target_date(offset_days=-1)  # 어제 날짜
+
+    tenants = active_tenants(settings)
+    print("=" * 60)
+    if tenants:
+        print(f"📅 Daily Job 실행 - {target_date} ({len(tenants)}개 테넌트)")
+    else:
+        print(f"📅 Daily Job 실행 - {target_date}")
+    print("=" * 60)
+    
+    with profile_run(settings, profile, "daily", target_date):
+        try:
+            if tenants:
+                results = run_for_tenants(
+                    settings,
+                    lambda scoped: execute_daily(scoped, target_date, force=force, resume=resume)
+                )
+                print_tenant_summary(results)
+                failed = [r.name for r in results if not r.ok]
+                if failed:
+                    raise RuntimeError(f"{len(failed)}개 테넌트 실패: {', '.join(failed)}")
+            else:
+                result = execute_daily(settings, target_date, force=force, resume=resume)
+                if result is None:
+                    return
+                print(f"\n⏱️ {result.summary()}")
         
-        print("\n" + "=" * 60)
-        print("✅ Daily Job 완료!")
-        print("=" * 60)
+            print("\n" + "=" * 60)
+            print("✅ Daily Job 완료!")
+            print("=" * 60)
         
-    except Exception as e:
-        print(f"\n❌ 오류 발생: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+        except Exception as e:
+            print(f"\n❌ 오류 발생: {e}")
+            if settings.checkpoint.enabled:
+                print("   같은 명령으로 다시 실행하면 완료된 단계는 건너뛰고 이어서 처리합니다. (--no-resume 로 처음부터)")
+            import traceback
+            traceback.print_exc()
+            sys.exit(1)
 
 
 def main():
@@ -206,11 +526,25 @@ def main():
         action='store_true',
         help='오늘 날짜로 처리 (기본값: 어제)'
     )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='API 응답이 이전 처리와 같아도 다시 처리'
+    )
+    parser.add_argument(
+        '--no-resume',
+        action='store_true',
+        help='이전에 실패한 실행의 checkpoint를 무시하고 처음부터 실행'
+    )
+    add_shard_arguments(parser)
+    add_profile_arguments(parser)
     
     args = parser.parse_args()
     
     # 설정 로드
     settings = load_settings(args.config)
+    apply_shard_arguments(parser, args, settings)
+    profile = apply_profile_arguments(parser, args, settings)
     
     # 대상 날짜 결정
     target_date = args.date
@@ -221,7 +555,7 @@ def main():
             target_date = None  # 기본값(어제) 사용
     
     # Job 실행
-    run_daily_job(settings, target_date)
+    run_daily_job(settings, target_date, force=args.force, resume=not args.no_resume, profile=profile)
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ import sys
 import argparse
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Dict, Sequence
 try:
     # Python 3.9+
     from zoneinfo import ZoneInfo
@@ -19,21 +20,28 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from config.settings import load_settings, Settings
-from core.billing_client import fetch_billing
-from core.aggregator import extract_entries, aggregate_daily
-from core.baseline import get_baseline_data
+from core import metrics, stages
+from core.baseline import BaselineCache, get_baseline_data
 from core.anomaly_detector import detect_anomalies, anomaly_to_dict
 from core.logger import get_logger
-from infra.mongo_client import (
-    get_mongo_client,
-    get_database,
-    ensure_indexes,
-    insert_anomaly,
-    update_daily_anomaly_status
-)
+from core.notifier import NotificationDispatcher
+from core.pipeline import Pipeline, Stage
+from core.profiling import add_profile_arguments, apply_profile_arguments, profile_run
+from core.sharding import add_shard_arguments, apply_shard_arguments, shard_run_key
+from core.tenants import active_tenants, print_tenant_summary, run_for_tenants, tenant_run_key
+from infra.job_checkpoint import open_job_checkpoint
+from infra.job_lock import open_job_lease
+from infra.job_runs import track_job_run
+from infra.mongo_client import insert_anomaly
+from infra.notification_outbox import NOTIFICATION_OUTBOX_COLLECTION, enqueue_notifications
 
 
 KST = ZoneInfo("Asia/Seoul")
+# 완료된 Hourly 실행의 lease 유지 시간 - 같은 시간대를 다른 노드가 다시 처리하지 않도록 합니다.
+HOURLY_LEASE_HOLD_SECONDS = 3600
+# 이상치 탐지 기본 임계값 (테넌트별 zThreshold / ratioThreshold로 변경 가능)
+Z_THRESHOLD = 3.0
+RATIO_THRESHOLD = 2.0
 
 
 def get_current_target_date() -> str:
@@ -47,13 +55,14 @@ def get_current_target_date() -> str:
     return now.strftime("%Y%m%d")
 
 
-def build_baseline_map(db, summaries):
+def build_baseline_map(db, summaries, baseline_cache: BaselineCache = None):
     """
     집계 결과에서 필요한 baseline들을 조회하여 map을 구성합니다.
     
     Args:
         db: MongoDB Database 인스턴스
         summaries: DailySummary 리스트
+        baseline_cache: 상주 스케줄러의 baseline 캐시 (None이면 서비스별로 조회)
     
     Returns:
         baseline_map: {"domainId|projectId|serviceId": Baseline} 딕셔너리
@@ -72,132 +81,321 @@ def build_baseline_map(db, summaries):
         
         if key not in seen_keys:
             seen_keys.add(key)
-            baseline = get_baseline_data(
-                baseline_col,
-                summary.domain_id,
-                summary.project_id,
-                summary.service_id
-            )
+            if baseline_cache is not None:
+                baseline = baseline_cache.get(
+                    summary.domain_id,
+                    summary.project_id,
+                    summary.service_id
+                )
+            else:
+                baseline = get_baseline_data(
+                    baseline_col,
+                    summary.domain_id,
+                    summary.project_id,
+                    summary.service_id
+                )
             if baseline:
                 baseline_map[key] = baseline
-    
+
+    metrics.inc("baseline_reads_total", len(seen_keys), source="cache" if baseline_cache is not None else "mongo")
+    metrics.inc("baseline_missing_total", len(seen_keys) - len(baseline_map))
     return baseline_map
 
 
-def run_hourly_job(settings: Settings, target_date: str = None):
+def record_snapshots(daily_store, summaries, current_hour: int) -> Dict[str, Any]:
+    """시간대별 누적 스냅샷을 저장합니다. (time-series 저장소에서만 기록됨)"""
+    snapshot_count = daily_store.record_hourly_summaries(summaries, current_hour) if summaries else 0
+    if snapshot_count:
+        print(f"✅ {snapshot_count}개 시간대별 스냅샷 저장")
+    return {"snapshot_count": snapshot_count}
+
+
+def load_baselines(db, summaries, baseline_cache) -> Dict[str, Any]:
+    """집계된 서비스의 baseline을 조회합니다."""
+    baseline_map = build_baseline_map(db, summaries, baseline_cache)
+    print(f"✅ {len(baseline_map)}개 Baseline 조회 완료")
+    return {"baseline_map": baseline_map}
+
+
+def detect(
+    summaries,
+    baseline_map,
+    target_date: str,
+    current_hour: int,
+    z_threshold: float,
+    ratio_threshold: float
+) -> Dict[str, Any]:
+    """baseline 대비 이상치를 탐지합니다."""
+    anomalies = detect_anomalies(
+        summaries=summaries,
+        baseline_map=baseline_map,
+        current_date=target_date,
+        current_hour=current_hour,
+        z_threshold=z_threshold,
+        ratio_threshold=ratio_threshold
+    )
+    print(f"✅ {len(anomalies)}개 이상치 발견")
+    return {"anomalies": anomalies}
+
+
+def notify(settings, db, daily_store, anomalies, logger, run_key) -> Dict[str, Any]:
+    """이상치를 저장하고 일별 집계에 표시한 뒤 알림 로그를 남기고 알림 outbox에 추가합니다."""
+    if not anomalies:
+        print("✅ 이상치 없음")
+        return {}
+
+    anomalies_col = db.billing_anomalies
+    anomaly_dicts = []
+    
+    for anomaly in anomalies:
+        #1) MongoDB 저장 (이상치 이력)
+        anomaly_dict = anomaly_to_dict(anomaly)
+        insert_anomaly(anomalies_col, anomaly_dict)
+        anomaly_dicts.append(anomaly_dict)
+        
+        #2) 일별 집계 테이블에 이상치 마킹 (Daily Job Baseline 제외용)
+        daily_store.mark_anomaly(
+            date=anomaly.date,
+            domain_id=anomaly.domain_id,
+            project_id=anomaly.project_id,
+            service_id=anomaly.service_id,
+            is_anomaly=True
+        )
+        
+        #3) syslog에 이상치 로그 기록 (Alert Center 연동용)
+        # 고객에게 바로 보여줄 수 있도록, 자연어 한 문장 형태로 기록합니다.
+        # 예)
+        # [BILLING_ANOMALY] {domainName}/{projectName} 프로젝트의 {serviceName} 비용이 평소 대비 약 {increasePercent}% 높습니다. 현재 {amount}원, 기준 평균 {baselineMean}원.
+        increase_percent = (anomaly.deviation_ratio - 1.0) * 100
+        log_message = (
+            f"[BILLING_ANOMALY] "
+            f"{anomaly.domain_name}/{anomaly.project_name} 프로젝트의 "
+            f"{anomaly.service_name} 비용이 평소 대비 약 {increase_percent:.1f}% 높습니다. "
+            f"현재 {anomaly.observed_amount:.2f}원, "
+            f"기준 평균 {anomaly.baseline_mean:.2f}원."
+        )
+        # logging.format이 json이면 fields가 함께 기록됩니다. (text 형식은 메시지만)
+        logger.error(log_message, extra={"fields": {
+            "date": anomaly.date,
+            "hour": anomaly.hour,
+            "tenant": settings.tenant.name if settings.tenant else None,
+            "domainId": anomaly.domain_id,
+            "projectId": anomaly.project_id,
+            "serviceId": anomaly.service_id,
+            "observedAmount": round(anomaly.observed_amount, 2),
+            "baselineMean": round(anomaly.baseline_mean, 2),
+            "zScore": anomaly.z_score,
+            "deviationRatio": anomaly.deviation_ratio,
+        }})
+
+    #4) 채널별 알림을 outbox에 추가 (발송은 dispatch 단계)
+    channels = [channel.name for channel in settings.alert.all_channels()]
+    queued = enqueue_notifications(
+        db[NOTIFICATION_OUTBOX_COLLECTION],
+        channels,
+        anomaly_dicts,
+        run_key,
+        tenant=settings.tenant.name if settings.tenant else None
+    )
+    
+    print(f"✅ {len(anomalies)}개 이상치 저장 및 알림 로그 기록 완료 (알림 {queued}건 대기)")
+    return {}
+
+
+def dispatch(settings, db) -> Dict[str, Any]:
+    """
+    outbox에 쌓인 알림을 채널별 digest로 발송합니다.
+
+    이번 실행의 이상치뿐 아니라 이전 실행에서 실패해 재시도 시각이 된 알림도 함께 보냅니다.
+    """
+    if not settings.alert.all_channels():
+        return {}
+
+    result = NotificationDispatcher(
+        settings.alert,
+        db[NOTIFICATION_OUTBOX_COLLECTION],
+        tenant=settings.tenant.name if settings.tenant else None
+    ).dispatch()
+    for channel in result.channels:
+        if channel.error:
+            print(f"⚠️ [{channel.channel}] 알림 {channel.claimed}건 발송 실패: {channel.error}")
+        elif channel.sent:
+            print(f"✅ [{channel.channel}] 알림 {channel.sent}건 발송 완료")
+    if result.failed:
+        print(f"❌ 최대 시도 횟수를 넘은 알림 {result.failed}건은 더 이상 발송하지 않습니다.")
+    return {}
+
+
+def build_hourly_pipeline() -> Pipeline:
+    """
+    Hourly Job 파이프라인을 구성합니다.
+
+    connect ∥ fetch → aggregate → (snapshot ∥ budget ∥ baseline) → detect → notify → dispatch
+    """
+    return Pipeline("hourly", [
+        stages.CONNECT,
+        stages.FETCH,
+        Stage("aggregate", stages.aggregate,
+              requires=("entries",),
+              provides=("summaries",),
+              label="데이터 집계 중... (현재 시점까지 누적 합계)",
+              resumable=True),
+        Stage("snapshot", record_snapshots,
+              requires=("daily_store", "summaries", "current_hour"),
+              provides=("snapshot_count",),
+              resumable=True),
+        Stage("budget", stages.budgets,
+              requires=("settings", "db", "daily_store", "summaries", "target_date", "logger"),
+              label="예산 확인 중...",
+              resumable=True),
+        Stage("baseline", load_baselines,
+              requires=("db", "summaries", "baseline_cache"),
+              provides=("baseline_map",),
+              label="Baseline 조회 중...",
+              resumable=True),
+        Stage("detect", detect,
+              requires=("summaries", "baseline_map", "target_date", "current_hour", "z_threshold", "ratio_threshold"),
+              provides=("anomalies",),
+              label="이상치 탐지 중...",
+              resumable=True),
+        Stage("notify", notify,
+              requires=("settings", "db", "daily_store", "anomalies", "logger", "run_key"),
+              label="이상치 저장 및 알림 중...",
+              resumable=True),
+        # 재시도 대상 알림도 보내야 하므로 checkpoint와 관계없이 매번 실행합니다.
+        Stage("dispatch", dispatch,
+              requires=("settings", "db"),
+              after=("notify",),
+              label="알림 발송 중..."),
+    ])
+
+
+def execute_hourly(
+    settings: Settings,
+    target_date: str,
+    current_hour: int,
+    baseline_cache: BaselineCache = None,
+    resume: bool = True
+):
     """
-    Hourly Job을 실행합니다.
+    lease/checkpoint와 함께 Hourly 파이프라인을 1회 실행합니다. (테넌트 1개 단위)
+
+    Args:
+        settings: 설정 객체 (테넌트 실행 시 테넌트용 설정)
+        target_date: 대상 날짜 (YYYYMMDD)
+        current_hour: 현재 시각 (KST, 0~23)
+        baseline_cache: 상주 스케줄러에서 재사용하는 baseline 캐시 (선택)
+        resume: True면 같은 시간대에 실패한 실행의 완료 단계를 건너뛰고 이어서 실행
+
+    Returns:
+        PipelineResult (다른 노드가 처리 중이거나 완료해서 건너뛰면 None)
+
+    Raises:
+        Exception: 단계 실패 시 (lease 반납/checkpoint 실패 기록 후 다시 발생)
+    """
+    run_key = shard_run_key(tenant_run_key(f"{target_date}-{current_hour:02d}", settings), settings.cluster)
+
+    # 실행 1회의 단계별 소요 시간/카운터를 job_runs 컬렉션과 Prometheus textfile로 내보냅니다.
+    with track_job_run(settings, "hourly", run_key) as run:
+        # 여러 노드에서 실행될 때 같은 시간대(테넌트/shard)는 한 노드만 처리합니다.
+        lease = open_job_lease(settings, "hourly", run_key)
+        if lease and not lease.acquire():
+            print(f"✅ 다른 노드가 이미 처리 중이거나 완료했습니다: hourly:{run_key} ({lease.holder}) - 건너뜀")
+            run.finish("skipped")
+            return None
+
+        tenant = settings.tenant
+        checkpoint = None
+        try:
+            checkpoint = open_job_checkpoint(settings, "hourly", run_key, resume=resume)
+            if checkpoint and checkpoint.resumed_stages:
+                print(f"↩️ [{run_key}] 이전 실행에서 이어서 처리합니다. (완료 단계: {', '.join(checkpoint.resumed_stages)})")
+
+            result = build_hourly_pipeline().run({
+                "settings": settings,
+                "target_date": target_date,
+                "current_hour": current_hour,
+                "run_key": run_key,
+                "baseline_cache": baseline_cache,
+                "z_threshold": tenant.z_threshold if tenant and tenant.z_threshold is not None else Z_THRESHOLD,
+                "ratio_threshold": (
+                    tenant.ratio_threshold if tenant and tenant.ratio_threshold is not None else RATIO_THRESHOLD
+                ),
+                "logger": get_logger(settings=settings.logging),
+            }, checkpoint=checkpoint, guard=lease.check if lease else None)
+            if checkpoint:
+                checkpoint.complete()
+        except Exception as e:
+            if lease:
+                lease.release()
+            # lease를 잃었으면 checkpoint는 이어서 처리하는 노드의 것이므로 건드리지 않습니다.
+            if checkpoint and not (lease and lease.lost):
+                checkpoint.fail(e)
+            raise
+
+        if lease:
+            lease.release(completed=True, hold_seconds=HOURLY_LEASE_HOLD_SECONDS)
+        run.finish("skipped" if result.stopped else "success", stages=result.timings)
+        return result
+
+
+def run_hourly_job(
+    settings: Settings,
+    target_date: str = None,
+    baseline_cache: BaselineCache = None,
+    resume: bool = True,
+    profile: Sequence[str] = ()
+):
+    """
+    Hourly Job을 실행합니다. (settings.tenants가 있으면 테넌트별로 동시에 실행)
     
     Args:
         settings: 설정 객체
         target_date: 대상 날짜 (YYYYMMDD), None이면 오늘
+        baseline_cache: 상주 스케줄러에서 재사용하는 baseline 캐시 (선택)
+        resume: True면 같은 시간대에 실패한 실행의 완료 단계를 건너뛰고 이어서 실행
+        profile: 켤 프로파일러 목록 (core.profiling, 비어 있으면 프로파일링하지 않음)
     """
     if target_date is None:
         target_date = get_current_target_date()
     
     now = datetime.now(KST)
     current_hour = now.hour
-    logger = get_logger()
     
+    tenants = active_tenants(settings)
     print("=" * 60)
-    print(f"🕐 Hourly Job 실행 - {target_date} {current_hour:02d}:00")
+    if tenants:
+        print(f"🕐 Hourly Job 실행 - {target_date} {current_hour:02d}:00 ({len(tenants)}개 테넌트)")
+    else:
+        print(f"🕐 Hourly Job 실행 - {target_date} {current_hour:02d}:00")
     print("=" * 60)
     
-    try:
-        # 1. API 호출
-        print("\n[1/6] Billing API 호출 중...")
-        response = fetch_billing(
-            from_date=target_date,
-            to_date=target_date,
-            settings=settings.billing_api
-        )
-        print(f"✅ API 호출 성공")
-        
-        # 2. Entries 추출
-        print("\n[2/6] Entries 추출 중...")
-        entries = extract_entries(response)
-        print(f"✅ {len(entries)}개 엔트리 추출")
-        
-        if not entries:
-            print("⚠️ 처리할 데이터가 없습니다.")
-            return
-        
-        # 3. 집계 (현재 시점까지 누적 합계)
-        print("\n[3/6] 데이터 집계 중...")
-        summaries = aggregate_daily(entries)
-        print(f"✅ {len(summaries)}개 서비스별 집계 완료")
-        
-        # 4. MongoDB 연결
-        print("\n[4/6] MongoDB 연결 중...")
-        client = get_mongo_client(settings.mongo)
-        db = get_database(client, settings.mongo.db_name)
-        ensure_indexes(db)
-        print("✅ MongoDB 연결 성공")
-        
-        # 5. Baseline 조회
-        print("\n[5/6] Baseline 조회 중...")
-        baseline_map = build_baseline_map(db, summaries)
-        print(f"✅ {len(baseline_map)}개 Baseline 조회 완료")
-        
-        # 6. 이상치 탐지
-        print("\n[6/6] 이상치 탐지 중...")
-        anomalies = detect_anomalies(
-            summaries=summaries,
-            baseline_map=baseline_map,
-            current_date=target_date,
-            current_hour=current_hour,
-            z_threshold=3.0,
-            ratio_threshold=2.0
-        )
-        print(f"✅ {len(anomalies)}개 이상치 발견")
-        
-        # 7. 이상치 저장 및 알림
-        if anomalies:
-            anomalies_col = db.billing_anomalies
-            daily_col = db.billing_daily
-            
-            for anomaly in anomalies:
-                #1) MongoDB 저장 (이상치 이력)
-                anomaly_dict = anomaly_to_dict(anomaly)
-                insert_anomaly(anomalies_col, anomaly_dict)
-                
-                #2) 일별 집계 테이블에 이상치 마킹 (Daily Job Baseline 제외용)
-                update_daily_anomaly_status(
-                    collection=daily_col,
-                    date=anomaly.date,
-                    domain_id=anomaly.domain_id,
-                    project_id=anomaly.project_id,
-                    service_id=anomaly.service_id,
-                    is_anomaly=True
+    with profile_run(settings, profile, "hourly", target_date, current_hour):
+        try:
+            if tenants:
+                results = run_for_tenants(
+                    settings,
+                    lambda scoped: execute_hourly(scoped, target_date, current_hour, baseline_cache, resume)
                 )
-                
-                #3) syslog에 이상치 로그 기록 (Alert Center 연동용)
-                # 고객에게 바로 보여줄 수 있도록, 자연어 한 문장 형태로 기록합니다.
-                # 예)
-                # [BILLING_ANOMALY] {domainName}/{projectName} 프로젝트의 {serviceName} 비용이 평소 대비 약 {increasePercent}% 높습니다. 현재 {amount}원, 기준 평균 {baselineMean}원.
-                increase_percent = (anomaly.deviation_ratio - 1.0) * 100
-                log_message = (
-                    f"[BILLING_ANOMALY] "
-                    f"{anomaly.domain_name}/{anomaly.project_name} 프로젝트의 "
-                    f"{anomaly.service_name} 비용이 평소 대비 약 {increase_percent:.1f}% 높습니다. "
-                    f"현재 {anomaly.observed_amount:.2f}원, "
-                    f"기준 평균 {anomaly.baseline_mean:.2f}원."
-                )
-                logger.error(log_message)
-            
-            print(f"\n✅ {len(anomalies)}개 이상치 저장 및 알림 발송 완료")
-        else:
-            print("\n✅ 이상치 없음")
+                print_tenant_summary(results)
+                failed = [r.name for r in results if not r.ok]
+                if failed:
+                    raise RuntimeError(f"{len(failed)}개 테넌트 실패: {', '.join(failed)}")
+            else:
+                result = execute_hourly(settings, target_date, current_hour, baseline_cache, resume)
+                if result is None:
+                    return
+                print(f"\n⏱️ {result.summary()}")
         
-        print("\n" + "=" * 60)
-        print("✅ Hourly Job 완료!")
-        print("=" * 60)
+            print("\n" + "=" * 60)
+            print("✅ Hourly Job 완료!")
+            print("=" * 60)
         
-    except Exception as e:
-        print(f"\n❌ 오류 발생: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+        except Exception as e:
+            print(f"\n❌ 오류 발생: {e}")
+            import traceback
+            traceback.print_exc()
+            sys.exit(1)
 
 
 def main():
@@ -214,14 +412,23 @@ def main():
         type=str,
         help='대상 날짜 (YYYYMMDD, 기본값: 오늘)'
     )
+    parser.add_argument(
+        '--no-resume',
+        action='store_true',
+        help='같은 시간대에 실패한 실행의 checkpoint를 무시하고 처음부터 실행'
+    )
+    add_shard_arguments(parser)
+    add_profile_arguments(parser)
     
     args = parser.parse_args()
     
     # 설정 로드
     settings = load_settings(args.config)
+    apply_shard_arguments(parser, args, settings)
+    profile = apply_profile_arguments(parser, args, settings)
     
     # Job 실행
-    run_hourly_job(settings, args.date)
+    run_hourly_job(settings, args.date, resume=not args.no_resume, profile=profile)
 
 
 if __name__ == "__main__":
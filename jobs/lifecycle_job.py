@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Lifecycle Job: 보관 기간이 지난 데이터를 Object Storage로 아카이브하고 MongoDB에서 정리
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.settings import load_settings, Settings
+from core.lifecycle import run_lifecycle
+from infra.mongo_client import (
+    get_mongo_client,
+    get_database
+)
+from infra.schema import ensure_schema
+
+
+def run_lifecycle_job(settings: Settings, dry_run: bool = False):
+    """
+    Lifecycle Job을 실행합니다.
+
+    Args:
+        settings: 설정 객체
+        dry_run: True면 대상 건수만 출력하고 아카이브/삭제하지 않음
+    """
+    print("=" * 60)
+    print(f"🗄️ Lifecycle Job 실행{' (dry-run)' if dry_run else ''}")
+    print("=" * 60)
+
+    if not settings.lifecycle.retention_days and not settings.lifecycle.ttl_days:
+        print("⚠️ 설정된 보관 정책이 없습니다. (lifecycle.retentionDays / ttlDays)")
+        return
+
+    try:
+        client = get_mongo_client(settings.mongo)
+        db = get_database(client, settings.mongo.db_name)
+        ensure_schema(db)
+
+        results = run_lifecycle(
+            db,
+            settings.lifecycle,
+            settings.object_storage,
+            dry_run=dry_run
+        )
+        for result in results:
+            if dry_run:
+                print(f"📋 {result.collection}: {result.cutoff_date} 이전 문서 {result.archived}개 대상")
+            else:
+                print(
+                    f"✅ {result.collection}: {result.cutoff_date} 이전 문서 "
+                    f"{result.archived}개 아카이브 ({len(result.parts)}개 파트), {result.deleted}개 삭제"
+                )
+        for collection, days in settings.lifecycle.ttl_days.items():
+            print(f"✅ {collection}: TTL {days}일 적용")
+
+        print("\n" + "=" * 60)
+        print("✅ Lifecycle Job 완료!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='Billing Lifecycle Job')
+    parser.add_argument(
+        '--config',
+        type=str,
+        default='config/settings.yaml',
+        help='설정 파일 경로'
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='대상 건수만 확인 (아카이브/삭제하지 않음)'
+    )
+
+    args = parser.parse_args()
+
+    # 설정 로드
+    settings = load_settings(args.config)
+
+    # Job 실행
+    run_lifecycle_job(settings, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
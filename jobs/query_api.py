@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Query API: 대시보드용 읽기 전용 조회 API 서버 (core/query_api.py)
+
+- settings.yaml queryApi의 host/port에서 /daily, /baselines, /anomalies, /rollups, /health 를 제공합니다.
+- Job과 같은 MongoDB를 읽지만 응답은 프로세스 내 캐시에서 제공하며, Job 완료(job_runs)가 보이면 캐시를 비웁니다.
+- --mongomock: MongoDB 없이 합성 데이터(utils/synthetic.py)를 채운 메모리 DB로 실행합니다. (로컬 확인용, pip install mongomock)
+- SIGTERM / SIGINT를 받으면 처리 중인 요청을 마치고 종료합니다.
+
+사용 예:
+    python -m jobs.query_api --config config/settings.yaml
+    python -m jobs.query_api --mongomock --seed-days 35 --port 8090
+    curl -i 'http://127.0.0.1:8090/rollups?month=202503&level=project'
+"""
+
+import sys
+import signal
+import argparse
+import threading
+import traceback
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from pymongo.database import Database
+
+from config.settings import load_settings
+from core import metrics
+from core.aggregator import aggregate_daily
+from core.anomaly_detector import anomaly_to_dict, detect_anomalies
+from core.baseline import BaselineCache, recompute_baselines
+from core.query_api import QueryApiServer, QueryService
+from core.rollup import save_daily_with_rollup
+from infra.archive import ArchiveReader
+from infra.daily_store import DailyStore, DocumentDailyStore, get_daily_store
+from infra.job_runs import JOB_RUNS_COLLECTION, job_run_document
+from infra.mongo_client import get_mongo_client, get_database, close_mongo_clients, insert_anomaly
+from infra.schema import ensure_schema
+from utils.synthetic import SyntheticBilling, SyntheticConfig
+
+
+def seed_synthetic(db: Database, daily_store: DailyStore, days: int, end_date: str, seed: int = 42) -> None:
+    """
+    합성 데이터로 조회 대상 컬렉션을 채웁니다. (--mongomock 로컬 실행용)
+
+    end_date 이전 days-1일은 일별/월별 롤업과 baseline으로, end_date는 급증을 주입한 집계와 이상치로 저장하고
+    job_runs에 완료 기록 1건을 남깁니다.
+
+    Args:
+        db: Database 인스턴스
+        daily_store: 일별 집계 저장소
+        days: 채울 일수 (이상치 탐지에는 baseline 표본 20일 이상 필요)
+        end_date: 마지막 날짜 (YYYYMMDD)
+        seed: 합성 데이터 seed
+    """
+    billing = SyntheticBilling(SyntheticConfig(spike_rate=0.05, seed=seed))
+    end = datetime.strptime(end_date, "%Y%m%d")
+    with metrics.job_run("seed", end_date) as run:
+        for offset in range(days - 1, 0, -1):
+            date = (end - timedelta(days=offset)).strftime("%Y%m%d")
+            save_daily_with_rollup(daily_store, db.billing_monthly, aggregate_daily(billing.rows_for_date(date)))
+
+        summaries = aggregate_daily(billing.rows_for_date(end_date))
+        services = [(s.domain_id, s.project_id, s.service_id, s.service_name) for s in summaries]
+        recompute_baselines(daily_store, db.billing_baseline, services)
+
+        cache = BaselineCache(db.billing_baseline)
+        baseline_map = {}
+        for s in summaries:
+            baseline = cache.get(s.domain_id, s.project_id, s.service_id)
+            if baseline:
+                baseline_map["|".join([s.domain_id, s.project_id, s.service_id])] = baseline
+        anomalies = detect_anomalies(summaries, baseline_map, end_date, 23)
+        save_daily_with_rollup(daily_store, db.billing_monthly, summaries)
+        for anomaly in anomalies:
+            insert_anomaly(db.billing_anomalies, anomaly_to_dict(anomaly))
+            daily_store.mark_anomaly(anomaly.date, anomaly.domain_id, anomaly.project_id, anomaly.service_id, True)
+        run.finish("success")
+    db[JOB_RUNS_COLLECTION].insert_one(job_run_document(run, retention_days=1))
+
+    print(f"✅ 합성 데이터 적재: {days}일, 서비스 {len(services)}개, 이상치 {len(anomalies)}건")
+    domain_id = summaries[0].domain_id
+    print(f"   예) /daily?domainId={domain_id}&from={(end - timedelta(days=6)).strftime('%Y%m%d')}&to={end_date}")
+    print(f"       /anomalies?date={end_date}   /rollups?month={end_date[:6]}&level=project&domainId={domain_id}")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='Billing Query API (대시보드 조회용)')
+    parser.add_argument('--config', type=str, default='config/settings.yaml', help='설정 파일 경로')
+    parser.add_argument('--host', type=str, default=None, help='바인드 주소 (기본: queryApi.host)')
+    parser.add_argument('--port', type=int, default=None, help='포트 (기본: queryApi.port)')
+    parser.add_argument('--mongomock', action='store_true', help='합성 데이터를 채운 mongomock DB로 실행')
+    parser.add_argument('--seed-days', type=int, default=35, help='--mongomock 합성 데이터 일수')
+    parser.add_argument('--seed-end-date', type=str, default=None, help='--mongomock 합성 데이터 마지막 날짜 (YYYYMMDD, 기본: 어제)')
+
+    args = parser.parse_args()
+
+    # 로그 파일로 리다이렉트해도 진행 상황이 바로 기록되도록 줄 단위로 flush
+    sys.stdout.reconfigure(line_buffering=True)
+
+    settings = load_settings(args.config)
+    host = args.host or settings.query_api.host
+    port = args.port if args.port is not None else settings.query_api.port
+
+    print("=" * 60)
+    print("🔎 Billing Query API 시작")
+    print("=" * 60)
+
+    try:
+        if args.mongomock:
+            try:
+                import mongomock
+            except ImportError:
+                raise SystemExit("mongomock이 설치되어 있지 않습니다. (pip install mongomock)")
+            db = mongomock.MongoClient()[settings.mongo.db_name]
+            ensure_schema(db)
+            daily_store: DailyStore = DocumentDailyStore(db)
+            archive_reader = None
+            end_date = args.seed_end_date or (datetime.now() - timedelta(days=1)).strftime("%Y%m%d")
+            seed_synthetic(db, daily_store, args.seed_days, end_date)
+        else:
+            client = get_mongo_client(settings.mongo)
+            db = get_database(client, settings.mongo.db_name)
+            ensure_schema(db)
+            # 아카이브는 실행 중에도 생길 수 있으므로 래퍼 선택은 QueryService가 요청마다(generation 단위) 합니다.
+            daily_store = get_daily_store(db, settings.mongo)
+            archive_reader = ArchiveReader(
+                db,
+                settings.object_storage,
+                max_parts=settings.query_api.archive_cache_parts,
+                ttl_seconds=settings.query_api.cache_ttl_seconds
+            )
+        server = QueryApiServer(QueryService(db, daily_store, settings.query_api, archive_reader), host, port)
+    except Exception as e:
+        print(f"\n❌ 오류 발생: {e}")
+        traceback.print_exc()
+        sys.exit(1)
+
+    stopping = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopping.set())
+    signal.signal(signal.SIGINT, lambda *_: stopping.set())
+
+    server.start()
+    print(f"✅ {server.url('/health')}")
+    try:
+        stopping.wait()
+    finally:
+        server.stop()
+        close_mongo_clients()
+        print("✅ Billing Query API 종료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Replay Job: Object Storage에 저장된 Raw 데이터로 MongoDB 상태(billing_daily, billing_baseline)를 재구축
+
+Billing API를 다시 호출하지 않고, 아카이브된 Raw 오브젝트를 날짜 범위로 찾아
+병렬로 내려받아 집계/저장한 뒤 baseline은 마지막에 한 번만 재계산합니다.
+checkpoint 파일에 완료된 날짜를 기록하므로, 중단 후 같은 명령으로 다시 실행하면 이어서 처리합니다.
+
+사용 예:
+    python jobs/replay_job.py --from 20250101 --to 20250331
+    python jobs/replay_job.py --from 20250101 --to 20250131 --source local --local-root ./raw_backup
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.settings import load_settings, Settings
+from core.aggregator import aggregate_daily
+from core.baseline import recompute_baselines
+from core.rollup import save_daily_with_rollup
+from core.tenants import tenant_settings
+from infra.mongo_client import (
+    get_mongo_client,
+    get_database
+)
+from infra.schema import ensure_schema
+from infra.daily_store import get_daily_store
+from infra.raw_archive import RawArchive, S3RawArchive, LocalRawArchive
+from infra.transfer import ObjectTransferManager
+from utils.checkpoint import FileCheckpoint
+
+
+def load_day(archive: RawArchive, key: str):
+    """Raw 오브젝트 1개를 내려받아 집계합니다. (worker 스레드에서 실행)"""
+    entries = archive.read_entries(key)
+    return len(entries), aggregate_daily(entries)
+
+
+def run_replay_job(
+    settings: Settings,
+    from_date: str,
+    to_date: str,
+    archive: RawArchive,
+    checkpoint_path: str,
+    workers: int = 4,
+    skip_baseline: bool = False
+):
+    """
+    Replay Job을 실행합니다.
+
+    Args:
+        settings: 설정 객체
+        from_date: 시작 날짜 (YYYYMMDD, 포함)
+        to_date: 종료 날짜 (YYYYMMDD, 포함)
+        archive: Raw 오브젝트 저장소
+        checkpoint_path: checkpoint 파일 경로
+        workers: 다운로드/집계 병렬 수
+        skip_baseline: True면 baseline 재계산 생략
+    """
+    print("=" * 60)
+    print(f"⏪ Replay Job 실행 - {from_date} ~ {to_date}")
+    print("=" * 60)
+
+    try:
+        checkpoint = FileCheckpoint(checkpoint_path)
+
+        # 1. Raw 오브젝트 목록 조회
+        print("\n[1/3] Raw 오브젝트 조회 중...")
+        raw_keys = archive.list_raw_keys(from_date, to_date)
+        pending = checkpoint.pending(raw_keys)
+        print(f"✅ {len(raw_keys)}일치 Raw 데이터 발견 (처리 대상 {len(pending)}일, 완료 {len(raw_keys) - len(pending)}일)")
+
+        client = get_mongo_client(settings.mongo)
+        db = get_database(client, settings.mongo.db_name)
+        ensure_schema(db)
+        daily_store = get_daily_store(db, settings.mongo, settings.object_storage)
+
+        # 2. 병렬 다운로드/집계 → 날짜별 저장
+        print(f"\n[2/3] 다운로드/집계/저장 중... (workers={workers})")
+        started = time.perf_counter()
+        done = 0
+        dates_by_key = {raw_keys[date]: date for date in pending}
+        with ObjectTransferManager(settings.object_storage, workers) as transfer:
+            loaded = transfer.download_many(dates_by_key, lambda key: load_day(archive, key))
+            for key, (entry_count, summaries) in loaded:
+                date = dates_by_key[key]
+                if summaries:
+                    save_daily_with_rollup(daily_store, db.billing_monthly, summaries)
+                checkpoint.mark_done(
+                    [date],
+                    {(s.domain_id, s.project_id, s.service_id, s.service_name) for s in summaries}
+                )
+                done += 1
+                print(f"   [{done}/{len(pending)}] {date}: {entry_count}개 엔트리 → {len(summaries)}개 서비스 저장")
+        print(f"✅ {done}일 저장 완료 ({time.perf_counter() - started:.1f}s)")
+
+        # 3. Baseline 재계산 (마지막에 1회)
+        if skip_baseline:
+            print("\n[3/3] Baseline 재계산 생략 (--skip-baseline)")
+        elif checkpoint.baseline_done:
+            print("\n[3/3] Baseline 재계산이 이미 완료되었습니다.")
+        else:
+            print(f"\n[3/3] Baseline 재계산 중... ({len(checkpoint.services)}개 서비스)")
+            updated = recompute_baselines(daily_store, db.billing_baseline, sorted(checkpoint.services))
+            checkpoint.mark_baseline_done()
+            print(f"✅ {updated}개 서비스 Baseline 업데이트 완료")
+
+        print("\n" + "=" * 60)
+        print("✅ Replay Job 완료!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ 오류 발생: {e}")
+        print(f"   같은 명령으로 다시 실행하면 checkpoint({checkpoint_path})부터 이어서 처리합니다.")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='Billing Replay Job')
+    parser.add_argument('--config', type=str, default='config/settings.yaml', help='설정 파일 경로')
+    parser.add_argument('--from', dest='from_date', type=str, required=True, help='시작 날짜 (YYYYMMDD)')
+    parser.add_argument('--to', dest='to_date', type=str, required=True, help='종료 날짜 (YYYYMMDD)')
+    parser.add_argument('--source', choices=['s3', 'local'], default='s3', help='Raw 데이터 위치')
+    parser.add_argument('--local-root', type=str, help='--source local 일 때 raw/ 디렉토리의 상위 경로')
+    parser.add_argument('--workers', type=int, default=4, help='병렬 다운로드/집계 수')
+    parser.add_argument('--checkpoint', type=str, help='checkpoint 파일 경로 (기본값: logs/replay_{from}_{to}.json)')
+    parser.add_argument('--skip-baseline', action='store_true', help='baseline 재계산 생략')
+    parser.add_argument('--tenant', type=str, help='테넌트 Raw 데이터(raw/tenant=NAME/...)를 재처리')
+
+    args = parser.parse_args()
+
+    # 설정 로드
+    settings = load_settings(args.config)
+
+    if args.tenant:
+        tenant = next((t for t in settings.tenants if t.name == args.tenant), None)
+        if tenant is None:
+            parser.error(f'설정 파일에 없는 테넌트입니다: {args.tenant}')
+        settings = tenant_settings(settings, tenant)
+
+    if args.source == 'local':
+        if not args.local_root:
+            parser.error('--source local 에는 --local-root 가 필요합니다.')
+        archive = LocalRawArchive(args.local_root, tenant=args.tenant)
+    else:
+        archive = S3RawArchive(settings.object_storage)
+
+    run_name = f"replay_{args.from_date}_{args.to_date}" + (f"_{args.tenant}" if args.tenant else "")
+    checkpoint_path = args.checkpoint or str(project_root / "logs" / f"{run_name}.json")
+
+    # Job 실행
+    run_replay_job(
+        settings,
+        args.from_date,
+        args.to_date,
+        archive,
+        checkpoint_path,
+        workers=args.workers,
+        skip_baseline=args.skip_baseline
+    )
+
+
+if __name__ == "__main__":
+    main()
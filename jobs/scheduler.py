@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Scheduler: Hourly / Daily / Lifecycle Job을 한 프로세스에서 cron 일정대로 실행하는 상주 스케줄러
+
+cron으로 매번 새 프로세스를 띄우면 boto3/pymongo/requests import, 설정 로드, MongoDB 연결,
+인덱스 확인, baseline 조회를 실행할 때마다 처음부터 반복합니다.
+상주 모드에서는 MongoDB/S3/HTTP 클라이언트와 baseline 캐시를 프로세스 안에서 재사용합니다.
+
+- 일정은 settings.yaml의 scheduler 항목(cron 5필드, 기본 KST)을 따릅니다.
+- 같은 Job이 아직 실행 중이면 다음 회차는 건너뜁니다. (Job끼리는 동시에 실행될 수 있음)
+- SIGTERM / SIGINT를 받으면 새 Job을 시작하지 않고, 실행 중인 Job이 끝난 뒤 종료합니다.
+
+사용 예:
+    python -m jobs.scheduler --config config/settings.yaml
+    python -m jobs.scheduler --run-now hourly
+"""
+
+import sys
+import signal
+import argparse
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+try:
+    # Python 3.9+
+    from zoneinfo import ZoneInfo
+except ImportError:  # pragma: no cover
+    # Python 3.8 (e.g., Ubuntu 20.04 기본 python3)
+    from backports.zoneinfo import ZoneInfo
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.settings import load_settings, Settings
+from core.baseline import BaselineCache
+from core.billing_client import get_http_session, close_http_session
+from core.logger import get_logger
+from core.sharding import add_shard_arguments, apply_shard_arguments, shard_label
+from infra.mongo_client import (
+    get_mongo_client,
+    get_database,
+    close_mongo_clients
+)
+from infra.object_storage import get_s3_client, close_s3_clients
+from infra.schema import ensure_schema
+from jobs.daily_job import run_daily_job
+from jobs.hourly_job import run_hourly_job
+from jobs.lifecycle_job import run_lifecycle_job
+from utils.cron import CronSchedule
+
+
+# 다음 실행 시각까지 기다리는 최대 간격(초) - 시스템 시간 변경 시에도 1분 안에 일정을 다시 맞춥니다.
+MAX_SLEEP_SECONDS = 60
+
+
+@dataclass
+class ScheduledJob:
+    """스케줄러에 등록된 Job"""
+    name: str
+    schedule: CronSchedule
+    run: Callable[[], None]
+    next_run: Optional[datetime] = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class Scheduler:
+    """
+    cron 일정에 맞춰 Job을 worker 스레드에서 실행하는 스케줄러
+    """
+
+    def __init__(self, jobs: List[ScheduledJob], tz: ZoneInfo):
+        self.jobs = jobs
+        self.tz = tz
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def stop(self, signum=None, frame=None) -> None:
+        """새 Job 실행을 멈추고 루프를 종료합니다. (signal 핸들러로도 사용)"""
+        if not self._stop.is_set():
+            name = signal.Signals(signum).name if signum else "stop"
+            print(f"\n🛑 {name} 수신 - 실행 중인 Job이 끝나면 종료합니다.", flush=True)
+        self._stop.set()
+
+    def _execute(self, job: ScheduledJob) -> None:
+        try:
+            started = time.perf_counter()
+            job.run()
+            print(f"⏱️ [{job.name}] 완료 ({time.perf_counter() - started:.1f}s)", flush=True)
+        except SystemExit as e:
+            # 각 Job은 실패 시 sys.exit(1)을 호출하므로, 스케줄러 프로세스가 종료되지 않도록 여기서 막습니다.
+            if e.code not in (None, 0):
+                print(f"❌ [{job.name}] 실패 (exit code {e.code})", flush=True)
+        except Exception as e:
+            print(f"❌ [{job.name}] 실패: {e}", flush=True)
+            traceback.print_exc()
+        finally:
+            job.lock.release()
+
+    def trigger(self, job: ScheduledJob) -> bool:
+        """
+        Job을 worker 스레드에서 실행합니다.
+
+        Returns:
+            실행을 시작했으면 True, 같은 Job이 아직 실행 중이라 건너뛰었으면 False
+        """
+        if not job.lock.acquire(blocking=False):
+            print(f"⚠️ [{job.name}] 이전 실행이 아직 끝나지 않아 이번 회차를 건너뜁니다.", flush=True)
+            return False
+        thread = threading.Thread(target=self._execute, args=(job,), name=f"job-{job.name}")
+        self._threads = [t for t in self._threads if t.is_alive()]
+        self._threads.append(thread)
+        thread.start()
+        return True
+
+    def run_forever(self) -> None:
+        """stop()이 호출될 때까지 일정대로 Job을 실행합니다."""
+        now = datetime.now(self.tz)
+        for job in self.jobs:
+            job.next_run = job.schedule.next_after(now)
+            print(f"📅 [{job.name}] {job.schedule.expression} → 다음 실행 {job.next_run:%Y-%m-%d %H:%M}", flush=True)
+
+        while not self._stop.is_set():
+            now = datetime.now(self.tz)
+            due = [job for job in self.jobs if job.next_run <= now]
+            for job in due:
+                self.trigger(job)
+                job.next_run = job.schedule.next_after(now)
+
+            next_run = min(job.next_run for job in self.jobs)
+            wait = (next_run - datetime.now(self.tz)).total_seconds()
+            self._stop.wait(max(0.0, min(wait, MAX_SLEEP_SECONDS)))
+
+        for thread in self._threads:
+            thread.join()
+
+
+def warm_up(settings: Settings) -> BaselineCache:
+    """
+    상주 프로세스에서 재사용할 클라이언트를 미리 만들고 스키마를 확인합니다.
+
+    Returns:
+        Hourly Job이 재사용할 baseline 캐시
+    """
+    started = time.perf_counter()
+    client = get_mongo_client(settings.mongo)
+    db = get_database(client, settings.mongo.db_name)
+    schema_version = ensure_schema(db)
+    get_s3_client(settings.object_storage)
+    get_http_session()
+    get_logger(settings=settings.logging)
+    print(f"✅ 클라이언트 준비 완료 (schema v{schema_version}, {(time.perf_counter() - started) * 1000:.0f}ms)")
+    return BaselineCache(db.billing_baseline, ttl_seconds=settings.scheduler.baseline_cache_ttl_seconds)
+
+
+def build_jobs(settings: Settings, baseline_cache: BaselineCache) -> List[ScheduledJob]:
+    """
+    설정의 cron 표현식으로 Job 목록을 구성합니다. (표현식이 비어 있으면 제외)
+    """
+    def daily():
+        try:
+            run_daily_job(settings)
+        finally:
+            # Daily Job이 baseline을 재계산하므로 다음 Hourly Job에서 다시 읽습니다.
+            baseline_cache.invalidate()
+
+    runners: Dict[str, Callable[[], None]] = {
+        "hourly": lambda: run_hourly_job(settings, baseline_cache=baseline_cache),
+        "daily": daily,
+        "lifecycle": lambda: run_lifecycle_job(settings),
+    }
+    expressions = {
+        "hourly": settings.scheduler.hourly,
+        "daily": settings.scheduler.daily,
+        "lifecycle": settings.scheduler.lifecycle,
+    }
+    return [
+        ScheduledJob(name, CronSchedule(expressions[name]), runner)
+        for name, runner in runners.items()
+        if expressions[name]
+    ]
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='Billing Scheduler (상주 모드)')
+    parser.add_argument('--config', type=str, default='config/settings.yaml', help='설정 파일 경로')
+    parser.add_argument(
+        '--run-now',
+        choices=['hourly', 'daily', 'lifecycle'],
+        action='append',
+        default=[],
+        help='시작 직후 바로 실행할 Job (여러 번 지정 가능)'
+    )
+    add_shard_arguments(parser)
+
+    args = parser.parse_args()
+
+    # 로그 파일로 리다이렉트해도 진행 상황이 바로 기록되도록 줄 단위로 flush
+    sys.stdout.reconfigure(line_buffering=True)
+
+    # 설정 로드
+    settings = load_settings(args.config)
+    apply_shard_arguments(parser, args, settings)
+
+    print("=" * 60)
+    print("🗓️ Billing Scheduler 시작")
+    if shard_label(settings.cluster):
+        print(f"   shard {settings.cluster.shard_index}/{settings.cluster.shard_count} (key={settings.cluster.shard_key})")
+    print("=" * 60)
+
+    try:
+        baseline_cache = warm_up(settings)
+        jobs = build_jobs(settings, baseline_cache)
+    except Exception as e:
+        print(f"\n❌ 오류 발생: {e}")
+        traceback.print_exc()
+        sys.exit(1)
+
+    if not jobs:
+        print("⚠️ 활성화된 Job이 없습니다. (scheduler.hourly / daily / lifecycle)")
+        return
+
+    scheduler = Scheduler(jobs, ZoneInfo(settings.scheduler.timezone))
+    signal.signal(signal.SIGTERM, scheduler.stop)
+    signal.signal(signal.SIGINT, scheduler.stop)
+
+    for job in jobs:
+        if job.name in args.run_now:
+            scheduler.trigger(job)
+
+    try:
+        scheduler.run_forever()
+    finally:
+        close_http_session()
+        close_s3_clients()
+        close_mongo_clients()
+        print("✅ Billing Scheduler 종료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+billing_daily 저장 방식(document vs timeseries) 비교 스크립트
+
+- 컬렉션 크기: collStats(storageSize, totalIndexSize, count)
+- 조회 성능  : 임의 서비스 N개의 baseline 이력 조회(iter_daily_amounts) 시간
+
+사용 예:
+    python scripts/bench_daily_storage.py --config config/settings.yaml --services 200
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.settings import load_settings
+from infra.mongo_client import get_mongo_client, get_database
+from infra.schema import ensure_schema
+from infra.daily_store import (
+    DocumentDailyStore,
+    TimeSeriesDailyStore,
+    TIMESERIES_DAILY_COLLECTION
+)
+
+
+def coll_stats(db, name: str) -> dict:
+    stats = db.command("collStats", name)
+    return {
+        "count": stats.get("count", 0),
+        "storageSize": stats.get("storageSize", 0),
+        "totalIndexSize": stats.get("totalIndexSize", 0),
+    }
+
+
+def scan(store, services) -> tuple:
+    started = time.perf_counter()
+    rows = 0
+    for domain_id, project_id, service_id in services:
+        rows += sum(1 for _ in store.iter_daily_amounts(domain_id, project_id, service_id))
+    return time.perf_counter() - started, rows
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='billing_daily storage benchmark')
+    parser.add_argument('--config', type=str, default='config/settings.yaml', help='설정 파일 경로')
+    parser.add_argument('--services', type=int, default=200, help='조회할 서비스 수')
+    parser.add_argument('--seed', type=int, default=42, help='서비스 샘플링 시드')
+    args = parser.parse_args()
+
+    settings = load_settings(args.config)
+    db = get_database(get_mongo_client(settings.mongo), settings.mongo.db_name)
+    ensure_schema(db)
+
+    keys = db.billing_daily.aggregate([
+        {"$group": {"_id": {"d": "$domainId", "p": "$projectId", "s": "$serviceId"}}}
+    ])
+    services = [(k["_id"]["d"], k["_id"]["p"], k["_id"]["s"]) for k in keys]
+    random.Random(args.seed).shuffle(services)
+    services = services[:args.services]
+
+    print(f"{'storage':<12}{'count':>10}{'storage(MB)':>14}{'index(MB)':>12}{'scan(ms)':>12}{'rows':>10}")
+    for label, store, name in (
+        ("document", DocumentDailyStore(db), "billing_daily"),
+        ("timeseries", TimeSeriesDailyStore(db), TIMESERIES_DAILY_COLLECTION),
+    ):
+        stats = coll_stats(db, name)
+        elapsed, rows = scan(store, services)
+        print(
+            f"{label:<12}{stats['count']:>10}"
+            f"{stats['storageSize'] / 1024 / 1024:>14.2f}"
+            f"{stats['totalIndexSize'] / 1024 / 1024:>12.2f}"
+            f"{elapsed * 1000:>12.1f}{rows:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
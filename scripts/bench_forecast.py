@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+월말 예측(core/forecast.py) 학습 시간/정확도 벤치마크
+
+요일 계절성 + 추세 + 노이즈를 가진 합성 일별 금액으로 서비스 N개를 만들고,
+월말 예측 시간과 실제 월말 금액 대비 오차/구간 적중률을 출력합니다. (MongoDB 불필요)
+
+사용 예:
+    python scripts/bench_forecast.py --services 10000 --as-of 20250115
+"""
+
+import sys
+import time
+import argparse
+import calendar
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.forecast import forecast_month_end, history_dates
+
+
+def synthetic_history(services: int, days: int, seed: int) -> np.ndarray:
+    """[서비스, 날짜] 합성 일별 금액 (요일 패턴, 선형 추세, 곱셈 노이즈)"""
+    rng = np.random.default_rng(seed)
+    level = rng.lognormal(mean=8.0, sigma=1.0, size=(services, 1))
+    weekday = 1.0 + rng.uniform(-0.3, 0.3, size=(services, 7))
+    trend = rng.normal(0.0, 0.003, size=(services, 1))
+    t = np.arange(days)
+    seasonal = weekday[:, t % 7]
+    noise = rng.lognormal(mean=0.0, sigma=0.1, size=(services, days))
+    return level * seasonal * (1.0 + trend * t) * noise
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='Month-end forecast benchmark')
+    parser.add_argument('--services', type=int, default=10000, help='서비스 수')
+    parser.add_argument('--history-days', type=int, default=56, help='학습 일수')
+    parser.add_argument('--as-of', type=str, default='20250115', help='기준일 (YYYYMMDD)')
+    parser.add_argument('--interval-z', type=float, default=1.64, help='예측 구간 폭 (표준편차 배수)')
+    parser.add_argument('--seed', type=int, default=42, help='생성 시드')
+    args = parser.parse_args()
+
+    dates = history_dates(args.as_of, args.history_days)
+    as_of = datetime.strptime(args.as_of, "%Y%m%d")
+    remaining = calendar.monthrange(as_of.year, as_of.month)[1] - as_of.day
+    full = synthetic_history(args.services, len(dates) + remaining, args.seed)
+    history = full[:, :len(dates)]
+    keys = [("domain", "project", f"service-{i}") for i in range(args.services)]
+
+    started = time.perf_counter()
+    result = forecast_month_end(keys, history, dates, args.interval_z)
+    elapsed = time.perf_counter() - started
+
+    truth = result.actual + full[:, len(dates):].sum(axis=1)
+    error = np.abs(result.forecast - truth) / np.maximum(truth, 1e-9)
+    covered = (truth >= result.lower) & (truth <= result.upper)
+    totals = result.totals()
+
+    print(f"✅ 서비스 {args.services:,}개 × {len(dates)}일 → 남은 {remaining}일 예측: {elapsed * 1000:,.1f}ms")
+    print(f"   서비스별 오차(MAPE) 중앙값 {np.median(error) * 100:.2f}%, p95 {np.percentile(error, 95) * 100:.2f}%")
+    print(f"   예측 구간 적중률 {covered.mean() * 100:.1f}% (z={args.interval_z})")
+    print(
+        f"   합계: 예측 {totals['forecast']:,.0f} / 실제 {truth.sum():,.0f} "
+        f"(구간 {totals['lower']:,.0f} ~ {totals['upper']:,.0f})"
+    )
+
+
+if __name__ == "__main__":
+    main()
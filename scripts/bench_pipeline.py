@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+파이프라인 단계별 end-to-end 벤치마크
+
+합성 데이터(utils/synthetic.py)로 규모(하루 엔트리 수)별로 다음 단계를 실행하고
+단계별 소요 시간, 처리량(rows/s), 최대 메모리(tracemalloc peak)를 측정합니다.
+
+- fetch    : 로컬 stub 서버에 fetch_billing 호출 (HTTP + 페이지네이션 + JSON 파싱)
+- aggregate: aggregate_daily
+- persist  : save_daily_with_rollup (billing_daily + billing_monthly)
+- baseline : recompute_baselines (서비스별 history_days일 이력)
+- detect   : BaselineCache 로드 + detect_anomalies (주입한 spike 수와 함께 출력)
+
+MongoDB는 mongomock(기본, 설치 필요) 또는 설정 파일의 MongoDB(--mongo config, 별도 벤치마크 DB)를 사용합니다.
+mongomock은 쿼리마다 전체 문서를 훑으므로 persist/baseline 수치는 작은 규모의 상대 비교용으로만 보고,
+실제 규모 측정은 로컬 mongod(--mongo config)로 실행합니다.
+결과는 JSON으로 저장되며, --compare 로 이전 결과와 비교해 느려진 단계를 표시합니다.
+
+사용 예:
+    python scripts/bench_pipeline.py --scales 200,1000
+    python scripts/bench_pipeline.py --mongo config --scales 1000,10000,50000 --config config/settings.yaml --output logs/bench_pipeline.json
+    python scripts/bench_pipeline.py --compare logs/bench_pipeline.json
+"""
+
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.settings import BillingApiSettings, load_settings
+from core.aggregator import aggregate_daily, extract_entries
+from core.anomaly_detector import detect_anomalies
+from core.baseline import BaselineCache, recompute_baselines
+from core.billing_client import fetch_billing
+from core.rollup import save_daily_with_rollup
+from infra.daily_store import DocumentDailyStore
+from infra.mongo_client import get_mongo_client
+from infra.schema import ensure_schema
+from utils.synthetic import StubBillingServer, SyntheticBilling, SyntheticConfig
+
+
+STAGES = ("fetch", "aggregate", "persist", "baseline", "detect")
+TARGET_DATE = "20250301"
+
+
+def measure(results: Dict[str, Any], name: str, rows: int, trace: bool, func: Callable[[], Any]) -> Any:
+    """func를 실행하고 소요 시간/처리량/최대 메모리를 results[name]에 기록합니다."""
+    if trace:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    value = func()
+    seconds = time.perf_counter() - started
+    record = {
+        "seconds": round(seconds, 4),
+        "rows": rows,
+        "rowsPerSecond": round(rows / seconds, 1) if seconds > 0 else None,
+    }
+    if trace:
+        record["peakMb"] = round((tracemalloc.get_traced_memory()[1] - base) / 1024 / 1024, 2)
+    results[name] = record
+    return value
+
+
+def open_database(backend: str, config_path: str, db_name: str, scale: int):
+    """벤치마크용 빈 DB를 엽니다."""
+    if backend == "mongomock":
+        try:
+            import mongomock
+        except ImportError:
+            raise SystemExit("mongomock이 설치되어 있지 않습니다. (pip install mongomock 또는 --mongo config)")
+        return mongomock.MongoClient()[f"{db_name}_{scale}"]
+
+    settings = load_settings(config_path)
+    if db_name == settings.mongo.db_name:
+        raise SystemExit(f"운영 DB({db_name})는 벤치마크에 사용할 수 없습니다. --db-name 을 지정하세요.")
+    client = get_mongo_client(settings.mongo)
+    client.drop_database(f"{db_name}_{scale}")
+    return client[f"{db_name}_{scale}"]
+
+
+def run_scale(scale: int, args) -> Dict[str, Any]:
+    """하루 엔트리 수 scale 규모로 전체 단계를 실행합니다."""
+    config = SyntheticConfig.for_rows(scale, spike_rate=args.spike_rate, seed=args.seed)
+    billing = SyntheticBilling(config)
+    db = open_database(args.mongo, args.config, args.db_name, scale)
+    ensure_schema(db)
+    daily_store = DocumentDailyStore(db)
+
+    # 이전 history_days일 이력 적재 (측정 제외)
+    seed_started = time.perf_counter()
+    target = datetime.strptime(TARGET_DATE, "%Y%m%d")
+    for offset in range(args.history_days, 0, -1):
+        date = (target - timedelta(days=offset)).strftime("%Y%m%d")
+        daily_store.bulk_upsert_daily_summaries(aggregate_daily(billing.rows_for_date(date)))
+    seed_seconds = time.perf_counter() - seed_started
+
+    stages: Dict[str, Any] = {}
+    trace = not args.no_tracemalloc
+    if trace:
+        tracemalloc.start()
+    try:
+        with StubBillingServer(billing, latency_ms=args.latency_ms) as server:
+            api = BillingApiSettings(credential_id="bench", credential_secret="bench", api_url=server.url)
+            # stub 서버의 날짜 범위 캐시를 먼저 채워 생성 시간이 fetch 측정에 섞이지 않게 합니다.
+            server.rows(TARGET_DATE, TARGET_DATE)
+            response = measure(stages, "fetch", config.rows_per_day, trace,
+                               lambda: fetch_billing(TARGET_DATE, TARGET_DATE, api))
+        entries = extract_entries(response)
+        summaries = measure(stages, "aggregate", len(entries), trace, lambda: aggregate_daily(entries))
+        measure(stages, "persist", len(summaries), trace,
+                lambda: save_daily_with_rollup(daily_store, db.billing_monthly, summaries))
+        services = [(s.domain_id, s.project_id, s.service_id, s.service_name) for s in summaries]
+        measure(stages, "baseline", len(services) * (args.history_days + 1), trace,
+                lambda: recompute_baselines(daily_store, db.billing_baseline, services))
+
+        def detect():
+            cache = BaselineCache(db.billing_baseline)
+            baseline_map = {}
+            for s in summaries:
+                baseline = cache.get(s.domain_id, s.project_id, s.service_id)
+                if baseline:
+                    baseline_map["|".join([s.domain_id, s.project_id, s.service_id])] = baseline
+            return detect_anomalies(summaries, baseline_map, TARGET_DATE, 23)
+
+        anomalies = measure(stages, "detect", len(summaries), trace, detect)
+    finally:
+        if trace:
+            tracemalloc.stop()
+
+    return {
+        "scale": scale,
+        "rowsPerDay": config.rows_per_day,
+        "services": len(billing.service_keys),
+        "historyDays": args.history_days,
+        "seedSeconds": round(seed_seconds, 2),
+        "injectedSpikes": len(billing.spikes_for_date(TARGET_DATE)),
+        "anomalies": len(anomalies),
+        "stages": stages,
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=project_root,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"{'scale':>8}{'stage':>11}{'seconds':>10}{'rows/s':>12}{'peak(MB)':>10}")
+    for run in report["runs"]:
+        for stage in STAGES:
+            r = run["stages"][stage]
+            peak = f"{r['peakMb']:.1f}" if "peakMb" in r else "-"
+            print(f"{run['scale']:>8}{stage:>11}{r['seconds']:>10.3f}{r['rowsPerSecond'] or 0:>12,.0f}{peak:>10}")
+        print(
+            f"{'':>8}{'':>11}  spike {run['injectedSpikes']}개 주입 / 이상치 {run['anomalies']}개 탐지 "
+            f"(이력 적재 {run['seedSeconds']}s)"
+        )
+
+
+def compare(report: Dict[str, Any], previous_path: str, threshold: float) -> int:
+    """이전 결과와 단계별 소요 시간을 비교합니다. (threshold 배 이상 느려진 단계 수 반환)"""
+    with open(previous_path, encoding="utf-8") as f:
+        previous = {run["scale"]: run for run in json.load(f)["runs"]}
+    regressions = 0
+    print(f"\n비교 대상: {previous_path}")
+    for run in report["runs"]:
+        before = previous.get(run["scale"])
+        if not before:
+            continue
+        for stage in STAGES:
+            old = before["stages"].get(stage, {}).get("seconds")
+            new = run["stages"][stage]["seconds"]
+            if not old:
+                continue
+            ratio = new / old
+            flag = "⚠️" if ratio >= threshold else "  "
+            regressions += ratio >= threshold
+            print(f"{flag} {run['scale']:>8} {stage:<10} {old:.3f}s → {new:.3f}s (x{ratio:.2f})")
+    return regressions
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='Billing pipeline benchmark')
+    parser.add_argument('--scales', type=str, default='200,1000', help='하루 엔트리 수 목록 (쉼표 구분)')
+    parser.add_argument('--history-days', type=int, default=21, help='baseline 계산용 이력 일수 (탐지에는 20일 이상 필요)')
+    parser.add_argument('--spike-rate', type=float, default=0.02, help='서비스/일 단위 급증 확률')
+    parser.add_argument('--seed', type=int, default=42, help='생성 시드')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='stub API 응답 지연(ms)')
+    parser.add_argument('--mongo', choices=['mongomock', 'config'], default='mongomock', help='MongoDB 대상')
+    parser.add_argument('--config', type=str, default='config/settings.yaml', help='설정 파일 경로 (--mongo config)')
+    parser.add_argument('--db-name', type=str, default='billing_bench', help='벤치마크 DB 이름 접두어')
+    parser.add_argument('--no-tracemalloc', action='store_true', help='메모리 측정 생략 (시간 측정 오차 감소)')
+    parser.add_argument('--output', type=str, help='결과 JSON 경로 (기본값: logs/bench_pipeline_{시각}.json)')
+    parser.add_argument('--compare', type=str, help='비교할 이전 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=1.2, help='회귀로 표시할 배수')
+    args = parser.parse_args()
+
+    if args.compare and not Path(args.compare).is_file():
+        parser.error(f'비교할 결과 파일이 없습니다: {args.compare}')
+
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+    report = {
+        "createdAt": datetime.utcnow().isoformat(),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "mongo": args.mongo,
+        "tracemalloc": not args.no_tracemalloc,
+        "runs": [],
+    }
+    for scale in scales:
+        print(f"▶ scale {scale:,} 실행 중...", flush=True)
+        report["runs"].append(run_scale(scale, args))
+
+    print()
+    print_report(report)
+
+    # 같은 파일을 --output 으로 지정해도 덮어쓰기 전에 비교합니다.
+    regressions = compare(report, args.compare, args.threshold) if args.compare else 0
+
+    output = Path(args.output) if args.output else (
+        project_root / "logs" / f"bench_pipeline_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n✅ 결과 저장: {output}")
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Raw 데이터 업로드 방식 비교 스크립트
+
+- legacy: upload_json_with_metadata (indent=2 JSON 문자열 → bytes → put_object)
+- gzip  : upload_raw_entries (compact JSON Lines → gzip → spooled buffer → upload_fileobj)
+- zstd  : upload_raw_entries (zstandard 설치 시)
+
+변형마다 별도 프로세스에서 실행하여 peak RSS를 독립적으로 측정합니다.
+기본 sink(null)는 네트워크 없이 업로드 바이트만 세고, --sink s3 는 설정 파일의 버킷에 실제로 업로드합니다.
+
+사용 예:
+    python scripts/bench_raw_upload.py --rows 200000
+    python scripts/bench_raw_upload.py --rows 200000 --sink s3 --config config/settings.yaml
+"""
+
+import sys
+import json
+import time
+import random
+import resource
+import argparse
+import subprocess
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import infra.object_storage as object_storage
+from config.settings import ObjectStorageSettings, load_settings
+
+
+VARIANTS = ("legacy", "gzip", "zstd")
+
+
+class NullS3Client:
+    """업로드 바이트만 세는 S3 클라이언트 대체물 (네트워크 미사용)"""
+
+    def __init__(self):
+        self.uploaded_bytes = 0
+
+    def put_object(self, Body, **kwargs):
+        self.uploaded_bytes += len(Body)
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None, Config=None):
+        while True:
+            chunk = fileobj.read(1024 * 1024)
+            if not chunk:
+                break
+            self.uploaded_bytes += len(chunk)
+
+
+def make_response(rows: int, seed: int = 7) -> dict:
+    """Billing API 응답 형태의 샘플 데이터를 생성합니다."""
+    rng = random.Random(seed)
+    services = [f"service-{i:03d}" for i in range(60)]
+    content = []
+    for i in range(rows):
+        content.append({
+            "meteringDate": "20250101",
+            "domainId": f"domain-{i % 3:02d}",
+            "domainName": f"Domain {i % 3}",
+            "projectId": f"project-{i % 40:03d}",
+            "projectName": f"Project {i % 40}",
+            "serviceId": services[i % len(services)],
+            "serviceName": services[i % len(services)].upper(),
+            "region": rng.choice(["kr-central-1", "kr-central-2"]),
+            "pricingType": rng.choice(["ON_DEMAND", "RESERVED"]),
+            "usageTime": round(rng.random() * 24, 4),
+            "usageSize": round(rng.random() * 1000, 4),
+            "generalAmount": round(rng.random() * 5000, 2),
+            "discountAmount": round(rng.random() * 100, 2),
+            "expectAmount": round(rng.random() * 5000, 2),
+        })
+    return {"code": "OK", "result": {"content": content}}
+
+
+def current_rss_kb() -> int:
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * resource.getpagesize() // 1024
+
+
+def run_variant(variant: str, rows: int, sink: str, config: str) -> dict:
+    if sink == "s3":
+        settings = load_settings(config).object_storage
+        client = None
+    else:
+        settings = ObjectStorageSettings(endpoint="", bucket="bench", access_key="", secret_key="")
+        client = NullS3Client()
+        object_storage.get_s3_client = lambda _settings: client
+
+    response = make_response(rows)
+    rss_before = current_rss_kb()
+    metadata = {"fetchedAt": "bench", "apiParams": {"from": "20250101", "to": "20250101"}}
+
+    started = time.perf_counter()
+    if variant == "legacy":
+        object_storage.upload_json_with_metadata(response, "20250101", settings, metadata)
+        uploaded = client.uploaded_bytes if client else None
+    else:
+        result = object_storage.upload_raw_entries(
+            response["result"]["content"], "20250101", settings, variant, metadata
+        )
+        uploaded = result.compressed_bytes
+    elapsed = time.perf_counter() - started
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "variant": variant,
+        "rows": rows,
+        "seconds": elapsed,
+        "uploadBytes": uploaded,
+        "peakRssKb": peak_kb,
+        "peakOverheadKb": max(0, peak_kb - rss_before),
+    }
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='Raw upload benchmark')
+    parser.add_argument('--rows', type=int, default=100000, help='엔트리 수')
+    parser.add_argument('--sink', choices=['null', 's3'], default='null', help='업로드 대상')
+    parser.add_argument('--config', type=str, default='config/settings.yaml', help='설정 파일 경로 (sink=s3)')
+    parser.add_argument('--variant', choices=VARIANTS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        print(json.dumps(run_variant(args.variant, args.rows, args.sink, args.config)))
+        return
+
+    print(f"{'variant':<8}{'seconds':>10}{'upload(MB)':>12}{'peakRSS(MB)':>13}{'overhead(MB)':>14}")
+    for variant in VARIANTS:
+        if variant == "zstd" and object_storage.zstandard is None:
+            print(f"{variant:<8}  (zstandard 미설치, 건너뜀)")
+            continue
+        proc = subprocess.run(
+            [sys.executable, __file__, "--variant", variant, "--rows", str(args.rows),
+             "--sink", args.sink, "--config", args.config],
+            capture_output=True, text=True, check=True
+        )
+        r = json.loads(proc.stdout.strip().splitlines()[-1])
+        upload_mb = f"{r['uploadBytes'] / 1024 / 1024:.2f}" if r["uploadBytes"] is not None else "-"
+        print(
+            f"{variant:<8}{r['seconds']:>10.2f}{upload_mb:>12}"
+            f"{r['peakRssKb'] / 1024:>13.1f}{r['peakOverheadKb'] / 1024:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
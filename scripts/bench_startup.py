@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Job 시작 구간(MongoDB 연결 + 인덱스 준비) 지연 시간 측정 스크립트
+
+- before: 매 실행마다 기본 옵션 MongoClient 생성 + ensure_indexes (기존 동작)
+- after : 설정 기반 MongoClient 재사용 + ensure_schema (버전 확인 후 스킵)
+
+사용 예:
+    python scripts/bench_startup.py --config config/settings.yaml --runs 10
+"""
+
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from pymongo import MongoClient
+
+from config.settings import load_settings
+from infra.mongo_client import (
+    create_mongo_client,
+    get_database,
+    ensure_indexes
+)
+from infra.schema import ensure_schema
+import infra.schema as schema
+
+
+def measure_before(settings) -> float:
+    started = time.perf_counter()
+    client = MongoClient(settings.mongo.uri)
+    db = get_database(client, settings.mongo.db_name)
+    ensure_indexes(db)
+    elapsed = time.perf_counter() - started
+    client.close()
+    return elapsed
+
+
+def measure_after(settings) -> float:
+    # cron 실행은 매번 새 프로세스이므로, 프로세스 내 캐시를 비운 상태(cold)로 측정합니다.
+    schema._VERIFIED.clear()
+    started = time.perf_counter()
+    client = create_mongo_client(settings.mongo)
+    db = get_database(client, settings.mongo.db_name)
+    ensure_schema(db)
+    elapsed = time.perf_counter() - started
+    client.close()
+    return elapsed
+
+
+def report(label: str, samples) -> None:
+    ms = [s * 1000 for s in samples]
+    print(
+        f"{label:<8} mean={statistics.mean(ms):8.1f}ms  "
+        f"p50={statistics.median(ms):8.1f}ms  max={max(ms):8.1f}ms"
+    )
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='Job startup latency benchmark')
+    parser.add_argument('--config', type=str, default='config/settings.yaml', help='설정 파일 경로')
+    parser.add_argument('--runs', type=int, default=10, help='반복 횟수')
+    args = parser.parse_args()
+
+    settings = load_settings(args.config)
+
+    # 스키마 버전 기록을 먼저 최신으로 맞춰 둡니다.
+    ensure_schema(get_database(create_mongo_client(settings.mongo), settings.mongo.db_name))
+
+    before = [measure_before(settings) for _ in range(args.runs)]
+    after = [measure_after(settings) for _ in range(args.runs)]
+
+    report("before", before)
+    report("after", after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+주요 조회 쿼리의 실행 계획(explain) 점검 스크립트
+
+baseline 이력 조회(find_daily_amounts)가 커버링 인덱스를 사용하고
+문서를 읽지 않는지(FETCH 없음, totalDocsExamined == 0) 확인합니다.
+
+사용 예:
+    python scripts/check_query_plans.py --config config/settings.yaml
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.settings import load_settings
+from infra.mongo_client import (
+    get_mongo_client,
+    get_database,
+    find_daily_amounts,
+    DAILY_HISTORY_INDEX
+)
+from infra.schema import ensure_schema
+
+
+def collect_stages(plan: dict) -> list:
+    """winningPlan 트리에서 stage 목록을 수집합니다."""
+    stages = []
+    node = plan
+    while isinstance(node, dict):
+        # SBE 엔진은 queryPlan 아래에 실제 계획을 둡니다.
+        if "queryPlan" in node:
+            node = node["queryPlan"]
+            continue
+        stages.append(node)
+        node = node.get("inputStage")
+    return stages
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='Query plan check')
+    parser.add_argument('--config', type=str, default='config/settings.yaml', help='설정 파일 경로')
+    args = parser.parse_args()
+
+    settings = load_settings(args.config)
+    db = get_database(get_mongo_client(settings.mongo), settings.mongo.db_name)
+    ensure_schema(db)
+
+    # 실제 존재하는 서비스 하나를 골라 점검합니다 (없으면 임의 키 사용)
+    sample = db.billing_daily.find_one({}, {"domainId": 1, "projectId": 1, "serviceId": 1}) or {}
+    explain = find_daily_amounts(
+        db.billing_daily,
+        sample.get("domainId", "domain"),
+        sample.get("projectId", "project"),
+        sample.get("serviceId", "service")
+    ).explain()
+
+    stages = collect_stages(explain["queryPlanner"]["winningPlan"])
+    stage_names = [s.get("stage") for s in stages]
+    index_names = [s.get("indexName") for s in stages if s.get("stage") == "IXSCAN"]
+    docs_examined = explain.get("executionStats", {}).get("totalDocsExamined", 0)
+
+    print(f"stages: {' -> '.join(str(n) for n in stage_names)}")
+    print(f"index : {index_names}")
+
+    ok = DAILY_HISTORY_INDEX in index_names and "FETCH" not in stage_names and docs_examined == 0
+    if ok:
+        print("✅ baseline 이력 조회가 커버링 인덱스로 실행됩니다.")
+    else:
+        print("❌ baseline 이력 조회가 커버링 인덱스를 사용하지 않습니다.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
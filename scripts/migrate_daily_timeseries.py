@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+billing_daily (일반 컬렉션) → billing_daily_ts (time-series 컬렉션) 마이그레이션 스크립트
+
+- 기존 문서를 배치 단위로 읽어 time-series 측정 문서로 변환 후 insert 합니다.
+- isAnomaly=True 문서는 billing_daily_flags에도 기록하여 이후 Daily Job 재실행 시 유지되게 합니다.
+- 마이그레이션 후 설정에서 mongo.dailyStorage: "timeseries" 로 전환합니다.
+
+사용 예:
+    python scripts/migrate_daily_timeseries.py --config config/settings.yaml
+    python scripts/migrate_daily_timeseries.py --from-date 20250101 --to-date 20250131
+"""
+
+import sys
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from pymongo.operations import UpdateOne
+
+from config.settings import load_settings
+from infra.mongo_client import get_mongo_client, get_database
+from infra.schema import ensure_schema
+from infra.daily_store import (
+    TIMESERIES_DAILY_COLLECTION,
+    DAILY_FLAGS_COLLECTION,
+    daily_doc_to_timeseries_doc,
+    ensure_timeseries_collections
+)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='Migrate billing_daily to time-series collection')
+    parser.add_argument('--config', type=str, default='config/settings.yaml', help='설정 파일 경로')
+    parser.add_argument('--from-date', type=str, help='시작 날짜 (YYYYMMDD, 포함)')
+    parser.add_argument('--to-date', type=str, help='종료 날짜 (YYYYMMDD, 포함)')
+    parser.add_argument('--batch-size', type=int, default=5000, help='insert 배치 크기')
+    args = parser.parse_args()
+
+    settings = load_settings(args.config)
+    db = get_database(get_mongo_client(settings.mongo), settings.mongo.db_name)
+    ensure_schema(db)
+    ensure_timeseries_collections(db)
+
+    query = {"pricingType": None}
+    date_filter = {}
+    if args.from_date:
+        date_filter["$gte"] = args.from_date
+    if args.to_date:
+        date_filter["$lte"] = args.to_date
+    if date_filter:
+        query["date"] = date_filter
+
+    target = db[TIMESERIES_DAILY_COLLECTION]
+    flags = db[DAILY_FLAGS_COLLECTION]
+
+    # 재실행 시 중복되지 않도록 대상 범위를 먼저 비웁니다.
+    ts_filter = {}
+    if args.from_date:
+        ts_filter["$gte"] = datetime.strptime(args.from_date, "%Y%m%d")
+    if args.to_date:
+        ts_filter["$lte"] = datetime.strptime(args.to_date, "%Y%m%d")
+    deleted = target.delete_many({"ts": ts_filter} if ts_filter else {}).deleted_count
+    if deleted:
+        print(f"🧹 기존 time-series 문서 {deleted}개 삭제")
+
+    migrated = 0
+    flagged = 0
+    batch = []
+    flag_ops = []
+    now = datetime.utcnow()
+
+    def flush():
+        nonlocal batch, flag_ops
+        if batch:
+            target.insert_many(batch, ordered=False)
+        if flag_ops:
+            flags.bulk_write(flag_ops, ordered=False)
+        batch = []
+        flag_ops = []
+
+    cursor = db.billing_daily.find(query).sort("date", 1).batch_size(args.batch_size)
+    for doc in cursor:
+        if not doc.get("date"):
+            continue
+        batch.append(daily_doc_to_timeseries_doc(doc))
+        migrated += 1
+        if doc.get("isAnomaly"):
+            flag_ops.append(UpdateOne(
+                {
+                    "date": doc["date"],
+                    "domainId": doc.get("domainId", ""),
+                    "projectId": doc.get("projectId", ""),
+                    "serviceId": doc.get("serviceId", "")
+                },
+                {"$set": {"isAnomaly": True, "updatedAt": now}, "$setOnInsert": {"createdAt": now}},
+                upsert=True
+            ))
+            flagged += 1
+        if len(batch) >= args.batch_size:
+            flush()
+            print(f"   ... {migrated}개 이관")
+    flush()
+
+    print(f"✅ {migrated}개 문서 이관 완료 (이상치 마킹 {flagged}개)")
+    print('   설정 파일에서 mongo.dailyStorage: "timeseries" 로 전환하세요.')
+
+
+if __name__ == "__main__":
+    main()
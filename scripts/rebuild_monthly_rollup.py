@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+월별 롤업(billing_monthly) 재구축 스크립트
+
+billing_daily를 직접 수정했거나 날짜별 반영 금액(days)이 없는 기존 롤업 문서가 있는 경우,
+해당 월의 롤업을 billing_daily 기준으로 다시 계산합니다.
+
+사용 예:
+    python scripts/rebuild_monthly_rollup.py --month 202501
+    python scripts/rebuild_monthly_rollup.py --month 202501 --month 202502
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.settings import load_settings
+from core.rollup import rebuild_monthly_rollup
+from infra.mongo_client import get_mongo_client, get_database
+from infra.schema import ensure_schema
+from infra.daily_store import get_daily_store
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='Rebuild billing_monthly rollup')
+    parser.add_argument('--config', type=str, default='config/settings.yaml', help='설정 파일 경로')
+    parser.add_argument('--month', type=str, action='append', required=True, help='대상 월 (YYYYMM, 여러 번 지정 가능)')
+    args = parser.parse_args()
+
+    settings = load_settings(args.config)
+    db = get_database(get_mongo_client(settings.mongo), settings.mongo.db_name)
+    ensure_schema(db)
+    daily_store = get_daily_store(db, settings.mongo, settings.object_storage)
+
+    for month in args.month:
+        count = rebuild_monthly_rollup(daily_store, db.billing_monthly, month)
+        print(f"✅ {month}: 롤업 문서 {count}개 재구축")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,9 @@
 # Billing Tutorial Cron 설정 스크립트
 # Hourly Job과 Daily Job을 자동 실행하도록 cron을 설정합니다.
 #
+# cron 대신 상주 스케줄러를 쓰려면 이 스크립트 대신 scripts/billing-scheduler.service를 사용하세요.
+# (두 방식을 함께 쓰면 Job이 중복 실행됩니다)
+#
 
 set -e
 
@@ -26,6 +29,7 @@ fi
 # Job 스크립트 경로
 HOURLY_JOB="$PROJECT_ROOT/jobs/hourly_job.py"
 DAILY_JOB="$PROJECT_ROOT/jobs/daily_job.py"
+LIFECYCLE_JOB="$PROJECT_ROOT/jobs/lifecycle_job.py"
 CONFIG_FILE="$PROJECT_ROOT/config/settings.yaml"
 
 # 설정 파일 확인
@@ -53,6 +57,9 @@ mkdir -p "$LOG_DIR"
 # Cron 항목 생성
 HOURLY_CRON="10 * * * * cd $PROJECT_ROOT && $PYTHON3 $HOURLY_JOB --config $CONFIG_FILE >> $LOG_DIR/hourly_job.log 2>&1"
 DAILY_CRON="10 0 * * * cd $PROJECT_ROOT && $PYTHON3 $DAILY_JOB --config $CONFIG_FILE >> $LOG_DIR/daily_job.log 2>&1"
+# Lifecycle Job은 config/settings.yaml의 lifecycle.retentionDays가 비어 있으면 아무것도 삭제하지 않습니다.
+# (보관 정책을 켜기 전에 --dry-run 으로 대상 건수를 먼저 확인하세요)
+LIFECYCLE_CRON="40 3 * * * cd $PROJECT_ROOT && $PYTHON3 $LIFECYCLE_JOB --config $CONFIG_FILE >> $LOG_DIR/lifecycle_job.log 2>&1"
 
 # 현재 cron 설정 확인
 CURRENT_CRON=$(crontab -l 2>/dev/null || echo "")
@@ -101,8 +108,8 @@ show_menu() {
     echo "  Billing Tutorial Cron 설정"
     echo "=========================================="
     echo ""
-    echo "1) Cron 항목 추가 (Hourly + Daily)"
-    echo "2) Cron 항목 제거 (Hourly + Daily)"
+    echo "1) Cron 항목 추가 (Hourly + Daily + Lifecycle)"
+    echo "2) Cron 항목 제거 (Hourly + Daily + Lifecycle)"
     echo "3) 현재 Cron 설정 확인"
     echo "4) 종료"
     echo ""
@@ -113,7 +120,7 @@ show_current_cron() {
     echo ""
     echo "현재 Cron 설정:"
     echo "----------------------------------------"
-    crontab -l 2>/dev/null | grep -E "(hourly_job|daily_job)" || echo "설정된 항목이 없습니다."
+    crontab -l 2>/dev/null | grep -E "(hourly_job|daily_job|lifecycle_job)" || echo "설정된 항목이 없습니다."
     echo "----------------------------------------"
     echo ""
 }
@@ -124,22 +131,26 @@ main() {
         echo -e "${GREEN}📅 Cron 항목 추가 중...${NC}"
         add_cron "$HOURLY_CRON" "Hourly Job"
         add_cron "$DAILY_CRON" "Daily Job"
+        add_cron "$LIFECYCLE_CRON" "Lifecycle Job"
         echo ""
         echo -e "${GREEN}✅ 설정 완료!${NC}"
         echo ""
         echo "추가된 Cron 항목:"
         echo "  - Hourly Job: 매 시간 10분"
         echo "  - Daily Job: 매일 00:10"
+        echo "  - Lifecycle Job: 매일 03:40 (lifecycle.retentionDays 설정 시에만 아카이브/삭제)"
         echo ""
         echo "로그 파일 위치:"
         echo "  - $LOG_DIR/hourly_job.log"
         echo "  - $LOG_DIR/daily_job.log"
+        echo "  - $LOG_DIR/lifecycle_job.log"
         echo ""
         show_current_cron
     elif [ "$1" == "remove" ]; then
         echo -e "${YELLOW}🗑️  Cron 항목 제거 중...${NC}"
         remove_cron "$HOURLY_CRON" "Hourly Job"
         remove_cron "$DAILY_CRON" "Daily Job"
+        remove_cron "$LIFECYCLE_CRON" "Lifecycle Job"
         echo ""
         echo -e "${GREEN}✅ 제거 완료!${NC}"
         echo ""
@@ -155,6 +166,7 @@ main() {
                 1)
                     add_cron "$HOURLY_CRON" "Hourly Job"
                     add_cron "$DAILY_CRON" "Daily Job"
+                    add_cron "$LIFECYCLE_CRON" "Lifecycle Job"
                     echo ""
                     echo -e "${GREEN}✅ 설정 완료!${NC}"
                     show_current_cron
@@ -162,6 +174,7 @@ main() {
                 2)
                     remove_cron "$HOURLY_CRON" "Hourly Job"
                     remove_cron "$DAILY_CRON" "Daily Job"
+                    remove_cron "$LIFECYCLE_CRON" "Lifecycle Job"
                     echo ""
                     echo -e "${GREEN}✅ 제거 완료!${NC}"
                     show_current_cron
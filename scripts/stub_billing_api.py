@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+로컬 Billing API stub 서버
+
+합성 데이터(utils/synthetic.py)를 Billing API와 같은 경로/파라미터로 제공합니다.
+설정 파일의 billingApi.apiUrl을 출력된 주소로 바꾸면 Hourly/Daily/Backfill Job을 실제 API 없이 실행할 수 있습니다.
+
+사용 예:
+    python scripts/stub_billing_api.py --rows 50000 --port 8600
+    python scripts/stub_billing_api.py --domains 5 --projects 40 --spike-rate 0.05 --latency-ms 200 --error-rate 0.05
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.synthetic import StubBillingServer, SyntheticBilling, SyntheticConfig
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='Billing API stub server')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='바인드 주소')
+    parser.add_argument('--port', type=int, default=8600, help='포트')
+    parser.add_argument('--rows', type=int, help='하루 엔트리 수 (지정 시 --projects 대신 자동 계산)')
+    parser.add_argument('--domains', type=int, default=2, help='도메인 수')
+    parser.add_argument('--projects', type=int, default=5, help='도메인당 프로젝트 수')
+    parser.add_argument('--services', type=int, default=6, help='프로젝트당 서비스 수')
+    parser.add_argument('--resources', type=int, default=3, help='서비스당 리소스(엔트리) 수')
+    parser.add_argument('--spike-rate', type=float, default=0.01, help='서비스/일 단위 급증 확률')
+    parser.add_argument('--spike-multiplier', type=float, default=4.0, help='급증 배수')
+    parser.add_argument('--seed', type=int, default=42, help='생성 시드')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='응답 지연(ms)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='429 응답 비율 (재시도 테스트)')
+    args = parser.parse_args()
+
+    options = dict(
+        domains=args.domains,
+        services_per_project=args.services,
+        resources_per_service=args.resources,
+        spike_rate=args.spike_rate,
+        spike_multiplier=args.spike_multiplier,
+        seed=args.seed,
+    )
+    if args.rows:
+        config = SyntheticConfig.for_rows(args.rows, **options)
+    else:
+        config = SyntheticConfig(projects_per_domain=args.projects, **options)
+
+    server = StubBillingServer(
+        SyntheticBilling(config),
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate
+    )
+    print(f"✅ Billing API stub 서버 시작: {server.url}")
+    print(f"   하루 {config.rows_per_day:,}개 엔트리 (도메인 {config.domains}, 도메인당 프로젝트 {config.projects_per_domain})")
+    print(f"   설정 파일: billingApi.apiUrl: \"{server.url}\"")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print("✅ stub 서버 종료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+로컬 알림 webhook stub 서버
+
+받은 알림(Slack Incoming Webhook 형태의 {"text": ...})을 콘솔에 출력합니다.
+설정 파일의 alert.slackWebhookUrl / alert.channels[].webhookUrl을 출력된 주소로 바꾸면
+Hourly Job의 알림 발송(digest, 재시도, rate limit)을 실제 Slack 없이 확인할 수 있습니다.
+
+사용 예:
+    python scripts/stub_webhook.py --port 8601
+    python scripts/stub_webhook.py --rate-limit 1 --error-rate 0.3 --latency-ms 200
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.synthetic import StubWebhookServer
+
+
+class _PrintingWebhookServer(StubWebhookServer):
+    def record(self, path, payload):
+        super().record(path, payload)
+        print(f"📨 {path}\n{payload.get('text', payload)}\n")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='Notification webhook stub server')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='바인드 주소')
+    parser.add_argument('--port', type=int, default=8601, help='포트')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='응답 지연(ms)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='500 응답 비율 (재시도 테스트)')
+    parser.add_argument('--rate-limit', type=float, default=0.0, help='경로별 초당 허용 요청 수 (넘으면 429)')
+    args = parser.parse_args()
+
+    server = _PrintingWebhookServer(
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate,
+        rate_limit_per_second=args.rate_limit
+    )
+    print(f"✅ webhook stub 서버 시작: {server.url('/slack')} (경로마다 별도 webhook)")
+    print(f"   설정 파일: alert.slackWebhookUrl: \"{server.url('/slack')}\"")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(f"✅ stub 서버 종료 (수신 {sum(len(v) for v in server.received.values())}건, 429 응답 {server.throttled}건)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+파일 기반 진행 상황(checkpoint) 저장 헬퍼
+
+재처리/백필처럼 여러 날짜를 순서 없이 처리하는 작업이 중단되었을 때,
+완료된 날짜와 baseline 재계산 대상 서비스를 JSON 파일에 남겨 이어서 실행할 수 있게 합니다.
+파일은 임시 파일에 쓴 뒤 rename 하므로 중간에 종료되어도 깨지지 않습니다.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Iterable, List, Set, Tuple
+
+
+ServiceKey = Tuple[str, str, str, str]
+
+
+class FileCheckpoint:
+    """
+    완료 날짜 / baseline 대상 서비스 / baseline 완료 여부를 기록하는 checkpoint 파일
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.completed_dates: Set[str] = set()
+        self.services: Set[ServiceKey] = set()
+        self.baseline_done = False
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with self.path.open("r", encoding="utf-8") as f:
+            raw = json.load(f)
+        self.completed_dates = set(raw.get("completedDates", []))
+        self.services = {tuple(s) for s in raw.get("services", [])}
+        self.baseline_done = bool(raw.get("baselineDone", False))
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump({
+                "completedDates": sorted(self.completed_dates),
+                "services": sorted(list(s) for s in self.services),
+                "baselineDone": self.baseline_done,
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def is_done(self, date: str) -> bool:
+        """해당 날짜가 이미 처리되었는지 확인합니다."""
+        return date in self.completed_dates
+
+    def mark_done(self, dates: Iterable[str], services: Iterable[ServiceKey]) -> None:
+        """처리 완료된 날짜(들)와 baseline 재계산 대상 서비스를 기록합니다."""
+        with self._lock:
+            self.completed_dates.update(dates)
+            self.services.update(services)
+            self.baseline_done = False
+            self._save()
+
+    def mark_baseline_done(self) -> None:
+        """baseline 재계산 완료를 기록합니다."""
+        with self._lock:
+            self.baseline_done = True
+            self._save()
+
+    def pending(self, dates: Iterable[str]) -> List[str]:
+        """아직 처리되지 않은 날짜만 반환합니다."""
+        return [d for d in dates if d not in self.completed_dates]
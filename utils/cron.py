@@ -0,0 +1,101 @@
+"""
+cron 표현식 헬퍼
+
+상주 스케줄러(jobs/scheduler.py)가 crontab과 같은 5필드 표현식
+("분 시 일 월 요일")으로 다음 실행 시각을 계산할 때 사용합니다.
+
+지원 문법: `*`, 숫자, 범위(`1-5`), 목록(`0,30`), 간격(`*/15`, `0-30/10`)
+요일은 0(일요일)~6(토요일)이며, 7도 일요일로 취급합니다.
+일/요일이 모두 지정되면 crontab과 같이 둘 중 하나만 맞아도 실행합니다.
+"""
+
+from datetime import datetime, timedelta
+from typing import Set
+
+
+# (최소값, 최대값) - 분, 시, 일, 월, 요일
+FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+
+def _parse_field(text: str, low: int, high: int) -> Set[int]:
+    values: Set[int] = set()
+    for part in text.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step <= 0:
+                raise ValueError(f"잘못된 cron 간격입니다: {text}")
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(part)
+            end = high if step > 1 else start
+        if start < low or end > high or start > end:
+            raise ValueError(f"cron 필드 범위({low}-{high})를 벗어났습니다: {text}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    """
+    5필드 cron 표현식
+    """
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 표현식은 5개 필드여야 합니다: {expression!r}")
+        self.expression = expression
+        parsed = [_parse_field(text, low, high) for text, (low, high) in zip(fields, FIELD_RANGES)]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        # cron 요일(0=일요일) → Python weekday(0=월요일)
+        self.weekdays = {(d - 1) % 7 for d in weekdays}
+        # crontab과 같이 '*'로 시작하는 필드(*/2 등)가 있으면 일/요일을 AND로 비교합니다.
+        self._any_day = fields[2].startswith("*")
+        self._any_weekday = fields[4].startswith("*")
+
+    def _day_matches(self, dt: datetime) -> bool:
+        day_ok = dt.day in self.days
+        weekday_ok = dt.weekday() in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def matches(self, dt: datetime) -> bool:
+        """해당 시각(분 단위)이 표현식과 일치하는지 확인합니다."""
+        return (
+            dt.minute in self.minutes
+            and dt.hour in self.hours
+            and dt.month in self.months
+            and self._day_matches(dt)
+        )
+
+    def next_after(self, dt: datetime) -> datetime:
+        """
+        dt 이후(dt 제외) 가장 가까운 실행 시각을 반환합니다.
+
+        Args:
+            dt: 기준 시각 (tz-aware 권장, 같은 tz로 반환)
+
+        Returns:
+            다음 실행 시각 (초/마이크로초 0)
+        """
+        candidate = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        # 일치하지 않는 일/시는 통째로 건너뛰며 탐색합니다. (2월 29일처럼 드문 일정을 위해 최대 5년)
+        limit = candidate + timedelta(days=366 * 5)
+        while candidate <= limit:
+            if candidate.month not in self.months or not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+        raise ValueError(f"실행 시각을 찾을 수 없는 cron 표현식입니다: {self.expression!r}")
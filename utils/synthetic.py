@@ -0,0 +1,430 @@
+"""
+합성 Billing 데이터 생성 / 로컬 stub API 서버 모듈
+
+부하 테스트와 벤치마크에서 실제 Kakao Cloud API 없이 파이프라인 전체를 실행할 수 있도록,
+Billing API의 result.content와 같은 형태의 엔트리를 결정적으로(seed 기준) 생성합니다.
+
+- 도메인/프로젝트/서비스/리소스 수, region, pricingType을 설정으로 지정
+- 요일별 계절성(주말 감소)과 일별 노이즈
+- 일정 확률로 서비스 단위 급증(spike)을 주입하고, 어떤 서비스에 주입했는지 조회 가능
+- 같은 (seed, 날짜)는 항상 같은 엔트리를 생성 (날짜 순서와 무관)
+
+StubBillingServer는 생성된 데이터를 Billing API와 같은 경로/파라미터(from, to, page, size)로 제공합니다.
+StubWebhookServer는 알림 webhook(Slack Incoming Webhook 형태)을 받아 기록합니다. (발송/재시도/rate limit 확인용)
+"""
+
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from infra.raw_archive import iter_dates
+
+
+STUB_API_PATH = "/open/billing/public/v2/cost/resources"
+
+# (serviceId 접두어, serviceName, 리소스 1개당 하루 평균 비용(원))
+SERVICE_CATALOG: Tuple[Tuple[str, str, float], ...] = (
+    ("vm", "Virtual Machine", 42000.0),
+    ("bcs-gpu", "GPU Instance", 310000.0),
+    ("obj", "Object Storage", 3800.0),
+    ("bs", "Block Storage", 6500.0),
+    ("lb", "Load Balancer", 9800.0),
+    ("ke", "Kubernetes Engine", 27000.0),
+    ("mysql", "MySQL", 35000.0),
+    ("redis", "MemStore", 18000.0),
+    ("nat", "NAT Gateway", 5200.0),
+    ("cdn", "CDN", 7400.0),
+    ("dns", "DNS", 600.0),
+    ("kafka", "Advanced Managed Kafka", 52000.0),
+)
+
+# 요일별 사용량 비율 (월 ~ 일)
+WEEKDAY_PROFILE = (1.0, 1.02, 1.03, 1.02, 0.98, 0.7, 0.65)
+
+ServiceKey = Tuple[str, str, str]
+
+
+@dataclass
+class SyntheticConfig:
+    domains: int = 2
+    projects_per_domain: int = 5
+    services_per_project: int = 6
+    resources_per_service: int = 3
+    regions: Tuple[str, ...] = ("kr-central-1", "kr-central-2")
+    pricing_types: Tuple[str, ...] = ("ON_DEMAND", "RESERVED")
+    # 주말 감소 폭 (0이면 요일 계절성 없음, 1이면 WEEKDAY_PROFILE 그대로)
+    seasonality: float = 1.0
+    # 일별 노이즈 (표준편차 비율)
+    noise: float = 0.05
+    # 서비스/일 단위 급증 확률과 배수
+    spike_rate: float = 0.01
+    spike_multiplier: float = 4.0
+    seed: int = 42
+
+    @property
+    def rows_per_day(self) -> int:
+        return self.domains * self.projects_per_domain * self.services_per_project * self.resources_per_service
+
+    @classmethod
+    def for_rows(cls, rows_per_day: int, **overrides) -> "SyntheticConfig":
+        """하루 엔트리 수가 rows_per_day에 가깝도록 프로젝트 수를 정합니다."""
+        config = cls(**overrides)
+        per_project = config.services_per_project * config.resources_per_service
+        config.projects_per_domain = max(1, math.ceil(rows_per_day / (config.domains * per_project)))
+        return config
+
+
+def _stable_id(*parts: Any) -> str:
+    """시드/이름으로 만든 UUID 형태의 고정 ID"""
+    digest = hashlib.md5("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+    return f"{digest[:8]}-{digest[8:12]}-{digest[12:16]}-{digest[16:20]}-{digest[20:32]}"
+
+
+class SyntheticBilling:
+    """
+    설정에 따라 Billing API 엔트리를 생성합니다.
+
+    사용 예:
+        billing = SyntheticBilling(SyntheticConfig(domains=3, projects_per_domain=20))
+        response = billing.response("20250101", "20250107")
+        billing.spikes_for_date("20250105")  # 급증을 주입한 서비스 key
+    """
+
+    def __init__(self, config: SyntheticConfig):
+        self.config = config
+        rng = random.Random(config.seed)
+        # 리소스 목록: (서비스 key, 엔트리 고정 필드, 하루 기준 비용)
+        self._resources: List[Tuple[ServiceKey, Dict[str, Any], float]] = []
+        for d in range(config.domains):
+            domain_id = _stable_id(config.seed, "domain", d)
+            for p in range(config.projects_per_domain):
+                project_id = _stable_id(config.seed, "project", d, p)
+                services = rng.sample(
+                    range(len(SERVICE_CATALOG)), min(config.services_per_project, len(SERVICE_CATALOG))
+                )
+                # 카탈로그보다 많은 서비스를 요청하면 접미어를 붙여 반복합니다.
+                services += [
+                    i % len(SERVICE_CATALOG)
+                    for i in range(config.services_per_project - len(services))
+                ]
+                for index, catalog_index in enumerate(services):
+                    prefix, name, unit_cost = SERVICE_CATALOG[catalog_index]
+                    suffix = "" if index < len(SERVICE_CATALOG) else f"-{index // len(SERVICE_CATALOG)}"
+                    service_key = (domain_id, project_id, f"{prefix}{suffix}")
+                    # 프로젝트마다 규모가 다르도록 로그정규 분포로 비용 배율을 정합니다.
+                    scale = rng.lognormvariate(0, 0.8)
+                    for r in range(config.resources_per_service):
+                        fields = {
+                            "domainId": domain_id,
+                            "domainName": f"domain-{d:03d}",
+                            "projectId": project_id,
+                            "projectName": f"project-{d:03d}-{p:04d}",
+                            "serviceId": service_key[2],
+                            "serviceName": f"{name}{suffix}",
+                            "resourceId": _stable_id(config.seed, "resource", d, p, index, r),
+                            "region": rng.choice(config.regions),
+                            "pricingType": rng.choice(config.pricing_types),
+                        }
+                        self._resources.append((service_key, fields, unit_cost * scale))
+
+    @property
+    def service_keys(self) -> List[ServiceKey]:
+        """생성 대상 서비스 key 목록 (domainId, projectId, serviceId)"""
+        return sorted({key for key, _, _ in self._resources})
+
+    def _day_rng(self, date: str, salt: str) -> random.Random:
+        return random.Random(f"{self.config.seed}:{salt}:{date}")
+
+    def spikes_for_date(self, date: str) -> Set[ServiceKey]:
+        """해당 날짜에 급증을 주입한 서비스 key"""
+        rng = self._day_rng(date, "spike")
+        return {key for key in self.service_keys if rng.random() < self.config.spike_rate}
+
+    def rows_for_date(self, date: str) -> List[Dict[str, Any]]:
+        """
+        하루치 엔트리를 생성합니다.
+
+        Args:
+            date: 날짜 (YYYYMMDD)
+
+        Returns:
+            Billing API result.content 형태의 엔트리 리스트
+        """
+        config = self.config
+        rng = self._day_rng(date, "noise")
+        weekday = datetime.strptime(date, "%Y%m%d").weekday()
+        season = 1.0 + config.seasonality * (WEEKDAY_PROFILE[weekday] - 1.0)
+        spikes = self.spikes_for_date(date)
+
+        rows = []
+        for service_key, fields, base in self._resources:
+            factor = season * max(0.0, rng.gauss(1.0, config.noise))
+            if service_key in spikes:
+                factor *= config.spike_multiplier
+            expect = round(base * factor, 2)
+            discount = round(expect * 0.1, 2) if fields["pricingType"] == "RESERVED" else 0.0
+            rows.append({
+                "meteringDate": date,
+                **fields,
+                "usageTime": round(24 * min(1.0, factor), 4),
+                "usageSize": round(base / 100 * factor, 4),
+                "generalAmount": round(expect + discount, 2),
+                "discountAmount": discount,
+                "expectAmount": expect,
+            })
+        return rows
+
+    def response(self, from_date: str, to_date: str) -> Dict[str, Any]:
+        """날짜 범위의 엔트리를 Billing API 응답 형태로 반환합니다."""
+        content: List[Dict[str, Any]] = []
+        for date in iter_dates(from_date, to_date):
+            content.extend(self.rows_for_date(date))
+        return {"code": "OK", "result": {"content": content}}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: "_StubHTTPServer"
+
+    def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler 시그니처
+        pass
+
+    def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path != STUB_API_PATH:
+            self._send_json(404, {"code": "NOT_FOUND"})
+            return
+        stub = self.server.stub
+        if not self.headers.get("Credential-ID"):
+            self._send_json(401, {"code": "UNAUTHORIZED"})
+            return
+        if stub.error_rate and stub.next_error():
+            self._send_json(429, {"code": "TOO_MANY_REQUESTS"})
+            return
+
+        query = parse_qs(parsed.query)
+        from_date = query.get("from", [""])[0]
+        to_date = query.get("to", [from_date])[0]
+        page = int(query.get("page", ["0"])[0])
+        size = min(int(query.get("size", ["10000"])[0]), 10000)
+        rows = stub.rows(from_date, to_date)
+        if stub.latency_seconds:
+            threading.Event().wait(stub.latency_seconds)
+        self._send_json(200, {"code": "OK", "result": {"content": rows[page * size:(page + 1) * size]}})
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    stub: "StubBillingServer"
+
+
+class StubBillingServer:
+    """
+    합성 데이터를 제공하는 로컬 Billing API 서버
+
+    사용 예:
+        with StubBillingServer(SyntheticBilling(config)) as server:
+            settings.billing_api.api_url = server.url
+            fetch_billing("20250101", "20250101", settings.billing_api)
+    """
+
+    def __init__(
+        self,
+        billing: SyntheticBilling,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        error_rate: float = 0.0
+    ):
+        self.billing = billing
+        self.latency_seconds = latency_ms / 1000
+        self.error_rate = error_rate
+        self._error_rng = random.Random(billing.config.seed)
+        self._lock = threading.Lock()
+        # 페이지 요청마다 다시 생성하지 않도록 날짜 범위별 엔트리를 보관합니다.
+        self._cache: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._httpd = _StubHTTPServer((host, port), _StubHandler)
+        self._httpd.stub = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{STUB_API_PATH}"
+
+    def next_error(self) -> bool:
+        with self._lock:
+            return self._error_rng.random() < self.error_rate
+
+    def rows(self, from_date: str, to_date: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._cache.get((from_date, to_date))
+            if rows is None:
+                rows = self.billing.response(from_date, to_date)["result"]["content"]
+                self._cache = {(from_date, to_date): rows}
+            return rows
+
+    def start(self) -> "StubBillingServer":
+        """백그라운드 스레드에서 서버를 시작합니다."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stub-billing-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """현재 스레드에서 서버를 실행합니다. (Ctrl+C로 종료)"""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StubBillingServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    server: "_WebhookHTTPServer"
+
+    def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler 시그니처
+        pass
+
+    def _send_text(self, status: int, body: str, headers: Optional[Dict[str, str]] = None) -> None:
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        stub = self.server.stub
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        retry_after = stub.throttle(self.path)
+        if retry_after:
+            self._send_text(429, "rate_limited", {"Retry-After": f"{retry_after:.3f}"})
+            return
+        if stub.error_rate and stub.next_error():
+            self._send_text(500, "internal_error")
+            return
+        if stub.latency_seconds:
+            threading.Event().wait(stub.latency_seconds)
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            self._send_text(400, "invalid_payload")
+            return
+        stub.record(self.path, payload)
+        self._send_text(200, "ok")
+
+
+class _WebhookHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    stub: "StubWebhookServer"
+
+
+class StubWebhookServer:
+    """
+    받은 요청을 기록하는 로컬 webhook 서버
+
+    경로마다 별도 webhook으로 취급하며(예: /slack, /ops), 경로별로 초당 rate_limit_per_second개를 넘으면
+    Slack처럼 429와 Retry-After를 응답합니다.
+
+    사용 예:
+        with StubWebhookServer(rate_limit_per_second=1) as server:
+            settings.alert.slack_webhook_url = server.url("/slack")
+            NotificationDispatcher(settings.alert, outbox).dispatch()
+            print(server.received["/slack"])
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_per_second: float = 0.0,
+        seed: int = 42
+    ):
+        self.latency_seconds = latency_ms / 1000
+        self.error_rate = error_rate
+        self.rate_limit_per_second = rate_limit_per_second
+        self.received: Dict[str, List[Dict[str, Any]]] = {}
+        self.throttled = 0
+        self._error_rng = random.Random(seed)
+        self._last_accepted: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._httpd = _WebhookHTTPServer((host, port), _WebhookHandler)
+        self._httpd.stub = self
+        self._thread: Optional[threading.Thread] = None
+
+    def url(self, path: str = "/webhook") -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+    def next_error(self) -> bool:
+        with self._lock:
+            return self._error_rng.random() < self.error_rate
+
+    def throttle(self, path: str) -> float:
+        """rate limit을 넘었으면 Retry-After(초), 아니면 0을 반환합니다."""
+        if not self.rate_limit_per_second:
+            return 0.0
+        interval = 1.0 / self.rate_limit_per_second
+        now = time.monotonic()
+        with self._lock:
+            wait = self._last_accepted.get(path, float("-inf")) + interval - now
+            if wait > 0:
+                self.throttled += 1
+                return wait
+            self._last_accepted[path] = now
+            return 0.0
+
+    def record(self, path: str, payload: Dict[str, Any]) -> None:
+        with self._lock:
+            self.received.setdefault(path, []).append(payload)
+
+    def start(self) -> "StubWebhookServer":
+        """백그라운드 스레드에서 서버를 시작합니다."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stub-webhook", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """현재 스레드에서 서버를 실행합니다. (Ctrl+C로 종료)"""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StubWebhookServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()